@@ -0,0 +1,141 @@
+"""soft delete partial indexes
+
+Revision ID: 3f8b1c6d2e94
+Revises: 9a4d3e6b2c71
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f8b1c6d2e94"
+down_revision = "9a4d3e6b2c71"
+branch_labels = None
+depends_on = None
+
+ACTIVE_ROW_PREDICATE = "is_deleted = false"
+
+# (name, table, columns, unique) of the indexes rebuilt as partial indexes
+# over active rows. The names are unchanged.
+REBUILT_INDEXES = (
+    ("ix_user_verification_token", "users", ["verification_token"], True),
+    ("ix_user_password_reset_token", "users", ["password_reset_token"], True),
+    ("ix_user_deletion_token", "users", ["deletion_token"], True),
+    ("ix_api_key_fingerprint", "api_keys", ["key_fingerprint"], False),
+    (
+        "ix_api_key_user_active",
+        "api_keys",
+        ["user_id", "is_active", "expires_at"],
+        False,
+    ),
+    (
+        "ix_refresh_token_fingerprint",
+        "refresh_tokens",
+        ["token_fingerprint"],
+        False,
+    ),
+    (
+        "ix_refresh_token_user_active",
+        "refresh_tokens",
+        ["user_id", "is_revoked", "expires_at"],
+        False,
+    ),
+)
+
+# Full unique indexes replaced by partial unique indexes over active rows
+REPLACED_UNIQUE_INDEXES = (
+    ("ix_users_email", "uq_user_email_active", "email"),
+    ("ix_users_username", "uq_user_username_active", "username"),
+)
+
+# Duplicates of the fingerprint indexes above
+DUPLICATE_INDEXES = (
+    ("ix_api_keys_key_fingerprint", "api_keys", ["key_fingerprint"]),
+    ("ix_refresh_tokens_token_fingerprint", "refresh_tokens", ["token_fingerprint"]),
+)
+
+# Table-wide unique constraints superseded by the unique token indexes
+TOKEN_UNIQUE_CONSTRAINTS = (
+    ("users_verification_token_key", "verification_token"),
+    ("users_password_reset_token_key", "password_reset_token"),
+    ("users_deletion_token_key", "deletion_token"),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Build the partial unique indexes before dropping the full ones so
+        # active rows stay covered throughout
+        for old_name, new_name, column in REPLACED_UNIQUE_INDEXES:
+            op.create_index(
+                new_name,
+                "users",
+                [column],
+                unique=True,
+                postgresql_where=ACTIVE_ROW_PREDICATE,
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                old_name,
+                table_name="users",
+                postgresql_concurrently=True,
+            )
+
+        for name, table, columns, unique in REBUILT_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=unique,
+                postgresql_where=ACTIVE_ROW_PREDICATE,
+                postgresql_concurrently=True,
+            )
+
+        for name, table, _columns in DUPLICATE_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+    for name, _column in TOKEN_UNIQUE_CONSTRAINTS:
+        op.drop_constraint(name, "users", type_="unique")
+
+
+def downgrade() -> None:
+    # Fails if a soft-deleted account shares an email, username or token with
+    # another account, which the partial indexes allow
+    for name, column in TOKEN_UNIQUE_CONSTRAINTS:
+        op.create_unique_constraint(name, "users", [column])
+
+    with op.get_context().autocommit_block():
+        for name, table, columns in DUPLICATE_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+        for name, table, columns, _unique in REBUILT_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+        for old_name, new_name, column in REPLACED_UNIQUE_INDEXES:
+            op.create_index(
+                old_name,
+                "users",
+                [column],
+                unique=True,
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                new_name,
+                table_name="users",
+                postgresql_concurrently=True,
+            )
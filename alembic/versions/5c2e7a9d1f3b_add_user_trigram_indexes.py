@@ -0,0 +1,52 @@
+"""add user trigram indexes
+
+Revision ID: 5c2e7a9d1f3b
+Revises: 08dda0805e02
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "5c2e7a9d1f3b"
+down_revision = "08dda0805e02"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Build concurrently so large users tables stay writable during the upgrade
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_username_trgm",
+            "users",
+            [sa.text("lower(username) gin_trgm_ops")],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_user_email_trgm",
+            "users",
+            [sa.text("lower(email) gin_trgm_ops")],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_email_trgm",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_user_username_trgm",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
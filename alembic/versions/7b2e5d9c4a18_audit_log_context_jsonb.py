@@ -0,0 +1,58 @@
+"""audit log context jsonb
+
+Revision ID: 7b2e5d9c4a18
+Revises: 3f8b1c6d2e94
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "7b2e5d9c4a18"
+down_revision = "3f8b1c6d2e94"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Changing the column type rewrites the table once under an exclusive lock
+    op.alter_column(
+        "audit_logs",
+        "context",
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_type=postgresql.JSON(astext_type=sa.Text()),
+        existing_nullable=True,
+        existing_comment="Additional event metadata as JSON",
+        postgresql_using="context::jsonb",
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_audit_log_context",
+            "audit_logs",
+            ["context"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"context": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_audit_log_context",
+            table_name="audit_logs",
+            postgresql_concurrently=True,
+        )
+    op.alter_column(
+        "audit_logs",
+        "context",
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=True,
+        existing_comment="Additional event metadata as JSON",
+        postgresql_using="context::json",
+    )
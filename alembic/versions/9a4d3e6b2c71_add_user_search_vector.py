@@ -0,0 +1,53 @@
+"""add user search vector
+
+Revision ID: 9a4d3e6b2c71
+Revises: 5c2e7a9d1f3b
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "9a4d3e6b2c71"
+down_revision = "5c2e7a9d1f3b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Adding a stored generated column rewrites the table once to backfill it
+    op.add_column(
+        "users",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('english', coalesce(username, '') || ' ' || coalesce(email, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+            comment="Generated full-text search document for username and email",
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_search_vector",
+            "users",
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_search_vector",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("users", "search_vector")
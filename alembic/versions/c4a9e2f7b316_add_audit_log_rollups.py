@@ -0,0 +1,74 @@
+"""add audit log rollups
+
+Revision ID: c4a9e2f7b316
+Revises: 7b2e5d9c4a18
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "c4a9e2f7b316"
+down_revision = "7b2e5d9c4a18"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_log_rollups",
+        sa.Column(
+            "rollup",
+            sa.String(length=50),
+            nullable=False,
+            comment="Rollup name (e.g., 'failed_logins_per_ip_minute')",
+        ),
+        sa.Column(
+            "bucket_start",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            comment="Start of the time bucket (UTC)",
+        ),
+        sa.Column(
+            "dimension",
+            sa.String(length=255),
+            nullable=False,
+            comment="Grouping value (e.g., IP address or API key ID)",
+        ),
+        sa.Column(
+            "count",
+            sa.BigInteger(),
+            nullable=False,
+            comment="Number of matching events in the bucket",
+        ),
+        sa.PrimaryKeyConstraint("rollup", "bucket_start", "dimension"),
+    )
+    op.create_table(
+        "audit_rollup_watermarks",
+        sa.Column(
+            "rollup",
+            sa.String(length=50),
+            nullable=False,
+            comment="Rollup name",
+        ),
+        sa.Column(
+            "processed_until",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            comment="Audit logs before this time have been counted",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            comment="When the watermark last advanced",
+        ),
+        sa.PrimaryKeyConstraint("rollup"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("audit_rollup_watermarks")
+    op.drop_table("audit_log_rollups")
@@ -0,0 +1,139 @@
+"""move one-time tokens off users
+
+Revision ID: d8f1a3b5c729
+Revises: c4a9e2f7b316
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "d8f1a3b5c729"
+down_revision = "c4a9e2f7b316"
+branch_labels = None
+depends_on = None
+
+ACTIVE_ROW_PREDICATE = "is_deleted = false"
+
+# (purpose, token column) of the token columns moved to one_time_tokens.
+# The expiry column of each is "<token column>_expires" and its index
+# "ix_user_<token column>".
+TOKEN_COLUMNS = (
+    ("verification", "verification_token"),
+    ("password_reset", "password_reset_token"),
+    ("deletion", "deletion_token"),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "one_time_tokens",
+        sa.Column(
+            "token_hash",
+            sa.String(length=64),
+            nullable=False,
+            comment="SHA-256 fingerprint of the token",
+        ),
+        sa.Column(
+            "purpose",
+            sa.String(length=32),
+            nullable=False,
+            comment="What the token authorizes (e.g., 'password_reset')",
+        ),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            comment="User the token was issued to",
+        ),
+        sa.Column(
+            "expires_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            comment="When the token expires",
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            comment="When the token was issued",
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("token_hash"),
+    )
+    op.create_index(
+        "uq_one_time_token_user_purpose",
+        "one_time_tokens",
+        ["user_id", "purpose"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_one_time_token_expires_at",
+        "one_time_tokens",
+        ["expires_at"],
+    )
+
+    # Carry over unexpired tokens so links already emailed keep working with
+    # the database token store. Links sent before the upgrade stop working
+    # when the Redis token store is used.
+    for purpose, column in TOKEN_COLUMNS:
+        op.execute(
+            f"""
+            INSERT INTO one_time_tokens
+                (token_hash, purpose, user_id, expires_at, created_at)
+            SELECT encode(sha256(convert_to({column}, 'UTF8')), 'hex'),
+                   '{purpose}', id, {column}_expires, now()
+            FROM users
+            WHERE {column} IS NOT NULL
+              AND {column}_expires > now()
+              AND {ACTIVE_ROW_PREDICATE}
+            ON CONFLICT DO NOTHING
+            """,
+        )
+
+    with op.get_context().autocommit_block():
+        for _purpose, column in TOKEN_COLUMNS:
+            op.drop_index(
+                f"ix_user_{column}",
+                table_name="users",
+                postgresql_concurrently=True,
+            )
+
+    for _purpose, column in TOKEN_COLUMNS:
+        op.drop_column("users", f"{column}_expires")
+        op.drop_column("users", column)
+
+
+def downgrade() -> None:
+    # Pending tokens are not copied back; users request new links
+    for _purpose, column in TOKEN_COLUMNS:
+        op.add_column(
+            "users",
+            sa.Column(column, sa.String(length=255), nullable=True),
+        )
+        op.add_column(
+            "users",
+            sa.Column(
+                f"{column}_expires",
+                sa.TIMESTAMP(timezone=True),
+                nullable=True,
+            ),
+        )
+
+    with op.get_context().autocommit_block():
+        for _purpose, column in TOKEN_COLUMNS:
+            op.create_index(
+                f"ix_user_{column}",
+                "users",
+                [column],
+                unique=True,
+                postgresql_where=ACTIVE_ROW_PREDICATE,
+                postgresql_concurrently=True,
+            )
+
+    op.drop_index("ix_one_time_token_expires_at", table_name="one_time_tokens")
+    op.drop_index("uq_one_time_token_user_purpose", table_name="one_time_tokens")
+    op.drop_table("one_time_tokens")
@@ -3,6 +3,9 @@
 from fastapi import APIRouter
 
 # Import admin routers
+from .audit_logs import router as admin_audit_logs_router
+from .exports import router as admin_exports_router
+from .imports import router as admin_imports_router
 from .users import router as admin_users_router
 
 # Create main admin router
@@ -10,5 +13,8 @@ router = APIRouter(prefix="/admin", tags=["administration"])
 
 # Include admin sub-routers
 router.include_router(admin_users_router)
+router.include_router(admin_exports_router)
+router.include_router(admin_imports_router)
+router.include_router(admin_audit_logs_router)
 
 __all__ = ["router"]
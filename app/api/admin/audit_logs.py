@@ -0,0 +1,242 @@
+"""
+Admin audit log endpoints.
+
+Searches audit logs with keyset pagination, aggregates them into time
+buckets and serves the precomputed rollups used by security dashboards.
+All endpoints require superuser privileges.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.admin import require_superuser
+from app.crud.system.audit_log import get_audit_log_histogram, search_audit_logs
+from app.crud.system.audit_rollup import (
+    AUDIT_ROLLUPS,
+    AuditRollupDefinition,
+    get_audit_rollup,
+    get_audit_rollup_top,
+    get_audit_rollup_watermarks,
+)
+from app.database.database import get_db
+from app.schemas.auth.user import UserResponse
+from app.schemas.system.audit_log import (
+    AuditLogHistogramBucket,
+    AuditLogHistogramInterval,
+    AuditLogHistogramResponse,
+    AuditLogPage,
+    AuditLogResponse,
+    AuditRollupBucket,
+    AuditRollupInfo,
+    AuditRollupResponse,
+    AuditRollupTopEntry,
+    AuditRollupTopResponse,
+)
+from app.utils.datetime_utils import utc_now
+from app.utils.pagination import decode_keyset_cursor, encode_keyset_cursor
+from app.utils.search_filter import AuditLogFilterParams
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/audit-logs")
+
+
+@router.get("", response_model=AuditLogPage)
+async def list_audit_logs(
+    filters: AuditLogFilterParams = Depends(),
+    limit: int = Query(50, ge=1, le=500, description="Maximum entries per page"),
+    cursor: str | None = Query(None, description="Cursor from the previous page"),
+    current_admin: UserResponse = Depends(require_superuser),
+    db: AsyncSession = Depends(get_db),
+) -> AuditLogPage:
+    """
+    Search audit logs, newest first.
+
+    Filters combine with AND. Pass ``next_cursor`` from a response as
+    ``cursor`` to get the following page; the same filters must be used.
+    """
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_keyset_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(exc),
+            ) from exc
+
+    logger.info(
+        "Admin audit log search requested",
+        extra={"admin_id": str(current_admin.id), "limit": limit},
+    )
+
+    logs, next_key = await search_audit_logs(
+        db,
+        filters.to_search_config(),
+        limit=limit,
+        after=after,
+    )
+    return AuditLogPage(
+        items=[AuditLogResponse.model_validate(log) for log in logs],
+        limit=limit,
+        next_cursor=encode_keyset_cursor(*next_key) if next_key else None,
+    )
+
+
+@router.get("/histogram", response_model=AuditLogHistogramResponse)
+async def audit_log_histogram(
+    filters: AuditLogFilterParams = Depends(),
+    interval: AuditLogHistogramInterval = Query(
+        AuditLogHistogramInterval.HOUR,
+        description="Bucket size",
+    ),
+    current_admin: UserResponse = Depends(require_superuser),
+    db: AsyncSession = Depends(get_db),
+) -> AuditLogHistogramResponse:
+    """
+    Count audit logs matching the filters per time bucket.
+
+    Accepts the same filters as ``GET /audit-logs``. Empty buckets are
+    omitted.
+    """
+    logger.info(
+        "Admin audit log histogram requested",
+        extra={"admin_id": str(current_admin.id), "interval": interval.value},
+    )
+
+    buckets = await get_audit_log_histogram(
+        db,
+        filters.to_search_config(),
+        interval=interval.value,
+    )
+    return AuditLogHistogramResponse(
+        interval=interval,
+        buckets=[
+            AuditLogHistogramBucket(bucket=bucket, count=count)
+            for bucket, count in buckets
+        ],
+    )
+
+
+def _get_rollup(rollup: str) -> AuditRollupDefinition:
+    definition = AUDIT_ROLLUPS.get(rollup)
+    if definition is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown audit rollup: {rollup}",
+        )
+    return definition
+
+
+def _rollup_range(
+    since: datetime | None,
+    until: datetime | None,
+) -> tuple[datetime, datetime]:
+    until = until or utc_now()
+    return since or until - timedelta(hours=24), until
+
+
+@router.get("/rollups", response_model=list[AuditRollupInfo])
+async def list_audit_rollups(
+    current_admin: UserResponse = Depends(require_superuser),
+    db: AsyncSession = Depends(get_db),
+) -> list[AuditRollupInfo]:
+    """List the available audit log rollups and how far each is up to date."""
+    watermarks = await get_audit_rollup_watermarks(db)
+    return [
+        AuditRollupInfo(
+            name=name,
+            description=definition.description,
+            interval=definition.interval,
+            event_type=definition.event_type,
+            success=definition.success,
+            processed_until=watermarks.get(name),
+        )
+        for name, definition in AUDIT_ROLLUPS.items()
+    ]
+
+
+@router.get("/rollups/{rollup}", response_model=AuditRollupResponse)
+async def read_audit_rollup(
+    rollup: str,
+    since: datetime | None = Query(
+        None,
+        description="Buckets starting at or after this time (default: 24h before until)",
+    ),
+    until: datetime | None = Query(
+        None,
+        description="Buckets starting before this time (default: now)",
+    ),
+    dimension: str | None = Query(None, description="Only this dimension value"),
+    limit: int = Query(10000, ge=1, le=50000, description="Maximum buckets"),
+    current_admin: UserResponse = Depends(require_superuser),
+    db: AsyncSession = Depends(get_db),
+) -> AuditRollupResponse:
+    """
+    Read a rollup's buckets in a time range, oldest first.
+
+    Counts cover audit logs up to ``processed_until``; later events appear
+    after the next rollup refresh.
+    """
+    definition = _get_rollup(rollup)
+    since, until = _rollup_range(since, until)
+
+    logger.info(
+        "Admin audit rollup requested",
+        extra={"admin_id": str(current_admin.id), "rollup": rollup},
+    )
+
+    buckets = await get_audit_rollup(
+        db,
+        rollup,
+        since=since,
+        until=until,
+        dimension=dimension,
+        limit=limit,
+    )
+    watermarks = await get_audit_rollup_watermarks(db)
+    return AuditRollupResponse(
+        rollup=rollup,
+        interval=definition.interval,
+        processed_until=watermarks.get(rollup),
+        buckets=[AuditRollupBucket.model_validate(bucket) for bucket in buckets],
+    )
+
+
+@router.get("/rollups/{rollup}/top", response_model=AuditRollupTopResponse)
+async def read_audit_rollup_top(
+    rollup: str,
+    since: datetime | None = Query(
+        None,
+        description="Buckets starting at or after this time (default: 24h before until)",
+    ),
+    until: datetime | None = Query(
+        None,
+        description="Buckets starting before this time (default: now)",
+    ),
+    limit: int = Query(20, ge=1, le=1000, description="Maximum dimension values"),
+    current_admin: UserResponse = Depends(require_superuser),
+    db: AsyncSession = Depends(get_db),
+) -> AuditRollupTopResponse:
+    """Get the dimension values with the most events in a time range."""
+    _get_rollup(rollup)
+    since, until = _rollup_range(since, until)
+
+    logger.info(
+        "Admin audit rollup top requested",
+        extra={"admin_id": str(current_admin.id), "rollup": rollup},
+    )
+
+    top = await get_audit_rollup_top(db, rollup, since=since, until=until, limit=limit)
+    watermarks = await get_audit_rollup_watermarks(db)
+    return AuditRollupTopResponse(
+        rollup=rollup,
+        processed_until=watermarks.get(rollup),
+        items=[
+            AuditRollupTopEntry(dimension=dimension, count=count)
+            for dimension, count in top
+        ],
+    )
@@ -0,0 +1,115 @@
+"""
+Admin export endpoints.
+
+Streams users and audit logs as NDJSON or CSV without paging.
+All endpoints require superuser privileges.
+"""
+
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.core.admin import require_superuser
+from app.database.database import AsyncSessionLocal
+from app.models import AuditLog, User
+from app.schemas.admin.admin import AdminUserResponse
+from app.schemas.auth.user import UserResponse
+from app.schemas.system.audit_log import AuditLogResponse
+from app.utils.datetime_utils import utc_now
+from app.utils.export import EXPORT_MEDIA_TYPES, ExportFormat, stream_export
+from app.utils.search_filter import (
+    AuditLogSearchParams,
+    SearchFilterConfig,
+    UserSearchParams,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/exports")
+
+
+async def _export_chunks(
+    model: type[Any],
+    schema: type[BaseModel],
+    config: SearchFilterConfig,
+    export_format: ExportFormat,
+) -> AsyncIterator[bytes]:
+    # The request-scoped session from get_db is closed before a streaming
+    # body is sent, so the export owns its session for the whole stream.
+    async with AsyncSessionLocal() as db:
+        async for chunk in stream_export(db, model, schema, config, export_format):
+            yield chunk
+
+
+def _export_response(
+    name: str,
+    model: type[Any],
+    schema: type[BaseModel],
+    config: SearchFilterConfig,
+    export_format: ExportFormat,
+) -> StreamingResponse:
+    filename = f"{name}-{utc_now():%Y%m%dT%H%M%SZ}.{export_format.value}"
+    return StreamingResponse(
+        _export_chunks(model, schema, config, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/users")
+async def export_users(
+    export_format: ExportFormat = Query(
+        ExportFormat.NDJSON,
+        alias="format",
+        description="Export format",
+    ),
+    search_params: UserSearchParams = Depends(),
+    current_admin: UserResponse = Depends(require_superuser),
+) -> StreamingResponse:
+    """
+    Export users matching the search filters as NDJSON or CSV.
+
+    Accepts the same filters as ``GET /users/search``. The export is streamed,
+    so it can be used on tables of any size.
+    """
+    logger.info(
+        "Admin user export requested",
+        extra={"admin_id": str(current_admin.id), "format": export_format.value},
+    )
+    return _export_response(
+        "users",
+        User,
+        AdminUserResponse,
+        search_params.to_search_config(),
+        export_format,
+    )
+
+
+@router.get("/audit-logs")
+async def export_audit_logs(
+    export_format: ExportFormat = Query(
+        ExportFormat.NDJSON,
+        alias="format",
+        description="Export format",
+    ),
+    search_params: AuditLogSearchParams = Depends(),
+    current_admin: UserResponse = Depends(require_superuser),
+) -> StreamingResponse:
+    """
+    Export audit logs matching the filters as NDJSON or CSV.
+    """
+    logger.info(
+        "Admin audit log export requested",
+        extra={"admin_id": str(current_admin.id), "format": export_format.value},
+    )
+    return _export_response(
+        "audit-logs",
+        AuditLog,
+        AuditLogResponse,
+        search_params.to_search_config(),
+        export_format,
+    )
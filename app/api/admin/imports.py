@@ -0,0 +1,64 @@
+"""
+Admin import endpoints.
+
+Bulk-creates users from CSV or NDJSON request bodies.
+All endpoints require superuser privileges.
+"""
+
+import logging
+
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.admin import require_superuser
+from app.crud.system.admin import admin_user_crud
+from app.database.database import get_db
+from app.schemas.admin.admin import AdminUserImportResponse
+from app.schemas.auth.user import UserResponse
+from app.utils.export import ExportFormat
+from app.utils.user_import import iter_import_records
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/imports")
+
+
+@router.post("/users", response_model=AdminUserImportResponse)
+async def import_users(
+    request: Request,
+    import_format: ExportFormat = Query(
+        ExportFormat.CSV,
+        alias="format",
+        description="Format of the request body",
+    ),
+    current_admin: UserResponse = Depends(require_superuser),
+    db: AsyncSession = Depends(get_db),
+) -> AdminUserImportResponse:
+    """
+    Bulk-create users from a CSV or NDJSON request body.
+
+    Each record needs ``email``, ``username`` and ``password``, and may set
+    ``is_superuser`` and ``is_verified``. CSV bodies start with a header line.
+    The body is read as a stream, so large files are never held in memory.
+    Rows that fail validation or conflict with existing users are reported
+    with their line number; all other rows are created.
+    """
+    logger.info(
+        "Admin user import requested",
+        extra={"admin_id": str(current_admin.id), "format": import_format.value},
+    )
+
+    result = await admin_user_crud.import_users(
+        db,
+        iter_import_records(request.stream(), import_format),
+    )
+
+    logger.info(
+        "Admin user import completed",
+        extra={
+            "admin_id": str(current_admin.id),
+            "imported": result["imported"],
+            "failed": result["failed"],
+        },
+    )
+    return AdminUserImportResponse(**result)
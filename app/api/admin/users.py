@@ -13,9 +13,12 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.admin import require_superuser
-from app.crud.system.admin import admin_user_crud
+from app.crud.system.admin import BULK_USER_OPERATIONS, admin_user_crud
 from app.database.database import get_db
 from app.schemas.admin.admin import (
+    AdminBulkOperationJobRequest,
+    AdminBulkOperationJobResponse,
+    AdminBulkOperationJobStatus,
     AdminBulkOperationRequest,
     AdminBulkOperationResponse,
     AdminUserCreate,
@@ -26,10 +29,17 @@ from app.schemas.admin.admin import (
     AdminUserUpdate,
 )
 from app.schemas.auth.user import UserResponse
+from app.services.background.celery import (
+    get_task_status,
+    is_celery_enabled,
+    submit_task,
+)
 from app.utils.pagination import PaginatedResponse, PaginationParams
 
 logger = logging.getLogger(__name__)
 
+BULK_OPERATION_TASK = "app.services.celery_tasks.bulk_user_operation_task"
+
 router = APIRouter()
 
 
@@ -68,23 +78,17 @@ async def list_users(
     if oauth_provider is not None:
         filters["oauth_provider"] = oauth_provider
 
-    # Get users with pagination
-    users = await admin_user_crud.get_users(
+    # Get users with pagination, selecting only the response columns
+    user_responses = await admin_user_crud.get_user_responses(
         db=db,
         skip=pagination.skip,
         limit=pagination.limit,
-        is_superuser=is_superuser,
-        is_verified=is_verified,
-        is_deleted=is_deleted,
-        oauth_provider=oauth_provider,
+        filters=filters,
     )
 
     # Get total count with same filters
     total = await admin_user_crud.count(db, filters=filters)
 
-    # Convert to response models
-    user_responses = [AdminUserResponse.model_validate(user) for user in users]
-
     return AdminUserListResponse.create(
         items=user_responses,
         page=pagination.page,
@@ -400,6 +404,25 @@ async def get_user_statistics(
     return AdminUserStatistics(**stats)
 
 
+# Bulk operations an admin may not apply to their own account, with the same
+# errors as the single-user endpoints
+SELF_PROTECTED_OPERATIONS = {
+    "delete": "Cannot delete your own account",
+    "remove_superuser": "Cannot modify your own superuser status",
+}
+
+
+def _reject_own_account(
+    operation: str,
+    user_ids: list[UUID],
+    current_admin: UserResponse,
+) -> None:
+    """Refuse a bulk operation that would delete or demote the calling admin."""
+    detail = SELF_PROTECTED_OPERATIONS.get(operation)
+    if detail and current_admin.id in user_ids:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
 @router.post("/bulk-operations", response_model=AdminBulkOperationResponse)
 async def bulk_operations(
     request: AdminBulkOperationRequest,
@@ -416,43 +439,117 @@ async def bulk_operations(
         extra={"admin_id": str(current_admin.id), "operation": request.operation},
     )
 
-    successful = 0
-    failed = 0
-    failed_user_ids = []
-
-    for user_id in request.user_ids:
+    user_ids = list(dict.fromkeys(request.user_ids))
+    _reject_own_account(request.operation, user_ids, current_admin)
+    updated: set[UUID] = set()
+    if request.operation in BULK_USER_OPERATIONS:
         try:
-            if request.operation == "verify":
-                user = await admin_user_crud.toggle_verification_status(db, user_id)
-                if user and not user.is_verified:
-                    # If user was not verified, toggle again to verify them
-                    user = await admin_user_crud.toggle_verification_status(db, user_id)
-                if user:
-                    successful += 1
-                else:
-                    failed += 1
-                    failed_user_ids.append(user_id)
-            elif request.operation == "unverify":
-                user = await admin_user_crud.toggle_verification_status(db, user_id)
-                if user and user.is_verified:
-                    # If user was verified, toggle again to unverify them
-                    user = await admin_user_crud.toggle_verification_status(db, user_id)
-                if user:
-                    successful += 1
-                else:
-                    failed += 1
-                    failed_user_ids.append(user_id)
-            else:
-                failed += 1
-                failed_user_ids.append(user_id)
+            updated = set(
+                await admin_user_crud.bulk_update_users(
+                    db,
+                    user_ids,
+                    request.operation,
+                    performed_by=current_admin.id,
+                ),
+            )
         except Exception:
-            failed += 1
-            failed_user_ids.append(user_id)
+            logger.exception(
+                "Admin bulk operation failed",
+                extra={"operation": request.operation},
+            )
+
+    # Anything not returned by the UPDATE was missing, already in the target
+    # state for guarded operations, or part of a failed chunk
+    failed_user_ids = [user_id for user_id in user_ids if user_id not in updated]
 
     return AdminBulkOperationResponse(
         operation=request.operation,
-        total_users=len(request.user_ids),
-        successful=successful,
-        failed=failed,
+        total_users=len(user_ids),
+        successful=len(user_ids) - len(failed_user_ids),
+        failed=len(failed_user_ids),
         failed_user_ids=failed_user_ids,
     )
+
+
+@router.post(
+    "/bulk-operations/jobs",
+    response_model=AdminBulkOperationJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_bulk_operation_job(
+    request: AdminBulkOperationJobRequest,
+    current_admin: UserResponse = Depends(require_superuser),
+) -> AdminBulkOperationJobResponse:
+    """
+    Run a bulk operation on a very large list of users as a background job.
+
+    Poll ``GET /admin/bulk-operations/jobs/{job_id}`` for progress. Requires Celery.
+    """
+    if not is_celery_enabled():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Bulk operation jobs require Celery. Set ENABLE_CELERY=true.",
+        )
+    if request.operation not in BULK_USER_OPERATIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Operation '{request.operation}' is not supported for jobs",
+        )
+
+    _reject_own_account(request.operation, request.user_ids, current_admin)
+    user_ids = [str(user_id) for user_id in dict.fromkeys(request.user_ids)]
+    result = submit_task(
+        BULK_OPERATION_TASK,
+        request.operation,
+        user_ids,
+        str(current_admin.id),
+    )
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to submit bulk operation job",
+        )
+
+    logger.info(
+        "Admin bulk operation job submitted",
+        extra={
+            "admin_id": str(current_admin.id),
+            "operation": request.operation,
+            "job_id": result.id,
+            "total_users": len(user_ids),
+        },
+    )
+
+    return AdminBulkOperationJobResponse(
+        job_id=result.id,
+        operation=request.operation,
+        total_users=len(user_ids),
+        status="PENDING",
+    )
+
+
+@router.get(
+    "/bulk-operations/jobs/{job_id}",
+    response_model=AdminBulkOperationJobStatus,
+)
+async def get_bulk_operation_job(
+    job_id: str,
+    current_admin: UserResponse = Depends(require_superuser),
+) -> AdminBulkOperationJobStatus:
+    """
+    Get progress of a bulk operation job.
+    """
+    if not is_celery_enabled():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Bulk operation jobs require Celery. Set ENABLE_CELERY=true.",
+        )
+
+    task_status = get_task_status(job_id)
+    if task_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+
+    return AdminBulkOperationJobStatus.from_task_status(dict(task_status))
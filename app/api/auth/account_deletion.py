@@ -114,6 +114,9 @@ async def request_account_deletion(
                 email_sent=False,
             )
 
+        # Commit before sending so the emailed link works as soon as it arrives
+        await db.commit()
+
         # Send deletion confirmation email
         email_sent = email_service.send_account_deletion_email(
             str(user.email),
@@ -324,6 +327,10 @@ async def cancel_account_deletion(
                 deletion_cancelled=False,
             )
 
+        # A pending confirmation link must not outlive the cancellation
+        if email_service:
+            await email_service.revoke_deletion_token(db, str(user.id))
+
         # Log account deletion cancellation
         await log_account_deletion(
             db,
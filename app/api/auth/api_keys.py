@@ -13,13 +13,19 @@ from app.schemas.auth.user import (
     APIKeyRotateResponse,
     UserResponse,
 )
+from app.services.middleware.http_cache import SENSITIVE, cache_policy
 from app.utils.pagination import PaginationMetadata, PaginationParams
 
 router = APIRouter()
 logger = get_auth_logger()
 
 
-@router.post("/api-keys", response_model=APIKeyCreateResponse, status_code=201)
+@router.post(
+    "/api-keys",
+    response_model=APIKeyCreateResponse,
+    status_code=201,
+    dependencies=[Depends(cache_policy(SENSITIVE))],
+)
 async def create_api_key(
     api_key_data: APIKeyCreate,
     current_user: UserResponse = Depends(get_current_user),
@@ -154,7 +160,11 @@ async def deactivate_api_key(
     )
 
 
-@router.post("/api-keys/{key_id}/rotate", response_model=APIKeyRotateResponse)
+@router.post(
+    "/api-keys/{key_id}/rotate",
+    response_model=APIKeyRotateResponse,
+    dependencies=[Depends(cache_policy(SENSITIVE))],
+)
 async def rotate_api_key(
     key_id: str,
     current_user: UserResponse = Depends(get_current_user),
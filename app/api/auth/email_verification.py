@@ -47,6 +47,9 @@ async def resend_verification_email(
             email_sent=False,
         )
 
+    # Commit before sending so the emailed link works as soon as it arrives
+    await db.commit()
+
     # Send verification email
     email_sent = email_service.send_verification_email(
         str(user.email),
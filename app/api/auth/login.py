@@ -21,6 +21,11 @@ from app.services import (
     rate_limit_oauth,
     rate_limit_register,
 )
+from app.services.middleware.http_cache import (
+    PUBLIC,
+    SENSITIVE,
+    cache_policy,
+)
 from app.services.monitoring.audit import log_login_attempt, log_oauth_login
 
 router = APIRouter()
@@ -114,6 +119,8 @@ async def register_user(
                 str(db_user.id),
             )
             if verification_token:
+                # Commit before sending so the emailed link works on arrival
+                await db.commit()
                 email_service.send_verification_email(
                     str(user.email),
                     str(user.username),
@@ -178,7 +185,11 @@ async def register_user(
         return UserResponse.model_validate(db_user)
 
 
-@router.post("/login", response_model=Token)
+@router.post(
+    "/login",
+    response_model=Token,
+    dependencies=[Depends(cache_policy(SENSITIVE))],
+)
 @rate_limit_login
 async def login_user(
     request: Request,
@@ -284,7 +295,11 @@ async def login_user(
         _handle_login_error(e)
 
 
-@router.post("/oauth/login", response_model=Token)
+@router.post(
+    "/oauth/login",
+    response_model=Token,
+    dependencies=[Depends(cache_policy(SENSITIVE))],
+)
 @rate_limit_oauth
 async def oauth_login(
     request: Request,
@@ -486,7 +501,7 @@ async def oauth_login(
         ) from e
 
 
-@router.get("/oauth/providers")
+@router.get("/oauth/providers", dependencies=[Depends(cache_policy(PUBLIC))])
 async def get_oauth_providers() -> dict[str, list[str]]:
     """Get available OAuth providers."""
     if not oauth_service:
@@ -87,6 +87,9 @@ async def forgot_password(
                 email_sent=False,
             )
 
+        # Commit before sending so the emailed link works as soon as it arrives
+        await db.commit()
+
         # Send password reset email
         email_sent = email_service.send_password_reset_email(
             str(user.email),
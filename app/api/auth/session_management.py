@@ -17,6 +17,7 @@ from app.schemas.auth.user import (
     SessionListResponse,
     UserResponse,
 )
+from app.services.middleware.http_cache import SENSITIVE, cache_policy
 from app.services.monitoring.audit import log_logout
 
 router = APIRouter()
@@ -32,7 +33,11 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-@router.post("/refresh", response_model=RefreshTokenResponse)
+@router.post(
+    "/refresh",
+    response_model=RefreshTokenResponse,
+    dependencies=[Depends(cache_policy(SENSITIVE))],
+)
 async def refresh_token(
     request: Request,
     db: AsyncSession = Depends(get_db),
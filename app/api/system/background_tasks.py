@@ -56,6 +56,10 @@ class TaskStatusResponse(BaseModel):
         description="Task result if completed successfully",
     )
     error: str | None = Field(None, description="Error message if task failed")
+    progress: dict[str, Any] | None = Field(
+        None,
+        description="Progress reported by a running task",
+    )
 
 
 class TaskCancelResponse(BaseModel):
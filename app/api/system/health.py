@@ -22,8 +22,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.users.auth import require_api_scope
 from app.core.config import settings
 from app.core.config.logging_config import get_app_logger
+from app.database.api_key_filter import api_key_filter
 from app.database.database import get_db
+from app.database.pool_checker import pool_checker_stats
 from app.schemas.auth.user import APIKeyUser
+from app.services.cache import get_cache_stats
+from app.utils.search_filter import get_search_query_cache_stats
 
 router = APIRouter()
 logger = get_app_logger()
@@ -129,6 +133,9 @@ async def health_check(db: AsyncSession = Depends(get_db)) -> dict[str, Any]:
                     "checked_in": getattr(async_pool, "checkedin", lambda: 0)(),
                     "checked_out": getattr(async_pool, "checkedout", lambda: 0)(),
                     "overflow": getattr(async_pool, "overflow", lambda: 0)(),
+                    "evicted": pool_checker_stats.evicted,
+                    "recycled": pool_checker_stats.recycled,
+                    "pool_invalidations": pool_checker_stats.pool_invalidations,
                 },
             }
 
@@ -279,6 +286,15 @@ async def readiness_check(db: AsyncSession = Depends(get_db)) -> ReadinessRespon
     Returns:
         dict: Readiness status
     """
+    from app.database.warmup import is_warmed_up
+
+    # Don't take traffic before the startup warm-up has finished
+    if not is_warmed_up():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service warming up",
+        )
+
     try:
         # Test database connectivity
         result = await db.execute(text("SELECT 1"))
@@ -364,6 +380,9 @@ async def database_health_check(
                 "pool_size": settings.DB_POOL_SIZE,
                 "max_overflow": settings.DB_MAX_OVERFLOW,
                 "pool_recycle": settings.DB_POOL_RECYCLE,
+                "pre_ping": settings.DB_POOL_PRE_PING,
+                "check_interval": settings.DB_POOL_CHECK_INTERVAL,
+                **pool_checker_stats.as_dict(),
             },
             database_url=settings.DATABASE_URL.split("@")[-1],
         )
@@ -449,6 +468,9 @@ async def metrics_endpoint(
                 "rate_limiting_enabled": settings.ENABLE_RATE_LIMITING,
                 "sentry_enabled": settings.ENABLE_SENTRY,
             },
+            "search_query_cache": get_search_query_cache_stats(),
+            "cache": get_cache_stats(),
+            "api_key_filter": api_key_filter.as_dict(),
         },
         timestamp=time.time(),
     )
@@ -177,18 +177,14 @@ async def list_deleted_users(
     - ?deleted_by=user-uuid&sort_by=deleted_at&sort_order=desc
     - ?deletion_reason=spam&deleted_after=2024-01-01T00:00:00Z
     """
-    # Get deleted users with pagination and search
-    users = await admin_user_crud.get_deleted_users(
+    # Get the filtered page of deleted users and its total in a single query
+    users, total = await admin_user_crud.search(
         db=db,
+        config=search_params.to_search_config(),
         skip=pagination.skip,
         limit=pagination.limit,
     )
 
-    # Get total count with same filters
-    total = await admin_user_crud.count_deleted_users(
-        db=db,
-    )
-
     # Convert to response models ensuring required fields have correct types
     user_responses: list[DeletedUserResponse] = []
     for user in users:
@@ -252,18 +248,14 @@ async def search_deleted_users(
     - sort_field: Field used for sorting
     - sort_order: Sort direction used
     """
-    # Get deleted users with pagination and search
-    users = await admin_user_crud.get_deleted_users(
+    # Get the filtered page of deleted users and its total in a single query
+    users, total = await admin_user_crud.search(
         db=db,
+        config=search_params.to_search_config(),
         skip=pagination.skip,
         limit=pagination.limit,
     )
 
-    # Get total count with same filters
-    total = await admin_user_crud.count_deleted_users(
-        db=db,
-    )
-
     # Convert to response models
     user_responses = []
     for user in users:
@@ -15,8 +15,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.crud.auth import api_key as crud_api_key
+from app.crud.auth import fast_path
 from app.crud.auth import user as crud_user
+from app.crud.auth.fast_path import APIKeyRecord, UserRecord
 from app.database.database import get_db
+from app.models import APIKey, User
 from app.schemas.auth.user import APIKeyUser, TokenData
 
 
@@ -51,7 +54,11 @@ async def get_current_user(
         raise credentials_exception from e
 
     # Fetch by user id (subject)
-    user = await crud_user.get_user_by_id(db, user_id=str(user_id))
+    user: UserRecord | User | None
+    if settings.ENABLE_DB_FAST_PATH:
+        user = await fast_path.get_user_by_id(db, str(user_id))
+    else:
+        user = await crud_user.get_user_by_id(db, user_id=str(user_id))
     if user is None:
         raise credentials_exception
     # Return raw ORM user object; tests mock with SimpleNamespace
@@ -83,7 +90,11 @@ async def get_api_key_user(
     api_key = authorization[7:]  # Remove "Bearer " prefix
 
     # Verify the API key
-    db_api_key = await crud_api_key.verify_api_key_in_db(db, api_key)
+    db_api_key: APIKeyRecord | APIKey | None
+    if settings.ENABLE_DB_FAST_PATH:
+        db_api_key = await fast_path.verify_api_key_in_db(db, api_key)
+    else:
+        db_api_key = await crud_api_key.verify_api_key_in_db(db, api_key)
     if not db_api_key:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -5,19 +5,30 @@ This module provides the essential profile endpoints for user self-service,
 including viewing current user information and API key authentication.
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 
 from app.api.users.auth import get_api_key_user, get_current_user
 from app.schemas.auth.user import APIKeyUser, UserResponse
+from app.services.middleware.http_cache import (
+    PRIVATE,
+    cache_policy,
+    check_not_modified,
+)
 
 router = APIRouter()
 
 
-@router.get("/me")
+@router.get("/me", dependencies=[Depends(cache_policy(PRIVATE))])
 async def read_current_user(
+    request: Request,
     current_user: UserResponse = Depends(get_current_user),
 ) -> UserResponse:
     """Get current user information via JWT token authentication."""
+    # Every change to the user bumps updated_at, so a matching ETag is answered
+    # without serializing the user
+    updated_at = getattr(current_user, "updated_at", None)
+    if updated_at is not None:
+        check_not_modified(request, current_user.id, updated_at.isoformat())
     return current_user
 
 
@@ -39,7 +39,9 @@ async def list_users(
     with powerful search and filtering capabilities.
 
     Search and Filter Options:
-    - search: Text search in username and email fields
+    - search: Text search in username and email fields (at least 3 characters)
+    - use_full_text_search: Ranked full-text search instead of substring matching
+    - use_prefix_matching: Match full-text search terms as word prefixes
     - is_verified: Filter by verification status
     - oauth_provider: Filter by OAuth provider (google, apple, none)
     - is_superuser: Filter by superuser status
@@ -51,21 +53,18 @@ async def list_users(
 
     Examples:
     - ?search=trish&is_verified=true
-    - ?oauth_provider=google&sort_by=date_created&sort_order=desc
+    - ?search=trish&use_full_text_search=true&use_prefix_matching=true
+    - ?oauth_provider=google&sort_by=created_at&sort_order=desc
     - ?date_created_after=2024-01-01T00:00:00Z
     """
-    # Get users with pagination and search
-    users = await admin_user_crud.get_users(
+    # Get the filtered page and its total in a single query
+    users, total = await admin_user_crud.search(
         db=db,
+        config=search_params.to_search_config(),
         skip=pagination.skip,
         limit=pagination.limit,
     )
 
-    # Get total count with same filters
-    total = await admin_user_crud.count(
-        db=db,
-    )
-
     # Convert to response models
     user_responses = [UserResponse.model_validate(user) for user in users]
 
@@ -99,18 +98,14 @@ async def search_users(
     - sort_field: Field used for sorting
     - sort_order: Sort direction used
     """
-    # Get users with pagination and search
-    users = await admin_user_crud.get_users(
+    # Get the filtered page and its total in a single query
+    users, total = await admin_user_crud.search(
         db=db,
+        config=search_params.to_search_config(),
         skip=pagination.skip,
         limit=pagination.limit,
     )
 
-    # Get total count with same filters
-    total = await admin_user_crud.count(
-        db=db,
-    )
-
     # Convert to response models
     user_responses = [UserResponse.model_validate(user) for user in users]
 
@@ -12,7 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.crud.auth.user import get_user_by_email
-from app.database.database import get_db
+from app.database.database import get_autocommit_db
 from app.schemas.auth.user import UserCreate
 
 # Configure logging
@@ -129,7 +129,7 @@ async def bootstrap_superuser() -> None:
     logger.info("Checking for superuser bootstrap...")
 
     # Get database session
-    async for db in get_db():
+    async for db in get_autocommit_db():
         try:
             # Check if any superuser exists
             from sqlalchemy import select
@@ -13,11 +13,12 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import func, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.database.database import get_db
+from app.utils.search_filter import SearchFilterBuilder, SearchFilterConfig
 
 # Removed schemas import to avoid circular dependency - using local imports
 
@@ -39,12 +40,49 @@ ModelType = TypeVar("ModelType", bound=HasId)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 ResponseSchemaType = TypeVar("ResponseSchemaType", bound=BaseModel)
+# Schema of a projected listing, which may differ from ResponseSchemaType
+ProjectionT = TypeVar("ProjectionT", bound=BaseModel)
 
 # Type alias for database sessions (now async only)
 DBSession: TypeAlias = AsyncSession
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# (model, schema) -> labelled columns needed to build the schema
+_projection_cache: dict[tuple[type, type[BaseModel]], tuple[Any, ...]] = {}
+
+
+def get_projection_columns(
+    model: type[Any],
+    schema: type[BaseModel],
+) -> tuple[Any, ...]:
+    """
+    Get the model columns needed to populate a response schema.
+
+    Schema fields are matched to mapped column attributes by name, and each
+    column is labelled with the field name so result rows map straight onto
+    the schema. Fields without a matching column (and columns without a
+    matching field) are skipped. The result is cached per model and schema.
+
+    Args:
+        model: SQLAlchemy model class
+        schema: Pydantic response schema
+
+    Returns:
+        tuple: Labelled column expressions to select
+    """
+    key = (model, schema)
+    columns = _projection_cache.get(key)
+    if columns is None:
+        column_keys = {attr.key for attr in inspect(model).column_attrs}
+        columns = tuple(
+            getattr(model, name).label(name)
+            for name in schema.model_fields
+            if name in column_keys
+        )
+        _projection_cache[key] = columns
+    return columns
+
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
@@ -183,6 +221,90 @@ class BaseAdminCRUD(
         result = await db.execute(query)
         return list(result.scalars().all())
 
+    async def get_multi_projected(
+        self,
+        db: DBSession,
+        schema: type[ProjectionT],
+        skip: int = 0,
+        limit: int = 100,
+        filters: dict[str, Any] | None = None,
+    ) -> list[ProjectionT]:
+        """
+        Get multiple records as response schemas, selecting only their columns.
+
+        Unlike get_multi, this never instantiates ORM objects: only the columns
+        the schema needs are selected and each response is validated directly
+        from the row mapping. Use it for read-only listings.
+
+        Args:
+            db: Database session
+            schema: Response schema to build from each row
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            filters: Optional filters to apply
+
+        Returns:
+            List[ProjectionT]: Responses for the requested page
+        """
+        query = select(*get_projection_columns(self.model, schema))
+
+        if filters:
+            for field, value in filters.items():
+                if hasattr(self.model, field):
+                    query = query.where(getattr(self.model, field) == value)
+
+        # Order by primary key so pages are stable between requests
+        query = query.order_by(self.model.id).offset(skip).limit(limit)
+
+        result = await db.execute(query)
+        return [schema.model_validate(row) for row in result.mappings()]
+
+    async def search(
+        self,
+        db: DBSession,
+        config: SearchFilterConfig,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[ModelType], int]:
+        """
+        Get a filtered page of records together with the filtered total.
+
+        The total is computed in the same round trip with a ``count(*) OVER ()``
+        window, so listing endpoints don't need a second COUNT query.
+
+        Args:
+            db: Database session
+            config: Search and filter configuration to apply server-side
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            tuple: Records on the requested page and total number of matches
+        """
+        statement, params = SearchFilterBuilder(self.model).build_statement(config)
+        query = (
+            statement.add_columns(func.count().over().label("total_count"))
+            # Tie-break on the primary key so pages stay stable between requests
+            .order_by(self.model.id)
+            .offset(skip)
+            .limit(limit)
+        )
+
+        result = await db.execute(query, params)
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], int(rows[0][1])
+
+        # An empty page past the end carries no window value; fall back to a
+        # plain count so clients still see the real total.
+        if skip > 0:
+            count_query = select(func.count()).select_from(
+                statement.order_by(None).subquery(),
+            )
+            count_result = await db.execute(count_query, params)
+            return [], int(count_result.scalar() or 0)
+        return [], 0
+
     async def get(self, db: DBSession, record_id: str | UUID) -> ModelType | None:
         """
         Get a single record by ID.
@@ -279,8 +401,6 @@ class BaseAdminCRUD(
         Returns:
             int: Number of records
         """
-        from sqlalchemy import func
-
         query = select(func.count(self.model.id))
 
         # Apply filters if provided
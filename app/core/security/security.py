@@ -1,6 +1,14 @@
+import asyncio
+import atexit
 import base64
 import hashlib
+import hmac
+import os
+import re
 import secrets
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -41,6 +49,60 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+_hash_executor: ProcessPoolExecutor | None = None
+
+
+def _get_hash_executor() -> ProcessPoolExecutor:
+    """Get the shared process pool used for bulk password hashing."""
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS or None,
+        )
+        # Scripts and tests don't run the app lifespan that normally shuts it down
+        atexit.register(shutdown_hash_executor)
+    return _hash_executor
+
+
+def shutdown_hash_executor() -> None:
+    """Stop the bulk password hashing worker processes, if started."""
+    global _hash_executor
+    if _hash_executor is not None:
+        atexit.unregister(shutdown_hash_executor)
+        _hash_executor.shutdown(wait=True, cancel_futures=True)
+        _hash_executor = None
+
+
+def _hash_password_batch(passwords: list[str]) -> list[str]:
+    return [pwd_context.hash(password) for password in passwords]
+
+
+async def get_password_hashes(passwords: Sequence[str]) -> list[str]:
+    """Hash many passwords across worker processes, preserving order.
+
+    bcrypt is CPU-bound and holds the GIL, so bulk hashing in the event loop
+    (or a thread pool) would serialize on one core and block other requests.
+    """
+    if not passwords:
+        return []
+    workers = settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+    batch_size = -(-len(passwords) // workers)
+    batches = [
+        list(passwords[start : start + batch_size])
+        for start in range(0, len(passwords), batch_size)
+    ]
+
+    loop = asyncio.get_running_loop()
+    executor = _get_hash_executor()
+    results = await asyncio.gather(
+        *(
+            loop.run_in_executor(executor, _hash_password_batch, batch)
+            for batch in batches
+        ),
+    )
+    return [hashed for batch in results for hashed in batch]
+
+
 def create_refresh_token() -> str:
     """Create a cryptographically secure refresh token."""
     return secrets.token_urlsafe(32)
@@ -64,15 +126,47 @@ def fingerprint_refresh_token(token: str) -> str:
     return hashlib.sha256(token.encode("utf-8")).hexdigest()
 
 
+def fingerprint_one_time_token(token: str) -> str:
+    """Deterministic fingerprint (SHA-256 hex) of an emailed one-time token."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
 # API Key functions
+
+# sk_, the issue time (Unix seconds, 8 hex digits), 32 random bytes, then a
+# tag signing both, so that scanners can't pass made-up keys off as new
+_API_KEY_PATTERN = re.compile(r"(sk_([0-9a-f]{8})[A-Za-z0-9_-]{43})([0-9a-f]{8})")
+
+
+def _api_key_tag(body: str) -> str:
+    return hmac.new(
+        settings.SECRET_KEY.encode("utf-8"),
+        body.encode("ascii"),
+        hashlib.sha256,
+    ).hexdigest()[:8]
+
+
 def generate_api_key() -> str:
     """Generate a cryptographically secure API key."""
     # Generate 32 random bytes and encode as base64
     key_bytes = secrets.token_bytes(32)
     # Convert to base64 and remove padding
     key_b64 = base64.urlsafe_b64encode(key_bytes).decode("ascii").rstrip("=")
-    # Add prefix for easy identification
-    return f"sk_{key_b64}"
+    # Add prefix for easy identification, and the issue time so that keys
+    # newer than the API key filter are looked up instead of rejected
+    body = f"sk_{int(time.time()):08x}{key_b64}"
+    return body + _api_key_tag(body)
+
+
+def api_key_issued_at(key: str) -> float | None:
+    """When an API key was generated (Unix seconds), or None if not signed."""
+    match = _API_KEY_PATTERN.fullmatch(key)
+    if match is None or not hmac.compare_digest(
+        match.group(3),
+        _api_key_tag(match.group(1)),
+    ):
+        return None
+    return float(int(match.group(2), 16))
 
 
 def hash_api_key(key: str) -> str:
@@ -33,6 +33,12 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             "/api/auth/change-password": ["application/json"],
             "/api/auth/delete-account": ["application/json"],
             "/api/users": ["application/json"],
+            "/api/admin/imports": [
+                "text/csv",
+                "application/x-ndjson",
+                "application/json",
+                "text/plain",
+            ],
             "/api/admin": ["application/json"],
             "/api/system/health": ["application/json"],
             "/": ["text/html", "application/json"],
@@ -160,8 +166,15 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
                 hsts_value += "; preload"
             response.headers["Strict-Transport-Security"] = hsts_value
 
-        # Cache Control for sensitive endpoints
-        if request.url.path.startswith("/api/"):
+        # Cache Control for sensitive endpoints; routes that declared a cache
+        # policy get theirs from HTTPCacheMiddleware (imported here: app.services
+        # imports app.core.security)
+        from app.services.middleware.http_cache import CACHE_POLICY_STATE_KEY
+
+        if (
+            request.url.path.startswith("/api/")
+            and getattr(request.state, CACHE_POLICY_STATE_KEY, None) is None
+        ):
             response.headers["Cache-Control"] = (
                 "no-store, no-cache, must-revalidate, max-age=0"
             )
@@ -17,6 +17,12 @@ from .auth.api_key import (
     rotate_api_key,
     verify_api_key_in_db,
 )
+from .auth.one_time_token import (
+    consume_one_time_token,
+    delete_expired_one_time_tokens,
+    delete_user_one_time_tokens,
+    upsert_one_time_token,
+)
 from .auth.refresh_token import (
     cleanup_expired_tokens,
     create_refresh_token,
@@ -41,14 +47,11 @@ from .auth.user import (
     create_oauth_user,
     create_user,
     get_deleted_users,
-    get_user_by_deletion_token,
     get_user_by_email,
     get_user_by_id,
     get_user_by_id_any_status,
     get_user_by_oauth_id,
-    get_user_by_password_reset_token,
     get_user_by_username,
-    get_user_by_verification_token,
     get_users,
     get_users_for_deletion_reminder,
     get_users_for_permanent_deletion,
@@ -58,21 +61,30 @@ from .auth.user import (
     restore_user,
     schedule_user_deletion,
     soft_delete_user,
-    update_deletion_token,
-    update_password_reset_token,
     update_user_password,
-    update_verification_token,
     verify_user,
 )
 from .system.admin import AdminUserCRUD, admin_user_crud
 from .system.audit_log import (
+    audit_context_contains,
     cleanup_old_audit_logs,
     create_audit_log,
+    delete_audit_logs_in_range,
+    get_audit_log_histogram,
+    get_audit_logs_by_context,
     get_audit_logs_by_event_type,
     get_audit_logs_by_session,
     get_audit_logs_by_user,
     get_failed_audit_logs,
     get_recent_audit_logs,
+    search_audit_logs,
+)
+from .system.audit_rollup import (
+    AUDIT_ROLLUPS,
+    get_audit_rollup,
+    get_audit_rollup_top,
+    get_audit_rollup_watermarks,
+    refresh_audit_rollup,
 )
 
 __all__ = [
@@ -85,14 +97,8 @@ __all__ = [
     "get_user_by_oauth_id",
     "create_oauth_user",
     "verify_user",
-    "update_verification_token",
-    "get_user_by_verification_token",
-    "update_password_reset_token",
-    "get_user_by_password_reset_token",
     "reset_user_password",
     "update_user_password",
-    "update_deletion_token",
-    "get_user_by_deletion_token",
     "schedule_user_deletion",
     "confirm_user_deletion",
     "cancel_user_deletion",
@@ -132,6 +138,11 @@ __all__ = [
     "revoke_all_user_sessions",
     "verify_refresh_token_in_db",
     "enforce_session_limit",
+    # One-time Token CRUD operations
+    "upsert_one_time_token",
+    "consume_one_time_token",
+    "delete_user_one_time_tokens",
+    "delete_expired_one_time_tokens",
     # System CRUD operations
     "AdminUserCRUD",
     "admin_user_crud",
@@ -139,9 +150,19 @@ __all__ = [
     "get_audit_logs_by_user",
     "get_audit_logs_by_event_type",
     "get_audit_logs_by_session",
+    "get_audit_logs_by_context",
+    "audit_context_contains",
+    "search_audit_logs",
+    "get_audit_log_histogram",
     "get_recent_audit_logs",
     "get_failed_audit_logs",
     "cleanup_old_audit_logs",
+    "delete_audit_logs_in_range",
+    "AUDIT_ROLLUPS",
+    "refresh_audit_rollup",
+    "get_audit_rollup",
+    "get_audit_rollup_top",
+    "get_audit_rollup_watermarks",
     # Category modules
     "auth",
     "system",
@@ -12,6 +12,12 @@ from .api_key import (
     rotate_api_key,
     verify_api_key_in_db,
 )
+from .one_time_token import (
+    consume_one_time_token,
+    delete_expired_one_time_tokens,
+    delete_user_one_time_tokens,
+    upsert_one_time_token,
+)
 from .refresh_token import (
     cleanup_expired_tokens,
     enforce_session_limit,
@@ -34,14 +40,11 @@ from .user import (
     create_oauth_user,
     create_user,
     get_deleted_users,
-    get_user_by_deletion_token,
     get_user_by_email,
     get_user_by_id,
     get_user_by_id_any_status,
     get_user_by_oauth_id,
-    get_user_by_password_reset_token,
     get_user_by_username,
-    get_user_by_verification_token,
     get_users,
     get_users_for_deletion_reminder,
     get_users_for_permanent_deletion,
@@ -51,10 +54,7 @@ from .user import (
     restore_user,
     schedule_user_deletion,
     soft_delete_user,
-    update_deletion_token,
-    update_password_reset_token,
     update_user_password,
-    update_verification_token,
     verify_user,
 )
 
@@ -68,14 +68,8 @@ __all__ = [
     "get_user_by_oauth_id",
     "create_oauth_user",
     "verify_user",
-    "update_verification_token",
-    "get_user_by_verification_token",
-    "update_password_reset_token",
-    "get_user_by_password_reset_token",
     "reset_user_password",
     "update_user_password",
-    "update_deletion_token",
-    "get_user_by_deletion_token",
     "schedule_user_deletion",
     "confirm_user_deletion",
     "cancel_user_deletion",
@@ -114,4 +108,9 @@ __all__ = [
     "revoke_all_user_sessions",
     "verify_refresh_token_in_db",
     "enforce_session_limit",
+    # One-time Token CRUD
+    "upsert_one_time_token",
+    "consume_one_time_token",
+    "delete_user_one_time_tokens",
+    "delete_expired_one_time_tokens",
 ]
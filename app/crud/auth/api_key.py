@@ -2,16 +2,24 @@ import uuid
 from typing import TypeAlias
 
 from sqlalchemy import and_, func, select
-from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security.security import (
+    api_key_issued_at,
     fingerprint_api_key,
     generate_api_key,
     hash_api_key,
     verify_api_key,
 )
+from app.database.api_key_filter import api_key_filter, publish_api_key
+from app.database.database import commit_or_flush
+from app.database.invalidation import (
+    api_key_tag,
+    publish_invalidation,
+    user_api_keys_tag,
+)
 from app.models import APIKey
+from app.models.core.base import apply_column_defaults
 from app.schemas.auth.user import APIKeyCreate
 from app.utils.datetime_utils import utc_now
 
@@ -40,12 +48,11 @@ async def create_api_key(
     db_api_key.scopes = api_key_data.scopes
     db_api_key.expires_at = api_key_data.expires_at
 
+    apply_column_defaults(db_api_key)
     db.add(db_api_key)
-    await db.commit()
-    try:
-        await db.refresh(db_api_key)
-    except SQLAlchemyError:
-        pass
+    publish_invalidation(db, user_api_keys_tag(db_api_key.user_id))
+    publish_api_key(db, key_fp)
+    await commit_or_flush(db)
 
     return db_api_key
 
@@ -55,7 +62,7 @@ async def get_api_key_by_hash(db: DBSession, key_hash: str) -> APIKey | None:
     result = await db.execute(
         select(APIKey).filter(
             APIKey.key_hash == key_hash,
-            APIKey.is_deleted.is_(False),
+            APIKey.not_deleted(),
         ),
     )
 
@@ -67,14 +74,18 @@ async def verify_api_key_in_db(db: DBSession, raw_key: str) -> APIKey | None:
     """Verify an API key against the database."""
     # Narrow by deterministic fingerprint first, then bcrypt verify
     fp = fingerprint_api_key(raw_key)
+    if not api_key_filter.might_exist(fp, api_key_issued_at(raw_key)):
+        return None
     result = await db.execute(
         select(APIKey).filter(
             APIKey.key_fingerprint == fp,
-            APIKey.is_deleted.is_(False),
+            APIKey.not_deleted(),
         ),
     )
     api_key: APIKey | None = result.scalar_one_or_none()
-    if api_key and verify_api_key(raw_key, str(api_key.key_hash)):
+    if api_key is None:
+        api_key_filter.record_false_positive(fp)
+    elif verify_api_key(raw_key, str(api_key.key_hash)):
         if not api_key.is_active:
             return api_key
         if api_key.expires_at and api_key.expires_at <= utc_now():
@@ -96,7 +107,7 @@ async def get_user_api_keys(
         .filter(
             and_(
                 APIKey.user_id == user_id,
-                APIKey.is_deleted.is_(False),
+                APIKey.not_deleted(),
             ),
         )
         .order_by(APIKey.created_at.desc())
@@ -115,7 +126,7 @@ async def count_user_api_keys(db: DBSession, user_id: str) -> int:
         .filter(
             and_(
                 APIKey.user_id == user_id,
-                APIKey.is_deleted.is_(False),
+                APIKey.not_deleted(),
             ),
         ),
     )
@@ -132,7 +143,7 @@ async def get_api_key_by_id(
     query = select(APIKey).filter(
         and_(
             APIKey.id == key_id,
-            APIKey.is_deleted.is_(False),
+            APIKey.not_deleted(),
         ),
     )
 
@@ -155,7 +166,12 @@ async def deactivate_api_key(
         return False
 
     api_key.is_active = False
-    await db.commit()
+    publish_invalidation(
+        db,
+        api_key_tag(api_key.id),
+        user_api_keys_tag(api_key.user_id),
+    )
+    await commit_or_flush(db)
     return True
 
 
@@ -175,16 +191,24 @@ async def rotate_api_key(
     # Create a new key with the same properties
     new_raw_key = generate_api_key()
     new_key_hash = hash_api_key(new_raw_key)
+    new_key_fp = fingerprint_api_key(new_raw_key)
 
     new_api_key = APIKey()
     new_api_key.user_id = old_key.user_id
     new_api_key.key_hash = new_key_hash
+    new_api_key.key_fingerprint = new_key_fp
     new_api_key.label = old_key.label
     new_api_key.scopes = old_key.scopes
     new_api_key.expires_at = old_key.expires_at
 
     db.add(new_api_key)
-    await db.commit()
+    publish_invalidation(
+        db,
+        api_key_tag(old_key.id),
+        user_api_keys_tag(old_key.user_id),
+    )
+    publish_api_key(db, new_key_fp)
+    await commit_or_flush(db)
 
     return new_api_key, new_raw_key
 
@@ -197,7 +221,7 @@ async def get_all_api_keys(
     """Get all API keys (admin function)."""
     result = await db.execute(
         select(APIKey)
-        .filter(APIKey.is_deleted.is_(False))
+        .filter(APIKey.not_deleted())
         .order_by(APIKey.created_at.desc())
         .offset(skip)
         .limit(limit),
@@ -209,7 +233,7 @@ async def get_all_api_keys(
 async def count_all_api_keys(db: DBSession) -> int:
     """Count all API keys (admin function)."""
     result = await db.execute(
-        select(func.count()).select_from(APIKey).filter(APIKey.is_deleted.is_(False)),
+        select(func.count()).select_from(APIKey).filter(APIKey.not_deleted()),
     )
     count: int = int(result.scalar() or 0)
     return count
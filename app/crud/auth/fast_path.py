@@ -0,0 +1,192 @@
+"""
+Raw asyncpg fast path for the per-request auth lookups.
+
+get_current_user, get_api_key_user and access token refresh each run one of
+these lookups on almost every request. With ENABLE_DB_FAST_PATH they skip
+SQLAlchemy statement construction, compiled-cache lookups, ORM row processing
+and identity-map bookkeeping: the SQL below is fixed, is prepared once per
+pooled asyncpg connection and runs on the session's own connection (so it sees
+the request's transaction), and rows come back as NamedTuple records.
+
+Records are read-only snapshots. Load the ORM object to change a row.
+"""
+
+import uuid
+import weakref
+from datetime import datetime
+from typing import Any, NamedTuple, TypeAlias
+
+import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security.security import (
+    api_key_issued_at,
+    fingerprint_api_key,
+    fingerprint_refresh_token,
+    verify_api_key,
+    verify_refresh_token,
+)
+from app.database.api_key_filter import api_key_filter
+from app.models.core.base import ACTIVE_ROW_PREDICATE
+from app.utils.datetime_utils import utc_now
+
+# Type alias for async sessions only
+DBSession: TypeAlias = AsyncSession
+
+
+class UserRecord(NamedTuple):
+    """The user columns exposed by UserResponse, plus updated_at for its ETag."""
+
+    id: uuid.UUID
+    email: str
+    username: str
+    is_superuser: bool
+    is_verified: bool
+    created_at: datetime
+    oauth_provider: str | None
+    is_deleted: bool
+    deleted_at: datetime | None
+    deleted_by: uuid.UUID | None
+    deletion_reason: str | None
+    updated_at: datetime
+
+
+class APIKeyRecord(NamedTuple):
+    """An API key as needed to authenticate a request."""
+
+    id: uuid.UUID
+    user_id: uuid.UUID | None
+    label: str
+    scopes: list[str]
+    is_active: bool
+    expires_at: datetime | None
+
+
+class RefreshTokenRecord(NamedTuple):
+    """A valid refresh token."""
+
+    id: uuid.UUID
+    user_id: uuid.UUID
+    expires_at: datetime
+
+
+# The WHERE clauses mirror the ORM queries and use ACTIVE_ROW_PREDICATE so
+# the partial lookup indexes still apply.
+USER_BY_ID_SQL = f"""
+SELECT {", ".join(UserRecord._fields)}
+FROM users
+WHERE id = $1 AND {ACTIVE_ROW_PREDICATE}
+"""
+
+API_KEY_BY_FINGERPRINT_SQL = f"""
+SELECT key_hash, {", ".join(APIKeyRecord._fields)}
+FROM api_keys
+WHERE key_fingerprint = $1 AND {ACTIVE_ROW_PREDICATE}
+"""
+
+REFRESH_TOKEN_BY_FINGERPRINT_SQL = f"""
+SELECT token_hash, {", ".join(RefreshTokenRecord._fields)}
+FROM refresh_tokens
+WHERE token_fingerprint = $1
+  AND expires_at > $2
+  AND is_revoked = false
+  AND {ACTIVE_ROW_PREDICATE}
+"""
+
+FAST_PATH_STATEMENTS = (
+    USER_BY_ID_SQL,
+    API_KEY_BY_FINGERPRINT_SQL,
+    REFRESH_TOKEN_BY_FINGERPRINT_SQL,
+)
+
+# Prepared statements per asyncpg connection; entries go away with the
+# connection when the pool recycles it
+_prepared_statements: "weakref.WeakKeyDictionary[Any, dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _prepared(driver_connection: Any, sql: str) -> Any:
+    """Get the connection's prepared statement for sql, preparing it once."""
+    statements = _prepared_statements.setdefault(driver_connection, {})
+    statement = statements.get(sql)
+    if statement is None:
+        statement = await driver_connection.prepare(sql)
+        statements[sql] = statement
+    return statement
+
+
+async def prepare_fast_path_statements(driver_connection: Any) -> None:
+    """Prepare every fast-path statement on an asyncpg connection."""
+    for sql in FAST_PATH_STATEMENTS:
+        await _prepared(driver_connection, sql)
+
+
+async def _fetchrow(db: DBSession, sql: str, *args: Any) -> Any:
+    """Run a statement on the session's asyncpg connection."""
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    statement = await _prepared(driver_connection, sql)
+    try:
+        return await statement.fetchrow(*args)
+    except asyncpg.exceptions.InvalidCachedStatementError:
+        # The schema changed under the prepared statement; prepare it again
+        # on next use
+        _prepared_statements.get(driver_connection, {}).pop(sql, None)
+        raise
+
+
+async def get_user_by_id(db: DBSession, user_id: str) -> UserRecord | None:
+    """Fast-path equivalent of crud.auth.user.get_user_by_id."""
+    try:
+        user_uuid = uuid.UUID(str(user_id))
+    except ValueError:
+        return None
+    row = await _fetchrow(db, USER_BY_ID_SQL, user_uuid)
+    return UserRecord(*row) if row else None
+
+
+async def verify_api_key_in_db(db: DBSession, raw_key: str) -> APIKeyRecord | None:
+    """Fast-path equivalent of crud.auth.api_key.verify_api_key_in_db."""
+    fingerprint = fingerprint_api_key(raw_key)
+    if not api_key_filter.might_exist(fingerprint, api_key_issued_at(raw_key)):
+        return None
+    row = await _fetchrow(db, API_KEY_BY_FINGERPRINT_SQL, fingerprint)
+    if not row:
+        api_key_filter.record_false_positive(fingerprint)
+        return None
+    if not verify_api_key(raw_key, row[0]):
+        return None
+    return APIKeyRecord(*row[1:])
+
+
+async def verify_refresh_token_in_db(
+    db: DBSession,
+    raw_token: str,
+) -> RefreshTokenRecord | None:
+    """Fast-path equivalent of crud.auth.refresh_token.verify_refresh_token_in_db."""
+    row = await _fetchrow(
+        db,
+        REFRESH_TOKEN_BY_FINGERPRINT_SQL,
+        fingerprint_refresh_token(raw_token),
+        utc_now(),
+    )
+    if not row:
+        # Legacy tokens stored before fingerprints existed are found and
+        # migrated by the ORM implementation
+        from app.crud.auth.refresh_token import (
+            verify_refresh_token_in_db as verify_with_orm,
+        )
+
+        refresh_token = await verify_with_orm(db, raw_token)
+        if refresh_token is None:
+            return None
+        return RefreshTokenRecord(
+            refresh_token.id,
+            refresh_token.user_id,
+            refresh_token.expires_at,
+        )
+    if not verify_refresh_token(raw_token, row[0]):
+        return None
+    return RefreshTokenRecord(*row[1:])
@@ -0,0 +1,98 @@
+"""
+One-time token CRUD operations.
+
+Backs the database token store. Tokens are only ever stored and looked up by
+their SHA-256 fingerprint.
+"""
+
+import uuid
+from datetime import datetime
+from typing import TypeAlias
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.database import commit_or_flush
+from app.models import OneTimeToken
+from app.utils.datetime_utils import utc_now
+
+# Type alias for async sessions only
+DBSession: TypeAlias = AsyncSession
+
+
+async def upsert_one_time_token(
+    db: DBSession,
+    purpose: str,
+    user_id: str | uuid.UUID,
+    token_hash: str,
+    expires_at: datetime,
+) -> None:
+    """Store a token, replacing the user's pending token for the same purpose."""
+    statement = insert(OneTimeToken).values(
+        token_hash=token_hash,
+        purpose=purpose,
+        user_id=uuid.UUID(str(user_id)),
+        expires_at=expires_at,
+        created_at=utc_now(),
+    )
+    await db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[OneTimeToken.user_id, OneTimeToken.purpose],
+            set_={
+                "token_hash": statement.excluded.token_hash,
+                "expires_at": statement.excluded.expires_at,
+                "created_at": statement.excluded.created_at,
+            },
+        ),
+    )
+    await commit_or_flush(db)
+
+
+async def consume_one_time_token(
+    db: DBSession,
+    purpose: str,
+    token_hash: str,
+) -> uuid.UUID | None:
+    """
+    Delete an unexpired token and return the user it was issued to.
+
+    The lookup and the delete are one statement, so a token can be consumed
+    only once even under concurrent requests.
+    """
+    result = await db.execute(
+        delete(OneTimeToken)
+        .where(
+            OneTimeToken.token_hash == token_hash,
+            OneTimeToken.purpose == purpose,
+            OneTimeToken.expires_at > utc_now(),
+        )
+        .returning(OneTimeToken.user_id),
+    )
+    user_id: uuid.UUID | None = result.scalar_one_or_none()
+    await commit_or_flush(db)
+    return user_id
+
+
+async def delete_user_one_time_tokens(
+    db: DBSession,
+    user_id: str | uuid.UUID,
+    purpose: str,
+) -> None:
+    """Delete a user's pending token for a purpose."""
+    await db.execute(
+        delete(OneTimeToken).where(
+            OneTimeToken.user_id == uuid.UUID(str(user_id)),
+            OneTimeToken.purpose == purpose,
+        ),
+    )
+    await commit_or_flush(db)
+
+
+async def delete_expired_one_time_tokens(db: DBSession) -> int:
+    """Delete expired tokens and return how many were removed."""
+    result = await db.execute(
+        delete(OneTimeToken).where(OneTimeToken.expires_at <= utc_now()),
+    )
+    await commit_or_flush(db)
+    return int(result.rowcount or 0)
@@ -2,7 +2,6 @@ from datetime import datetime, timedelta
 from typing import TypeAlias
 
 from sqlalchemy import func, select
-from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -11,7 +10,10 @@ from app.core.security.security import (
     hash_refresh_token,
     verify_refresh_token,
 )
+from app.database.database import commit_or_flush
+from app.database.invalidation import publish_invalidation, user_sessions_tag
 from app.models import RefreshToken
+from app.models.core.base import apply_column_defaults
 from app.utils.datetime_utils import utc_now
 
 # Type alias for async sessions only
@@ -46,12 +48,10 @@ async def create_refresh_token(
     refresh_token.device_info = device_info
     refresh_token.ip_address = ip_address
 
+    apply_column_defaults(refresh_token)
     db.add(refresh_token)
-    await db.commit()
-    try:
-        await db.refresh(refresh_token)
-    except SQLAlchemyError:
-        pass
+    publish_invalidation(db, user_sessions_tag(user_id))
+    await commit_or_flush(db)
 
     return refresh_token
 
@@ -71,7 +71,11 @@ async def cleanup_expired_tokens(db: DBSession) -> int:
         token.is_revoked = True
         count += 1
 
-    await db.commit()
+    publish_invalidation(
+        db,
+        *{user_sessions_tag(token.user_id) for token in expired_tokens},
+    )
+    await commit_or_flush(db)
     return count
 
 
@@ -99,7 +103,8 @@ async def revoke_refresh_token(db: DBSession, token_hash: str) -> bool:
         return False
 
     token.is_revoked = True
-    await db.commit()
+    publish_invalidation(db, user_sessions_tag(token.user_id))
+    await commit_or_flush(db)
 
     return True
 
@@ -118,7 +123,8 @@ async def revoke_refresh_token_by_id(db: DBSession, token_id: str) -> bool:
     if not token:
         return False
     token.is_revoked = True
-    await db.commit()
+    publish_invalidation(db, user_sessions_tag(token.user_id))
+    await commit_or_flush(db)
     return True
 
 
@@ -129,6 +135,7 @@ async def get_user_sessions(db: DBSession, user_id: str) -> list[RefreshToken]:
             RefreshToken.user_id == user_id,
             RefreshToken.expires_at > utc_now(),
             RefreshToken.is_revoked.is_(False),
+            RefreshToken.not_deleted(),
         ),
     )
 
@@ -144,6 +151,7 @@ async def get_user_session_count(db: DBSession, user_id: str) -> int:
             RefreshToken.user_id == user_id,
             RefreshToken.expires_at > utc_now(),
             RefreshToken.is_revoked.is_(False),
+            RefreshToken.not_deleted(),
         ),
     )
     count: int = int(result.scalar() or 0)
@@ -157,7 +165,8 @@ async def revoke_all_user_sessions(db: DBSession, user_id: str) -> int:
     for session in sessions:
         session.is_revoked = True
 
-    await db.commit()
+    publish_invalidation(db, user_sessions_tag(user_id))
+    await commit_or_flush(db)
     return len(sessions)
 
 
@@ -177,6 +186,7 @@ async def verify_refresh_token_in_db(
             RefreshToken.token_fingerprint == fingerprint,
             RefreshToken.expires_at > utc_now(),
             RefreshToken.is_revoked.is_(False),
+            RefreshToken.not_deleted(),
         ),
     )
     candidate: RefreshToken | None = result.scalar_one_or_none()
@@ -195,7 +205,7 @@ async def verify_refresh_token_in_db(
         # Migrate legacy record in-place to hashed+fingerprint
         candidate.token_fingerprint = fingerprint
         candidate.token_hash = hash_refresh_token(raw_token)
-        await db.commit()
+        await commit_or_flush(db)
 
     # Verify using bcrypt hash
     if not verify_refresh_token(raw_token, str(candidate.token_hash)):
@@ -225,4 +235,5 @@ async def enforce_session_limit(
         for session in sessions_to_revoke:
             session.is_revoked = True
 
-        await db.commit()
+        publish_invalidation(db, user_sessions_tag(user_id))
+        await commit_or_flush(db)
@@ -1,12 +1,14 @@
 from datetime import datetime, timedelta
 from typing import TypeAlias
 
-from sqlalchemy import func, select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security.security import get_password_hash, verify_password
+from app.database.database import commit_or_flush
+from app.database.invalidation import publish_invalidation, user_tag
 from app.models import User
+from app.models.core.base import apply_column_defaults
 from app.schemas.auth.user import UserCreate
 from app.utils.datetime_utils import utc_now
 
@@ -16,7 +18,7 @@ DBSession: TypeAlias = AsyncSession
 
 async def get_user_by_email(db: DBSession, email: str) -> User | None:
     result = await db.execute(
-        select(User).filter(User.email == email, User.is_deleted.is_(False)),
+        select(User).filter(User.email == email, User.not_deleted()),
     )
     user: User | None = result.scalar_one_or_none()
     return user
@@ -24,7 +26,7 @@ async def get_user_by_email(db: DBSession, email: str) -> User | None:
 
 async def get_user_by_username(db: DBSession, username: str) -> User | None:
     result = await db.execute(
-        select(User).filter(User.username == username, User.is_deleted.is_(False)),
+        select(User).filter(User.username == username, User.not_deleted()),
     )
     user: User | None = result.scalar_one_or_none()
     return user
@@ -37,12 +39,9 @@ async def create_user(db: DBSession, user: UserCreate) -> User:
     db_user.username = user.username
     db_user.hashed_password = hashed_password
     db_user.is_superuser = user.is_superuser
+    apply_column_defaults(db_user)
     db.add(db_user)
-    await db.commit()
-    try:
-        await db.refresh(db_user)
-    except SQLAlchemyError:
-        pass
+    await commit_or_flush(db)
     return db_user
 
 
@@ -55,7 +54,7 @@ async def authenticate_user(db: DBSession, email: str, password: str) -> User |
 
 async def get_user_by_id(db: DBSession, user_id: str) -> User | None:
     result = await db.execute(
-        select(User).filter(User.id == user_id, User.is_deleted.is_(False)),
+        select(User).filter(User.id == user_id, User.not_deleted()),
     )
     user: User | None = result.scalar_one_or_none()
     return user
@@ -70,7 +69,7 @@ async def get_user_by_oauth_id(
         select(User).filter(
             User.oauth_provider == oauth_provider,
             User.oauth_id == oauth_id,
-            User.is_deleted.is_(False),
+            User.not_deleted(),
         ),
     )
     user: User | None = result.scalar_one_or_none()
@@ -92,12 +91,9 @@ async def create_oauth_user(
     db_user.oauth_id = oauth_id
     db_user.oauth_email = oauth_email
     db_user.is_verified = True
+    apply_column_defaults(db_user)
     db.add(db_user)
-    await db.commit()
-    try:
-        await db.refresh(db_user)
-    except SQLAlchemyError:
-        pass
+    await commit_or_flush(db)
     return db_user
 
 
@@ -107,81 +103,21 @@ async def verify_user(db: DBSession, user_id: str) -> bool:
         return False
 
     user.is_verified = True
-    user.verification_token = None
-    user.verification_token_expires = None
 
-    await db.commit()
+    publish_invalidation(db, user_tag(user_id))
+    await commit_or_flush(db)
     return True
 
 
-async def update_verification_token(
-    db: DBSession,
-    user_id: str,
-    token: str,
-    expires: datetime,
-) -> bool:
-    user = await get_user_by_id(db, user_id)
-    if not user:
-        return False
-
-    user.verification_token = token
-    user.verification_token_expires = expires
-
-    await db.commit()
-    return True
-
-
-async def get_user_by_verification_token(db: DBSession, token: str) -> User | None:
-    result = await db.execute(
-        select(User).filter(
-            User.verification_token == token,
-            User.verification_token_expires > utc_now(),
-            User.is_deleted.is_(False),
-        ),
-    )
-    user: User | None = result.scalar_one_or_none()
-    return user
-
-
-async def update_password_reset_token(
-    db: DBSession,
-    user_id: str,
-    token: str,
-    expires: datetime,
-) -> bool:
-    user = await get_user_by_id(db, user_id)
-    if not user:
-        return False
-
-    user.password_reset_token = token
-    user.password_reset_token_expires = expires
-
-    await db.commit()
-    return True
-
-
-async def get_user_by_password_reset_token(db: DBSession, token: str) -> User | None:
-    result = await db.execute(
-        select(User).filter(
-            User.password_reset_token == token,
-            User.password_reset_token_expires > utc_now(),
-            User.is_deleted.is_(False),
-        ),
-    )
-    user: User | None = result.scalar_one_or_none()
-    return user
-
-
 async def reset_user_password(db: DBSession, user_id: str, new_password: str) -> bool:
     user = await get_user_by_id(db, user_id)
     if not user:
         return False
 
     user.hashed_password = get_password_hash(new_password)
-    user.password_reset_token = None
-    user.password_reset_token_expires = None
 
-    await db.commit()
+    publish_invalidation(db, user_tag(user_id))
+    await commit_or_flush(db)
     return True
 
 
@@ -192,39 +128,11 @@ async def update_user_password(db: DBSession, user_id: str, new_password: str) -
 
     user.hashed_password = get_password_hash(new_password)
 
-    await db.commit()
-    return True
-
-
-async def update_deletion_token(
-    db: DBSession,
-    user_id: str,
-    token: str,
-    expires: datetime,
-) -> bool:
-    user = await get_user_by_id(db, user_id)
-    if not user:
-        return False
-
-    user.deletion_token = token
-    user.deletion_token_expires = expires
-
-    await db.commit()
+    publish_invalidation(db, user_tag(user_id))
+    await commit_or_flush(db)
     return True
 
 
-async def get_user_by_deletion_token(db: DBSession, token: str) -> User | None:
-    result = await db.execute(
-        select(User).filter(
-            User.deletion_token == token,
-            User.deletion_token_expires > utc_now(),
-            User.is_deleted.is_(False),
-        ),
-    )
-    user: User | None = result.scalar_one_or_none()
-    return user
-
-
 async def schedule_user_deletion(
     db: DBSession,
     user_id: str,
@@ -237,7 +145,8 @@ async def schedule_user_deletion(
     user.deletion_scheduled_for = scheduled_date
     user.deletion_requested_at = utc_now()
 
-    await db.commit()
+    publish_invalidation(db, user_tag(user_id))
+    await commit_or_flush(db)
     return True
 
 
@@ -251,10 +160,9 @@ async def confirm_user_deletion(db: DBSession, user_id: str) -> bool:
     user.deletion_scheduled_for = None
     user.deletion_requested_at = None
     user.deletion_confirmed_at = utc_now()
-    user.deletion_token = None
-    user.deletion_token_expires = None
 
-    await db.commit()
+    publish_invalidation(db, user_tag(user_id))
+    await commit_or_flush(db)
     return True
 
 
@@ -266,10 +174,9 @@ async def cancel_user_deletion(db: DBSession, user_id: str) -> bool:
     user.deletion_scheduled_for = None
     user.deletion_requested_at = None
     user.deletion_confirmed_at = None
-    user.deletion_token = None
-    user.deletion_token_expires = None
 
-    await db.commit()
+    publish_invalidation(db, user_tag(user_id))
+    await commit_or_flush(db)
     return True
 
 
@@ -280,7 +187,7 @@ async def get_users_for_deletion_reminder(db: DBSession) -> list[User]:
         select(User).filter(
             User.deletion_requested_at.is_not(None),
             User.deletion_scheduled_for <= reminder_date,
-            User.is_deleted.is_(False),
+            User.not_deleted(),
         ),
     )
     return list(result.scalars().all())
@@ -301,7 +208,7 @@ async def get_users_for_permanent_deletion(db: DBSession) -> list[User]:
 async def count_users(db: DBSession) -> int:
     """Count all non-deleted users."""
     result = await db.execute(
-        select(func.count()).select_from(User).filter(User.is_deleted.is_(False)),
+        select(func.count()).select_from(User).filter(User.not_deleted()),
     )
     count: int = int(result.scalar() or 0)
     return count
@@ -315,7 +222,8 @@ async def soft_delete_user(db: DBSession, user_id: str) -> bool:
     user.is_deleted = True
     user.deleted_at = utc_now()
 
-    await db.commit()
+    publish_invalidation(db, user_tag(user_id))
+    await commit_or_flush(db)
     return True
 
 
@@ -324,10 +232,24 @@ async def restore_user(db: DBSession, user_id: str) -> bool:
     if not user or not user.is_deleted:
         return False
 
+    # Email and username are only unique among active users, so another
+    # account may have claimed them since the deletion
+    result = await db.execute(
+        select(User.id)
+        .filter(
+            User.not_deleted(),
+            or_(User.email == user.email, User.username == user.username),
+        )
+        .limit(1),
+    )
+    if result.scalar_one_or_none() is not None:
+        return False
+
     user.is_deleted = False
     user.deleted_at = None
 
-    await db.commit()
+    publish_invalidation(db, user_tag(user_id))
+    await commit_or_flush(db)
     return True
 
 
@@ -337,7 +259,8 @@ async def permanently_delete_user(db: DBSession, user_id: str) -> bool:
         return False
 
     await db.delete(user)
-    await db.commit()
+    publish_invalidation(db, user_tag(user_id))
+    await commit_or_flush(db)
     return True
 
 
@@ -386,6 +309,6 @@ async def count_deleted_users(db: DBSession) -> int:
 async def get_users(db: DBSession, skip: int = 0, limit: int = 100) -> list[User]:
     """Get list of non-deleted users."""
     result = await db.execute(
-        select(User).filter(User.is_deleted.is_(False)).offset(skip).limit(limit),
+        select(User).filter(User.not_deleted()).offset(skip).limit(limit),
     )
     return list(result.scalars().all())
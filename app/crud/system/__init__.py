@@ -2,13 +2,25 @@
 
 from .admin import AdminUserCRUD, admin_user_crud
 from .audit_log import (
+    audit_context_contains,
     cleanup_old_audit_logs,
     create_audit_log,
+    delete_audit_logs_in_range,
+    get_audit_log_histogram,
+    get_audit_logs_by_context,
     get_audit_logs_by_event_type,
     get_audit_logs_by_session,
     get_audit_logs_by_user,
     get_failed_audit_logs,
     get_recent_audit_logs,
+    search_audit_logs,
+)
+from .audit_rollup import (
+    AUDIT_ROLLUPS,
+    get_audit_rollup,
+    get_audit_rollup_top,
+    get_audit_rollup_watermarks,
+    refresh_audit_rollup,
 )
 
 __all__ = [
@@ -20,7 +32,18 @@ __all__ = [
     "get_audit_logs_by_user",
     "get_audit_logs_by_event_type",
     "get_audit_logs_by_session",
+    "get_audit_logs_by_context",
+    "audit_context_contains",
+    "search_audit_logs",
+    "get_audit_log_histogram",
     "get_recent_audit_logs",
     "get_failed_audit_logs",
     "cleanup_old_audit_logs",
+    "delete_audit_logs_in_range",
+    # Audit Log Rollups
+    "AUDIT_ROLLUPS",
+    "refresh_audit_rollup",
+    "get_audit_rollup",
+    "get_audit_rollup_top",
+    "get_audit_rollup_watermarks",
 ]
@@ -5,17 +5,154 @@ This module provides admin-only CRUD operations for managing users and other res
 All operations require superuser privileges.
 """
 
+import logging
+import uuid
+from collections.abc import AsyncIterable, Callable, Sequence
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+import asyncpg
+from sqlalchemy import any_, bindparam, exists, or_, select, text, true, update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import aliased
 
 from app.core.admin.admin import BaseAdminCRUD, DBSession
-from app.core.security.security import get_password_hash
+from app.core.config import settings
+from app.core.security.security import get_password_hash, get_password_hashes
 from app.crud.auth import user as crud_user
+from app.database.invalidation import publish_invalidation, user_tag
 from app.models import User
-from app.schemas.admin.admin import AdminUserUpdate
+from app.models.core.base import apply_column_defaults
+from app.schemas.admin.admin import AdminUserResponse, AdminUserUpdate
 from app.schemas.auth.user import UserCreate, UserResponse
+from app.utils.datetime_utils import utc_now
+from app.utils.user_import import (
+    UserImportRow,
+    import_error,
+    validate_import_record,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bulk operations that map onto a single set-based UPDATE
+BULK_USER_OPERATIONS = frozenset(
+    {"verify", "unverify", "make_superuser", "remove_superuser", "delete", "restore"},
+)
+
+
+def _bulk_operation_update(
+    operation: str,
+    performed_by: UUID | None,
+) -> tuple[dict[str, Any], Any]:
+    """Get the column values and row guard for a bulk user operation."""
+    if operation == "verify":
+        return {"is_verified": True}, None
+    if operation == "unverify":
+        return {"is_verified": False}, None
+    if operation == "make_superuser":
+        return {"is_superuser": True}, None
+    if operation == "remove_superuser":
+        return {"is_superuser": False}, None
+    if operation == "delete":
+        values = {
+            "is_deleted": True,
+            "deleted_at": utc_now(),
+            "deleted_by": performed_by,
+        }
+        return values, User.not_deleted()
+    if operation == "restore":
+        values = {
+            "is_deleted": False,
+            "deleted_at": None,
+            "deleted_by": None,
+            "deletion_reason": None,
+        }
+        # Email and username are only unique among active users, so skip
+        # accounts whose email or username has since been taken
+        active = aliased(User)
+        identity_taken = exists().where(
+            active.not_deleted(),
+            or_(active.email == User.email, active.username == User.username),
+        )
+        return values, (User.is_deleted == true()) & ~identity_taken
+    msg = f"Unsupported bulk operation: {operation}"
+    raise ValueError(msg)
+
+
+# Per-connection staging table for bulk imports; rows vanish on commit
+USER_IMPORT_STAGING_TABLE = "user_import_staging"
+
+_USER_IMPORT_STAGING_COLUMNS = (
+    "line",
+    "id",
+    "email",
+    "username",
+    "hashed_password",
+    "is_superuser",
+    "is_verified",
+    "created_at",
+)
+
+_CREATE_USER_IMPORT_STAGING = text(
+    f"""
+    CREATE TEMPORARY TABLE IF NOT EXISTS {USER_IMPORT_STAGING_TABLE} (
+        line integer NOT NULL,
+        id uuid NOT NULL,
+        email varchar(254) NOT NULL,
+        username varchar(30) NOT NULL,
+        hashed_password varchar(255) NOT NULL,
+        is_superuser boolean NOT NULL,
+        is_verified boolean NOT NULL,
+        created_at timestamptz NOT NULL
+    ) ON COMMIT DELETE ROWS
+    """,
+)
+
+# Insert staged rows, skipping any that hit a unique index, and report the
+# skipped ones. Email and username are only unique among active users. The
+# outer SELECT sees users as of statement start, so a row that conflicts with
+# neither an active email nor username collided with an earlier row of the
+# same import.
+_MERGE_USER_IMPORT_STAGING = text(
+    f"""
+    WITH inserted AS (
+        INSERT INTO users (
+            id, email, username, hashed_password, is_superuser, is_verified,
+            is_deleted, created_at, updated_at
+        )
+        SELECT
+            id, email, username, hashed_password, is_superuser, is_verified,
+            false, created_at, created_at
+        FROM {USER_IMPORT_STAGING_TABLE}
+        ORDER BY line
+        ON CONFLICT DO NOTHING
+        RETURNING id
+    )
+    SELECT
+        s.line,
+        s.email,
+        s.username,
+        CASE
+            WHEN EXISTS (
+                SELECT 1 FROM users u
+                WHERE u.email = s.email AND u.is_deleted = false
+            )
+                THEN 'Email already registered'
+            WHEN EXISTS (
+                SELECT 1 FROM users u
+                WHERE u.username = s.username AND u.is_deleted = false
+            )
+                THEN 'Username already taken'
+            ELSE 'Duplicate of an earlier row in this import'
+        END AS reason
+    FROM {USER_IMPORT_STAGING_TABLE} s
+    LEFT JOIN inserted i ON i.id = s.id
+    WHERE i.id IS NULL
+    ORDER BY s.line
+    """,
+)
 
 
 class AdminUserCRUD(BaseAdminCRUD[User, UserCreate, AdminUserUpdate, UserResponse]):
@@ -70,6 +207,36 @@ class AdminUserCRUD(BaseAdminCRUD[User, UserCreate, AdminUserUpdate, UserRespons
 
         return await self.get_multi(db, skip=skip, limit=limit, filters=filters)
 
+    async def get_user_responses(
+        self,
+        db: DBSession,
+        skip: int = 0,
+        limit: int = 100,
+        filters: dict[str, Any] | None = None,
+    ) -> list[AdminUserResponse]:
+        """
+        Get a page of users as admin responses without loading ORM objects.
+
+        Only the columns used by AdminUserResponse are selected, so token
+        columns and the search vector are never read.
+
+        Args:
+            db: Database session
+            skip: Number of users to skip
+            limit: Maximum number of users to return
+            filters: Optional column filters (e.g. {"is_verified": True})
+
+        Returns:
+            List[AdminUserResponse]: Users matching criteria
+        """
+        return await self.get_multi_projected(
+            db,
+            AdminUserResponse,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+        )
+
     async def get_user_by_email(self, db: DBSession, email: str) -> User | None:
         """
         Get user by email address.
@@ -116,10 +283,10 @@ class AdminUserCRUD(BaseAdminCRUD[User, UserCreate, AdminUserUpdate, UserRespons
         db_user.hashed_password = hashed_password
         db_user.is_superuser = bool(user_data.is_superuser)
         db_user.is_verified = False
+        apply_column_defaults(db_user)
         db.add(db_user)
 
         await db.commit()
-        await db.refresh(db_user)
         return db_user
 
     async def update_user(
@@ -156,6 +323,7 @@ class AdminUserCRUD(BaseAdminCRUD[User, UserCreate, AdminUserUpdate, UserRespons
                 setattr(user, field, value)
 
         db.add(user)
+        publish_invalidation(db, user_tag(user.id))
         await db.commit()
         await db.refresh(user)
         return user
@@ -171,6 +339,7 @@ class AdminUserCRUD(BaseAdminCRUD[User, UserCreate, AdminUserUpdate, UserRespons
         Returns:
             bool: True if deleted, False if not found
         """
+        publish_invalidation(db, user_tag(user_id))
         return await self.delete(db, user_id)
 
     async def toggle_superuser_status(
@@ -194,6 +363,7 @@ class AdminUserCRUD(BaseAdminCRUD[User, UserCreate, AdminUserUpdate, UserRespons
 
         user.is_superuser = not user.is_superuser
         db.add(user)
+        publish_invalidation(db, user_tag(user.id))
         await db.commit()
         await db.refresh(user)
         return user
@@ -219,10 +389,190 @@ class AdminUserCRUD(BaseAdminCRUD[User, UserCreate, AdminUserUpdate, UserRespons
 
         user.is_verified = not user.is_verified
         db.add(user)
+        publish_invalidation(db, user_tag(user.id))
         await db.commit()
         await db.refresh(user)
         return user
 
+    async def bulk_update_users(
+        self,
+        db: DBSession,
+        user_ids: Sequence[UUID],
+        operation: str,
+        performed_by: UUID | None = None,
+        chunk_size: int | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> list[UUID]:
+        """
+        Apply a bulk operation with one UPDATE ... RETURNING per chunk of ids.
+
+        Each chunk is a single ``UPDATE users ... WHERE id = ANY(:ids)`` statement
+        committed on its own, so the number of round trips and transactions grows
+        with the number of chunks rather than the number of users. A chunk that
+        fails is rolled back and its ids are reported as not updated.
+
+        Args:
+            db: Database session
+            user_ids: IDs of users to update (duplicates are ignored)
+            operation: One of BULK_USER_OPERATIONS
+            performed_by: Admin performing the operation (recorded on delete)
+            chunk_size: IDs per statement, defaults to ADMIN_BULK_CHUNK_SIZE
+            on_progress: Called with (processed, updated) after each chunk
+
+        Returns:
+            List[UUID]: IDs of users that were updated
+        """
+        values, guard = _bulk_operation_update(operation, performed_by)
+        chunk_size = chunk_size or settings.ADMIN_BULK_CHUNK_SIZE
+
+        statement = update(User).where(
+            User.id == any_(bindparam("ids", type_=ARRAY(PG_UUID(as_uuid=True)))),
+        )
+        if guard is not None:
+            statement = statement.where(guard)
+        statement = (
+            statement.values(**values)
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        )
+
+        unique_ids = list(dict.fromkeys(user_ids))
+        updated: list[UUID] = []
+        for start in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[start : start + chunk_size]
+            try:
+                result = await db.execute(statement, {"ids": chunk})
+                chunk_updated = list(result.scalars().all())
+                publish_invalidation(db, *map(user_tag, chunk_updated))
+                await db.commit()
+            except SQLAlchemyError:
+                await db.rollback()
+                logger.exception(
+                    "Bulk user operation chunk failed",
+                    extra={"operation": operation, "chunk_size": len(chunk)},
+                )
+            else:
+                updated.extend(chunk_updated)
+
+            if on_progress is not None:
+                on_progress(start + len(chunk), len(updated))
+
+        return updated
+
+    async def import_users(
+        self,
+        db: DBSession,
+        records: AsyncIterable[tuple[int, dict[str, Any] | None]],
+        batch_size: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Bulk-create users from parsed import records.
+
+        Records are validated as they arrive and loaded in batches: passwords
+        are hashed in worker processes, rows are COPYed into a temporary
+        staging table and merged into users with a single INSERT ... SELECT
+        that skips conflicts. Each batch is committed on its own.
+
+        Args:
+            db: Database session
+            records: (line number, record) pairs, e.g. from iter_import_records
+            batch_size: Rows per batch, defaults to ADMIN_IMPORT_BATCH_SIZE
+
+        Returns:
+            Dict[str, Any]: total_rows, imported, failed and per-row errors
+        """
+        batch_size = batch_size or settings.ADMIN_IMPORT_BATCH_SIZE
+        total_rows = 0
+        imported = 0
+        errors: list[dict[str, Any]] = []
+        batch: list[UserImportRow] = []
+
+        async for line, record in records:
+            total_rows += 1
+            row, error = validate_import_record(line, record)
+            if row is None:
+                if error is not None:
+                    errors.append(error)
+                continue
+            batch.append(row)
+            if len(batch) >= batch_size:
+                imported += await self._import_user_batch(db, batch, errors)
+                batch = []
+
+        if batch:
+            imported += await self._import_user_batch(db, batch, errors)
+
+        errors.sort(key=lambda error: error["line"])
+        return {
+            "total_rows": total_rows,
+            "imported": imported,
+            "failed": total_rows - imported,
+            "errors": errors,
+        }
+
+    async def _import_user_batch(
+        self,
+        db: DBSession,
+        batch: list[UserImportRow],
+        errors: list[dict[str, Any]],
+    ) -> int:
+        """Hash, stage and merge one import batch, returning rows inserted."""
+        hashes = await get_password_hashes([row.password for row in batch])
+        now = utc_now()
+        staged = [
+            (
+                row.line,
+                uuid.uuid4(),
+                row.email,
+                row.username,
+                hashed,
+                row.is_superuser,
+                row.is_verified,
+                now,
+            )
+            for row, hashed in zip(batch, hashes, strict=True)
+        ]
+
+        try:
+            # Creating the staging table through the session also begins the
+            # transaction the COPY below runs in.
+            await db.execute(_CREATE_USER_IMPORT_STAGING)
+            connection = await db.connection()
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            if driver_connection is None:
+                msg = "User import needs a live asyncpg connection for COPY"
+                raise RuntimeError(msg)
+            await driver_connection.copy_records_to_table(
+                USER_IMPORT_STAGING_TABLE,
+                records=staged,
+                columns=_USER_IMPORT_STAGING_COLUMNS,
+            )
+            result = await db.execute(_MERGE_USER_IMPORT_STAGING)
+            conflicts = result.all()
+            await db.commit()
+        except (SQLAlchemyError, asyncpg.PostgresError):
+            await db.rollback()
+            logger.exception(
+                "User import batch failed",
+                extra={"first_line": batch[0].line, "rows": len(batch)},
+            )
+            errors.extend(
+                import_error(row.line, row._asdict(), "Database error") for row in batch
+            )
+            return 0
+
+        errors.extend(
+            {
+                "line": line,
+                "email": email,
+                "username": username,
+                "reason": reason,
+            }
+            for line, email, username, reason in conflicts
+        )
+        return len(batch) - len(conflicts)
+
     async def force_delete_user(self, db: DBSession, user_id: str | UUID) -> bool:
         """
         Force delete a user (bypasses normal deletion flow).
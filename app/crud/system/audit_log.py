@@ -1,16 +1,30 @@
 import uuid
-from datetime import timedelta
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from itertools import islice
 from typing import Any, TypeAlias
 
-from sqlalchemy import desc, select
+from sqlalchemy import ColumnElement, and_, delete, desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.database import commit_or_flush
 from app.models import AuditLog
+from app.models.core.base import apply_column_defaults
+from app.schemas.system.audit_log import AuditLogHistogramInterval
 from app.utils.datetime_utils import utc_now
+from app.utils.search_filter import SearchFilterBuilder, SearchFilterConfig
 
 # Type alias for async sessions only
 DBSession: TypeAlias = AsyncSession
 
+# date_trunc units offered for audit log histograms
+AUDIT_HISTOGRAM_INTERVALS = frozenset(
+    interval.value for interval in AuditLogHistogramInterval
+)
+
+# Upper bound on histogram buckets returned by one query
+AUDIT_HISTOGRAM_MAX_BUCKETS = 1000
+
 
 async def create_audit_log(
     db: DBSession,
@@ -39,12 +53,9 @@ async def create_audit_log(
     audit_log.success = success
     audit_log.context = context
     audit_log.session_id = session_id
+    apply_column_defaults(audit_log)
     db.add(audit_log)
-    await db.commit()
-    try:
-        await db.refresh(audit_log)
-    except Exception:  # tolerate any refresh failure in template context
-        pass
+    await commit_or_flush(db)
     return audit_log
 
 
@@ -142,6 +153,154 @@ async def get_failed_audit_logs(
     return list(result.scalars().all())
 
 
+def audit_context_contains(context: dict[str, Any]) -> ColumnElement[bool]:
+    """
+    Match audit logs whose context contains all the given key/value pairs.
+
+    Renders as ``context @> :value``, which the jsonb_path_ops GIN index
+    (ix_audit_log_context) serves. Nested objects match by containment too,
+    e.g. ``{"device": {"os": "ios"}}``.
+    """
+    return AuditLog.context.contains(context)
+
+
+async def get_audit_logs_by_context(
+    db: DBSession,
+    context: dict[str, Any],
+    event_type: str | None = None,
+    success: bool | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    limit: int = 100,
+    offset: int = 0,
+) -> list[AuditLog]:
+    """
+    Get audit logs whose context contains the given key/value pairs.
+
+    The containment filter can be combined with the event and time filters,
+    which the planner serves from ix_audit_log_event_success or the timestamp
+    index together with the context GIN index.
+
+    Args:
+        db: Database session
+        context: Key/value pairs the context must contain,
+            e.g. ``{"oauth_provider": "google"}``
+        event_type: Only logs of this event type
+        success: Only successful or only failed events
+        since: Only logs at or after this time
+        until: Only logs before this time
+        limit: Maximum number of logs to return
+        offset: Number of logs to skip
+
+    Returns:
+        List[AuditLog]: Matching logs, newest first
+    """
+    query = select(AuditLog).filter(audit_context_contains(context))
+    if event_type is not None:
+        query = query.filter(AuditLog.event_type == event_type)
+    if success is not None:
+        query = query.filter(AuditLog.success == success)
+    if since is not None:
+        query = query.filter(AuditLog.timestamp >= since)
+    if until is not None:
+        query = query.filter(AuditLog.timestamp < until)
+
+    result = await db.execute(
+        query.order_by(desc(AuditLog.timestamp)).offset(offset).limit(limit),
+    )
+    return list(result.scalars().all())
+
+
+async def search_audit_logs(
+    db: DBSession,
+    config: SearchFilterConfig,
+    limit: int = 100,
+    after: tuple[datetime, uuid.UUID] | None = None,
+) -> tuple[list[AuditLog], tuple[datetime, uuid.UUID] | None]:
+    """
+    Get one page of filtered audit logs, newest first, by keyset pagination.
+
+    Pages are ordered by (timestamp, id) and continue after the last row of
+    the previous page instead of using OFFSET, so deep pages cost the same
+    as the first. The bound on timestamp is a plain range condition, which
+    ix_audit_log_timestamp_user and ix_audit_log_event_success can serve.
+    Any sort in ``config`` is ignored.
+
+    Args:
+        db: Database session
+        config: Filters to apply
+        limit: Maximum number of logs to return
+        after: (timestamp, id) of the last log of the previous page
+
+    Returns:
+        tuple: The page of logs and the keyset position of the next page,
+            or None on the last page
+    """
+    statement, params = SearchFilterBuilder(AuditLog).build_statement(config)
+    statement = statement.order_by(None)
+    if after is not None:
+        timestamp, row_id = after
+        statement = statement.where(
+            AuditLog.timestamp <= timestamp,
+            or_(
+                AuditLog.timestamp < timestamp,
+                and_(AuditLog.timestamp == timestamp, AuditLog.id < row_id),
+            ),
+        )
+    statement = statement.order_by(
+        desc(AuditLog.timestamp),
+        desc(AuditLog.id),
+    ).limit(limit + 1)
+
+    result = await db.execute(statement, params)
+    logs = list(result.scalars().all())
+    if len(logs) <= limit:
+        return logs, None
+    logs = logs[:limit]
+    return logs, (logs[-1].timestamp, logs[-1].id)
+
+
+async def get_audit_log_histogram(
+    db: DBSession,
+    config: SearchFilterConfig,
+    interval: str = "hour",
+) -> list[tuple[datetime, int]]:
+    """
+    Count filtered audit logs per time bucket.
+
+    Buckets are ``date_trunc(interval, timestamp)`` in UTC, so a dashboard
+    can chart events without downloading rows. Empty buckets are omitted and
+    at most AUDIT_HISTOGRAM_MAX_BUCKETS buckets are returned, oldest first.
+
+    Args:
+        db: Database session
+        config: Filters to apply
+        interval: One of AUDIT_HISTOGRAM_INTERVALS
+
+    Returns:
+        List[tuple]: Bucket start and number of logs in the bucket
+
+    Raises:
+        ValueError: If the interval is not supported
+    """
+    if interval not in AUDIT_HISTOGRAM_INTERVALS:
+        msg = f"Unsupported histogram interval: {interval}"
+        raise ValueError(msg)
+
+    statement, params = SearchFilterBuilder(AuditLog).build_statement(config)
+    bucket = func.date_trunc(interval, AuditLog.timestamp, "UTC").label("bucket")
+    statement = (
+        statement.with_only_columns(bucket, func.count().label("count"))
+        .order_by(None)
+        .group_by(bucket)
+        .order_by(bucket)
+        .limit(AUDIT_HISTOGRAM_MAX_BUCKETS)
+    )
+
+    result = await db.execute(statement, params)
+    return [(row.bucket, row.count) for row in result.all()]
+
+
 async def cleanup_old_audit_logs(db: DBSession, days_to_keep: int = 90) -> int:
     """Clean up audit logs older than specified days.
 
@@ -164,3 +323,42 @@ async def cleanup_old_audit_logs(db: DBSession, days_to_keep: int = 90) -> int:
 
     await db.commit()
     return len(old_logs)
+
+
+async def delete_audit_logs_in_range(
+    db: DBSession,
+    start: datetime,
+    end: datetime,
+    batch_size: int = 5000,
+    ids: Iterable[uuid.UUID] | None = None,
+) -> int:
+    """
+    Delete audit logs in [start, end) in chunks, committing after each.
+
+    Short transactions keep row locks and WAL bursts small while large ranges
+    are purged, e.g. after archiving them. Pass the archived ids to leave
+    alone audit logs written into the range after it was archived; they are
+    read one chunk at a time, so they can be streamed from a file.
+
+    Returns:
+        int: Number of audit logs deleted
+    """
+    in_range = and_(AuditLog.timestamp >= start, AuditLog.timestamp < end)
+    deleted = 0
+    if ids is not None:
+        pending = iter(ids)
+        while chunk := list(islice(pending, batch_size)):
+            result = await db.execute(
+                delete(AuditLog).where(in_range, AuditLog.id.in_(chunk)),
+            )
+            await db.commit()
+            deleted += result.rowcount
+        return deleted
+
+    while True:
+        chunk = select(AuditLog.id).where(in_range).limit(batch_size).scalar_subquery()
+        result = await db.execute(delete(AuditLog).where(AuditLog.id.in_(chunk)))
+        await db.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
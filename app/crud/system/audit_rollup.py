@@ -0,0 +1,283 @@
+"""
+Audit log rollup CRUD operations.
+
+Rollups count audit events per time bucket and dimension (e.g. failed logins
+per IP per minute). A background job folds in only the audit logs recorded
+since each rollup's watermark, so dashboards read a few thousand rollup rows
+instead of aggregating millions of audit logs.
+
+The watermark is an audit log timestamp, and timestamps are taken before the
+writing transaction commits. The job therefore stays AUDIT_ROLLUP_LAG_SECONDS
+behind the present, and that lag must exceed the longest transaction that
+writes audit logs; a log that becomes visible after the job has passed its
+timestamp is never counted.
+"""
+
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Any, NamedTuple, TypeAlias
+
+from sqlalchemy import desc, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models import AuditLog, AuditLogRollup, AuditRollupWatermark
+from app.utils.datetime_utils import utc_now
+
+# Type alias for async sessions only
+DBSession: TypeAlias = AsyncSession
+
+# Dimension value recorded for events that lack one (e.g. no client IP)
+UNKNOWN_DIMENSION = ""
+
+
+class AuditRollupDefinition(NamedTuple):
+    """Which audit logs a rollup counts and how it groups them."""
+
+    interval: str  # date_trunc unit of the buckets
+    event_type: str
+    success: bool
+    dimension: Any  # SQL expression the counts are grouped by
+    description: str
+
+
+AUDIT_ROLLUPS: Mapping[str, AuditRollupDefinition] = MappingProxyType(
+    {
+        "failed_logins_per_ip_minute": AuditRollupDefinition(
+            interval="minute",
+            event_type="login_failed",
+            success=False,
+            dimension=AuditLog.ip_address,
+            description="Failed logins per client IP per minute",
+        ),
+        "api_key_usage_per_key_hour": AuditRollupDefinition(
+            interval="hour",
+            event_type="api_key_usage",
+            success=True,
+            dimension=AuditLog.context["api_key_id"].astext,
+            description="API key requests per key per hour",
+        ),
+    },
+)
+
+
+def get_rollup_definition(name: str) -> AuditRollupDefinition:
+    """
+    Get a rollup definition by name.
+
+    Raises:
+        ValueError: If the rollup doesn't exist
+    """
+    definition = AUDIT_ROLLUPS.get(name)
+    if definition is None:
+        msg = f"Unknown audit rollup: {name}"
+        raise ValueError(msg)
+    return definition
+
+
+def _source_filter(definition: AuditRollupDefinition) -> list[Any]:
+    # Equality on (event_type, success) plus a timestamp range stays on
+    # ix_audit_log_event_success
+    return [
+        AuditLog.event_type == definition.event_type,
+        AuditLog.success == definition.success,
+    ]
+
+
+async def _lock_watermark(
+    db: DBSession,
+    name: str,
+    definition: AuditRollupDefinition,
+    until: datetime,
+) -> datetime:
+    """Get a rollup's watermark, creating it on first use, and lock it."""
+    # A new rollup starts at its oldest matching audit log
+    first_event = (
+        select(func.min(AuditLog.timestamp))
+        .where(*_source_filter(definition))
+        .scalar_subquery()
+    )
+    await db.execute(
+        insert(AuditRollupWatermark)
+        .values(
+            rollup=name,
+            processed_until=func.coalesce(first_event, until),
+            updated_at=utc_now(),
+        )
+        .on_conflict_do_nothing(index_elements=[AuditRollupWatermark.rollup]),
+    )
+    # The row lock makes concurrent runs of the job wait instead of counting
+    # the same window twice
+    result = await db.execute(
+        select(AuditRollupWatermark.processed_until)
+        .where(AuditRollupWatermark.rollup == name)
+        .with_for_update(),
+    )
+    processed_until: datetime = result.scalar_one()
+    return processed_until
+
+
+def _upsert_counts(
+    name: str,
+    definition: AuditRollupDefinition,
+    since: datetime,
+    until: datetime,
+) -> Any:
+    """Build the statement adding the counts of one window to the rollup."""
+    bucket = func.date_trunc(definition.interval, AuditLog.timestamp, "UTC")
+    dimension = func.coalesce(definition.dimension, UNKNOWN_DIMENSION)
+    counts = (
+        select(literal(name), bucket, dimension, func.count())
+        .where(
+            *_source_filter(definition),
+            AuditLog.timestamp >= since,
+            AuditLog.timestamp < until,
+        )
+        .group_by(bucket, dimension)
+    )
+    statement = insert(AuditLogRollup).from_select(
+        ["rollup", "bucket_start", "dimension", "count"],
+        counts,
+    )
+    return statement.on_conflict_do_update(
+        index_elements=[
+            AuditLogRollup.rollup,
+            AuditLogRollup.bucket_start,
+            AuditLogRollup.dimension,
+        ],
+        set_={"count": AuditLogRollup.count + statement.excluded.count},
+    )
+
+
+async def refresh_audit_rollup(
+    db: DBSession,
+    name: str,
+    until: datetime | None = None,
+) -> int:
+    """
+    Fold audit logs recorded since the rollup's watermark into its counts.
+
+    Audit logs are processed in windows of at most
+    AUDIT_ROLLUP_MAX_WINDOW_HOURS. Each window's counts and the advanced
+    watermark are committed together, so an interrupted run resumes where it
+    stopped without double counting.
+
+    Args:
+        db: Database session
+        name: Rollup name from AUDIT_ROLLUPS
+        until: Process audit logs before this time, defaults to
+            AUDIT_ROLLUP_LAG_SECONDS ago. Audit logs that commit with an
+            older timestamp after their window was processed are not counted,
+            so an explicit value must also leave room for transactions still
+            in flight.
+
+    Returns:
+        int: Number of rollup buckets inserted or updated
+
+    Raises:
+        ValueError: If the rollup doesn't exist
+    """
+    definition = get_rollup_definition(name)
+    if until is None:
+        until = utc_now() - timedelta(seconds=settings.AUDIT_ROLLUP_LAG_SECONDS)
+    max_window = timedelta(hours=settings.AUDIT_ROLLUP_MAX_WINDOW_HOURS)
+
+    updated = 0
+    while True:
+        since = await _lock_watermark(db, name, definition, until)
+        if since >= until:
+            await db.commit()
+            return updated
+
+        window_end = min(until, since + max_window)
+        result = await db.execute(_upsert_counts(name, definition, since, window_end))
+        updated += result.rowcount
+        await db.execute(
+            update(AuditRollupWatermark)
+            .where(AuditRollupWatermark.rollup == name)
+            .values(processed_until=window_end, updated_at=utc_now()),
+        )
+        await db.commit()
+
+
+async def get_audit_rollup_watermarks(db: DBSession) -> dict[str, datetime]:
+    """Get the watermark of every rollup that has been refreshed."""
+    result = await db.execute(
+        select(AuditRollupWatermark.rollup, AuditRollupWatermark.processed_until),
+    )
+    return dict(result.tuples().all())
+
+
+async def get_audit_rollup(
+    db: DBSession,
+    name: str,
+    since: datetime,
+    until: datetime,
+    dimension: str | None = None,
+    limit: int = 10000,
+) -> list[AuditLogRollup]:
+    """
+    Get a rollup's buckets in a time range, oldest first.
+
+    Args:
+        db: Database session
+        name: Rollup name from AUDIT_ROLLUPS
+        since: Only buckets starting at or after this time
+        until: Only buckets starting before this time
+        dimension: Only buckets for this dimension value
+        limit: Maximum number of buckets to return
+
+    Returns:
+        List[AuditLogRollup]: Matching buckets ordered by time and dimension
+    """
+    query = select(AuditLogRollup).where(
+        AuditLogRollup.rollup == name,
+        AuditLogRollup.bucket_start >= since,
+        AuditLogRollup.bucket_start < until,
+    )
+    if dimension is not None:
+        query = query.where(AuditLogRollup.dimension == dimension)
+
+    result = await db.execute(
+        query.order_by(AuditLogRollup.bucket_start, AuditLogRollup.dimension).limit(
+            limit,
+        ),
+    )
+    return list(result.scalars().all())
+
+
+async def get_audit_rollup_top(
+    db: DBSession,
+    name: str,
+    since: datetime,
+    until: datetime,
+    limit: int = 20,
+) -> list[tuple[str, int]]:
+    """
+    Get the dimension values with the most events in a time range.
+
+    Args:
+        db: Database session
+        name: Rollup name from AUDIT_ROLLUPS
+        since: Only buckets starting at or after this time
+        until: Only buckets starting before this time
+        limit: Maximum number of dimension values to return
+
+    Returns:
+        List[tuple]: Dimension value and total count, highest first
+    """
+    total = func.sum(AuditLogRollup.count).label("total")
+    result = await db.execute(
+        select(AuditLogRollup.dimension, total)
+        .where(
+            AuditLogRollup.rollup == name,
+            AuditLogRollup.bucket_start >= since,
+            AuditLogRollup.bucket_start < until,
+        )
+        .group_by(AuditLogRollup.dimension)
+        .order_by(desc(total), AuditLogRollup.dimension)
+        .limit(limit),
+    )
+    return [(dimension, int(count)) for dimension, count in result.all()]
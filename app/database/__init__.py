@@ -1,3 +1,21 @@
-from .database import AsyncSessionLocal, Base, engine, get_db
+from .database import (
+    UNIT_OF_WORK_KEY,
+    AsyncSessionLocal,
+    Base,
+    commit_or_flush,
+    engine,
+    get_autocommit_db,
+    get_db,
+)
+from .invalidation import publish_invalidation
 
-__all__ = ["AsyncSessionLocal", "Base", "engine", "get_db"]
+__all__ = [
+    "UNIT_OF_WORK_KEY",
+    "AsyncSessionLocal",
+    "Base",
+    "commit_or_flush",
+    "engine",
+    "get_autocommit_db",
+    "get_db",
+    "publish_invalidation",
+]
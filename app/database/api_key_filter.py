@@ -0,0 +1,248 @@
+"""
+Per-worker Bloom filter of active API key fingerprints.
+
+Every API key a request presents is looked up by its fingerprint in
+verify_api_key_in_db, so a scanner sending random keys costs a query per
+request. Each worker keeps a Bloom filter of the fingerprints of
+active keys and rejects keys it has never seen without touching the database.
+Keys the filter might contain (including false positives, about
+API_KEY_FILTER_ERROR_RATE of random keys) are looked up as before.
+
+A filter miss must never reject a key that exists, so a miss only rejects
+keys the filter is known to be complete for:
+
+- the listener (app/services/auth/api_key_filter_listener.py) loads it from
+  the database at startup and every API_KEY_FILTER_REBUILD_INTERVAL seconds;
+- while the listener isn't connected, the filter is dropped and every key is
+  looked up;
+- keys carry their signed issue time (generate_api_key), and a key issued
+  after NEW_KEY_GRACE seconds before the last rebuild started is looked up
+  even if the filter misses it. It may have committed after the rebuild
+  loaded, and notifications from other workers can be late or lost;
+- create_api_key and rotate_api_key record the new fingerprint on the session
+  with publish_api_key(). When the session commits, it's added to this
+  worker's filter and sent to the other workers with ``pg_notify``, which
+  also covers keys without an issue time created by older releases.
+
+Bloom filters can't remove entries: deactivated keys stay in the filter, and
+are rejected by the lookup, until the next rebuild.
+"""
+
+import math
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.core.base import ACTIVE_ROW_PREDICATE
+
+API_KEY_CHANNEL = "api_key_created"
+
+PENDING_FINGERPRINTS_KEY = "pending_api_key_fingerprints"
+
+ACTIVE_FINGERPRINTS_SQL = f"""
+SELECT key_fingerprint
+FROM api_keys
+WHERE key_fingerprint IS NOT NULL AND is_active = true AND {ACTIVE_ROW_PREDICATE}
+"""
+
+# Keys issued up to this long (seconds) before a rebuild started may be missing
+# from it: clock skew between servers plus the longest create_api_key request
+NEW_KEY_GRACE = 300.0
+
+# Room for keys created between rebuilds before the error rate degrades
+MIN_CAPACITY = 1024
+CAPACITY_HEADROOM = 2
+
+_NOTIFY_SQL = text("SELECT pg_notify(:channel, :payload)")
+
+
+class BloomFilter:
+    """
+    A Bloom filter of SHA-256 hex fingerprints.
+
+    The fingerprints are uniformly distributed already, so bit positions are
+    taken from them by double hashing instead of hashing them again.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(capacity, 1)
+        self.size = max(
+            8,
+            math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2),
+        )
+        self.hash_count = min(
+            16,
+            max(1, round(self.size / capacity * math.log(2))),
+        )
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, fingerprint: str) -> list[int]:
+        h1 = int(fingerprint[:16], 16)
+        h2 = int(fingerprint[16:32], 16) | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, fingerprint: str) -> None:
+        for position in self._positions(fingerprint):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(fingerprint)
+        )
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self.bits)
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Expected false positive rate at the current number of entries."""
+        return float(
+            (1 - math.exp(-self.hash_count * self.count / self.size))
+            ** self.hash_count,
+        )
+
+
+class APIKeyFilter:
+    """This worker's filter of active API key fingerprints, with counters."""
+
+    def __init__(self) -> None:
+        self.bloom: BloomFilter | None = None
+        # Fingerprints added while a rebuild is loading, replayed into it
+        self._rebuilding: list[str] | None = None
+        # Wall-clock time the current filter's rebuild (and one in progress) began
+        self.built_from: float | None = None
+        self._rebuild_started: float | None = None
+        self.rebuilds = 0
+        self.checks = 0
+        self.rejected = 0
+        self.new_keys = 0
+        self.false_positives = 0
+
+    @property
+    def ready(self) -> bool:
+        return self.bloom is not None
+
+    def might_exist(self, fingerprint: str, issued_at: float | None = None) -> bool:
+        """
+        False only if no active key has this fingerprint.
+
+        issued_at is the key's issue time (api_key_issued_at); keys too new
+        for the filter to be complete for are always looked up.
+        """
+        bloom, built_from = self.bloom, self.built_from
+        if bloom is None or built_from is None:
+            return True
+        self.checks += 1
+        if fingerprint in bloom:
+            return True
+        if issued_at is not None and issued_at >= built_from - NEW_KEY_GRACE:
+            self.new_keys += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def record_false_positive(self, fingerprint: str) -> None:
+        """Count a key that the filter let through but wasn't found."""
+        if self.bloom is not None and fingerprint in self.bloom:
+            self.false_positives += 1
+
+    def add(self, fingerprint: str) -> None:
+        if self.bloom is not None:
+            self.bloom.add(fingerprint)
+        if self._rebuilding is not None:
+            self._rebuilding.append(fingerprint)
+
+    def begin_rebuild(self) -> None:
+        """Start collecting fingerprints added while the rebuild loads."""
+        self._rebuilding = []
+        self._rebuild_started = time.time()
+
+    def finish_rebuild(self, fingerprints: Iterable[str]) -> None:
+        """Replace the filter with one holding fingerprints."""
+        fingerprints = list(fingerprints) + (self._rebuilding or [])
+        bloom = BloomFilter(
+            max(MIN_CAPACITY, len(fingerprints) * CAPACITY_HEADROOM),
+            settings.API_KEY_FILTER_ERROR_RATE,
+        )
+        for fingerprint in fingerprints:
+            bloom.add(fingerprint)
+        self.bloom = bloom
+        self.built_from = self._rebuild_started or time.time()
+        self._rebuilding = None
+        self._rebuild_started = None
+        self.rebuilds += 1
+
+    def reset(self) -> None:
+        """Stop using the filter until the next rebuild."""
+        self.bloom = None
+        self.built_from = None
+        self._rebuilding = None
+        self._rebuild_started = None
+
+    def as_dict(self) -> dict[str, Any]:
+        bloom = self.bloom
+        passed = self.checks - self.rejected - self.new_keys
+        return {
+            "ready": bloom is not None,
+            "entries": bloom.count if bloom else 0,
+            "hash_count": bloom.hash_count if bloom else 0,
+            "memory_bytes": bloom.memory_bytes if bloom else 0,
+            "expected_false_positive_rate": (
+                bloom.false_positive_rate if bloom else None
+            ),
+            "rebuilds": self.rebuilds,
+            "checks": self.checks,
+            "passed": passed,
+            "rejected": self.rejected,
+            # Keys missing from the filter but issued too recently to reject
+            "new_keys": self.new_keys,
+            "false_positives": self.false_positives,
+            # Share of unknown keys the filter let through to the database
+            "observed_false_positive_rate": (
+                self.false_positives / (self.false_positives + self.rejected)
+                if self.false_positives + self.rejected
+                else None
+            ),
+        }
+
+
+api_key_filter = APIKeyFilter()
+
+
+def publish_api_key(db: Any, fingerprint: str) -> None:
+    """Add a new key's fingerprint to every worker's filter when db commits."""
+    info = getattr(db, "info", None)
+    if not isinstance(info, dict) or not settings.API_KEY_FILTER:
+        return
+    info.setdefault(PENDING_FINGERPRINTS_KEY, set()).add(fingerprint)
+
+
+@event.listens_for(Session, "before_commit")
+def _notify_pending_api_keys(session: Session) -> None:
+    fingerprints = session.info.pop(PENDING_FINGERPRINTS_KEY, None)
+    if not fingerprints:
+        return
+    # Added before the commit lands: at worst a false positive if it fails
+    for fingerprint in fingerprints:
+        api_key_filter.add(fingerprint)
+    connection = session.connection()
+    if connection.dialect.name != "postgresql":
+        return
+    for fingerprint in sorted(fingerprints):
+        connection.execute(
+            _NOTIFY_SQL,
+            {"channel": API_KEY_CHANNEL, "payload": fingerprint},
+        )
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_api_keys(session: Session) -> None:
+    session.info.pop(PENDING_FINGERPRINTS_KEY, None)
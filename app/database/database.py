@@ -2,6 +2,7 @@ from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from starlette.exceptions import HTTPException
 
 from app.core.config import settings
 
@@ -41,8 +42,63 @@ class Base(DeclarativeBase):
     pass
 
 
+# Session.info flag telling CRUD functions to flush instead of commit
+UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+async def commit_or_flush(db: AsyncSession) -> None:
+    """
+    Finish a CRUD write.
+
+    Inside a unit of work (sessions from get_db) the changes are only flushed
+    and the request commits them once at the end. Any other session, such as
+    one from AsyncSessionLocal in a Celery task, is committed right away.
+    """
+    if getattr(db, "info", {}).get(UNIT_OF_WORK_KEY) is True:
+        await db.flush()
+    else:
+        await db.commit()
+
+
+async def _commit_unless_failed(session: AsyncSession) -> None:
+    if session.is_active:
+        await session.commit()
+    else:
+        # A failed flush already rolled the transaction back
+        await session.rollback()
+
+
 # Dependency to get async DB session
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Request-scoped session with a single transaction.
+
+    CRUD writes are flushed as they happen and committed together when the
+    endpoint returns, before the response is sent. HTTP errors raised by the
+    endpoint still commit, so writes such as failed-login audit entries are
+    kept; any other exception rolls the request back, as does a failed flush
+    the endpoint handled itself. Endpoints can call
+    ``await db.commit()`` themselves where work must be durable before a
+    side effect, or depend on get_autocommit_db instead.
+    """
+    async with AsyncSessionLocal() as session:
+        session.info[UNIT_OF_WORK_KEY] = True
+        try:
+            yield session
+        except HTTPException:
+            await _commit_unless_failed(session)
+            raise
+        except Exception:
+            await session.rollback()
+            raise
+        else:
+            await _commit_unless_failed(session)
+        finally:
+            await session.close()
+
+
+async def get_autocommit_db() -> AsyncGenerator[AsyncSession, None]:
+    """Session whose CRUD writes each commit on their own."""
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -0,0 +1,102 @@
+"""
+Cache invalidation over Postgres LISTEN/NOTIFY.
+
+Deployments without Redis keep a memory cache per worker, so a write made by
+one worker has to reach every other worker's cache. CRUD functions record the
+cache tags a mutation affects on the session:
+
+    user.is_verified = True
+    publish_invalidation(db, user_tag(user_id))
+    await commit_or_flush(db)
+
+When the session commits, the tags are sent with a single ``pg_notify`` inside
+the committing transaction. Postgres only delivers the notification once the
+transaction commits, and drops it on rollback, so caches are never invalidated
+for changes that didn't happen. Every worker listens on the channel (see
+app/services/cache/pg_invalidation.py) and drops the matching entries.
+"""
+
+import json
+from collections.abc import Iterable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+INVALIDATION_CHANNEL = "cache_invalidate"
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+MAX_PAYLOAD_BYTES = 7900
+
+PENDING_INVALIDATIONS_KEY = "pending_cache_invalidations"
+
+_NOTIFY_SQL = text("SELECT pg_notify(:channel, :payload)")
+
+
+def user_tag(user_id: str | UUID) -> str:
+    """Tag of cached values derived from a user."""
+    return f"user:{user_id}"
+
+
+def api_key_tag(key_id: str | UUID) -> str:
+    """Tag of cached values derived from an API key."""
+    return f"api_key:{key_id}"
+
+
+def user_api_keys_tag(user_id: str | UUID | None) -> str:
+    """Tag of cached values derived from a user's API keys (None: system keys)."""
+    return f"api_keys:{user_id}"
+
+
+def user_sessions_tag(user_id: str | UUID) -> str:
+    """Tag of cached values derived from a user's sessions (refresh tokens)."""
+    return f"sessions:{user_id}"
+
+
+def invalidation_bus_enabled() -> bool:
+    """
+    Whether invalidations go over Postgres.
+
+    A Redis-backed cache is shared or invalidated through Redis already.
+    """
+    return settings.CACHE_PG_NOTIFY and not (
+        settings.ENABLE_REDIS and settings.CACHE_BACKEND in ("redis", "tiered")
+    )
+
+
+def publish_invalidation(db: Any, *tags: str) -> None:
+    """Invalidate the tags in every worker's cache when db commits."""
+    info = getattr(db, "info", None)
+    if not isinstance(info, dict) or not invalidation_bus_enabled():
+        return
+    info.setdefault(PENDING_INVALIDATIONS_KEY, set()).update(tags)
+
+
+def build_payload(tags: Iterable[str]) -> str:
+    """The NOTIFY payload for tags; a full flush if they don't fit in one."""
+    payload = json.dumps({"tags": sorted(tags)})
+    if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+        return json.dumps({"clear": True})
+    return payload
+
+
+@event.listens_for(Session, "before_commit")
+def _notify_pending_invalidations(session: Session) -> None:
+    tags = session.info.pop(PENDING_INVALIDATIONS_KEY, None)
+    if not tags:
+        return
+    connection = session.connection()
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(
+        _NOTIFY_SQL,
+        {"channel": INVALIDATION_CHANNEL, "payload": build_payload(tags)},
+    )
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    session.info.pop(PENDING_INVALIDATIONS_KEY, None)
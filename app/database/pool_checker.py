@@ -0,0 +1,152 @@
+"""
+Background liveness checks for idle pooled connections.
+
+With DB_POOL_PRE_PING every checkout costs a round trip before the request's
+first query. This task checks out the pool's idle connections every
+DB_POOL_CHECK_INTERVAL seconds, one at a time, and pings each one:
+
+- a connection that errors or doesn't answer within DB_POOL_CHECK_TIMEOUT is
+  evicted (invalidated), so no request gets it;
+- a connection that landed on a server in recovery (the old primary after a
+  failover) or dropped with a disconnect error invalidates the whole pool, so
+  every connection is reopened against the current primary.
+
+It can't catch a connection that breaks between checks, so it only replaces
+pre-ping when DB_POOL_PRE_PING is turned off. Counters are reported by the
+health endpoints.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import get_app_logger, settings
+from app.database.database import engine
+from app.utils.datetime_utils import utc_now
+
+logger = get_app_logger()
+
+# Doubles as the liveness ping; true on a standby
+PING_SQL = "SELECT pg_is_in_recovery()"
+
+
+class PoolCheckerStats:
+    """Counters of the pool checker since startup."""
+
+    def __init__(self) -> None:
+        self.checks = 0
+        self.evicted = 0
+        self.recycled = 0
+        self.pool_invalidations = 0
+        self.last_check_at: datetime | None = None
+        self.last_error: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "checks": self.checks,
+            "evicted": self.evicted,
+            "recycled": self.recycled,
+            "pool_invalidations": self.pool_invalidations,
+            "last_check_at": (
+                self.last_check_at.isoformat() if self.last_check_at else None
+            ),
+            "last_error": self.last_error,
+        }
+
+
+pool_checker_stats = PoolCheckerStats()
+_checker_task: asyncio.Task[None] | None = None
+
+
+async def _ping(connection: Any) -> bool:
+    """
+    Ping one connection; return whether the server is in recovery.
+
+    Evicts the connection if the ping fails.
+    """
+    try:
+        result = await asyncio.wait_for(
+            connection.exec_driver_sql(PING_SQL),
+            timeout=settings.DB_POOL_CHECK_TIMEOUT,
+        )
+        return bool(result.scalar())
+    except Exception as e:
+        pool_checker_stats.evicted += 1
+        pool_checker_stats.last_error = str(e) or type(e).__name__
+        if isinstance(e, DBAPIError) and e.connection_invalidated:
+            # SQLAlchemy already invalidated the whole pool on the disconnect
+            pool_checker_stats.pool_invalidations += 1
+        elif not connection.invalidated:
+            await connection.invalidate()
+        raise
+
+
+def _idle_connections() -> int:
+    return int(getattr(engine.pool, "checkedin", lambda: 0)())
+
+
+async def invalidate_pool() -> None:
+    """Close every idle connection and discard checked-out ones on return."""
+    pool_checker_stats.recycled += _idle_connections()
+    pool_checker_stats.pool_invalidations += 1
+    await engine.dispose()
+
+
+async def check_pool() -> None:
+    """Ping each idle pooled connection once, one at a time."""
+    idle = _idle_connections()
+    pool_checker_stats.checks += 1
+    pool_checker_stats.last_check_at = utc_now()
+
+    # Each connection is released before the next is taken, so requests never
+    # wait on the checker. The pool hands out its oldest idle connection first,
+    # so this reaches each one once. Stop when requests have taken the rest:
+    # another checkout would open a new connection.
+    in_recovery = False
+    for _ in range(idle):
+        if not _idle_connections():
+            break
+        connection = await engine.connect()
+        try:
+            in_recovery = await _ping(connection)
+        except Exception:
+            continue
+        finally:
+            await connection.close()
+        if in_recovery:
+            break
+
+    if in_recovery:
+        logger.warning("Database server is in recovery; invalidating the pool")
+        await invalidate_pool()
+
+
+async def run_pool_checker() -> None:
+    """Check the pool every DB_POOL_CHECK_INTERVAL seconds until cancelled."""
+    while True:
+        await asyncio.sleep(settings.DB_POOL_CHECK_INTERVAL)
+        try:
+            await check_pool()
+        except Exception as e:
+            pool_checker_stats.last_error = str(e) or type(e).__name__
+            logger.warning("Pool check failed", error=pool_checker_stats.last_error)
+
+
+def start_pool_checker() -> None:
+    """Start the background pool checker."""
+    global _checker_task
+    _checker_task = asyncio.create_task(run_pool_checker())
+
+
+async def stop_pool_checker() -> None:
+    """Stop the background pool checker."""
+    global _checker_task
+    if _checker_task and not _checker_task.done():
+        _checker_task.cancel()
+        try:
+            await _checker_task
+        except asyncio.CancelledError:
+            pass
+    _checker_task = None
@@ -0,0 +1,120 @@
+"""
+Startup warm-up for the database pool and Redis.
+
+Right after a deploy every worker starts with an empty pool, so the first
+requests pay for connection setup, Postgres backend startup and statement
+preparation. start_warmup schedules a background task that opens pooled
+connections concurrently, prepares the fast-path auth statements on each when
+ENABLE_DB_FAST_PATH is on, and round-trips Redis. /health/ready reports not
+ready until it has finished.
+"""
+
+import asyncio
+from typing import Any
+
+from app.core.config import get_app_logger, settings
+from app.crud.auth.fast_path import prepare_fast_path_statements
+from app.database.database import engine
+
+logger = get_app_logger()
+
+
+class WarmupState:
+    """Progress of the startup warm-up."""
+
+    def __init__(self) -> None:
+        self.pending = False
+        self.connections = 0
+        self.error: str | None = None
+        self.task: asyncio.Task[None] | None = None
+
+
+warmup_state = WarmupState()
+
+
+def is_warmed_up() -> bool:
+    """Whether no startup warm-up is still running."""
+    return not warmup_state.pending
+
+
+async def _prepare_connection(connection: Any) -> None:
+    raw_connection = await connection.get_raw_connection()
+    await prepare_fast_path_statements(raw_connection.driver_connection)
+
+
+async def warm_up_pool(connections: int) -> int:
+    """
+    Open pooled connections concurrently and prepare statements on each.
+
+    All connections are held until every one is open, so the pool really
+    ends up with that many. The fast-path statements are only prepared when
+    ENABLE_DB_FAST_PATH is on; nothing else uses them, and poolers in
+    transaction mode don't support prepared statements. Returns how many were
+    warmed.
+    """
+    connections = min(connections, settings.DB_POOL_SIZE)
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(connections)),
+        return_exceptions=True,
+    )
+    opened = [result for result in results if not isinstance(result, BaseException)]
+    try:
+        if settings.ENABLE_DB_FAST_PATH:
+            await asyncio.gather(*(_prepare_connection(c) for c in opened))
+    finally:
+        await asyncio.gather(*(c.close() for c in opened), return_exceptions=True)
+
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures:
+        raise failures[0]
+    return len(opened)
+
+
+async def warm_up_redis() -> None:
+    """Round-trip the Redis client so its connection pool opens a connection."""
+    if not settings.ENABLE_REDIS:
+        return
+    from app.services.external.redis import get_redis_client
+
+    redis_client = get_redis_client()
+    if redis_client:
+        await redis_client.ping()
+
+
+async def run_warmup() -> None:
+    """Warm up the pool and Redis, then mark the application ready."""
+    try:
+        warmup_state.connections, _ = await asyncio.wait_for(
+            asyncio.gather(
+                warm_up_pool(settings.DB_WARMUP_CONNECTIONS),
+                warm_up_redis(),
+            ),
+            timeout=settings.DB_WARMUP_TIMEOUT,
+        )
+        logger.info("Startup warm-up complete", connections=warmup_state.connections)
+    except Exception as e:
+        # Warm-up is best effort; readiness still checks the dependencies
+        warmup_state.error = str(e) or type(e).__name__
+        logger.warning("Startup warm-up failed", error=warmup_state.error)
+    finally:
+        warmup_state.pending = False
+
+
+def start_warmup() -> None:
+    """Schedule the warm-up in the background; readiness waits for it."""
+    warmup_state.pending = True
+    warmup_state.error = None
+    warmup_state.task = asyncio.create_task(run_warmup())
+
+
+async def stop_warmup() -> None:
+    """Cancel a warm-up that is still running at shutdown."""
+    task = warmup_state.task
+    if task and not task.done():
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    warmup_state.task = None
+    warmup_state.pending = False
@@ -2,8 +2,7 @@ import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
-from starlette.responses import HTMLResponse
+from fastapi import Depends, FastAPI, Request, Response
 
 from app.api import api_router
 
@@ -18,8 +17,17 @@ from app.core import (
 )
 from app.core.config import settings
 from app.database.database import engine
+from app.database.invalidation import invalidation_bus_enabled
 from app.models import Base
 from app.services import init_sentry
+from app.services.cache import CacheStatusMiddleware, has_cached_functions
+from app.services.middleware.http_cache import (
+    PUBLIC,
+    CachePolicy,
+    cache_policy,
+    configure_http_cache,
+)
+from app.utils.api_docs import OPENAPI_PATH, build_docs_cache, get_docs_response
 
 if settings.ENABLE_CELERY:
     # Import celery tasks to register them with the worker
@@ -73,6 +81,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.info("Initializing Redis connection")
         await init_redis()
 
+        # Drop this worker's L1 entries when other workers invalidate them
+        if settings.CACHE_BACKEND == "tiered":
+            from app.services.cache.invalidation import start_invalidation_listener
+
+            start_invalidation_listener()
+
     # Initialize rate limiting if enabled
     if settings.ENABLE_RATE_LIMITING:
         from app.services import init_rate_limiter
@@ -83,11 +97,65 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize Sentry error monitoring
     init_sentry()
 
+    # Warm up pooled connections in the background; /health/ready waits for it
+    if os.getenv("TESTING") != "1" and settings.DB_WARMUP_CONNECTIONS > 0:
+        from app.database.warmup import start_warmup
+
+        start_warmup()
+
+    # Drop cache entries invalidated by other workers' writes (no Redis), if
+    # anything is cached
+    if (
+        os.getenv("TESTING") != "1"
+        and engine.dialect.name == "postgresql"
+        and invalidation_bus_enabled()
+        and has_cached_functions()
+    ):
+        from app.services.cache.pg_invalidation import start_pg_invalidation_listener
+
+        start_pg_invalidation_listener()
+
+    # Ping idle pooled connections in the background instead of on checkout
+    if os.getenv("TESTING") != "1" and settings.DB_POOL_CHECK_INTERVAL > 0:
+        from app.database.pool_checker import start_pool_checker
+
+        start_pool_checker()
+
+    # Reject unknown API keys without a query once the filter is loaded
+    if (
+        os.getenv("TESTING") != "1"
+        and engine.dialect.name == "postgresql"
+        and settings.API_KEY_FILTER
+    ):
+        from app.services.auth.api_key_filter_listener import (
+            start_api_key_filter_listener,
+        )
+
+        start_api_key_filter_listener()
+
+    # Render and compress the OpenAPI schema and /docs once, before serving
+    build_docs_cache(app)
+
     logger.info("Application startup complete")
     yield
 
     # Shutdown
     logger.info("Shutting down application")
+    from app.core.security.security import shutdown_hash_executor
+    from app.database.pool_checker import stop_pool_checker
+    from app.database.warmup import stop_warmup
+    from app.services.auth.api_key_filter_listener import (
+        stop_api_key_filter_listener,
+    )
+    from app.services.cache.invalidation import stop_invalidation_listener
+    from app.services.cache.pg_invalidation import stop_pg_invalidation_listener
+
+    await stop_warmup()
+    await stop_pool_checker()
+    await stop_invalidation_listener()
+    await stop_pg_invalidation_listener()
+    await stop_api_key_filter_listener()
+    shutdown_hash_executor()
     await engine.dispose()
 
     # Close Redis if enabled
@@ -102,7 +170,8 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     description=settings.DESCRIPTION,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    # Served from a precomputed cache by openapi_schema() below
+    openapi_url=None,
     docs_url=None,
     redoc_url=None,
     lifespan=lifespan,
@@ -111,6 +180,10 @@ app = FastAPI(
 # Configure CORS
 configure_cors(app)
 
+# Cache-Control, ETags and 304s for routes that declare a cache policy (inside
+# the security headers, which send no-store on /api/ routes that don't)
+configure_http_cache(app)
+
 # Configure Security Headers
 if settings.ENABLE_SECURITY_HEADERS:
     configure_security_headers(app)
@@ -127,6 +200,10 @@ if settings.ENABLE_RATE_LIMITING:
 
     setup_rate_limiting(app)
 
+# Report cache hits and misses in X-Cache-Status (outermost, so it sees
+# lookups made anywhere in the request)
+app.add_middleware(CacheStatusMiddleware)
+
 # Register error handlers for standardized error responses
 
 register_error_handlers(app)
@@ -141,7 +218,7 @@ async def read_root() -> dict[str, str]:
 
 
 # Add feature status endpoint
-@app.get("/features")
+@app.get("/features", dependencies=[Depends(cache_policy(PUBLIC))])
 async def get_features() -> dict[str, bool]:
     """
     Get the status of optional features.
@@ -158,98 +235,20 @@ async def get_features() -> dict[str, bool]:
     }
 
 
-# Custom Swagger UI with CDN fallbacks and CSP-friendly setup
-@app.get("/docs", include_in_schema=False)
-async def custom_swagger_ui() -> HTMLResponse:
-    """Serve Swagger UI with robust CDN fallbacks.
+# OpenAPI schema and Swagger UI, rendered and compressed once per worker; they
+# only change on deploy, so clients and CDNs may reuse them for a long time
+docs_cache = cache_policy(
+    CachePolicy(max_age=settings.DOCS_CACHE_MAX_AGE, public=True),
+)
 
-    This avoids upstream template issues and works with our CSP by allowing
-    specific CDNs for scripts and styles.
-    """
-    openapi_url = f"{settings.API_V1_STR}/openapi.json"
-    # Pin to a known-good Swagger UI version for stability
-    swagger_version = "5.11.0"
-
-    html = f"""
-<!DOCTYPE html>
-<html lang=\"en\">
-  <head>
-    <meta charset=\"UTF-8\" />
-    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
-    <title>{settings.PROJECT_NAME} — API Docs</title>
-
-    <!-- Primary CSS with non-blocking fallback -->
-    <link rel=\"stylesheet\" href=\"https://unpkg.com/swagger-ui-dist@{swagger_version}/swagger-ui.css\" />
-    <link rel=\"stylesheet\" href=\"https://cdnjs.cloudflare.com/ajax/libs/swagger-ui/{swagger_version}/swagger-ui.min.css\" media=\"print\" onload=\"this.media='all'\" />
-
-    <style>
-      html {{ box-sizing: border-box; overflow-y: scroll; }}
-      *, *:before, *:after {{ box-sizing: inherit; }}
-      body {{ margin: 0; background: #fafafa; }}
-    </style>
-  </head>
-  <body>
-    <div id=\"swagger-ui\"></div>
-    <script>
-      (function() {{
-        function loadScript(src, onload, onerror) {{
-          var s = document.createElement('script');
-          s.src = src;
-          s.async = true;
-          s.onload = onload;
-          s.onerror = onerror || function(){{}};
-          document.head.appendChild(s);
-        }}
-
-        function initUI() {{
-          if (!window.SwaggerUIBundle || !window.SwaggerUIStandalonePreset) {{
-            console.error('Swagger UI assets missing');
-            var c = document.getElementById('swagger-ui');
-            c.innerHTML = '<p style="padding:16px;color:#b00">Failed to load Swagger UI assets.</p>';
-            return;
-          }}
-          window.ui = SwaggerUIBundle({{
-            url: '{openapi_url}',
-            dom_id: '#swagger-ui',
-            deepLinking: true,
-            presets: [SwaggerUIBundle.presets.apis, SwaggerUIStandalonePreset],
-            layout: 'StandaloneLayout'
-          }});
-        }}
-
-        // Try unpkg first, then fall back to cdnjs
-        loadScript(
-          'https://unpkg.com/swagger-ui-dist@{swagger_version}/swagger-ui-bundle.js',
-          function() {{
-            loadScript(
-              'https://unpkg.com/swagger-ui-dist@{swagger_version}/swagger-ui-standalone-preset.js',
-              initUI,
-              function() {{
-                loadScript(
-                  'https://cdnjs.cloudflare.com/ajax/libs/swagger-ui/{swagger_version}/swagger-ui-standalone-preset.min.js',
-                  initUI,
-                  function() {{ initUI(); }}
-                );
-              }}
-            );
-          }},
-          function() {{
-            loadScript(
-              'https://cdnjs.cloudflare.com/ajax/libs/swagger-ui/{swagger_version}/swagger-ui-bundle.min.js',
-              function() {{
-                loadScript(
-                  'https://cdnjs.cloudflare.com/ajax/libs/swagger-ui/{swagger_version}/swagger-ui-standalone-preset.min.js',
-                  initUI,
-                  function() {{ initUI(); }}
-                );
-              }},
-              function() {{ initUI(); }}
-            );
-          }}
-        );
-      }})();
-    </script>
-  </body>
-</html>
-    """
-    return HTMLResponse(content=html)
+
+@app.get(OPENAPI_PATH, include_in_schema=False, dependencies=[Depends(docs_cache)])
+async def openapi_schema(request: Request) -> Response:
+    """Serve the precomputed OpenAPI schema."""
+    return get_docs_response(app, "openapi").response(request)
+
+
+@app.get("/docs", include_in_schema=False, dependencies=[Depends(docs_cache)])
+async def custom_swagger_ui(request: Request) -> Response:
+    """Serve the precomputed Swagger UI page."""
+    return get_docs_response(app, "docs").response(request)
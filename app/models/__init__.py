@@ -1,9 +1,9 @@
 """Database models organized by category."""
 
 # Import from organized subfolders
-from .auth import APIKey, RefreshToken, User
+from .auth import APIKey, OneTimeToken, RefreshToken, User
 from .core import Base, SoftDeleteMixin, TimestampMixin
-from .system import AuditLog
+from .system import AuditLog, AuditLogRollup, AuditRollupWatermark
 
 __all__ = [
     # Core components
@@ -14,6 +14,9 @@ __all__ = [
     "User",
     "APIKey",
     "RefreshToken",
+    "OneTimeToken",
     # System models
     "AuditLog",
+    "AuditLogRollup",
+    "AuditRollupWatermark",
 ]
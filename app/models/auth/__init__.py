@@ -1,6 +1,7 @@
 """Authentication and authorization models."""
 
 from .api_key import APIKey
+from .one_time_token import OneTimeToken
 from .refresh_token import RefreshToken
 from .user import User
 
@@ -8,4 +9,5 @@ __all__ = [
     "User",
     "APIKey",
     "RefreshToken",
+    "OneTimeToken",
 ]
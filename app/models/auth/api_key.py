@@ -11,7 +11,11 @@ from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.database import Base
-from app.models.core.base import SoftDeleteMixin, TimestampMixin
+from app.models.core.base import (
+    ACTIVE_ROW_PREDICATE,
+    SoftDeleteMixin,
+    TimestampMixin,
+)
 from app.utils.datetime_utils import utc_now
 
 
@@ -55,7 +59,6 @@ class APIKey(Base, SoftDeleteMixin, TimestampMixin):
     key_fingerprint: Mapped[str | None] = mapped_column(
         String(64),
         nullable=True,
-        index=True,
         comment="Deterministic fingerprint (SHA-256) of API key for lookup",
     )
     label: Mapped[str] = mapped_column(
@@ -98,13 +101,23 @@ class APIKey(Base, SoftDeleteMixin, TimestampMixin):
     # Performance-optimized indexes
     __table_args__: tuple[Index, ...] = (
         # Composite index for user's active keys
-        Index("ix_api_key_user_active", "user_id", "is_active", "expires_at"),
+        Index(
+            "ix_api_key_user_active",
+            "user_id",
+            "is_active",
+            "expires_at",
+            postgresql_where=ACTIVE_ROW_PREDICATE,
+        ),
         # Composite index for system keys
         Index("ix_api_key_system", "is_active", "expires_at"),
         # GIN index for JSONB scopes lookups
         Index("ix_api_key_scopes", "scopes", postgresql_using="gin"),
         # Fingerprint index for verification shortcuts
-        Index("ix_api_key_fingerprint", "key_fingerprint"),
+        Index(
+            "ix_api_key_fingerprint",
+            "key_fingerprint",
+            postgresql_where=ACTIVE_ROW_PREDICATE,
+        ),
     )
 
     def __repr__(self) -> str:
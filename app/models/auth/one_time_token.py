@@ -0,0 +1,64 @@
+"""
+One-time token model for emailed verification, reset and deletion links.
+
+Used by the database token store when Redis is not available. Keeping the
+tokens in this narrow table instead of on ``users`` means issuing a token
+doesn't rewrite the user row or its indexes.
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.database import Base
+from app.utils.datetime_utils import utc_now
+
+
+class OneTimeToken(Base):
+    """A pending one-time token, stored by fingerprint only."""
+
+    __tablename__ = "one_time_tokens"
+
+    token_hash: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="SHA-256 fingerprint of the token",
+    )
+    purpose: Mapped[str] = mapped_column(
+        String(32),
+        nullable=False,
+        comment="What the token authorizes (e.g., 'password_reset')",
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="User the token was issued to",
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        comment="When the token expires",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        default=utc_now,
+        nullable=False,
+        comment="When the token was issued",
+    )
+
+    __table_args__ = (
+        # One pending token per user and purpose; issuing a new one replaces it
+        Index("uq_one_time_token_user_purpose", "user_id", "purpose", unique=True),
+        # Purging expired tokens
+        Index("ix_one_time_token_expires_at", "expires_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<OneTimeToken(purpose='{self.purpose}', user_id={self.user_id}, "
+            f"expires_at={self.expires_at})>"
+        )
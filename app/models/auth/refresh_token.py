@@ -11,7 +11,11 @@ from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.database import Base
-from app.models.core.base import SoftDeleteMixin, TimestampMixin
+from app.models.core.base import (
+    ACTIVE_ROW_PREDICATE,
+    SoftDeleteMixin,
+    TimestampMixin,
+)
 from app.utils.datetime_utils import utc_now
 
 
@@ -55,7 +59,6 @@ class RefreshToken(Base, SoftDeleteMixin, TimestampMixin):
     token_fingerprint: Mapped[str | None] = mapped_column(
         String(64),
         nullable=True,
-        index=True,
         comment="Deterministic fingerprint of the refresh token for lookup",
     )
 
@@ -100,11 +103,21 @@ class RefreshToken(Base, SoftDeleteMixin, TimestampMixin):
     # Performance-optimized indexes
     __table_args__: tuple[Index, ...] = (
         # Composite index for user's active tokens
-        Index("ix_refresh_token_user_active", "user_id", "is_revoked", "expires_at"),
+        Index(
+            "ix_refresh_token_user_active",
+            "user_id",
+            "is_revoked",
+            "expires_at",
+            postgresql_where=ACTIVE_ROW_PREDICATE,
+        ),
         # Composite index for token validation
         Index("ix_refresh_token_validation", "token_hash", "is_revoked", "expires_at"),
         # Index on fingerprint for quick candidate lookup
-        Index("ix_refresh_token_fingerprint", "token_fingerprint"),
+        Index(
+            "ix_refresh_token_fingerprint",
+            "token_fingerprint",
+            postgresql_where=ACTIVE_ROW_PREDICATE,
+        ),
         # Index for security monitoring
         Index("ix_refresh_token_ip_timestamp", "ip_address", "created_at"),
         # Partial index for revoked tokens
@@ -6,12 +6,16 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Index, String
-from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID
+from sqlalchemy import DDL, Boolean, Computed, Index, String, event, text
+from sqlalchemy.dialects.postgresql import TIMESTAMP, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.database import Base
-from app.models.core.base import SoftDeleteMixin, TimestampMixin
+from app.models.core.base import (
+    ACTIVE_ROW_PREDICATE,
+    SoftDeleteMixin,
+    TimestampMixin,
+)
 
 
 class User(Base, SoftDeleteMixin, TimestampMixin):
@@ -35,15 +39,11 @@ class User(Base, SoftDeleteMixin, TimestampMixin):
     # Core user information with proper constraints
     email: Mapped[str] = mapped_column(
         String(254),
-        unique=True,
-        index=True,
         nullable=False,
         comment="User's email address",
     )
     username: Mapped[str] = mapped_column(
         String(50),
-        unique=True,
-        index=True,
         nullable=False,
         comment="User's unique username",
     )
@@ -86,32 +86,6 @@ class User(Base, SoftDeleteMixin, TimestampMixin):
         comment="Email address from OAuth provider",
     )
 
-    # Email verification with proper token length
-    verification_token: Mapped[str | None] = mapped_column(
-        String(255),
-        nullable=True,
-        unique=True,
-        comment="Token for email verification",
-    )
-    verification_token_expires: Mapped[datetime | None] = mapped_column(
-        TIMESTAMP(timezone=True),
-        nullable=True,
-        comment="Expiration time for verification token",
-    )
-
-    # Password reset with proper token length
-    password_reset_token: Mapped[str | None] = mapped_column(
-        String(255),
-        nullable=True,
-        unique=True,
-        comment="Token for password reset",
-    )
-    password_reset_token_expires: Mapped[datetime | None] = mapped_column(
-        TIMESTAMP(timezone=True),
-        nullable=True,
-        comment="Expiration time for password reset token",
-    )
-
     # Account deletion (GDPR compliance)
     deletion_requested_at: Mapped[datetime | None] = mapped_column(
         TIMESTAMP(timezone=True),
@@ -128,16 +102,19 @@ class User(Base, SoftDeleteMixin, TimestampMixin):
         nullable=True,
         comment="When account deletion is scheduled",
     )
-    deletion_token: Mapped[str | None] = mapped_column(
-        String(255),
-        nullable=True,
-        unique=True,
-        comment="Token for account deletion confirmation",
-    )
-    deletion_token_expires: Mapped[datetime | None] = mapped_column(
-        TIMESTAMP(timezone=True),
-        nullable=True,
-        comment="Expiration time for deletion token",
+
+    # Full-text search document maintained by PostgreSQL. Deferred so regular
+    # user loads don't transfer it; SearchFilterBuilder matches against it
+    # when a search targets exactly the fields listed in info["search_fields"].
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', coalesce(username, '') || ' ' || coalesce(email, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+        info={"search_fields": ("username", "email")},
+        comment="Generated full-text search document for username and email",
     )
 
     # Relationships (lazy loading for better performance)
@@ -174,10 +151,33 @@ class User(Base, SoftDeleteMixin, TimestampMixin):
             unique=True,
             postgresql_where="oauth_provider IS NOT NULL AND oauth_id IS NOT NULL",
         ),
-        # Index for token-based operations
-        Index("ix_user_verification_token", "verification_token"),
-        Index("ix_user_password_reset_token", "password_reset_token"),
-        Index("ix_user_deletion_token", "deletion_token"),
+        # Email and username are unique among active accounts only, so a
+        # soft-deleted account doesn't block signing up with its email again
+        Index(
+            "uq_user_email_active",
+            "email",
+            unique=True,
+            postgresql_where=ACTIVE_ROW_PREDICATE,
+        ),
+        Index(
+            "uq_user_username_active",
+            "username",
+            unique=True,
+            postgresql_where=ACTIVE_ROW_PREDICATE,
+        ),
+        # Index for ranked full-text search
+        Index("ix_user_search_vector", "search_vector", postgresql_using="gin"),
+        # Trigram indexes for case-insensitive substring search
+        Index(
+            "ix_user_username_trgm",
+            text("lower(username) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_user_email_trgm",
+            text("lower(email) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
     )
 
     def __repr__(self) -> str:
@@ -206,6 +206,15 @@ class User(Base, SoftDeleteMixin, TimestampMixin):
         return str(self.username or self.email.split("@")[0])
 
 
+# The trigram indexes need pg_trgm; make sure it exists when tables are created
+# outside of Alembic (e.g. create_all during development).
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
 if TYPE_CHECKING:
     # Only for typing to avoid import cycles
     from app.models.auth.api_key import APIKey
@@ -6,17 +6,22 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, TypeVar
 
-from sqlalchemy import Boolean, ForeignKey, Index, String
+from sqlalchemy import Boolean, ForeignKey, Index, String, false, inspect
 from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID
 from sqlalchemy.orm import Mapped, declarative_mixin, mapped_column
 
 from app.utils.datetime_utils import utc_now
 
 if TYPE_CHECKING:
-    from sqlalchemy.sql import Select
+    from sqlalchemy.sql import ColumnElement, Select
 
 TModel = TypeVar("TModel", bound="SoftDeleteMixin")
 
+# Predicate of the partial indexes on soft-deletable tables. Queries must use
+# the same literal comparison (see SoftDeleteMixin.not_deleted) for the planner
+# to prove the index applies; "IS false" or a bound parameter won't match.
+ACTIVE_ROW_PREDICATE = "is_deleted = false"
+
 
 @declarative_mixin
 class SoftDeleteMixin:
@@ -85,12 +90,22 @@ class SoftDeleteMixin:
         """Check if the record is active (not soft-deleted)."""
         return bool(not self.is_deleted)
 
+    @classmethod
+    def not_deleted(cls) -> "ColumnElement[bool]":
+        """
+        Get the condition that excludes soft-deleted records.
+
+        Renders as ``is_deleted = false`` so it matches the predicate of the
+        partial indexes built with ACTIVE_ROW_PREDICATE.
+        """
+        return cls.is_deleted == false()
+
     @classmethod
     def get_active_query(cls: type[TModel]) -> "Select[tuple[TModel]]":
         """Get a query that excludes soft-deleted records."""
         from sqlalchemy import select
 
-        return select(cls).filter(cls.is_deleted.is_(False))
+        return select(cls).filter(cls.not_deleted())
 
     @classmethod
     def get_deleted_query(cls: type[TModel]) -> "Select[tuple[TModel]]":
@@ -126,3 +141,22 @@ class TimestampMixin:
         index=True,
         comment="Record last update timestamp",
     )
+
+
+def apply_column_defaults(obj: object) -> None:
+    """
+    Fill a new instance's unset columns from their Python-side defaults.
+
+    Primary keys, timestamps and flags then travel as INSERT parameters and
+    are readable straight away, so creating a row needs no SELECT afterwards
+    to load what the database generated.
+    """
+    state = inspect(obj)
+    for attr in state.mapper.column_attrs:
+        default = attr.columns[0].default
+        if attr.key in state.dict or default is None:
+            continue
+        if default.is_callable:
+            setattr(obj, attr.key, default.arg(None))
+        elif default.is_scalar:
+            setattr(obj, attr.key, default.arg)
@@ -1,7 +1,10 @@
 """System and monitoring models."""
 
 from .audit_log import AuditLog
+from .audit_rollup import AuditLogRollup, AuditRollupWatermark
 
 __all__ = [
     "AuditLog",
+    "AuditLogRollup",
+    "AuditRollupWatermark",
 ]
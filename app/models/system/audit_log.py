@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Any
 
 from sqlalchemy import Boolean, ForeignKey, Index, String, Text
-from sqlalchemy.dialects.postgresql import JSON, TIMESTAMP, UUID
+from sqlalchemy.dialects.postgresql import JSONB, TIMESTAMP, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.database import Base
@@ -82,7 +82,7 @@ class AuditLog(Base):
 
     # Additional metadata with JSONB for better performance
     context: Mapped[dict[str, Any] | None] = mapped_column(
-        JSON,
+        JSONB,
         nullable=True,
         comment="Additional event metadata as JSON",
     )
@@ -113,6 +113,13 @@ class AuditLog(Base):
         Index("ix_audit_log_ip_timestamp", "ip_address", "timestamp"),
         # Composite index for session analysis
         Index("ix_audit_log_session_timestamp", "session_id", "timestamp"),
+        # GIN index for context containment (@>) lookups
+        Index(
+            "ix_audit_log_context",
+            "context",
+            postgresql_using="gin",
+            postgresql_ops={"context": "jsonb_path_ops"},
+        ),
         # Partial index for failed events (more efficient)
         Index(
             "ix_audit_log_failed_events",
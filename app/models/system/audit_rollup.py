@@ -0,0 +1,85 @@
+"""
+Audit log rollup models.
+
+Pre-aggregated audit event counts per time bucket, maintained incrementally
+from audit_logs so security dashboards don't aggregate raw rows on demand.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, String
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.database import Base
+from app.utils.datetime_utils import utc_now
+
+
+class AuditLogRollup(Base):
+    """
+    Event count for one rollup, time bucket and dimension value.
+
+    The primary key (rollup, bucket_start, dimension) serves range reads of
+    a rollup and the upserts of the rollup job.
+    """
+
+    __tablename__ = "audit_log_rollups"
+
+    rollup: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True,
+        comment="Rollup name (e.g., 'failed_logins_per_ip_minute')",
+    )
+    bucket_start: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        primary_key=True,
+        comment="Start of the time bucket (UTC)",
+    )
+    dimension: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="Grouping value (e.g., IP address or API key ID)",
+    )
+    count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        comment="Number of matching events in the bucket",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<AuditLogRollup(rollup='{self.rollup}', "
+            f"bucket_start={self.bucket_start}, dimension='{self.dimension}', "
+            f"count={self.count})>"
+        )
+
+
+class AuditRollupWatermark(Base):
+    """Position up to which audit logs have been counted into a rollup."""
+
+    __tablename__ = "audit_rollup_watermarks"
+
+    rollup: Mapped[str] = mapped_column(
+        String(50),
+        primary_key=True,
+        comment="Rollup name",
+    )
+    processed_until: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        comment="Audit logs before this time have been counted",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        default=utc_now,
+        onupdate=utc_now,
+        nullable=False,
+        comment="When the watermark last advanced",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<AuditRollupWatermark(rollup='{self.rollup}', "
+            f"processed_until={self.processed_until})>"
+        )
@@ -2,6 +2,9 @@
 
 # Import from organized subfolders
 from .admin import (
+    AdminBulkOperationJobRequest,
+    AdminBulkOperationJobResponse,
+    AdminBulkOperationJobStatus,
     AdminBulkOperationRequest,
     AdminBulkOperationResponse,
     AdminSessionInfo,
@@ -9,6 +12,8 @@ from .admin import (
     AdminSystemInfo,
     AdminUserCreate,
     AdminUserFilters,
+    AdminUserImportError,
+    AdminUserImportResponse,
     AdminUserListResponse,
     AdminUserResponse,
     AdminUserStatistics,
@@ -85,6 +90,18 @@ from .core import (
     ServerErrorDetail,
     ValidationErrorDetail,
 )
+from .system import (
+    AuditLogHistogramBucket,
+    AuditLogHistogramInterval,
+    AuditLogHistogramResponse,
+    AuditLogPage,
+    AuditLogResponse,
+    AuditRollupBucket,
+    AuditRollupInfo,
+    AuditRollupResponse,
+    AuditRollupTopEntry,
+    AuditRollupTopResponse,
+)
 
 __all__ = [
     # Error schemas
@@ -152,6 +169,9 @@ __all__ = [
     "APIKeyListResponse",
     "APIKeyUser",
     # Admin schemas
+    "AdminBulkOperationJobRequest",
+    "AdminBulkOperationJobResponse",
+    "AdminBulkOperationJobStatus",
     "AdminBulkOperationRequest",
     "AdminBulkOperationResponse",
     "AdminSessionInfo",
@@ -159,11 +179,24 @@ __all__ = [
     "AdminSystemInfo",
     "AdminUserCreate",
     "AdminUserFilters",
+    "AdminUserImportError",
+    "AdminUserImportResponse",
     "AdminUserListResponse",
     "AdminUserResponse",
     "AdminUserStatistics",
     "AdminUserToggleResponse",
     "AdminUserUpdate",
+    # System schemas
+    "AuditLogResponse",
+    "AuditLogPage",
+    "AuditLogHistogramInterval",
+    "AuditLogHistogramBucket",
+    "AuditLogHistogramResponse",
+    "AuditRollupInfo",
+    "AuditRollupBucket",
+    "AuditRollupResponse",
+    "AuditRollupTopEntry",
+    "AuditRollupTopResponse",
     # Custom exceptions
     "ScopesTypeError",
     "InvalidScopeError",
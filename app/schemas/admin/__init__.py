@@ -1,6 +1,9 @@
 """Admin-specific schemas for management operations."""
 
 from .admin import (
+    AdminBulkOperationJobRequest,
+    AdminBulkOperationJobResponse,
+    AdminBulkOperationJobStatus,
     AdminBulkOperationRequest,
     AdminBulkOperationResponse,
     AdminSessionInfo,
@@ -8,6 +11,8 @@ from .admin import (
     AdminSystemInfo,
     AdminUserCreate,
     AdminUserFilters,
+    AdminUserImportError,
+    AdminUserImportResponse,
     AdminUserListResponse,
     AdminUserResponse,
     AdminUserStatistics,
@@ -16,6 +21,9 @@ from .admin import (
 )
 
 __all__ = [
+    "AdminBulkOperationJobRequest",
+    "AdminBulkOperationJobResponse",
+    "AdminBulkOperationJobStatus",
     "AdminBulkOperationRequest",
     "AdminBulkOperationResponse",
     "AdminSessionInfo",
@@ -23,6 +31,8 @@ __all__ = [
     "AdminSystemInfo",
     "AdminUserCreate",
     "AdminUserFilters",
+    "AdminUserImportError",
+    "AdminUserImportResponse",
     "AdminUserListResponse",
     "AdminUserResponse",
     "AdminUserStatistics",
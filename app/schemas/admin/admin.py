@@ -5,7 +5,7 @@ This module provides admin-only schemas for user management and admin operations
 """
 
 from datetime import datetime
-from typing import ClassVar
+from typing import Any, ClassVar
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
@@ -187,6 +187,11 @@ class AdminUserToggleResponse(BaseModel):
     message: str = Field(..., description="Success message")
 
 
+# Largest id list handled inline; bigger lists go through bulk operation jobs
+BULK_OPERATION_MAX_USERS = 100
+BULK_OPERATION_JOB_MAX_USERS = 200_000
+
+
 class AdminBulkOperationRequest(BaseModel):
     """Schema for bulk operations on users."""
 
@@ -194,7 +199,7 @@ class AdminBulkOperationRequest(BaseModel):
         ...,
         description="List of user IDs to operate on",
         min_length=1,
-        max_length=100,
+        max_length=BULK_OPERATION_MAX_USERS,
     )
     operation: str = Field(
         ...,
@@ -239,6 +244,98 @@ class AdminBulkOperationResponse(BaseModel):
     failed_user_ids: list[UUID] = Field(default=[], description="User IDs that failed")
 
 
+class AdminBulkOperationJobRequest(AdminBulkOperationRequest):
+    """Schema for bulk operations run as a background job."""
+
+    user_ids: list[UUID] = Field(
+        ...,
+        description="List of user IDs to operate on",
+        min_length=1,
+        max_length=BULK_OPERATION_JOB_MAX_USERS,
+    )
+
+
+class AdminBulkOperationJobResponse(BaseModel):
+    """Schema for a submitted bulk operation job."""
+
+    job_id: str = Field(..., description="Job identifier to poll for progress")
+    operation: str = Field(..., description="Operation being performed")
+    total_users: int = Field(..., description="Number of users in the job")
+    status: str = Field(..., description="Initial job status")
+
+
+class AdminBulkOperationJobStatus(BaseModel):
+    """Schema for bulk operation job progress."""
+
+    job_id: str = Field(..., description="Job identifier")
+    status: str = Field(..., description="Job status (PENDING, PROGRESS, SUCCESS, ...)")
+    ready: bool = Field(..., description="Whether the job has finished")
+    processed: int = Field(default=0, description="Number of users processed so far")
+    total_users: int | None = Field(None, description="Number of users in the job")
+    successful: int = Field(default=0, description="Successful operations so far")
+    failed: int = Field(default=0, description="Failed operations so far")
+    result: AdminBulkOperationResponse | None = Field(
+        None,
+        description="Final result once the job has succeeded",
+    )
+    error: str | None = Field(None, description="Error message if the job failed")
+
+    @classmethod
+    def from_task_status(
+        cls,
+        task_status: dict[str, Any],
+    ) -> "AdminBulkOperationJobStatus":
+        """Build job status from a Celery task status dict."""
+        progress = task_status.get("progress") or {}
+        raw_result = (
+            task_status.get("result") if task_status.get("successful") else None
+        )
+        result = (
+            AdminBulkOperationResponse.model_validate(raw_result)
+            if isinstance(raw_result, dict)
+            else None
+        )
+        if result is not None:
+            progress = {
+                "processed": result.total_users,
+                "total": result.total_users,
+                "successful": result.successful,
+                "failed": result.failed,
+            }
+        return cls(
+            job_id=task_status["task_id"],
+            status=task_status["status"],
+            ready=task_status["ready"],
+            processed=progress.get("processed", 0),
+            total_users=progress.get("total"),
+            successful=progress.get("successful", 0),
+            failed=progress.get("failed", 0),
+            result=result,
+            error=task_status.get("error"),
+        )
+
+
+class AdminUserImportError(BaseModel):
+    """Schema for a row rejected by a bulk user import."""
+
+    line: int = Field(..., description="Line number in the input")
+    email: str | None = Field(None, description="Email from the rejected row")
+    username: str | None = Field(None, description="Username from the rejected row")
+    reason: str = Field(..., description="Why the row was rejected")
+
+
+class AdminUserImportResponse(BaseModel):
+    """Schema for bulk user import results."""
+
+    total_rows: int = Field(..., description="Number of records read")
+    imported: int = Field(..., description="Number of users created")
+    failed: int = Field(..., description="Number of records rejected")
+    errors: list[AdminUserImportError] = Field(
+        default_factory=list,
+        description="Rejected records in input order",
+    )
+
+
 class AdminSessionInfo(BaseModel):
     """Schema for session information in admin interface."""
 
@@ -1 +1,27 @@
 """System schemas (monitoring, health, audit)."""
+
+from .audit_log import (
+    AuditLogHistogramBucket,
+    AuditLogHistogramInterval,
+    AuditLogHistogramResponse,
+    AuditLogPage,
+    AuditLogResponse,
+    AuditRollupBucket,
+    AuditRollupInfo,
+    AuditRollupResponse,
+    AuditRollupTopEntry,
+    AuditRollupTopResponse,
+)
+
+__all__ = [
+    "AuditLogHistogramBucket",
+    "AuditLogHistogramInterval",
+    "AuditLogHistogramResponse",
+    "AuditLogPage",
+    "AuditLogResponse",
+    "AuditRollupBucket",
+    "AuditRollupInfo",
+    "AuditRollupResponse",
+    "AuditRollupTopEntry",
+    "AuditRollupTopResponse",
+]
@@ -0,0 +1,129 @@
+"""
+Audit log schemas.
+
+This module provides schemas for reading and aggregating audit log entries.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class AuditLogResponse(BaseModel):
+    """Schema for audit log entries."""
+
+    id: UUID = Field(..., description="Audit log entry identifier")
+    timestamp: datetime = Field(..., description="When the event occurred")
+    user_id: UUID | None = Field(None, description="User who performed the action")
+    event_type: str = Field(..., description="Type of event")
+    ip_address: str | None = Field(None, description="Client IP address")
+    user_agent: str | None = Field(None, description="Client user agent")
+    success: bool = Field(..., description="Whether the event was successful")
+    context: dict[str, Any] | None = Field(
+        None,
+        description="Additional event metadata",
+    )
+    session_id: str | None = Field(None, description="Session identifier")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AuditLogPage(BaseModel):
+    """Schema for one keyset-paginated page of audit log entries."""
+
+    items: list[AuditLogResponse] = Field(..., description="Audit log entries")
+    limit: int = Field(..., description="Maximum number of entries per page")
+    next_cursor: str | None = Field(
+        None,
+        description="Cursor for the next page (null on the last page)",
+    )
+
+
+class AuditLogHistogramInterval(str, Enum):
+    """Bucket sizes for audit log histograms."""
+
+    MINUTE = "minute"
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class AuditLogHistogramBucket(BaseModel):
+    """Schema for the event count of one histogram bucket."""
+
+    bucket: datetime = Field(..., description="Start of the bucket (UTC)")
+    count: int = Field(..., description="Number of events in the bucket")
+
+
+class AuditLogHistogramResponse(BaseModel):
+    """Schema for an audit log histogram."""
+
+    interval: AuditLogHistogramInterval = Field(..., description="Bucket size")
+    buckets: list[AuditLogHistogramBucket] = Field(
+        ...,
+        description="Non-empty buckets, oldest first",
+    )
+
+
+class AuditRollupInfo(BaseModel):
+    """Schema describing an audit log rollup."""
+
+    name: str = Field(..., description="Rollup name")
+    description: str = Field(..., description="What the rollup counts")
+    interval: str = Field(..., description="Bucket size")
+    event_type: str = Field(..., description="Audit event type counted")
+    success: bool = Field(..., description="Outcome of the events counted")
+    processed_until: datetime | None = Field(
+        None,
+        description="Audit logs before this time are counted; null if never refreshed",
+    )
+
+
+class AuditRollupBucket(BaseModel):
+    """Schema for one bucket of an audit log rollup."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    bucket_start: datetime = Field(..., description="Start of the bucket (UTC)")
+    dimension: str = Field(..., description="Grouping value, empty if unknown")
+    count: int = Field(..., description="Number of events in the bucket")
+
+
+class AuditRollupResponse(BaseModel):
+    """Schema for a time range of an audit log rollup."""
+
+    rollup: str = Field(..., description="Rollup name")
+    interval: str = Field(..., description="Bucket size")
+    processed_until: datetime | None = Field(
+        None,
+        description="Audit logs before this time are counted",
+    )
+    buckets: list[AuditRollupBucket] = Field(
+        ...,
+        description="Non-empty buckets, oldest first",
+    )
+
+
+class AuditRollupTopEntry(BaseModel):
+    """Schema for a dimension value's total in an audit log rollup."""
+
+    dimension: str = Field(..., description="Grouping value, empty if unknown")
+    count: int = Field(..., description="Number of events in the time range")
+
+
+class AuditRollupTopResponse(BaseModel):
+    """Schema for the top dimension values of an audit log rollup."""
+
+    rollup: str = Field(..., description="Rollup name")
+    processed_until: datetime | None = Field(
+        None,
+        description="Audit logs before this time are counted",
+    )
+    items: list[AuditRollupTopEntry] = Field(
+        ...,
+        description="Dimension values with the most events, highest first",
+    )
@@ -10,6 +10,13 @@ from .refresh_token import (
     revoke_session,
     utc_now,
 )
+from .token_store import (
+    DatabaseTokenStore,
+    RedisTokenStore,
+    TokenPurpose,
+    TokenStore,
+    get_token_store,
+)
 
 if TYPE_CHECKING:  # for type checkers only
     from .oauth import OAuthService as _OAuthService
@@ -31,4 +38,9 @@ __all__ = [
     "revoke_all_sessions",
     "revoke_session",
     "utc_now",
+    "TokenPurpose",
+    "TokenStore",
+    "DatabaseTokenStore",
+    "RedisTokenStore",
+    "get_token_store",
 ]
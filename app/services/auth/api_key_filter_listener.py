@@ -0,0 +1,122 @@
+"""
+Keeps this worker's API key filter (app/database/api_key_filter.py) complete.
+
+The listener runs from lifespan on a dedicated asyncpg connection, outside the
+pool. It subscribes to the fingerprints of keys created by other workers
+before loading the active ones from the database, so no key created in
+between is missed, and reloads them every API_KEY_FILTER_REBUILD_INTERVAL
+seconds to drop deactivated keys. Notifications sent while it isn't
+connected are lost, so the filter is dropped until it reconnects. Like the
+cache listener, it needs a direct connection to Postgres (DATABASE_LISTEN_URL).
+"""
+
+import asyncio
+import contextlib
+from typing import Any
+
+import asyncpg
+from sqlalchemy import text
+
+from app.core.config import get_app_logger, settings
+from app.database.api_key_filter import (
+    ACTIVE_FINGERPRINTS_SQL,
+    API_KEY_CHANNEL,
+    api_key_filter,
+)
+from app.database.database import engine
+from app.services.cache.pg_invalidation import (
+    HEALTH_CHECK_TIMEOUT,
+    check_listener_dsn,
+    listener_dsn,
+    wait_until_lost,
+)
+
+logger = get_app_logger()
+
+# Seconds between reconnect attempts, doubling up to the maximum
+RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 30.0
+
+_listener_task: asyncio.Task[None] | None = None
+
+
+def _on_api_key_created(
+    connection: Any,
+    pid: int,
+    channel: str,
+    payload: str,
+) -> None:
+    api_key_filter.add(payload)
+
+
+async def rebuild_api_key_filter() -> None:
+    """Load the fingerprints of every active API key into a new filter."""
+    api_key_filter.begin_rebuild()
+    try:
+        async with engine.connect() as connection:
+            result = await connection.execute(text(ACTIVE_FINGERPRINTS_SQL))
+            fingerprints = result.scalars().all()
+    except BaseException:
+        api_key_filter.reset()
+        raise
+    api_key_filter.finish_rebuild(fingerprints)
+    logger.info("API key filter rebuilt", **api_key_filter.as_dict())
+
+
+async def run_api_key_filter_listener() -> None:
+    """Keep the API key filter complete until cancelled."""
+    delay = RECONNECT_DELAY
+    while True:
+        connection: asyncpg.Connection | None = None
+        lost: asyncio.Task[None] | None = None
+        try:
+            connection = await asyncpg.connect(
+                listener_dsn(),
+                server_settings={"application_name": "fastapi_template_api_keys"},
+            )
+            await connection.add_listener(API_KEY_CHANNEL, _on_api_key_created)
+            await rebuild_api_key_filter()
+            delay = RECONNECT_DELAY
+            lost = asyncio.create_task(wait_until_lost(connection))
+            while not lost.done():
+                await asyncio.wait(
+                    {lost},
+                    timeout=settings.API_KEY_FILTER_REBUILD_INTERVAL,
+                )
+                if not lost.done():
+                    await rebuild_api_key_filter()
+            lost.result()
+            logger.warning("API key filter listener connection closed")
+        except Exception as e:
+            logger.warning(
+                "API key filter listener disconnected",
+                error=str(e) or type(e).__name__,
+            )
+        finally:
+            api_key_filter.reset()
+            if lost is not None:
+                lost.cancel()
+            if connection is not None:
+                with contextlib.suppress(Exception):
+                    await connection.close(timeout=HEALTH_CHECK_TIMEOUT)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+
+def start_api_key_filter_listener() -> None:
+    """Start keeping the API key filter complete."""
+    global _listener_task
+    check_listener_dsn("api_key_filter")
+    _listener_task = asyncio.create_task(run_api_key_filter_listener())
+
+
+async def stop_api_key_filter_listener() -> None:
+    """Stop the API key filter listener."""
+    global _listener_task
+    if _listener_task and not _listener_task.done():
+        _listener_task.cancel()
+        try:
+            await _listener_task
+        except asyncio.CancelledError:
+            pass
+    _listener_task = None
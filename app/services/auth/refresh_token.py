@@ -160,23 +160,40 @@ async def refresh_access_token(
     refresh_token_value: str,
 ) -> tuple[str, datetime] | None:
     """Refresh an access token using a valid refresh token."""
-    # Verify refresh token
-    db_refresh_token = await verify_refresh_token_in_db(db, refresh_token_value)
-    if not db_refresh_token:
-        return None
-
-    # Get user
-    from sqlalchemy import select
-
-    result = await db.execute(select(User).filter(User.id == db_refresh_token.user_id))
-    user: User | None = result.scalar_one_or_none()
-    if not user or user.is_deleted:
-        return None
+    if settings.ENABLE_DB_FAST_PATH:
+        from app.crud.auth import fast_path
+
+        token_record = await fast_path.verify_refresh_token_in_db(
+            db,
+            refresh_token_value,
+        )
+        if not token_record:
+            return None
+        user_record = await fast_path.get_user_by_id(db, str(token_record.user_id))
+        if not user_record:
+            return None
+        user_id = user_record.id
+    else:
+        # Verify refresh token
+        db_refresh_token = await verify_refresh_token_in_db(db, refresh_token_value)
+        if not db_refresh_token:
+            return None
+
+        # Get user
+        from sqlalchemy import select
+
+        result = await db.execute(
+            select(User).filter(User.id == db_refresh_token.user_id),
+        )
+        user: User | None = result.scalar_one_or_none()
+        if not user or user.is_deleted:
+            return None
+        user_id = user.id
 
     # Create new access token
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        subject=user.id,
+        subject=user_id,
         expires_delta=access_token_expires,
     )
 
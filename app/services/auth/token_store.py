@@ -0,0 +1,189 @@
+"""
+One-time token store for emailed verification, password reset and deletion links.
+
+Tokens are kept out of the ``users`` table. With ``TOKEN_STORE_BACKEND=redis``
+and Redis enabled they live in Redis and expire through native TTLs;
+otherwise they go to the compact ``one_time_tokens`` table. Either way only a
+SHA-256 fingerprint of the token is stored, each user has at most one pending
+token per purpose, and a token can be consumed once.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.security.security import fingerprint_one_time_token
+from app.crud.auth.one_time_token import (
+    consume_one_time_token,
+    delete_user_one_time_tokens,
+    upsert_one_time_token,
+)
+from app.utils.datetime_utils import utc_now
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+
+class TokenPurpose(str, Enum):
+    """What a one-time token authorizes."""
+
+    VERIFICATION = "verification"
+    PASSWORD_RESET = "password_reset"
+    DELETION = "deletion"
+
+
+class TokenStore(ABC):
+    """Stores one-time tokens by fingerprint."""
+
+    @abstractmethod
+    async def issue(
+        self,
+        db: AsyncSession,
+        purpose: TokenPurpose,
+        user_id: str,
+        token: str,
+        ttl: timedelta,
+    ) -> bool:
+        """Store a token for a user, replacing their pending one for the purpose."""
+
+    @abstractmethod
+    async def consume(
+        self,
+        db: AsyncSession,
+        purpose: TokenPurpose,
+        token: str,
+    ) -> str | None:
+        """Invalidate a token and return its user ID, or None if not valid."""
+
+    @abstractmethod
+    async def revoke(
+        self,
+        db: AsyncSession,
+        purpose: TokenPurpose,
+        user_id: str,
+    ) -> None:
+        """Invalidate a user's pending token for a purpose."""
+
+
+class DatabaseTokenStore(TokenStore):
+    """Token store backed by the ``one_time_tokens`` table."""
+
+    async def issue(
+        self,
+        db: AsyncSession,
+        purpose: TokenPurpose,
+        user_id: str,
+        token: str,
+        ttl: timedelta,
+    ) -> bool:
+        try:
+            # A savepoint, so a failed upsert keeps the request's other writes
+            async with db.begin_nested():
+                await upsert_one_time_token(
+                    db,
+                    purpose.value,
+                    user_id,
+                    fingerprint_one_time_token(token),
+                    utc_now() + ttl,
+                )
+        except IntegrityError:
+            # The user doesn't exist (anymore)
+            return False
+        return True
+
+    async def consume(
+        self,
+        db: AsyncSession,
+        purpose: TokenPurpose,
+        token: str,
+    ) -> str | None:
+        user_id = await consume_one_time_token(
+            db,
+            purpose.value,
+            fingerprint_one_time_token(token),
+        )
+        return str(user_id) if user_id else None
+
+    async def revoke(
+        self,
+        db: AsyncSession,
+        purpose: TokenPurpose,
+        user_id: str,
+    ) -> None:
+        await delete_user_one_time_tokens(db, user_id, purpose.value)
+
+
+class RedisTokenStore(TokenStore):
+    """
+    Token store backed by Redis.
+
+    ``<prefix>:<purpose>:<fingerprint>`` maps a token to its user and
+    ``<prefix>:<purpose>:user:<user_id>`` points at the user's pending token,
+    so issuing a new token can invalidate the previous one. Both keys carry
+    the token's TTL.
+    """
+
+    def __init__(self, client: "redis.Redis", prefix: str = "one_time_token") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    def _token_key(self, purpose: TokenPurpose, fingerprint: str) -> str:
+        return f"{self.prefix}:{purpose.value}:{fingerprint}"
+
+    def _user_key(self, purpose: TokenPurpose, user_id: str) -> str:
+        return f"{self.prefix}:{purpose.value}:user:{user_id}"
+
+    async def issue(
+        self,
+        db: AsyncSession,
+        purpose: TokenPurpose,
+        user_id: str,
+        token: str,
+        ttl: timedelta,
+    ) -> bool:
+        fingerprint = fingerprint_one_time_token(token)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(self._user_key(purpose, user_id), fingerprint, ex=ttl, get=True)
+            pipe.set(self._token_key(purpose, fingerprint), user_id, ex=ttl)
+            previous, _ = await pipe.execute()
+        if previous and previous != fingerprint:
+            await self.client.delete(self._token_key(purpose, previous))
+        return True
+
+    async def consume(
+        self,
+        db: AsyncSession,
+        purpose: TokenPurpose,
+        token: str,
+    ) -> str | None:
+        # GETDEL is atomic, so concurrent requests can't both consume a token
+        user_id: str | None = await self.client.getdel(
+            self._token_key(purpose, fingerprint_one_time_token(token)),
+        )
+        return user_id
+
+    async def revoke(
+        self,
+        db: AsyncSession,
+        purpose: TokenPurpose,
+        user_id: str,
+    ) -> None:
+        fingerprint = await self.client.getdel(self._user_key(purpose, user_id))
+        if fingerprint:
+            await self.client.delete(self._token_key(purpose, fingerprint))
+
+
+def get_token_store() -> TokenStore:
+    """Get the configured token store, falling back to the database."""
+    if settings.ENABLE_REDIS and settings.TOKEN_STORE_BACKEND == "redis":
+        from app.services.external.redis import get_redis_client
+
+        redis_client = get_redis_client()
+        if redis_client:
+            return RedisTokenStore(redis_client)
+    return DatabaseTokenStore()
@@ -19,6 +19,8 @@ try:
         periodic_health_check,
         permanently_delete_accounts_task,
         process_data_task,
+        purge_expired_one_time_tokens_task,
+        refresh_audit_rollups_task,
         send_email_task,
     )
 except ImportError:
@@ -29,6 +31,8 @@ except ImportError:
     long_running_task = None
     periodic_health_check = None
     permanently_delete_accounts_task = None
+    refresh_audit_rollups_task = None
+    purge_expired_one_time_tokens_task = None
 
 __all__ = [
     "celery_app",
@@ -45,4 +49,6 @@ __all__ = [
     "long_running_task",
     "periodic_health_check",
     "permanently_delete_accounts_task",
+    "refresh_audit_rollups_task",
+    "purge_expired_one_time_tokens_task",
 ]
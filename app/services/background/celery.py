@@ -28,6 +28,7 @@ class TaskStatusTD(TypedDict, total=False):
     failed: bool
     result: Any
     error: str
+    progress: dict[str, Any]
 
 
 class ActiveTaskTD(TypedDict):
@@ -101,6 +102,8 @@ def get_task_status(task_id: str) -> TaskStatusTD | None:
             "successful": result.successful(),
             "failed": result.failed(),
         }
+        if result.status == "PROGRESS" and isinstance(result.info, dict):
+            status_info["progress"] = result.info
         if result.ready():
             if result.successful():
                 status_info["result"] = result.result
@@ -32,3 +32,15 @@ celery_app.conf.update(
     worker_send_task_events=True,
     task_send_sent_event=True,
 )
+
+celery_app.conf.beat_schedule = {
+    "refresh-audit-rollups": {
+        "task": "app.services.celery_tasks.refresh_audit_rollups_task",
+        "schedule": float(settings.AUDIT_ROLLUP_INTERVAL_SECONDS),
+    },
+    # Redis expires one-time tokens itself; the database store needs purging
+    "purge-expired-one-time-tokens": {
+        "task": "app.services.celery_tasks.purge_expired_one_time_tokens_task",
+        "schedule": 3600.0,
+    },
+}
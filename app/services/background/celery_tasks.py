@@ -76,7 +76,7 @@ def permanently_delete_accounts_task() -> dict[str, Any]:
                 result = await db.execute(
                     select(User).filter(
                         User.deletion_scheduled_for <= utc_now(),
-                        User.is_deleted == False,  # noqa: E712
+                        User.not_deleted(),
                         User.deletion_confirmed_at.isnot(None),
                     ),
                 )
@@ -119,7 +119,7 @@ def permanently_delete_accounts_task() -> dict[str, Any]:
                         select(User).filter(
                             User.deletion_scheduled_for <= reminder_date,
                             User.deletion_scheduled_for > utc_now(),
-                            User.is_deleted == False,  # noqa: E712
+                            User.not_deleted(),
                             User.deletion_confirmed_at.isnot(None),
                         ),
                     )
@@ -188,3 +188,120 @@ def permanently_delete_accounts_task() -> dict[str, Any]:
             exc_info=True,
         )
         return {"status": "failed", "error": str(e)}
+
+
+@celery_app.task(
+    bind=True,
+    name="app.services.celery_tasks.bulk_user_operation_task",
+)
+def bulk_user_operation_task(
+    self: Any,
+    operation: str,
+    user_ids: list[str],
+    performed_by: str | None = None,
+) -> dict[str, Any]:
+    """Apply an admin bulk operation to a large list of users, reporting progress."""
+    import asyncio
+    from uuid import UUID
+
+    from app.core.config import get_app_logger
+    from app.crud.system.admin import admin_user_crud
+    from app.database.database import AsyncSessionLocal
+
+    logger = get_app_logger()
+    ids = [UUID(user_id) for user_id in dict.fromkeys(user_ids)]
+    total = len(ids)
+
+    def report_progress(processed: int, updated: int) -> None:
+        self.update_state(
+            state="PROGRESS",
+            meta={
+                "processed": processed,
+                "total": total,
+                "successful": updated,
+                "failed": processed - updated,
+            },
+        )
+
+    async def run_bulk_operation() -> list[UUID]:
+        async with AsyncSessionLocal() as db:
+            return await admin_user_crud.bulk_update_users(
+                db,
+                ids,
+                operation,
+                performed_by=UUID(performed_by) if performed_by else None,
+                on_progress=report_progress,
+            )
+
+    updated = set(asyncio.run(run_bulk_operation()))
+    failed_user_ids = [str(user_id) for user_id in ids if user_id not in updated]
+
+    logger.info(
+        "Bulk user operation job completed",
+        operation=operation,
+        total_users=total,
+        failed=len(failed_user_ids),
+    )
+    return {
+        "operation": operation,
+        "total_users": total,
+        "successful": total - len(failed_user_ids),
+        "failed": len(failed_user_ids),
+        "failed_user_ids": failed_user_ids,
+    }
+
+
+@celery_app.task(name="app.services.celery_tasks.refresh_audit_rollups_task")
+def refresh_audit_rollups_task() -> dict[str, Any]:
+    """Fold audit logs recorded since the last run into every audit rollup."""
+    import asyncio
+
+    from app.core.config import get_app_logger
+    from app.crud.system.audit_rollup import AUDIT_ROLLUPS, refresh_audit_rollup
+    from app.database.database import AsyncSessionLocal
+
+    logger = get_app_logger()
+
+    async def run_refresh() -> dict[str, int]:
+        updated: dict[str, int] = {}
+        async with AsyncSessionLocal() as db:
+            for name in AUDIT_ROLLUPS:
+                try:
+                    updated[name] = await refresh_audit_rollup(db, name)
+                except Exception as e:
+                    # One broken rollup must not hold back the others
+                    await db.rollback()
+                    logger.error(
+                        "Audit rollup refresh failed",
+                        rollup=name,
+                        error=str(e),
+                        exc_info=True,
+                    )
+        return updated
+
+    updated = asyncio.run(run_refresh())
+    logger.info("Audit rollups refreshed", buckets_updated=updated)
+    return {
+        "status": "completed" if len(updated) == len(AUDIT_ROLLUPS) else "partial",
+        "buckets_updated": updated,
+    }
+
+
+@celery_app.task(name="app.services.celery_tasks.purge_expired_one_time_tokens_task")
+def purge_expired_one_time_tokens_task() -> dict[str, Any]:
+    """Delete expired tokens from the database token store."""
+    import asyncio
+
+    from app.core.config import get_app_logger
+    from app.crud.auth.one_time_token import delete_expired_one_time_tokens
+    from app.database.database import AsyncSessionLocal
+
+    logger = get_app_logger()
+
+    async def run_purge() -> int:
+        async with AsyncSessionLocal() as db:
+            return await delete_expired_one_time_tokens(db)
+
+    purged = asyncio.run(run_purge())
+    logger.info("Expired one-time tokens purged", purged=purged)
+    return {"status": "completed", "purged": purged}
@@ -0,0 +1,35 @@
+"""Application cache with pluggable memory and Redis backends."""
+
+from .backends import (
+    MISSING,
+    CacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    TieredCacheBackend,
+)
+from .cache import (
+    Cache,
+    build_cache_key,
+    cached,
+    get_cache,
+    get_cache_stats,
+    get_request_cache_status,
+    has_cached_functions,
+)
+from .middleware import CacheStatusMiddleware
+
+__all__ = [
+    "MISSING",
+    "Cache",
+    "CacheBackend",
+    "CacheStatusMiddleware",
+    "MemoryCacheBackend",
+    "RedisCacheBackend",
+    "TieredCacheBackend",
+    "build_cache_key",
+    "cached",
+    "get_cache",
+    "get_cache_stats",
+    "get_request_cache_status",
+    "has_cached_functions",
+]
@@ -0,0 +1,413 @@
+"""
+Storage backends for the application cache.
+
+MemoryCacheBackend keeps values in a per-process LRU that is bounded both by
+entry count and by an estimate of the memory the values use. RedisCacheBackend
+shares values between workers; it stores them as JSON, so values read back
+are plain JSON types (dicts, lists, strings, numbers). TieredCacheBackend puts
+a memory cache in front of Redis.
+"""
+
+import json
+import sys
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from fastapi.encoders import jsonable_encoder
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+# Returned by get() for absent keys, so that None can be cached
+MISSING: Any = object()
+
+
+class CacheBackend(ABC):
+    """Key/value storage with per-entry TTL and tag-based invalidation."""
+
+    name: str
+
+    @abstractmethod
+    async def get(self, key: str) -> Any:
+        """Get a value, or MISSING if absent or expired."""
+
+    @abstractmethod
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        tags: Iterable[str] = (),
+        versions: dict[str, int] | None = None,
+    ) -> None:
+        """
+        Store a value for ttl seconds, indexed under tags.
+
+        versions is the tag_versions() snapshot taken before the value was
+        loaded; an invalidation since then makes the value read as stale.
+        """
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a value."""
+
+    @abstractmethod
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Remove every value stored under any of the tags."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove every value."""
+
+    async def tag_versions(self, tags: Iterable[str]) -> dict[str, int] | None:
+        """Snapshot the tags' versions before loading a value to store."""
+        # Only backends shared between workers version their tags
+        return None
+
+    async def apply_invalidation(self, message: dict[str, Any]) -> None:
+        """Apply an invalidation published by another worker."""
+        # Only backends with per-worker state have anything to drop
+        return
+
+    def stats(self) -> dict[str, Any]:
+        """Backend-specific counters."""
+        return {"backend": self.name}
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the bytes a value keeps alive, following containers."""
+    seen: set[int] = set()
+    pending = [value]
+    size = 0
+    while pending:
+        item = pending.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, list | tuple | set | frozenset):
+            pending.extend(item)
+        elif hasattr(item, "__dict__"):
+            pending.append(vars(item))
+    return size
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires_at: float
+    size: int
+    tags: tuple[str, ...]
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Per-process LRU cache.
+
+    Least recently used entries are evicted once either max_entries or
+    max_bytes (as measured by estimate_size) is exceeded. Values are returned
+    as stored, not copied, so don't mutate them.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+
+    def _remove(self, key: str) -> _Entry | None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+            for tag in entry.tags:
+                keys = self._tags.get(tag)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._tags[tag]
+        return entry
+
+    async def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        return entry.value
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        tags: Iterable[str] = (),
+        versions: dict[str, int] | None = None,
+    ) -> None:
+        self._remove(key)
+        size = sys.getsizeof(key) + estimate_size(value)
+        if size > self.max_bytes:
+            # Caching it would flush everything else
+            return
+        tags = tuple(tags)
+        self._entries[key] = _Entry(value, time.monotonic() + ttl, size, tags)
+        self.bytes += size
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._remove(key)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        keys = set().union(*(self._tags.get(tag, ()) for tag in tags))
+        for key in keys:
+            self._remove(key)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+        self.bytes = 0
+
+    async def apply_invalidation(self, message: dict[str, Any]) -> None:
+        if message.get("clear"):
+            await self.clear()
+            return
+        for key in message.get("keys", ()):
+            await self.delete(key)
+        await self.invalidate_tags(message.get("tags", ()))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": self.name,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache shared by all workers through Redis.
+
+    Values live at ``<prefix>:<key>`` with a native TTL, together with the
+    version each of their tags had before they were loaded (or else when they
+    were written). Invalidating a tag
+    increments ``<prefix>:version:<tag>``, so every value stored under it reads
+    as stale without the keys having to be found. A version key lives at least
+    as long as the values that reference it. Eviction under memory pressure is
+    left to Redis' maxmemory policy.
+    """
+
+    name = "redis"
+
+    def __init__(self, client: "redis.Redis", prefix: str = "cache") -> None:
+        self.client = client
+        self.prefix = prefix
+        self.stale_reads = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def _version_key(self, tag: str) -> str:
+        return f"{self.prefix}:version:{tag}"
+
+    async def tag_versions(self, tags: Iterable[str]) -> dict[str, int]:
+        tags = list(dict.fromkeys(tags))
+        if not tags:
+            return {}
+        versions = await self.client.mget([self._version_key(tag) for tag in tags])
+        return {
+            tag: int(version or 0) for tag, version in zip(tags, versions, strict=True)
+        }
+
+    async def get_entry(self, key: str) -> tuple[Any, list[str]] | None:
+        """Get a current value together with its tags, or None."""
+        payload = await self.client.get(self._key(key))
+        if payload is None:
+            return None
+        entry = json.loads(payload)
+        versions: dict[str, int] = entry["versions"]
+        if versions and await self.tag_versions(versions) != versions:
+            # A tag was invalidated after the value was written
+            self.stale_reads += 1
+            return None
+        return entry["value"], list(versions)
+
+    async def get(self, key: str) -> Any:
+        entry = await self.get_entry(key)
+        return MISSING if entry is None else entry[0]
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        tags: Iterable[str] = (),
+        versions: dict[str, int] | None = None,
+    ) -> None:
+        seconds = max(1, int(ttl))
+        tags = list(dict.fromkeys(tags))
+        if tags:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for tag in tags:
+                    version_key = self._version_key(tag)
+                    # Create it with a TTL if absent, else only ever extend it
+                    pipe.set(version_key, 0, ex=seconds, nx=True)
+                    pipe.expire(version_key, seconds, gt=True)
+                await pipe.execute()
+        if versions is None:
+            versions = await self.tag_versions(tags)
+        else:
+            # A tag left out of the snapshot reads as stale once invalidated
+            versions = {tag: versions.get(tag, 0) for tag in tags}
+        payload = {"value": jsonable_encoder(value), "versions": versions}
+        await self.client.set(self._key(key), json.dumps(payload), ex=seconds)
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self._key(key))
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                version_key = self._version_key(tag)
+                pipe.incr(version_key)
+                # Only matters if no value referenced the tag; writes extend it
+                pipe.expire(version_key, 3600, nx=True)
+            await pipe.execute()
+
+    async def clear(self) -> None:
+        batch: list[str] = []
+        async for key in self.client.scan_iter(match=f"{self.prefix}:*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                await self.client.delete(*batch)
+                batch.clear()
+        if batch:
+            await self.client.delete(*batch)
+
+    def stats(self) -> dict[str, Any]:
+        return {"backend": self.name, "stale_reads": self.stale_reads}
+
+
+class TieredCacheBackend(CacheBackend):
+    """
+    Per-worker memory cache (L1) in front of the shared Redis cache (L2).
+
+    Reads try L1, then L2, copying L2 hits into L1 for at most l1_ttl seconds.
+    Deletes and tag invalidations are applied to both tiers and published on
+    ``channel``; every worker's listener (see invalidation.py) drops the
+    matching L1 entries. l1_ttl bounds how long a worker that missed a message
+    can serve a stale L1 entry; L2 checks tag versions on every read.
+
+    Both tiers hold values as JSON types, so a value reads the same whichever
+    worker or tier serves it.
+    """
+
+    name = "tiered"
+
+    def __init__(
+        self,
+        l1: MemoryCacheBackend,
+        l2: RedisCacheBackend,
+        l1_ttl: float,
+        channel: str = "cache:invalidate",
+    ) -> None:
+        self.l1 = l1
+        self.l2 = l2
+        self.l1_ttl = l1_ttl
+        self.channel = channel
+        # Tells this worker's own messages apart
+        self.origin = uuid.uuid4().hex
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.invalidations_received = 0
+
+    @property
+    def client(self) -> "redis.Redis":
+        return self.l2.client
+
+    async def get(self, key: str) -> Any:
+        value = await self.l1.get(key)
+        if value is not MISSING:
+            self.l1_hits += 1
+            return value
+        entry = await self.l2.get_entry(key)
+        if entry is None:
+            return MISSING
+        self.l2_hits += 1
+        value, tags = entry
+        await self.l1.set(key, value, self.l1_ttl, tags)
+        return value
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        tags: Iterable[str] = (),
+        versions: dict[str, int] | None = None,
+    ) -> None:
+        tags = tuple(tags)
+        value = jsonable_encoder(value)
+        await self.l2.set(key, value, ttl, tags, versions)
+        await self.l1.set(key, value, min(ttl, self.l1_ttl), tags)
+
+    async def tag_versions(self, tags: Iterable[str]) -> dict[str, int]:
+        return await self.l2.tag_versions(tags)
+
+    async def _publish(self, **message: Any) -> None:
+        await self.client.publish(
+            self.channel,
+            json.dumps({"origin": self.origin, **message}),
+        )
+
+    async def delete(self, key: str) -> None:
+        await self.l1.delete(key)
+        await self.l2.delete(key)
+        await self._publish(keys=[key])
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        tags = list(tags)
+        await self.l1.invalidate_tags(tags)
+        await self.l2.invalidate_tags(tags)
+        await self._publish(tags=tags)
+
+    async def clear(self) -> None:
+        await self.l1.clear()
+        await self.l2.clear()
+        await self._publish(clear=True)
+
+    async def apply_invalidation(self, message: dict[str, Any]) -> None:
+        if message.get("origin") == self.origin:
+            return
+        self.invalidations_received += 1
+        await self.l1.apply_invalidation(message)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": self.name,
+            "l1": self.l1.stats(),
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "stale_reads": self.l2.stale_reads,
+            "invalidations_received": self.invalidations_received,
+        }
@@ -0,0 +1,396 @@
+"""
+Application cache with single-flight loading and tag-based invalidation.
+
+Use the ``cached`` decorator for async functions, or ``get_cache()`` for
+direct access:
+
+    @cached(ttl=300, tags=lambda db, user_id: [f"user:{user_id}"])
+    async def get_user_summary(db: AsyncSession, user_id: str) -> dict: ...
+
+    await get_cache().invalidate_tags([f"user:{user_id}"])
+
+Keys are built from the function's bound arguments. Sessions, requests and
+responses are skipped, and arguments without a stable representation raise
+TypeError (pass ``key=`` for those). Concurrent misses for the same key share
+one load. The backend is chosen by CACHE_BACKEND; see backends.py.
+"""
+
+import asyncio
+import hashlib
+import inspect
+from collections.abc import Awaitable, Callable, Iterable
+from contextvars import ContextVar
+from datetime import date, time
+from decimal import Decimal
+from enum import Enum
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.background import BackgroundTasks
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.config import get_app_logger, settings
+from app.services.cache.backends import (
+    MISSING,
+    CacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    TieredCacheBackend,
+)
+
+logger = get_app_logger()
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+CACHE_HIT = "HIT"
+CACHE_MISS = "MISS"
+CACHE_BYPASS = "BYPASS"
+
+# Arguments that don't identify the result
+SKIPPED_KEY_ARGUMENT_TYPES = (
+    AsyncSession,
+    Session,
+    Request,
+    Response,
+    BackgroundTasks,
+)
+
+_KEY_SCALAR_TYPES = (str, int, float, bool, bytes, Decimal, UUID, date, time, Enum)
+
+
+class _RequestCacheStatus:
+    """Outcome of the cache lookups made while handling one request."""
+
+    def __init__(self) -> None:
+        self.status: str | None = None
+
+
+# Shared by reference, so lookups made in tasks spawned by the request
+# (BaseHTTPMiddleware runs the endpoint in one) are seen by the middleware
+_request_cache_status: ContextVar[_RequestCacheStatus | None] = ContextVar(
+    "request_cache_status",
+    default=None,
+)
+
+
+def start_request_cache_status() -> None:
+    """Start tracking the cache lookups of a new request."""
+    _request_cache_status.set(_RequestCacheStatus())
+
+
+def _record_cache_status(status: str) -> None:
+    tracker = _request_cache_status.get()
+    if tracker is None:
+        tracker = _RequestCacheStatus()
+        _request_cache_status.set(tracker)
+    # A single miss makes the whole response a miss
+    if tracker.status != CACHE_MISS:
+        tracker.status = status
+
+
+def get_request_cache_status() -> str:
+    """
+    Get the X-Cache-Status of the current request.
+
+    HIT if every cache lookup in the request hit, MISS if any missed, and
+    BYPASS if it made none.
+    """
+    tracker = _request_cache_status.get()
+    return (tracker.status if tracker else None) or CACHE_BYPASS
+
+
+class Cache:
+    """A cache backend plus hit/miss metrics and single-flight loading."""
+
+    def __init__(self, backend: CacheBackend, default_ttl: float) -> None:
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.load_errors = 0
+        self.backend_errors = 0
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        # Bumped by invalidations; a load that straddles one isn't stored
+        self._generation = 0
+
+    async def get(self, key: str) -> Any:
+        """Get a cached value, or MISSING. Backend errors count as misses."""
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            self.backend_errors += 1
+            logger.warning("Cache read failed", key=key, error=str(e))
+            value = MISSING
+        if value is MISSING:
+            self.misses += 1
+            _record_cache_status(CACHE_MISS)
+        else:
+            self.hits += 1
+            _record_cache_status(CACHE_HIT)
+        return value
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        tags: Iterable[str] = (),
+        versions: dict[str, int] | None = None,
+    ) -> None:
+        """Store a value; a ttl of 0 or less doesn't store it."""
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        try:
+            await self.backend.set(key, value, ttl, tags, versions)
+        except Exception as e:
+            self.backend_errors += 1
+            logger.warning("Cache write failed", key=key, error=str(e))
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[R]],
+        ttl: float | None = None,
+        tags: Iterable[str] = (),
+    ) -> R:
+        """Get a cached value, loading and storing it on a miss."""
+        value = await self.get(key)
+        if value is not MISSING:
+            return value  # type: ignore[no-any-return]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(inflight)  # type: ignore[no-any-return]
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The loading request was cancelled; load it ourselves
+                return await self.get_or_load(key, loader, ttl, tags)
+
+        tags = tuple(tags)
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            # Other workers' invalidations during the load make it read as stale
+            versions = await self._tag_versions(key, tags)
+            result = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            self.load_errors += 1
+            future.set_exception(e)
+            # Waiters re-raise it; don't warn if there are none
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._inflight[key]
+
+        if generation == self._generation and versions is not MISSING:
+            await self.set(key, result, ttl, tags, versions)
+        return result
+
+    async def _tag_versions(self, key: str, tags: tuple[str, ...]) -> Any:
+        """The backend's tag_versions(), or MISSING if it failed."""
+        if not tags:
+            return None
+        try:
+            return await self.backend.tag_versions(tags)
+        except Exception as e:
+            self.backend_errors += 1
+            logger.warning("Cache read failed", key=key, error=str(e))
+            return MISSING
+
+    async def delete(self, key: str) -> None:
+        """Remove a cached value."""
+        self._generation += 1
+        await self.backend.delete(key)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Remove every value stored under any of the tags."""
+        self._generation += 1
+        await self.backend.invalidate_tags(tags)
+
+    async def apply_invalidation(self, message: dict[str, Any]) -> None:
+        """Apply an invalidation published by another worker."""
+        self._generation += 1
+        await self.backend.apply_invalidation(message)
+
+    async def clear(self) -> None:
+        """Remove every value and reset the counters."""
+        self._generation += 1
+        await self.backend.clear()
+        self.hits = self.misses = self.coalesced = 0
+        self.load_errors = self.backend_errors = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters merged with the backend's own."""
+        total = self.hits + self.misses
+        return {
+            **self.backend.stats(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+            "coalesced": self.coalesced,
+            "load_errors": self.load_errors,
+            "backend_errors": self.backend_errors,
+        }
+
+
+_caches: dict[str, Cache] = {}
+
+
+def _memory_backend() -> MemoryCacheBackend:
+    return MemoryCacheBackend(settings.CACHE_MAX_ENTRIES, settings.CACHE_MAX_BYTES)
+
+
+def _redis_backend(name: str, redis_client: Any) -> CacheBackend:
+    if name == TieredCacheBackend.name:
+        return TieredCacheBackend(
+            _memory_backend(),
+            RedisCacheBackend(redis_client),
+            settings.CACHE_L1_TTL,
+        )
+    return RedisCacheBackend(redis_client)
+
+
+def get_cache() -> Cache:
+    """
+    Get the configured cache.
+
+    Uses Redis (CACHE_BACKEND "redis") or memory in front of Redis ("tiered")
+    while the Redis client is up, otherwise the per-process memory cache.
+    """
+    backend_name = settings.CACHE_BACKEND
+    if settings.ENABLE_REDIS and backend_name in (
+        RedisCacheBackend.name,
+        TieredCacheBackend.name,
+    ):
+        from app.services.external.redis import get_redis_client
+
+        redis_client = get_redis_client()
+        if redis_client:
+            cache = _caches.get(backend_name)
+            client = getattr(cache.backend, "client", None) if cache else None
+            # A new client after a Redis reconnect gets a new backend
+            if cache is None or client is not redis_client:
+                cache = Cache(
+                    _redis_backend(backend_name, redis_client),
+                    settings.CACHE_DEFAULT_TTL,
+                )
+                _caches[backend_name] = cache
+            return cache
+
+    cache = _caches.get(MemoryCacheBackend.name)
+    if cache is None:
+        cache = Cache(_memory_backend(), settings.CACHE_DEFAULT_TTL)
+        _caches[MemoryCacheBackend.name] = cache
+    return cache
+
+
+def get_cache_stats() -> dict[str, Any]:
+    """Get the counters of every cache used so far, by backend."""
+    return {name: cache.stats() for name, cache in _caches.items()}
+
+
+def _key_part(value: Any) -> str:
+    """A representation of an argument that is equal for equal values."""
+    if value is None or isinstance(value, _KEY_SCALAR_TYPES):
+        return repr(value)
+    if isinstance(value, BaseModel):
+        return f"{type(value).__qualname__}{value.model_dump_json()}"
+    if isinstance(value, list | tuple):
+        return f"[{','.join(_key_part(item) for item in value)}]"
+    if isinstance(value, set | frozenset):
+        return f"{{{','.join(sorted(_key_part(item) for item in value))}}}"
+    if isinstance(value, dict):
+        items = sorted(f"{_key_part(k)}:{_key_part(v)}" for k, v in value.items())
+        return f"{{{','.join(items)}}}"
+    msg = (
+        f"Can't build a cache key from a {type(value).__name__} argument; "
+        "pass key= to cached()"
+    )
+    raise TypeError(msg)
+
+
+def build_cache_key(
+    func: Callable[..., Any],
+    signature: inspect.Signature,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> str:
+    """Build a cache key from a function's bound arguments, skipping sessions."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    parts = "|".join(
+        f"{name}={_key_part(value)}"
+        for name, value in bound.arguments.items()
+        if not isinstance(value, SKIPPED_KEY_ARGUMENT_TYPES)
+    )
+    digest = hashlib.sha256(parts.encode()).hexdigest()[:32]
+    return f"{func.__module__}.{func.__qualname__}:{digest}"
+
+
+# Functions decorated with cached(), so startup knows whether the cache is used
+_cached_functions: set[str] = set()
+
+
+def has_cached_functions() -> bool:
+    """Whether any function has been decorated with cached()."""
+    return bool(_cached_functions)
+
+
+def cached(
+    ttl: float | None = None,
+    *,
+    key: Callable[..., str] | None = None,
+    tags: Iterable[str] | Callable[..., Iterable[str]] = (),
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """
+    Decorator to cache an async function's results.
+
+    Args:
+        ttl: Seconds to keep a result (default: CACHE_DEFAULT_TTL; 0 disables)
+        key: Builds the key from the call's arguments instead of the default
+        tags: Tags to store results under, or a function of the call's
+            arguments returning them
+
+    Returns:
+        Decorated function with caching
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        signature = inspect.signature(func)
+        _cached_functions.add(f"{func.__module__}.{func.__qualname__}")
+
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            cache_key = (
+                f"{func.__module__}.{func.__qualname__}:{key(*args, **kwargs)}"
+                if key
+                else build_cache_key(func, signature, args, kwargs)
+            )
+            entry_tags = tags(*args, **kwargs) if callable(tags) else tags
+            return await get_cache().get_or_load(
+                cache_key,
+                lambda: func(*args, **kwargs),
+                ttl,
+                entry_tags,
+            )
+
+        return wrapper
+
+    return decorator
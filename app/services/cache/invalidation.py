@@ -0,0 +1,71 @@
+"""
+Cross-worker cache invalidation over Redis pub/sub.
+
+With CACHE_BACKEND=tiered, TieredCacheBackend publishes every delete, tag
+invalidation and clear. Each worker runs the listener below from lifespan and
+drops the matching entries from its own L1. Messages published while a worker
+isn't subscribed are lost, so its L1 is flushed whenever it (re)subscribes.
+"""
+
+import asyncio
+import contextlib
+import json
+
+from app.core.config import get_app_logger
+from app.services.cache.backends import TieredCacheBackend
+from app.services.cache.cache import get_cache
+
+logger = get_app_logger()
+
+# Seconds between reconnect attempts, doubling up to the maximum
+RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 30.0
+
+_listener_task: asyncio.Task[None] | None = None
+
+
+async def run_invalidation_listener() -> None:
+    """Apply invalidations published by other workers until cancelled."""
+    delay = RECONNECT_DELAY
+    while True:
+        backend = get_cache().backend
+        # While Redis is down get_cache() serves from memory; retry later
+        if isinstance(backend, TieredCacheBackend):
+            pubsub = backend.client.pubsub()
+            try:
+                await pubsub.subscribe(backend.channel)
+                await get_cache().apply_invalidation({"clear": True})
+                delay = RECONNECT_DELAY
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        await get_cache().apply_invalidation(
+                            json.loads(message["data"]),
+                        )
+            except Exception as e:
+                logger.warning(
+                    "Cache invalidation listener disconnected",
+                    error=str(e) or type(e).__name__,
+                )
+            finally:
+                with contextlib.suppress(Exception):
+                    await pubsub.close()
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+
+def start_invalidation_listener() -> None:
+    """Start listening for cache invalidations from other workers."""
+    global _listener_task
+    _listener_task = asyncio.create_task(run_invalidation_listener())
+
+
+async def stop_invalidation_listener() -> None:
+    """Stop the invalidation listener."""
+    global _listener_task
+    if _listener_task and not _listener_task.done():
+        _listener_task.cancel()
+        try:
+            await _listener_task
+        except asyncio.CancelledError:
+            pass
+    _listener_task = None
@@ -0,0 +1,38 @@
+"""Middleware reporting whether a response was served from the cache."""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.cache.cache import (
+    CACHE_BYPASS,
+    get_request_cache_status,
+    start_request_cache_status,
+)
+
+
+class CacheStatusMiddleware:
+    """
+    Set X-Cache-Status on responses of requests that looked up the cache.
+
+    HIT means every lookup hit; MISS means at least one had to load. Requests
+    that didn't use the cache get no header.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_request_cache_status()
+
+        async def send_with_cache_status(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                cache_status = get_request_cache_status()
+                if cache_status != CACHE_BYPASS:
+                    MutableHeaders(scope=message)["X-Cache-Status"] = cache_status
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_status)
@@ -0,0 +1,140 @@
+"""
+Cross-worker cache invalidation over Postgres LISTEN/NOTIFY.
+
+For deployments without Redis: CRUD writes publish the cache tags they affect
+with NOTIFY when they commit (see app/database/invalidation.py), and each
+worker runs the listener below from lifespan on a dedicated asyncpg
+connection, outside the pool. Notifications sent while a worker isn't
+listening are lost, so its cache is flushed whenever it (re)connects. A
+connection that drops without a clean close is found by pinging it every
+HEALTH_CHECK_INTERVAL seconds.
+
+The connection must reach Postgres directly (DATABASE_LISTEN_URL): pgbouncer
+in transaction mode accepts LISTEN but never delivers the notifications.
+"""
+
+import asyncio
+import contextlib
+import json
+from typing import Any
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from app.core.config import get_app_logger, settings
+from app.database.invalidation import INVALIDATION_CHANNEL
+from app.services.cache.cache import get_cache
+
+logger = get_app_logger()
+
+# Seconds between reconnect attempts, doubling up to the maximum
+RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 30.0
+
+HEALTH_CHECK_INTERVAL = 30.0
+HEALTH_CHECK_TIMEOUT = 5.0
+
+# pgbouncer's default port; its host is named pgbouncer in the deployment guide
+PGBOUNCER_PORT = 6432
+
+_listener_task: asyncio.Task[None] | None = None
+
+
+def listener_dsn() -> str:
+    """
+    URL of LISTEN connections: DATABASE_LISTEN_URL, or else DATABASE_URL.
+
+    Without the SQLAlchemy driver suffix, which asyncpg doesn't know.
+    """
+    url = make_url(settings.DATABASE_LISTEN_URL or settings.DATABASE_URL)
+    return url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+def listens_through_pgbouncer() -> bool:
+    """Whether the LISTEN connection looks like it goes through pgbouncer."""
+    url = make_url(listener_dsn())
+    return "pgbouncer" in (url.host or "").lower() or url.port == PGBOUNCER_PORT
+
+
+def check_listener_dsn(listener: str) -> None:
+    """Log an error if a listener would connect through pgbouncer."""
+    if listens_through_pgbouncer():
+        logger.error(
+            "Listener connects through pgbouncer; in transaction mode it never "
+            "receives notifications. Set DATABASE_LISTEN_URL to connect to "
+            "Postgres directly",
+            listener=listener,
+        )
+
+
+async def _on_notification(
+    connection: Any,
+    pid: int,
+    channel: str,
+    payload: str,
+) -> None:
+    try:
+        message = json.loads(payload)
+    except ValueError:
+        logger.warning("Ignoring malformed cache invalidation", payload=payload)
+        return
+    await get_cache().apply_invalidation(message)
+
+
+async def wait_until_lost(connection: asyncpg.Connection) -> None:
+    """Return once the connection closes or stops answering pings."""
+    lost = asyncio.Event()
+    connection.add_termination_listener(lambda _connection: lost.set())
+    while not connection.is_closed():
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(lost.wait(), HEALTH_CHECK_INTERVAL)
+        if lost.is_set():
+            return
+        await asyncio.wait_for(connection.fetchval("SELECT 1"), HEALTH_CHECK_TIMEOUT)
+
+
+async def run_pg_invalidation_listener() -> None:
+    """Apply invalidations notified through Postgres until cancelled."""
+    delay = RECONNECT_DELAY
+    while True:
+        connection: asyncpg.Connection | None = None
+        try:
+            connection = await asyncpg.connect(
+                listener_dsn(),
+                server_settings={"application_name": "fastapi_template_cache"},
+            )
+            await connection.add_listener(INVALIDATION_CHANNEL, _on_notification)
+            await get_cache().apply_invalidation({"clear": True})
+            delay = RECONNECT_DELAY
+            await wait_until_lost(connection)
+            logger.warning("Cache invalidation listener connection closed")
+        except Exception as e:
+            logger.warning(
+                "Cache invalidation listener disconnected",
+                error=str(e) or type(e).__name__,
+            )
+        finally:
+            if connection is not None:
+                with contextlib.suppress(Exception):
+                    await connection.close(timeout=HEALTH_CHECK_TIMEOUT)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+
+def start_pg_invalidation_listener() -> None:
+    """Start listening for cache invalidations notified through Postgres."""
+    global _listener_task
+    check_listener_dsn("cache_invalidation")
+    _listener_task = asyncio.create_task(run_pg_invalidation_listener())
+
+
+async def stop_pg_invalidation_listener() -> None:
+    """Stop the Postgres invalidation listener."""
+    global _listener_task
+    if _listener_task and not _listener_task.done():
+        _listener_task.cancel()
+        try:
+            await _listener_task
+        except asyncio.CancelledError:
+            pass
+    _listener_task = None
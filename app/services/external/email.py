@@ -1,24 +1,12 @@
 import secrets
 import string
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 
 import emails
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.crud import (
-    get_user_by_deletion_token,
-    get_user_by_password_reset_token,
-    get_user_by_verification_token,
-    update_deletion_token,
-    update_password_reset_token,
-    update_verification_token,
-)
-
-
-def utc_now() -> datetime:
-    """Get current UTC datetime (replaces deprecated utc_now())."""
-    return datetime.now(timezone.utc)
+from app.services.auth.token_store import TokenPurpose, get_token_store
 
 
 class EmailService:
@@ -104,32 +92,20 @@ class EmailService:
     ) -> str | None:
         """Create and store verification token for a user."""
         token = self.generate_verification_token()
-        expires = utc_now() + timedelta(hours=settings.VERIFICATION_TOKEN_EXPIRE_HOURS)
 
-        success = await update_verification_token(
+        success = await get_token_store().issue(
             db,
-            user_id=user_id,
-            token=token,
-            expires=expires,
+            TokenPurpose.VERIFICATION,
+            user_id,
+            token,
+            timedelta(hours=settings.VERIFICATION_TOKEN_EXPIRE_HOURS),
         )
 
         return token if success else None
 
     async def verify_token(self, db: AsyncSession, token: str) -> str | None:
-        """Verify a verification token and return user ID if valid."""
-        user = await get_user_by_verification_token(db, token=token)
-        if not user:
-            return None
-
-        # Check if token is expired
-        if (
-            user.verification_token_expires
-            and user.verification_token_expires < utc_now()
-        ):
-            return None
-
-        # Return user ID for verification
-        return str(user.id)
+        """Consume a verification token and return user ID if valid."""
+        return await get_token_store().consume(db, TokenPurpose.VERIFICATION, token)
 
     def send_password_reset_email(
         self,
@@ -189,15 +165,13 @@ class EmailService:
     ) -> str | None:
         """Create and store password reset token for a user."""
         token = self.generate_verification_token()
-        expires = utc_now() + timedelta(
-            hours=settings.PASSWORD_RESET_TOKEN_EXPIRE_HOURS,
-        )
 
-        success = await update_password_reset_token(
+        success = await get_token_store().issue(
             db,
-            user_id=user_id,
-            token=token,
-            expires=expires,
+            TokenPurpose.PASSWORD_RESET,
+            user_id,
+            token,
+            timedelta(hours=settings.PASSWORD_RESET_TOKEN_EXPIRE_HOURS),
         )
 
         return token if success else None
@@ -207,20 +181,8 @@ class EmailService:
         db: AsyncSession,
         token: str,
     ) -> str | None:
-        """Verify a password reset token and return user ID if valid."""
-        user = await get_user_by_password_reset_token(db, token=token)
-        if not user:
-            return None
-
-        # Check if token is expired
-        if (
-            user.password_reset_token_expires
-            and user.password_reset_token_expires < utc_now()
-        ):
-            return None
-
-        # Return user ID for password reset
-        return str(user.id)
+        """Consume a password reset token and return user ID if valid."""
+        return await get_token_store().consume(db, TokenPurpose.PASSWORD_RESET, token)
 
     def send_account_deletion_email(
         self,
@@ -330,31 +292,24 @@ class EmailService:
     async def create_deletion_token(self, db: AsyncSession, user_id: str) -> str | None:
         """Create and store deletion token for a user."""
         token = self.generate_verification_token()
-        expires = utc_now() + timedelta(
-            hours=settings.ACCOUNT_DELETION_TOKEN_EXPIRE_HOURS,
-        )
 
-        success = await update_deletion_token(
+        success = await get_token_store().issue(
             db,
-            user_id=user_id,
-            token=token,
-            expires=expires,
+            TokenPurpose.DELETION,
+            user_id,
+            token,
+            timedelta(hours=settings.ACCOUNT_DELETION_TOKEN_EXPIRE_HOURS),
         )
 
         return token if success else None
 
     async def verify_deletion_token(self, db: AsyncSession, token: str) -> str | None:
-        """Verify a deletion token and return user ID if valid."""
-        user = await get_user_by_deletion_token(db, token=token)
-        if not user:
-            return None
-
-        # Check if token is expired
-        if user.deletion_token_expires and user.deletion_token_expires < utc_now():
-            return None
+        """Consume a deletion token and return user ID if valid."""
+        return await get_token_store().consume(db, TokenPurpose.DELETION, token)
 
-        # Return user ID for deletion confirmation
-        return str(user.id)
+    async def revoke_deletion_token(self, db: AsyncSession, user_id: str) -> None:
+        """Invalidate a user's pending deletion token."""
+        await get_token_store().revoke(db, TokenPurpose.DELETION, user_id)
 
 
 email_service = EmailService()
@@ -0,0 +1,252 @@
+"""
+HTTP caching policy per route, with weak ETags and conditional GET.
+
+Routes declare how clients may cache their responses with a dependency:
+
+    @router.get("/me", dependencies=[Depends(cache_policy(PRIVATE))])
+
+Routes that can't take dependencies (such as FastAPI's OpenAPI route) are
+given a policy by path in configure_http_cache(). Responses of routes with a
+non-sensitive policy get Cache-Control from the policy and a weak ETag, and a
+GET whose If-None-Match carries that ETag is answered with an empty 304.
+
+An endpoint that can tell its version without building the response (e.g. from
+``updated_at``) calls check_not_modified() first, which skips serializing the
+response entirely on a match. Otherwise the ETag is a hash of the body.
+
+Routes without a policy are left alone, so SecurityHeadersMiddleware keeps
+sending no-store on every /api/ response that didn't opt in.
+"""
+
+import hashlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import cast
+
+from fastapi import FastAPI, Request, Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+NO_STORE = "no-store, no-cache, must-revalidate, max-age=0"
+
+CACHE_POLICY_STATE_KEY = "cache_policy"
+ETAG_STATE_KEY = "etag"
+
+# Headers that describe a body, which a 304 doesn't have
+_BODY_HEADERS = frozenset({"content-length", "content-type", "content-encoding"})
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How clients may cache a route's responses."""
+
+    # Seconds a client may reuse a response without revalidating it
+    max_age: int = 0
+    # Whether shared caches (proxies, CDNs) may store it
+    public: bool = False
+    # Never stored anywhere; no ETag either
+    sensitive: bool = False
+
+    @property
+    def cache_control(self) -> str:
+        if self.sensitive:
+            return NO_STORE
+        scope = "public" if self.public else "private"
+        if self.max_age > 0:
+            return f"{scope}, max-age={self.max_age}"
+        return f"{scope}, no-cache"
+
+
+# Revalidated on every use; PRIVATE for per-user responses
+PRIVATE = CachePolicy()
+PUBLIC = CachePolicy(public=True)
+SENSITIVE = CachePolicy(sensitive=True)
+
+
+class NotModifiedError(Exception):
+    """Raised by check_not_modified when the client has the current version."""
+
+    def __init__(self, etag: str) -> None:
+        super().__init__(etag)
+        self.etag = etag
+
+
+def cache_policy(policy: CachePolicy) -> Callable[[Request], None]:
+    """Dependency declaring the cache policy of a route."""
+
+    def declare_cache_policy(request: Request) -> None:
+        setattr(request.state, CACHE_POLICY_STATE_KEY, policy)
+
+    return declare_cache_policy
+
+
+def weak_etag(*parts: object) -> str:
+    """A weak ETag identifying the given version parts."""
+    digest = hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def body_etag(body: bytes) -> str:
+    """A weak ETag from a response body."""
+    return f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an ETag against an If-None-Match header."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def check_not_modified(request: Request, *version: object) -> None:
+    """
+    Answer with 304 if the client already has this version of the response.
+
+    Call it before building the response; version identifies the response,
+    e.g. the record's id and updated_at. The response gets the same ETag.
+    """
+    etag = weak_etag(*version)
+    setattr(request.state, ETAG_STATE_KEY, etag)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise NotModifiedError(etag)
+
+
+async def not_modified_handler(request: Request, exc: NotModifiedError) -> Response:
+    """Turn NotModifiedError into an empty 304."""
+    return Response(status_code=304, headers={"ETag": exc.etag})
+
+
+def _not_modified(start: Message) -> Message:
+    headers = [
+        (name, value)
+        for name, value in start.get("headers", [])
+        if name.decode("latin-1").lower() not in _BODY_HEADERS
+    ]
+    return {**start, "status": 304, "headers": headers}
+
+
+class HTTPCacheMiddleware:
+    """
+    Apply each route's CachePolicy: Cache-Control, weak ETags and 304s.
+
+    Only responses of routes with a policy are touched. Bodies are buffered to
+    hash them, so give policies to routes with small responses only.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        policies: dict[str, CachePolicy] | None = None,
+    ) -> None:
+        self.app = app
+        self.policies = policies or {}
+
+    @staticmethod
+    def _policy(scope: Scope) -> CachePolicy | None:
+        policy: CachePolicy | None = scope.get("state", {}).get(
+            CACHE_POLICY_STATE_KEY,
+        )
+        return policy
+
+    @staticmethod
+    def _version_etag(scope: Scope) -> str | None:
+        etag: str | None = scope.get("state", {}).get(ETAG_STATE_KEY)
+        return etag
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path_policy = self.policies.get(scope["path"])
+        if path_policy is not None:
+            # Declared like a route's own policy, for the middleware outside
+            scope.setdefault("state", {}).setdefault(
+                CACHE_POLICY_STATE_KEY,
+                path_policy,
+            )
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        conditional = scope["method"] in ("GET", "HEAD")
+        # The response start, held back until the body is hashed
+        held_start: Message | None = None
+        body: list[bytes] = []
+        # Set once a 304 replaced the response; its body is dropped
+        replaced = False
+
+        async def send_with_cache_headers(message: Message) -> None:
+            nonlocal held_start, replaced
+            if message["type"] == "http.response.start":
+                policy = self._policy(scope)
+                if policy is None:
+                    await send(message)
+                    return
+                headers = MutableHeaders(scope=message)
+                headers["Cache-Control"] = policy.cache_control
+                if policy.sensitive:
+                    headers["Pragma"] = "no-cache"
+                    headers["Expires"] = "0"
+                if policy.sensitive or not conditional or message["status"] != 200:
+                    await send(message)
+                    return
+                version_etag = self._version_etag(scope)
+                if version_etag and "etag" not in headers:
+                    headers["ETag"] = version_etag
+                if "etag" in headers:
+                    replaced = etag_matches(if_none_match, headers["etag"])
+                    await send(_not_modified(message) if replaced else message)
+                elif scope["method"] == "HEAD":
+                    # There's no body to hash
+                    await send(message)
+                else:
+                    held_start = message
+                return
+
+            if replaced:
+                if not message.get("more_body", False):
+                    await send({"type": "http.response.body", "body": b""})
+                return
+            if held_start is None:
+                await send(message)
+                return
+
+            body.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            content = b"".join(body)
+            etag = body_etag(content)
+            MutableHeaders(scope=held_start)["ETag"] = etag
+            if etag_matches(if_none_match, etag):
+                await send(_not_modified(held_start))
+                await send({"type": "http.response.body", "body": b""})
+            else:
+                await send(held_start)
+                await send({"type": "http.response.body", "body": content})
+
+        await self.app(scope, receive, send_with_cache_headers)
+
+
+def configure_http_cache(
+    app: FastAPI,
+    policies: dict[str, CachePolicy] | None = None,
+) -> None:
+    """
+    Configure HTTP caching for the FastAPI app.
+
+    Args:
+        app: The application
+        policies: Cache policies by exact path, for routes that can't declare
+            one with the cache_policy dependency
+    """
+    ExceptionHandler = Callable[[Request, Exception], Awaitable[Response]]
+    app.add_exception_handler(
+        NotModifiedError,
+        cast(ExceptionHandler, not_modified_handler),
+    )
+    app.add_middleware(HTTPCacheMiddleware, policies=policies)
@@ -12,10 +12,17 @@ from .audit import (
     log_oauth_login,
     log_password_change,
 )
+from .audit_archive import (
+    archive_audit_logs,
+    iter_archive_files,
+    read_archived_audit_logs,
+)
 
 __all__ = [
+    "archive_audit_logs",
     "get_client_ip",
     "get_user_agent",
+    "iter_archive_files",
     "log_account_deletion",
     "log_api_key_usage",
     "log_email_verification",
@@ -24,4 +31,5 @@ __all__ = [
     "log_logout",
     "log_oauth_login",
     "log_password_change",
+    "read_archived_audit_logs",
 ]
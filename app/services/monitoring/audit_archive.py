@@ -0,0 +1,273 @@
+"""
+Cold-storage archival of old audit logs.
+
+Audit logs older than a retention period are streamed into gzip-compressed
+NDJSON files on local disk, one directory per UTC day, and then deleted from
+the database in chunks. Archive files are never modified once written: each
+run adds new files and appends one line per file to ``index.ndjson`` at the
+archive root, recording the time range the file covers. Readers use the index
+to open only the files that overlap the requested range.
+
+Layout::
+
+    <archive_dir>/index.ndjson
+    <archive_dir>/date=2025-01-31/audit_logs_20250501T030000000000.ndjson.gz
+"""
+
+import gzip
+import json
+import os
+import tempfile
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import IO, Any, TypeAlias
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_app_logger, settings
+from app.crud.system.audit_log import delete_audit_logs_in_range
+from app.models import AuditLog
+from app.utils.datetime_utils import utc_now
+from app.utils.export import encode_ndjson
+
+# Type alias for async sessions only
+DBSession: TypeAlias = AsyncSession
+
+INDEX_FILENAME = "index.ndjson"
+
+logger = get_app_logger()
+
+
+def _partition_dir(archive_dir: Path, day: datetime) -> Path:
+    return archive_dir / f"date={day:%Y-%m-%d}"
+
+
+def _append_index_entry(archive_dir: Path, entry: dict[str, Any]) -> None:
+    """Append one file's entry to the archive index and flush it to disk."""
+    with (archive_dir / INDEX_FILENAME).open("a", encoding="utf-8") as index:
+        index.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        index.flush()
+        os.fsync(index.fileno())
+
+
+async def _archive_day(
+    db: DBSession,
+    archive_dir: Path,
+    start: datetime,
+    end: datetime,
+    run_id: str,
+    id_spool: IO[str],
+) -> int:
+    """
+    Write the audit logs in [start, end) to a new archive file.
+
+    The file is written under a temporary name, synced and renamed before it
+    is added to the index, so the index never points at a partial file. The
+    ids of the archived audit logs are written to id_spool, one per line, so
+    that memory use doesn't grow with the number of rows in the day.
+
+    Returns:
+        int: Number of audit logs archived
+    """
+    statement = (
+        select(*AuditLog.__table__.columns)
+        .where(AuditLog.timestamp >= start, AuditLog.timestamp < end)
+        .order_by(AuditLog.timestamp, AuditLog.id)
+        .execution_options(yield_per=settings.AUDIT_ARCHIVE_FETCH_SIZE)
+    )
+
+    partition = _partition_dir(archive_dir, start)
+    partition.mkdir(parents=True, exist_ok=True)
+    path = partition / f"audit_logs_{run_id}.ndjson.gz"
+    part_path = path.with_name(path.name + ".part")
+
+    archived = 0
+    first: datetime | None = None
+    last: datetime | None = None
+    with part_path.open("wb") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as gz:
+            result = await db.stream(statement)
+            async for partition_rows in result.mappings().partitions():
+                gz.write(encode_ndjson(partition_rows))
+                id_spool.writelines(f"{row['id']}\n" for row in partition_rows)
+                archived += len(partition_rows)
+                first = first or partition_rows[0]["timestamp"]
+                last = partition_rows[-1]["timestamp"]
+        raw.flush()
+        os.fsync(raw.fileno())
+
+    if not archived or first is None or last is None:
+        part_path.unlink()
+        return 0
+
+    part_path.replace(path)
+    _append_index_entry(
+        archive_dir,
+        {
+            "path": path.relative_to(archive_dir).as_posix(),
+            "start": first.isoformat(),
+            "end": last.isoformat(),
+            "rows": archived,
+            "archived_at": utc_now().isoformat(),
+        },
+    )
+    return archived
+
+
+def _spooled_ids(id_spool: IO[str]) -> Iterator[UUID]:
+    id_spool.flush()
+    id_spool.seek(0)
+    for line in id_spool:
+        yield UUID(line.strip())
+
+
+async def archive_audit_logs(
+    db: DBSession,
+    older_than_days: int | None = None,
+    archive_dir: str | Path | None = None,
+) -> dict[str, int]:
+    """
+    Move audit logs older than a retention period to archive files.
+
+    Days are processed oldest first. Each day's audit logs are written to a
+    new file and indexed before they are deleted from the database in chunks
+    of AUDIT_ARCHIVE_DELETE_BATCH_SIZE, so an interrupted run never loses
+    rows; rerunning it archives whatever is still in the database. Rows of a
+    day whose deletion was interrupted end up in two files. Only the ids
+    written to the file are deleted, so audit logs inserted into the day
+    while it was being archived stay for the next run. The ids are spooled to
+    a temporary file rather than kept in memory.
+
+    Args:
+        db: Database session
+        older_than_days: Archive audit logs older than this many days,
+            defaults to AUDIT_ARCHIVE_AFTER_DAYS
+        archive_dir: Archive root, defaults to AUDIT_ARCHIVE_DIR
+
+    Returns:
+        dict: Number of audit logs archived and deleted, and files written
+    """
+    if older_than_days is None:
+        older_than_days = settings.AUDIT_ARCHIVE_AFTER_DAYS
+    root = Path(archive_dir or settings.AUDIT_ARCHIVE_DIR)
+    root.mkdir(parents=True, exist_ok=True)
+
+    cutoff = utc_now() - timedelta(days=older_than_days)
+    run_id = utc_now().strftime("%Y%m%dT%H%M%S%f")
+    stats = {"archived": 0, "deleted": 0, "files": 0}
+
+    oldest = (
+        await db.execute(
+            select(func.min(AuditLog.timestamp)).where(AuditLog.timestamp < cutoff),
+        )
+    ).scalar_one_or_none()
+    if oldest is None:
+        return stats
+
+    day = oldest.astimezone(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    while day < cutoff:
+        end = min(day + timedelta(days=1), cutoff)
+        # Ids of the day's archived audit logs, for the delete
+        with tempfile.TemporaryFile("w+", encoding="ascii") as id_spool:
+            archived = await _archive_day(db, root, day, end, run_id, id_spool)
+            if archived:
+                deleted = await delete_audit_logs_in_range(
+                    db,
+                    day,
+                    end,
+                    batch_size=settings.AUDIT_ARCHIVE_DELETE_BATCH_SIZE,
+                    ids=_spooled_ids(id_spool),
+                )
+                stats["archived"] += archived
+                stats["deleted"] += deleted
+                stats["files"] += 1
+                logger.info(
+                    "Archived audit logs",
+                    day=day.date().isoformat(),
+                    archived=archived,
+                    deleted=deleted,
+                )
+        day += timedelta(days=1)
+
+    return stats
+
+
+def _parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    # Naive bounds (e.g. typed on the command line) are taken as UTC
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def iter_archive_files(
+    archive_dir: str | Path | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> Iterator[Path]:
+    """
+    List the archive files that may hold audit logs in [since, until).
+
+    Only the index is read; files whose recorded range doesn't overlap the
+    requested one are skipped.
+    """
+    root = Path(archive_dir or settings.AUDIT_ARCHIVE_DIR)
+    since, until = _as_utc(since), _as_utc(until)
+    index_path = root / INDEX_FILENAME
+    if not index_path.exists():
+        return
+
+    with index_path.open(encoding="utf-8") as index:
+        for line in index:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if since is not None and _parse_timestamp(entry["end"]) < since:
+                continue
+            if until is not None and _parse_timestamp(entry["start"]) >= until:
+                continue
+            yield root / entry["path"]
+
+
+def read_archived_audit_logs(
+    archive_dir: str | Path | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    event_type: str | None = None,
+    user_id: UUID | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Read archived audit logs without loading them back into the database.
+
+    Args:
+        archive_dir: Archive root, defaults to AUDIT_ARCHIVE_DIR
+        since: Only audit logs at or after this time
+        until: Only audit logs before this time
+        event_type: Only audit logs of this event type
+        user_id: Only audit logs of this user
+
+    Yields:
+        dict: Audit log rows as stored, oldest first within each file
+    """
+    since, until = _as_utc(since), _as_utc(until)
+    wanted_user = str(user_id) if user_id is not None else None
+    for path in iter_archive_files(archive_dir, since, until):
+        with gzip.open(path, "rt", encoding="utf-8") as archive:
+            for line in archive:
+                row = json.loads(line)
+                timestamp = _parse_timestamp(row["timestamp"])
+                if since is not None and timestamp < since:
+                    continue
+                if until is not None and timestamp >= until:
+                    continue
+                if event_type is not None and row["event_type"] != event_type:
+                    continue
+                if wanted_user is not None and row["user_id"] != wanted_user:
+                    continue
+                yield row
@@ -0,0 +1,201 @@
+"""
+Precomputed OpenAPI schema and Swagger UI page.
+
+FastAPI builds the OpenAPI schema on the first request to it, in every worker,
+and serializes it again on every request. Instead, build_docs_cache() renders
+the schema and the /docs page once at startup and keeps their bytes, gzipped
+and (with the optional ``brotli`` package) brotli-compressed, in memory. Each
+request only picks the encoding the client accepts, or answers 304.
+"""
+
+import gzip
+import json
+from dataclasses import dataclass
+
+from fastapi import FastAPI, Request, Response
+
+from app.core.config import settings
+from app.services.middleware.http_cache import body_etag, etag_matches
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency path
+    brotli = None
+
+# Compression runs once per worker, so use the smallest output
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+OPENAPI_PATH = f"{settings.API_V1_STR}/openapi.json"
+
+# Pin to a known-good Swagger UI version for stability
+SWAGGER_UI_VERSION = "5.11.0"
+
+
+@dataclass(frozen=True)
+class PrecomputedResponse:
+    """A response body kept in memory in every encoding it's served in."""
+
+    media_type: str
+    body: bytes
+    gzip_body: bytes
+    brotli_body: bytes | None
+    etag: str
+
+    @classmethod
+    def build(cls, body: bytes, media_type: str) -> "PrecomputedResponse":
+        return cls(
+            media_type=media_type,
+            body=body,
+            gzip_body=gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+            brotli_body=(
+                brotli.compress(body, quality=BROTLI_QUALITY) if brotli else None
+            ),
+            etag=body_etag(body),
+        )
+
+    def response(self, request: Request) -> Response:
+        """Serve the body in the best encoding the client accepts, or a 304."""
+        headers = {"ETag": self.etag, "Vary": "Accept-Encoding"}
+        if etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        body = self.body
+        if self.brotli_body is not None and "br" in accepted:
+            body = self.brotli_body
+            headers["Content-Encoding"] = "br"
+        elif "gzip" in accepted:
+            body = self.gzip_body
+            headers["Content-Encoding"] = "gzip"
+        return Response(content=body, media_type=self.media_type, headers=headers)
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    """Content codings an Accept-Encoding header allows (q > 0)."""
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            if params and float(quality) <= 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def swagger_ui_html(openapi_url: str, title: str) -> str:
+    """
+    Swagger UI page with robust CDN fallbacks.
+
+    This avoids upstream template issues and works with our CSP by allowing
+    specific CDNs for scripts and styles.
+    """
+    swagger_version = SWAGGER_UI_VERSION
+
+    return f"""
+<!DOCTYPE html>
+<html lang=\"en\">
+  <head>
+    <meta charset=\"UTF-8\" />
+    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
+    <title>{title} — API Docs</title>
+
+    <!-- Primary CSS with non-blocking fallback -->
+    <link rel=\"stylesheet\" href=\"https://unpkg.com/swagger-ui-dist@{swagger_version}/swagger-ui.css\" />
+    <link rel=\"stylesheet\" href=\"https://cdnjs.cloudflare.com/ajax/libs/swagger-ui/{swagger_version}/swagger-ui.min.css\" media=\"print\" onload=\"this.media='all'\" />
+
+    <style>
+      html {{ box-sizing: border-box; overflow-y: scroll; }}
+      *, *:before, *:after {{ box-sizing: inherit; }}
+      body {{ margin: 0; background: #fafafa; }}
+    </style>
+  </head>
+  <body>
+    <div id=\"swagger-ui\"></div>
+    <script>
+      (function() {{
+        function loadScript(src, onload, onerror) {{
+          var s = document.createElement('script');
+          s.src = src;
+          s.async = true;
+          s.onload = onload;
+          s.onerror = onerror || function(){{}};
+          document.head.appendChild(s);
+        }}
+
+        function initUI() {{
+          if (!window.SwaggerUIBundle || !window.SwaggerUIStandalonePreset) {{
+            console.error('Swagger UI assets missing');
+            var c = document.getElementById('swagger-ui');
+            c.innerHTML = '<p style="padding:16px;color:#b00">Failed to load Swagger UI assets.</p>';
+            return;
+          }}
+          window.ui = SwaggerUIBundle({{
+            url: '{openapi_url}',
+            dom_id: '#swagger-ui',
+            deepLinking: true,
+            presets: [SwaggerUIBundle.presets.apis, SwaggerUIStandalonePreset],
+            layout: 'StandaloneLayout'
+          }});
+        }}
+
+        // Try unpkg first, then fall back to cdnjs
+        loadScript(
+          'https://unpkg.com/swagger-ui-dist@{swagger_version}/swagger-ui-bundle.js',
+          function() {{
+            loadScript(
+              'https://unpkg.com/swagger-ui-dist@{swagger_version}/swagger-ui-standalone-preset.js',
+              initUI,
+              function() {{
+                loadScript(
+                  'https://cdnjs.cloudflare.com/ajax/libs/swagger-ui/{swagger_version}/swagger-ui-standalone-preset.min.js',
+                  initUI,
+                  function() {{ initUI(); }}
+                );
+              }}
+            );
+          }},
+          function() {{
+            loadScript(
+              'https://cdnjs.cloudflare.com/ajax/libs/swagger-ui/{swagger_version}/swagger-ui-bundle.min.js',
+              function() {{
+                loadScript(
+                  'https://cdnjs.cloudflare.com/ajax/libs/swagger-ui/{swagger_version}/swagger-ui-standalone-preset.min.js',
+                  initUI,
+                  function() {{ initUI(); }}
+                );
+              }},
+              function() {{ initUI(); }}
+            );
+          }}
+        );
+      }})();
+    </script>
+  </body>
+</html>
+    """
+
+
+_docs_cache: dict[str, PrecomputedResponse] = {}
+
+
+def build_docs_cache(app: FastAPI) -> None:
+    """Render and compress the OpenAPI schema and the /docs page."""
+    schema = json.dumps(
+        app.openapi(),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode()
+    page = swagger_ui_html(OPENAPI_PATH, settings.PROJECT_NAME).encode()
+    _docs_cache["openapi"] = PrecomputedResponse.build(schema, "application/json")
+    _docs_cache["docs"] = PrecomputedResponse.build(page, "text/html; charset=utf-8")
+
+
+def get_docs_response(app: FastAPI, name: str) -> PrecomputedResponse:
+    """Get a precomputed response ("openapi" or "docs"), building it if needed."""
+    if name not in _docs_cache:
+        build_docs_cache(app)
+    return _docs_cache[name]
@@ -0,0 +1,129 @@
+"""
+Streaming export utilities.
+
+This module streams query results as NDJSON or CSV using server-side cursors,
+so exports use constant memory regardless of table size.
+"""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Mapping, Sequence
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, TypeAlias
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.admin.admin import get_projection_columns
+from app.core.config import settings
+from app.utils.search_filter import SearchFilterBuilder, SearchFilterConfig
+
+# Rows as fetched with .mappings(), or plain dicts
+ExportRows: TypeAlias = Sequence[RowMapping] | Sequence[Mapping[str, Any]]
+
+
+class ExportFormat(str, Enum):
+    """Supported export formats."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values the json module doesn't handle natively."""
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+def _csv_value(value: Any) -> Any:
+    """Render a value as a CSV cell."""
+    if value is None:
+        return ""
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, dict | list):
+        return json.dumps(value, default=_json_default, separators=(",", ":"))
+    return value
+
+
+def encode_ndjson(rows: ExportRows) -> bytes:
+    """Encode rows as newline-delimited JSON."""
+    return b"".join(
+        json.dumps(dict(row), default=_json_default, separators=(",", ":")).encode()
+        + b"\n"
+        for row in rows
+    )
+
+
+def encode_csv(
+    rows: ExportRows,
+    columns: Sequence[str],
+    header: bool = False,
+) -> bytes:
+    """Encode rows as CSV lines, optionally preceded by a header line."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    writer.writerows([_csv_value(row[column]) for column in columns] for row in rows)
+    return buffer.getvalue().encode()
+
+
+async def stream_export(
+    db: AsyncSession,
+    model: type[Any],
+    schema: type[BaseModel],
+    config: SearchFilterConfig,
+    export_format: ExportFormat,
+    fetch_size: int | None = None,
+) -> AsyncIterator[bytes]:
+    """
+    Stream records matching a search config as encoded export chunks.
+
+    Only the columns of ``schema`` are selected. Rows are read through a
+    server-side cursor ``fetch_size`` at a time and each batch is yielded as
+    one chunk, so at most one batch is held in memory.
+
+    Args:
+        db: Database session (must stay open while the iterator is consumed)
+        model: SQLAlchemy model class to export
+        schema: Response schema whose fields become the export columns
+        config: Search and filter configuration to apply
+        export_format: Output format
+        fetch_size: Rows per cursor fetch, defaults to ADMIN_EXPORT_FETCH_SIZE
+
+    Yields:
+        bytes: Encoded chunks of the export
+    """
+    fetch_size = fetch_size or settings.ADMIN_EXPORT_FETCH_SIZE
+    columns = get_projection_columns(model, schema)
+    column_names = [column.name for column in columns]
+
+    statement, params = SearchFilterBuilder(model).build_statement(config)
+    statement = statement.with_only_columns(*columns).execution_options(
+        yield_per=fetch_size,
+    )
+
+    if export_format == ExportFormat.CSV:
+        yield encode_csv([], column_names, header=True)
+
+    result = await db.stream(statement, params)
+    async for partition in result.mappings().partitions():
+        if export_format == ExportFormat.CSV:
+            yield encode_csv(partition, column_names)
+        else:
+            yield encode_ndjson(partition)
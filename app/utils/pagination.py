@@ -5,8 +5,12 @@ This module provides generic pagination helpers and response schemas for consist
 pagination across all API endpoints.
 """
 
+import base64
+import binascii
 import math
+from datetime import datetime
 from typing import Any, Generic, TypeVar
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
@@ -198,3 +202,41 @@ class PaginatedResponseWithLinks(PaginatedResponse[T]):
         )
 
         return cls(items=items, metadata=metadata, links=links)
+
+
+def encode_keyset_cursor(timestamp: datetime, row_id: UUID) -> str:
+    """
+    Encode a (timestamp, id) keyset position as an opaque cursor.
+
+    Args:
+        timestamp: Timestamp of the last row on the page
+        row_id: ID of the last row on the page
+
+    Returns:
+        str: URL-safe cursor for the next page
+    """
+    raw = f"{timestamp.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_keyset_cursor.
+
+    Args:
+        cursor: Cursor from a previous page
+
+    Returns:
+        tuple: Timestamp and ID of the last row of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        timestamp, row_id = raw.split("|")
+        return datetime.fromisoformat(timestamp), UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        msg = "Invalid pagination cursor"
+        raise ValueError(msg) from exc
@@ -18,6 +18,7 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 
 from app.core.config import get_app_logger
+from app.services.cache import cached, get_request_cache_status
 
 logger = get_app_logger()
 
@@ -25,9 +26,6 @@ logger = get_app_logger()
 P = ParamSpec("P")
 R = TypeVar("R")
 
-# Global cache for performance utilities
-_performance_cache: dict[str, tuple[Any, float]] = {}
-
 
 def monitor_database_queries() -> None:
     """Enable database query monitoring for performance analysis."""
@@ -91,39 +89,16 @@ def cache_result(
     """
     Decorator to cache function results.
 
+    Kept for existing callers; new code should use
+    ``app.services.cache.cached``, which also takes key builders and tags.
+
     Args:
         ttl: Time to live in seconds (default: 5 minutes)
 
     Returns:
         Decorated function with caching
     """
-
-    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
-        @wraps(func)
-        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            # Simple in-memory cache (in production, use Redis)
-            cache_key = (
-                f"{func.__name__}:{hash(str(args) + str(sorted(kwargs.items())))}"
-            )
-
-            # Check if result is cached
-            if cache_key in _performance_cache:
-                cached_result, timestamp = _performance_cache[cache_key]
-                if time.time() - timestamp < ttl:
-                    logger.debug(f"Cache hit for {func.__name__}")
-                    return cached_result
-
-            # Execute function and cache result
-            result = await func(*args, **kwargs)
-
-            _performance_cache[cache_key] = (result, time.time())
-            logger.debug(f"Cache miss for {func.__name__}, cached result")
-
-            return result
-
-        return wrapper
-
-    return decorator
+    return cached(ttl=ttl)
 
 
 def monitor_request_performance() -> (
@@ -186,7 +161,7 @@ def add_performance_headers(response: Any, execution_time: float) -> None:
         execution_time: Request execution time in seconds
     """
     response.headers["X-Execution-Time"] = str(execution_time)
-    response.headers["X-Cache-Status"] = "MISS"  # Could be enhanced with cache status
+    response.headers["X-Cache-Status"] = get_request_cache_status()
 
 
 class QueryAnalyzer:
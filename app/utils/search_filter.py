@@ -1,10 +1,16 @@
+import re
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from operator import eq, ge, gt, le, lt, ne
+from types import MappingProxyType
+from typing import Any, NamedTuple
 from uuid import UUID
 
 from pydantic import BaseModel, Field
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, bindparam, func, or_, select
+from sqlalchemy.sql.elements import BindParameter
 
 
 class SearchOperator(str, Enum):
@@ -49,6 +55,10 @@ class TextSearchFilter(BaseModel):
         default=False,
         description="Whether to use PostgreSQL full-text search (if available)",
     )
+    use_prefix_matching: bool = Field(
+        default=False,
+        description="Match full-text search terms as word prefixes",
+    )
 
 
 class FieldFilter(BaseModel):
@@ -78,92 +88,324 @@ class SearchFilterConfig(BaseModel):
     sort_order: str = Field(default="asc", description="Sort order (asc or desc)")
 
 
+# Text search configuration shared with generated search_vector columns
+TEXT_SEARCH_CONFIG = "english"
+
+# Name of the stored tsvector column a model can declare for full-text search
+SEARCH_VECTOR_COLUMN = "search_vector"
+
+# Trigram indexes can't narrow patterns shorter than one trigram, so shorter
+# search terms would degrade to a full scan.
+MIN_SEARCH_QUERY_LENGTH = 3
+
+
+# Upper bound on cached query templates; each distinct filter shape is one entry
+SEARCH_QUERY_CACHE_SIZE = 512
+
+_PATTERN_OPERATORS = frozenset(
+    {SearchOperator.CONTAINS, SearchOperator.STARTS_WITH, SearchOperator.ENDS_WITH},
+)
+
+# Comparison operators whose value is sent as a bound parameter
+_FILTER_OPERATORS: Mapping[FilterOperator, Callable[[Any, Any], Any]] = (
+    MappingProxyType(
+        {
+            FilterOperator.EQUALS: eq,
+            FilterOperator.NOT_EQUALS: ne,
+            FilterOperator.GREATER_THAN: gt,
+            FilterOperator.GREATER_THAN_EQUAL: ge,
+            FilterOperator.LESS_THAN: lt,
+            FilterOperator.LESS_THAN_EQUAL: le,
+            FilterOperator.IN: lambda field, param: field.in_(param),
+            FilterOperator.NOT_IN: lambda field, param: ~field.in_(param),
+        },
+    )
+)
+
+# Operators that take no value
+_NULL_OPERATORS: Mapping[FilterOperator, Callable[[Any], Any]] = MappingProxyType(
+    {
+        FilterOperator.IS_NULL: lambda field: field.is_(None),
+        FilterOperator.IS_NOT_NULL: lambda field: field.is_not(None),
+    },
+)
+
+# Comparing with None means a NULL check rather than a bound parameter
+_NONE_VALUE_OPERATORS: Mapping[FilterOperator, FilterOperator] = MappingProxyType(
+    {
+        FilterOperator.EQUALS: FilterOperator.IS_NULL,
+        FilterOperator.NOT_EQUALS: FilterOperator.IS_NOT_NULL,
+    },
+)
+
+# Flags compared as SQL literals instead of bound parameters, so the planner
+# can match partial indexes built on them (e.g. "is_deleted = false") even
+# when a prepared statement switches to a generic plan
+_LITERAL_FILTER_FIELDS = frozenset({"is_deleted"})
+
+
+class ModelSearchMetadata(NamedTuple):
+    """Immutable per-model field information used to validate search configs."""
+
+    fields: frozenset[str]
+    sortable_fields: frozenset[str]
+    search_vector_fields: frozenset[str] | None
+
+
+_model_metadata: dict[type[Any], ModelSearchMetadata] = {}
+
+# Query templates keyed by (model, text search shape, filter shapes, sort)
+_query_cache: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+_query_cache_stats = {"hits": 0, "misses": 0}
+
+
+def get_model_search_metadata(model_class: type[Any]) -> ModelSearchMetadata:
+    """Get search metadata for a model, computing it once per model."""
+    metadata = _model_metadata.get(model_class)
+    if metadata is None:
+        columns = model_class.__table__.columns
+        fields = frozenset(column.name for column in columns)
+        sortable_fields = frozenset(
+            name
+            for name in fields
+            if hasattr(getattr(model_class, name, None), "asc")
+            and hasattr(getattr(model_class, name, None), "desc")
+        )
+        vector_column = columns.get(SEARCH_VECTOR_COLUMN)
+        search_vector_fields = (
+            frozenset(vector_column.info.get("search_fields", ()))
+            if vector_column is not None
+            else None
+        )
+        metadata = ModelSearchMetadata(fields, sortable_fields, search_vector_fields)
+        _model_metadata[model_class] = metadata
+    return metadata
+
+
+def get_search_query_cache_stats() -> dict[str, Any]:
+    """Get hit/miss counters for the search query template cache."""
+    hits = _query_cache_stats["hits"]
+    misses = _query_cache_stats["misses"]
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "size": len(_query_cache),
+        "max_size": SEARCH_QUERY_CACHE_SIZE,
+        "hit_ratio": hits / total if total else 0.0,
+    }
+
+
+def clear_search_query_cache() -> None:
+    """Drop all cached query templates and reset the counters."""
+    _query_cache.clear()
+    _query_cache_stats["hits"] = 0
+    _query_cache_stats["misses"] = 0
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 class SearchFilterBuilder:
-    """Builder class for constructing search and filter queries."""
+    """
+    Builder class for constructing search and filter queries.
+
+    Queries are built once per distinct shape (fields, operators, sort) with
+    every user-supplied value as a bound parameter, and cached. Repeated
+    searches that differ only in their values reuse the same statement, so
+    SQLAlchemy's compiled cache and asyncpg's prepared statements are hit.
+    """
 
     def __init__(self, model_class: type[Any]) -> None:
         self.model_class = model_class
-        self._allowed_fields = self._get_model_fields()
-
-    def _get_model_fields(self) -> list[str]:
-        """Get list of allowed fields from the model."""
-        return [column.name for column in self.model_class.__table__.columns]
+        self._metadata = get_model_search_metadata(model_class)
 
     def _validate_field(self, field: str) -> bool:
         """Validate that a field exists in the model."""
-        return field in self._allowed_fields
+        return field in self._metadata.fields
 
     def _validate_sort_field(self, field: str) -> bool:
         """Validate that a sort field exists in the model and is sortable."""
-        if not self._validate_field(field):
-            return False
-
-        # Additional validation: ensure the field is not a complex type that can't be sorted
-        # This is a basic check - you might want to add more specific validations
-        column = getattr(self.model_class, field)
-        return hasattr(column, "asc") and hasattr(column, "desc")
+        return field in self._metadata.sortable_fields
+
+    def _get_search_vector(self, fields: tuple[str, ...]) -> Any:
+        """Get the tsvector expression to match for the given fields."""
+        if self._metadata.search_vector_fields == frozenset(fields):
+            # Indexed, precomputed document covering exactly these fields
+            return getattr(self.model_class, SEARCH_VECTOR_COLUMN)
+
+        field_expressions = [
+            func.coalesce(getattr(self.model_class, field), "") for field in fields
+        ]
+        return func.to_tsvector(
+            TEXT_SEARCH_CONFIG,
+            func.concat_ws(" ", *field_expressions),
+        )
 
-    def _build_text_search_condition(self, filter_config: TextSearchFilter) -> Any:
-        """Build SQLAlchemy condition for text search."""
+    def _ts_query_text(self, filter_config: TextSearchFilter) -> str | None:
+        """Get the tsquery input for a full-text search, if it has any terms."""
+        if filter_config.use_prefix_matching:
+            terms = re.findall(r"\w+", filter_config.query)
+            if not terms:
+                return None
+            return " & ".join(f"{term}:*" for term in terms)
+        return filter_config.query
+
+    def _plan_text_search(
+        self,
+        filter_config: TextSearchFilter,
+        params: dict[str, Any],
+    ) -> tuple[Any, ...] | None:
+        """Get the cache key part for a text search and collect its values."""
         if not filter_config.query.strip():
             return None
 
-        search_conditions = []
         query = filter_config.query
-
         if not filter_config.case_sensitive:
             query = query.lower()
 
-        # Use PostgreSQL full-text search if enabled and available
+        mode = "pattern"
         if filter_config.use_full_text_search:
+            ts_query_text = self._ts_query_text(filter_config)
+            # No searchable terms: fall through to pattern matching
+            if ts_query_text is not None:
+                mode = "prefix" if filter_config.use_prefix_matching else "websearch"
+                params["search_tsquery"] = ts_query_text
+
+        # Pattern values are always supplied so a template that fell back from
+        # full-text search can still be executed.
+        escaped = _escape_like(query)
+        params["search_pattern"] = {
+            SearchOperator.CONTAINS: f"%{escaped}%",
+            SearchOperator.STARTS_WITH: f"{escaped}%",
+            SearchOperator.ENDS_WITH: f"%{escaped}",
+        }.get(filter_config.operator, escaped)
+        params["search_text"] = query
+
+        return (
+            tuple(filter_config.fields),
+            filter_config.operator,
+            filter_config.case_sensitive,
+            mode,
+        )
+
+    def _plan_field_filter(
+        self,
+        index: int,
+        filter_config: FieldFilter,
+        params: dict[str, Any],
+    ) -> tuple[Any, ...] | None:
+        """Get the cache key part for a field filter and collect its value."""
+        if not self._validate_field(filter_config.field):
+            return None
+
+        filter_operator = filter_config.operator
+        if filter_config.value is None and filter_operator in _NONE_VALUE_OPERATORS:
+            filter_operator = _NONE_VALUE_OPERATORS[filter_operator]
+
+        if filter_operator in _NULL_OPERATORS:
+            return (filter_config.field, filter_operator, None)
+
+        if filter_operator in (FilterOperator.IN, FilterOperator.NOT_IN):
+            if not filter_config.values:
+                return None
+            value: Any = list(filter_config.values)
+        elif filter_operator in _FILTER_OPERATORS:
+            value = filter_config.value
+        else:
+            return None
+
+        if (
+            filter_config.field in _LITERAL_FILTER_FIELDS
+            and filter_operator in _NONE_VALUE_OPERATORS
+            and isinstance(value, bool)
+        ):
+            # The value is part of the cache key; a flag has only two
+            return (filter_config.field, filter_operator, value)
+
+        param_name = f"filter_{index}"
+        params[param_name] = value
+        return (filter_config.field, filter_operator, param_name)
+
+    def _plan(
+        self,
+        config: SearchFilterConfig,
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        """Reduce a config to its cache key and bound parameter values."""
+        params: dict[str, Any] = {}
+
+        text_key = None
+        if config.text_search:
+            text_key = self._plan_text_search(config.text_search, params)
+
+        filter_keys = []
+        for index, field_filter in enumerate(config.filters):
+            filter_key = self._plan_field_filter(index, field_filter, params)
+            if filter_key is not None:
+                filter_keys.append(filter_key)
+
+        sort_key = None
+        if config.sort_by and self._validate_sort_field(config.sort_by):
+            sort_order = config.sort_order.lower()
+            if sort_order not in ["asc", "desc"]:
+                sort_order = "asc"  # Default to ascending if invalid
+            sort_key = (config.sort_by, sort_order)
+
+        return (self.model_class, text_key, tuple(filter_keys), sort_key), params
+
+    def _build_text_search(
+        self,
+        fields: tuple[str, ...],
+        search_operator: SearchOperator,
+        case_sensitive: bool,
+        mode: str,
+    ) -> tuple[Any, Any]:
+        """Build the text search condition and, for full-text search, its rank."""
+        # Use PostgreSQL full-text search if enabled and available
+        if mode != "pattern":
             try:
-                # Create a full-text search condition using PostgreSQL's to_tsvector
-                field_expressions = [
-                    func.coalesce(getattr(self.model_class, field), "")
-                    for field in filter_config.fields
-                ]
-                search_vector = func.to_tsvector(
-                    "english",
-                    func.concat_ws(" ", *field_expressions),
+                ts_query_func = (
+                    func.to_tsquery if mode == "prefix" else func.websearch_to_tsquery
+                )
+                # websearch_to_tsquery accepts quoted phrases, OR and -term, and
+                # never raises on malformed input
+                search_query = ts_query_func(
+                    TEXT_SEARCH_CONFIG,
+                    bindparam("search_tsquery"),
+                )
+                search_vector = self._get_search_vector(fields)
+                return (
+                    search_vector.op("@@")(search_query),
+                    func.ts_rank(search_vector, search_query),
                 )
-                search_query = func.plainto_tsquery("english", query)
-                return search_vector.op("@@")(search_query)
             except Exception:
                 # Fall back to LIKE search if full-text search fails
                 pass
 
-        # Standard LIKE-based search
-        for field_name in filter_config.fields:
+        # Pattern search. Case-insensitive matching compares against lower(col)
+        # so the pg_trgm GIN indexes on lower(username)/lower(email) are used.
+        pattern: BindParameter[str] = bindparam("search_pattern")
+        search_text: BindParameter[str] = bindparam("search_text")
+        search_conditions = []
+
+        for field_name in fields:
             if not self._validate_field(field_name):
                 continue
 
             field = getattr(self.model_class, field_name)
+            target = field if case_sensitive else func.lower(field)
 
-            if filter_config.operator == SearchOperator.CONTAINS:
-                if not filter_config.case_sensitive:
-                    condition = func.lower(field).contains(query)
+            if search_operator in _PATTERN_OPERATORS:
+                if not case_sensitive:
+                    condition = target.ilike(pattern, escape="\\")
                 else:
-                    condition = field.contains(query)
-            elif filter_config.operator == SearchOperator.STARTS_WITH:
-                if not filter_config.case_sensitive:
-                    condition = func.lower(field).startswith(query)
-                else:
-                    condition = field.startswith(query)
-            elif filter_config.operator == SearchOperator.ENDS_WITH:
-                if not filter_config.case_sensitive:
-                    condition = func.lower(field).endswith(query)
-                else:
-                    condition = field.endswith(query)
-            elif filter_config.operator == SearchOperator.EQUALS:
-                if not filter_config.case_sensitive:
-                    condition = func.lower(field) == query
-                else:
-                    condition = field == query
-            elif filter_config.operator == SearchOperator.NOT_EQUALS:
-                if not filter_config.case_sensitive:
-                    condition = func.lower(field) != query
-                else:
-                    condition = field != query
+                    condition = target.like(pattern, escape="\\")
+            elif search_operator == SearchOperator.EQUALS:
+                condition = target == search_text
+            elif search_operator == SearchOperator.NOT_EQUALS:
+                condition = target != search_text
             else:
                 # Unknown operator: skip this field
                 continue
@@ -171,77 +413,91 @@ class SearchFilterBuilder:
             search_conditions.append(condition)
 
         if not search_conditions:
-            return None
-
-        return or_(*search_conditions)
-
-    def _build_field_filter_condition(self, filter_config: FieldFilter) -> Any:
-        """Build SQLAlchemy condition for field filter."""
-        if not self._validate_field(filter_config.field):
-            return None
-
-        field = getattr(self.model_class, filter_config.field)
-
-        if filter_config.operator == FilterOperator.EQUALS:
-            return field == filter_config.value
-        if filter_config.operator == FilterOperator.NOT_EQUALS:
-            return field != filter_config.value
-        if filter_config.operator == FilterOperator.GREATER_THAN:
-            return field > filter_config.value
-        if filter_config.operator == FilterOperator.GREATER_THAN_EQUAL:
-            return field >= filter_config.value
-        if filter_config.operator == FilterOperator.LESS_THAN:
-            return field < filter_config.value
-        if filter_config.operator == FilterOperator.LESS_THAN_EQUAL:
-            return field <= filter_config.value
-        if filter_config.operator == FilterOperator.IN:
-            if filter_config.values:
-                return field.in_(filter_config.values)
-            return None
-        if filter_config.operator == FilterOperator.NOT_IN:
-            if filter_config.values:
-                return ~field.in_(filter_config.values)
-            return None
-        if filter_config.operator == FilterOperator.IS_NULL:
-            return field.is_(None)
-        if filter_config.operator == FilterOperator.IS_NOT_NULL:
-            return field.is_not(None)
-        # All enum cases covered; no default branch needed
-        return None
-
-    def build_query(self, config: SearchFilterConfig) -> Any:
-        """Build a complete SQLAlchemy query with search and filters."""
+            return None, None
+
+        return or_(*search_conditions), None
+
+    def _build_field_filter(
+        self,
+        field_name: str,
+        filter_operator: FilterOperator,
+        param_name: str | bool | None,
+    ) -> Any:
+        """Build SQLAlchemy condition for a planned field filter."""
+        field = getattr(self.model_class, field_name)
+        if param_name is None:
+            return _NULL_OPERATORS[filter_operator](field)
+        if isinstance(param_name, bool):
+            # Literal flag comparison, rendered as "= true" / "= false"
+            return _FILTER_OPERATORS[filter_operator](field, param_name)
+
+        expanding = filter_operator in (FilterOperator.IN, FilterOperator.NOT_IN)
+        param: BindParameter[Any] = bindparam(param_name, expanding=expanding)
+        return _FILTER_OPERATORS[filter_operator](field, param)
+
+    def _build_template(self, key: tuple[Any, ...]) -> Any:
+        """Build the query template for a planned cache key."""
+        _, text_key, filter_keys, sort_key = key
         query: Any = select(self.model_class)
         conditions = []
+        rank = None
 
         # Add text search condition
-        if config.text_search:
-            text_condition = self._build_text_search_condition(config.text_search)
+        if text_key is not None:
+            text_condition, rank = self._build_text_search(*text_key)
             if text_condition is not None:
                 conditions.append(text_condition)
 
         # Add field filter conditions
-        for field_filter in config.filters:
-            filter_condition = self._build_field_filter_condition(field_filter)
-            if filter_condition is not None:
-                conditions.append(filter_condition)
+        conditions.extend(
+            self._build_field_filter(*filter_key) for filter_key in filter_keys
+        )
 
         # Apply all conditions
         if conditions:
             query = query.filter(and_(*conditions))
 
         # Apply sorting
-        if config.sort_by and self._validate_sort_field(config.sort_by):
-            sort_field = getattr(self.model_class, config.sort_by)
-            sort_order = config.sort_order.lower()
-            if sort_order not in ["asc", "desc"]:
-                sort_order = "asc"  # Default to ascending if invalid
+        if sort_key is not None:
+            sort_by, sort_order = sort_key
+            sort_field = getattr(self.model_class, sort_by)
             if sort_order == "desc":
                 sort_field = sort_field.desc()
             query = query.order_by(sort_field)
+        elif rank is not None:
+            # Without an explicit sort, show the best full-text matches first
+            query = query.order_by(rank.desc())
 
         return query
 
+    def build_statement(self, config: SearchFilterConfig) -> tuple[Any, dict[str, Any]]:
+        """Get the cached query template for a config and its parameter values."""
+        key, params = self._plan(config)
+
+        statement = _query_cache.get(key)
+        if statement is not None:
+            _query_cache_stats["hits"] += 1
+            _query_cache.move_to_end(key)
+            return statement, params
+
+        _query_cache_stats["misses"] += 1
+        statement = self._build_template(key)
+        _query_cache[key] = statement
+        if len(_query_cache) > SEARCH_QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+        return statement, params
+
+    def build_query(self, config: SearchFilterConfig) -> Any:
+        """
+        Build a complete SQLAlchemy query with search and filters.
+
+        The values are baked into a copy of the cached template. Hot paths that
+        execute the query should prefer build_statement() and pass the params
+        to execute(), which skips the copy.
+        """
+        statement, params = self.build_statement(config)
+        return statement.params(params)
+
 
 # Convenience functions for common search patterns
 def create_text_search(
@@ -250,6 +506,7 @@ def create_text_search(
     operator: SearchOperator = SearchOperator.CONTAINS,
     case_sensitive: bool = False,
     use_full_text_search: bool = False,
+    use_prefix_matching: bool = False,
 ) -> TextSearchFilter:
     """Create a text search filter configuration."""
     return TextSearchFilter(
@@ -258,6 +515,7 @@ def create_text_search(
         operator=operator,
         case_sensitive=case_sensitive,
         use_full_text_search=use_full_text_search,
+        use_prefix_matching=use_prefix_matching,
     )
 
 
@@ -275,6 +533,7 @@ def create_field_filter(
 def create_user_search_filters(
     search_query: str | None = None,
     use_full_text_search: bool = False,
+    use_prefix_matching: bool = False,
     is_verified: bool | None = None,
     oauth_provider: str | None = None,
     is_superuser: bool | None = None,
@@ -290,6 +549,7 @@ def create_user_search_filters(
     Args:
         search_query: Text to search in username and email fields
         use_full_text_search: Whether to use PostgreSQL full-text search
+        use_prefix_matching: Whether full-text terms match as word prefixes
         is_verified: Filter by verification status
         oauth_provider: Filter by OAuth provider
         is_superuser: Filter by superuser status
@@ -311,6 +571,7 @@ def create_user_search_filters(
             query=search_query,
             fields=["username", "email"],
             use_full_text_search=use_full_text_search,
+            use_prefix_matching=use_prefix_matching,
         )
 
     # Add boolean filters
@@ -348,7 +609,7 @@ def create_user_search_filters(
     if date_created_after:
         filters.append(
             create_field_filter(
-                "date_created",
+                "created_at",
                 FilterOperator.GREATER_THAN_EQUAL,
                 date_created_after,
             ),
@@ -357,7 +618,7 @@ def create_user_search_filters(
     if date_created_before:
         filters.append(
             create_field_filter(
-                "date_created",
+                "created_at",
                 FilterOperator.LESS_THAN_EQUAL,
                 date_created_before,
             ),
@@ -440,15 +701,90 @@ def create_deleted_user_search_filters(
     )
 
 
+def create_audit_log_search_filters(
+    user_id: UUID | None = None,
+    event_type: str | None = None,
+    success: bool | None = None,
+    session_id: str | None = None,
+    ip_address: str | None = None,
+    occurred_after: datetime | None = None,
+    occurred_before: datetime | None = None,
+    sort_by: str | None = None,
+    sort_order: str = "desc",
+) -> SearchFilterConfig:
+    """
+    Create a search filter configuration for audit logs.
+
+    Args:
+        user_id: Filter by user who performed the action
+        event_type: Filter by event type
+        success: Filter by event outcome
+        session_id: Filter by session identifier
+        ip_address: Filter by client IP address
+        occurred_after: Filter events at or after this time
+        occurred_before: Filter events at or before this time
+        sort_by: Field to sort by
+        sort_order: Sort order (asc or desc)
+
+    Returns:
+        SearchFilterConfig: Complete search and filter configuration
+    """
+    filters = []
+
+    equality_filters = {
+        "user_id": user_id,
+        "event_type": event_type,
+        "success": success,
+        "session_id": session_id,
+        "ip_address": ip_address,
+    }
+    for field, value in equality_filters.items():
+        if value is not None:
+            filters.append(create_field_filter(field, FilterOperator.EQUALS, value))
+
+    if occurred_after:
+        filters.append(
+            create_field_filter(
+                "timestamp",
+                FilterOperator.GREATER_THAN_EQUAL,
+                occurred_after,
+            ),
+        )
+
+    if occurred_before:
+        filters.append(
+            create_field_filter(
+                "timestamp",
+                FilterOperator.LESS_THAN_EQUAL,
+                occurred_before,
+            ),
+        )
+
+    return SearchFilterConfig(
+        filters=filters,
+        text_search=None,
+        sort_by=sort_by,
+        sort_order=sort_order,
+    )
+
+
 # Query parameter models for FastAPI endpoints
 class UserSearchParams(BaseModel):
     """Query parameters for user search endpoint."""
 
-    search: str | None = Field(None, description="Search query for username and email")
+    search: str | None = Field(
+        None,
+        min_length=MIN_SEARCH_QUERY_LENGTH,
+        description="Search query for username and email",
+    )
     use_full_text_search: bool = Field(
         default=False,
         description="Use PostgreSQL full-text search (if available)",
     )
+    use_prefix_matching: bool = Field(
+        default=False,
+        description="Match full-text search terms as word prefixes",
+    )
     is_verified: bool | None = Field(None, description="Filter by verification status")
     oauth_provider: str | None = Field(
         None,
@@ -472,6 +808,7 @@ class UserSearchParams(BaseModel):
         return create_user_search_filters(
             search_query=self.search,
             use_full_text_search=self.use_full_text_search,
+            use_prefix_matching=self.use_prefix_matching,
             is_verified=self.is_verified,
             oauth_provider=self.oauth_provider,
             is_superuser=self.is_superuser,
@@ -515,3 +852,47 @@ class DeletedUserSearchParams(BaseModel):
             sort_by=self.sort_by,
             sort_order=self.sort_order,
         )
+
+
+class AuditLogFilterParams(BaseModel):
+    """Query parameters for filtering audit logs."""
+
+    user_id: UUID | None = Field(None, description="Filter by user")
+    event_type: str | None = Field(None, description="Filter by event type")
+    success: bool | None = Field(None, description="Filter by event outcome")
+    session_id: str | None = Field(None, description="Filter by session identifier")
+    ip_address: str | None = Field(None, description="Filter by client IP address")
+    occurred_after: datetime | None = Field(
+        None,
+        description="Filter events at or after this time",
+    )
+    occurred_before: datetime | None = Field(
+        None,
+        description="Filter events at or before this time",
+    )
+
+    def to_search_config(self) -> SearchFilterConfig:
+        """Convert filter parameters to an unsorted search configuration."""
+        return create_audit_log_search_filters(
+            user_id=self.user_id,
+            event_type=self.event_type,
+            success=self.success,
+            session_id=self.session_id,
+            ip_address=self.ip_address,
+            occurred_after=self.occurred_after,
+            occurred_before=self.occurred_before,
+        )
+
+
+class AuditLogSearchParams(AuditLogFilterParams):
+    """Query parameters for audit log endpoints."""
+
+    sort_by: str | None = Field(None, description="Field to sort by")
+    sort_order: str = Field(default="desc", description="Sort order (asc or desc)")
+
+    def to_search_config(self) -> SearchFilterConfig:
+        """Convert search parameters to search configuration."""
+        config = super().to_search_config()
+        config.sort_by = self.sort_by
+        config.sort_order = self.sort_order
+        return config
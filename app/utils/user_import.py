@@ -0,0 +1,232 @@
+"""
+Bulk user import parsing and validation.
+
+Reads CSV or NDJSON user records from a byte stream one record at a time and
+validates them with the same rules as single-user registration.
+"""
+
+import csv
+import json
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any, NamedTuple
+
+from app.core.security.validation import (
+    clean_input,
+    validate_email_format,
+    validate_password,
+    validate_username,
+)
+from app.utils.export import ExportFormat
+
+IMPORT_REQUIRED_FIELDS = ("email", "username", "password")
+
+# Matches the users.email column length
+MAX_EMAIL_LENGTH = 254
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "y", "t"})
+
+INVALID_ENCODING_ERROR = "Record is not valid UTF-8"
+
+
+class UserImportRow(NamedTuple):
+    """A validated user record ready to be hashed and loaded."""
+
+    line: int
+    email: str
+    username: str
+    password: str
+    is_superuser: bool
+    is_verified: bool
+
+
+def import_error(line: int, record: dict[str, Any], reason: str) -> dict[str, Any]:
+    """Build an import error entry for a record."""
+    return {
+        "line": line,
+        "email": record.get("email"),
+        "username": record.get("username"),
+        "reason": reason,
+    }
+
+
+async def iter_lines(
+    chunks: AsyncIterable[bytes],
+    keep_blank: bool = False,
+) -> AsyncIterator[tuple[int, str | None]]:
+    """
+    Split a byte stream into numbered text lines.
+
+    Blank lines are skipped unless keep_blank is set. Lines that aren't valid
+    UTF-8 are yielded as None.
+    """
+    buffer = b""
+    line_number = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for raw in lines:
+            line_number += 1
+            line = _decode_line(raw)
+            if keep_blank or line is None or line.strip():
+                yield line_number, line
+    if buffer.strip():
+        yield line_number + 1, _decode_line(buffer)
+
+
+def _decode_line(raw: bytes) -> str | None:
+    try:
+        return raw.decode("utf-8-sig").rstrip("\r")
+    except UnicodeDecodeError:
+        return None
+
+
+class _PendingRecords:
+    """Hands complete CSV records to a csv reader as they arrive."""
+
+    def __init__(self) -> None:
+        self.records: deque[str] = deque()
+
+    def __iter__(self) -> "_PendingRecords":
+        return self
+
+    def __next__(self) -> str:
+        if not self.records:
+            raise StopIteration
+        return self.records.popleft()
+
+
+async def _iter_csv_records(
+    chunks: AsyncIterable[bytes],
+) -> AsyncIterator[tuple[int, dict[str, Any] | None]]:
+    pending = _PendingRecords()
+    reader = csv.DictReader(pending)
+    header_read = False
+    # Lines of a record whose quoted field continues on the next line
+    record_lines: list[str] = []
+    record_line = 0
+
+    async for line_number, line in iter_lines(chunks, keep_blank=True):
+        if line is None:
+            # The record this line belongs to can't be parsed; drop all of it
+            yield (record_line if record_lines else line_number), None
+            record_lines = []
+            continue
+        if not record_lines:
+            if not line.strip():
+                continue
+            record_line = line_number
+        record_lines.append(line)
+        text = "\n".join(record_lines)
+        # Quotes inside quoted fields are doubled, so an odd count means a
+        # quoted field is still open
+        if text.count('"') % 2:
+            continue
+        record_lines = []
+        pending.records.append(text)
+        if not header_read:
+            reader.fieldnames = [name.strip() for name in reader.fieldnames or []]
+            header_read = True
+            continue
+        try:
+            yield record_line, next(reader)
+        except csv.Error:
+            yield record_line, {}
+
+    if record_lines:
+        # Unterminated quoted field
+        yield record_line, {}
+
+
+async def iter_import_records(
+    chunks: AsyncIterable[bytes],
+    import_format: ExportFormat,
+) -> AsyncIterator[tuple[int, dict[str, Any] | None]]:
+    """
+    Parse user records from a CSV or NDJSON byte stream.
+
+    CSV input must start with a header line naming the columns; quoted fields
+    may span lines. Records that can't be parsed are yielded as empty records
+    so they are reported as validation errors with their line number, and
+    records that aren't valid UTF-8 as None.
+
+    Args:
+        chunks: Raw input bytes
+        import_format: Input format
+
+    Yields:
+        tuple: Line number (the first line of the record) and the parsed record
+    """
+    if import_format == ExportFormat.CSV:
+        async for line_number, csv_record in _iter_csv_records(chunks):
+            yield line_number, csv_record
+        return
+
+    async for line_number, line in iter_lines(chunks):
+        if line is None:
+            yield line_number, None
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            record = {}
+        yield line_number, record if isinstance(record, dict) else {}
+
+
+def _as_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in _TRUE_VALUES
+
+
+def validate_import_record(
+    line: int,
+    record: dict[str, Any] | None,
+) -> tuple[UserImportRow | None, dict[str, Any] | None]:
+    """
+    Validate a parsed import record.
+
+    Args:
+        line: Line number of the record in the input
+        record: Parsed record
+
+    Returns:
+        tuple: The validated row, or None and an import error entry
+    """
+    if record is None:
+        return None, import_error(line, {}, INVALID_ENCODING_ERROR)
+
+    missing = [
+        field
+        for field in IMPORT_REQUIRED_FIELDS
+        if not isinstance(record.get(field), str) or not record[field].strip()
+    ]
+    if missing:
+        return None, import_error(line, record, f"Missing fields: {', '.join(missing)}")
+
+    email = record["email"].strip().lower()
+    username = clean_input(record["username"])
+    password = record["password"]
+
+    if len(email) > MAX_EMAIL_LENGTH:
+        return None, import_error(line, record, "Email address is too long")
+
+    for is_valid, message in (
+        validate_email_format(email),
+        validate_username(username),
+        validate_password(password),
+    ):
+        if not is_valid:
+            return None, import_error(line, record, message)
+
+    return (
+        UserImportRow(
+            line=line,
+            email=email,
+            username=username,
+            password=password,
+            is_superuser=_as_bool(record.get("is_superuser")),
+            is_verified=_as_bool(record.get("is_verified")),
+        ),
+        None,
+    )
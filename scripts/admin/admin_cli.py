@@ -8,13 +8,26 @@ This script provides a command-line interface for admin operations.
 import argparse
 import asyncio
 import sys
+from collections.abc import AsyncIterator
+from datetime import datetime
+from pathlib import Path
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.system.admin import admin_user_crud
-from app.database.database import get_db
+from app.database.database import get_autocommit_db
+from app.models import AuditLog, User
+from app.schemas.admin.admin import AdminUserResponse
 from app.schemas.auth.user import UserCreate
+from app.schemas.system.audit_log import AuditLogResponse
+from app.services.monitoring.audit_archive import (
+    archive_audit_logs,
+    read_archived_audit_logs,
+)
+from app.utils.export import ExportFormat, encode_ndjson, stream_export
+from app.utils.search_filter import AuditLogSearchParams, UserSearchParams
+from app.utils.user_import import iter_import_records
 
 
 def print_json(data: dict) -> None:
@@ -253,6 +266,96 @@ async def get_statistics(db: AsyncSession) -> None:
         sys.exit(1)
 
 
+async def export_records(
+    db: AsyncSession,
+    resource: str,
+    export_format: str = "ndjson",
+    output: str | None = None,
+    search: str | None = None,
+    event_type: str | None = None,
+    user_id: str | None = None,
+    since: datetime | None = None,
+) -> None:
+    """Stream users or audit logs to a file (or stdout) as NDJSON or CSV."""
+    if resource == "users":
+        model, schema = User, AdminUserResponse
+        config = UserSearchParams(
+            search=search,
+            date_created_after=since,
+        ).to_search_config()
+    else:
+        model, schema = AuditLog, AuditLogResponse
+        config = AuditLogSearchParams(
+            event_type=event_type,
+            user_id=UUID(user_id) if user_id else None,
+            occurred_after=since,
+        ).to_search_config()
+
+    chunks = stream_export(db, model, schema, config, ExportFormat(export_format))
+    if output is None:
+        async for chunk in chunks:
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+        return
+
+    with Path(output).open("wb") as f:
+        async for chunk in chunks:
+            f.write(chunk)
+
+
+async def read_file_chunks(
+    path: str,
+    chunk_size: int = 1 << 20,
+) -> AsyncIterator[bytes]:
+    """Read a file in fixed-size chunks."""
+    with Path(path).open("rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+async def import_users(db: AsyncSession, path: str, import_format: str) -> None:
+    """Bulk-create users from a CSV or NDJSON file."""
+    result = await admin_user_crud.import_users(
+        db,
+        iter_import_records(read_file_chunks(path), ExportFormat(import_format)),
+    )
+    print_json(result)
+
+
+async def archive_audit_log_records(
+    db: AsyncSession,
+    older_than_days: int | None = None,
+    archive_dir: str | None = None,
+) -> None:
+    """Move old audit logs to compressed archive files."""
+    result = await archive_audit_logs(
+        db,
+        older_than_days=older_than_days,
+        archive_dir=archive_dir,
+    )
+    print_json(result)
+
+
+def read_audit_archive(
+    archive_dir: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    event_type: str | None = None,
+    user_id: str | None = None,
+) -> None:
+    """Write archived audit logs in a time range to stdout as NDJSON."""
+    rows = read_archived_audit_logs(
+        archive_dir,
+        since=since,
+        until=until,
+        event_type=event_type,
+        user_id=UUID(user_id) if user_id else None,
+    )
+    for row in rows:
+        sys.stdout.buffer.write(encode_ndjson([row]))
+    sys.stdout.buffer.flush()
+
+
 def main() -> None:
     """Main CLI function."""
     parser = argparse.ArgumentParser(description="Admin CLI utility")
@@ -339,14 +442,100 @@ def main() -> None:
     # Statistics command
     subparsers.add_parser("stats", help="Get user statistics")
 
+    # Import command
+    import_parser = subparsers.add_parser(
+        "import",
+        help="Bulk-create users from a CSV or NDJSON file",
+    )
+    import_parser.add_argument("path", help="Input file")
+    import_parser.add_argument(
+        "--format",
+        choices=[fmt.value for fmt in ExportFormat],
+        default=ExportFormat.CSV.value,
+        help="Input format",
+    )
+
+    # Export command
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Stream users or audit logs as NDJSON or CSV",
+    )
+    export_parser.add_argument("resource", choices=["users", "audit-logs"])
+    export_parser.add_argument(
+        "--format",
+        choices=[fmt.value for fmt in ExportFormat],
+        default=ExportFormat.NDJSON.value,
+        help="Export format",
+    )
+    export_parser.add_argument(
+        "--output",
+        "-o",
+        help="Output file (defaults to stdout)",
+    )
+    export_parser.add_argument("--search", help="Search username and email (users)")
+    export_parser.add_argument("--event-type", help="Filter by event type (audit logs)")
+    export_parser.add_argument("--user-id", help="Filter by user ID (audit logs)")
+    export_parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        help="Only records created at or after this ISO timestamp",
+    )
+
+    # Archive audit logs command
+    archive_parser = subparsers.add_parser(
+        "archive-audit-logs",
+        help="Move old audit logs to compressed archive files",
+    )
+    archive_parser.add_argument(
+        "--older-than-days",
+        type=int,
+        help="Archive audit logs older than this (default: AUDIT_ARCHIVE_AFTER_DAYS)",
+    )
+    archive_parser.add_argument(
+        "--archive-dir",
+        help="Archive root (default: AUDIT_ARCHIVE_DIR)",
+    )
+
+    # Read audit archive command
+    read_archive_parser = subparsers.add_parser(
+        "read-audit-archive",
+        help="Query archived audit logs as NDJSON without touching the database",
+    )
+    read_archive_parser.add_argument(
+        "--archive-dir",
+        help="Archive root (default: AUDIT_ARCHIVE_DIR)",
+    )
+    read_archive_parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        help="Only audit logs at or after this ISO timestamp (UTC if naive)",
+    )
+    read_archive_parser.add_argument(
+        "--until",
+        type=datetime.fromisoformat,
+        help="Only audit logs before this ISO timestamp (UTC if naive)",
+    )
+    read_archive_parser.add_argument("--event-type", help="Filter by event type")
+    read_archive_parser.add_argument("--user-id", help="Filter by user ID")
+
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
+    if args.command == "read-audit-archive":
+        read_audit_archive(
+            archive_dir=args.archive_dir,
+            since=args.since,
+            until=args.until,
+            event_type=args.event_type,
+            user_id=args.user_id,
+        )
+        return
+
     async def run_command() -> None:
-        async for db in get_db():
+        async for db in get_autocommit_db():
             try:
                 if args.command == "list":
                     await list_users(
@@ -387,6 +576,25 @@ def main() -> None:
                     await toggle_verification(db, args.user_id)
                 elif args.command == "stats":
                     await get_statistics(db)
+                elif args.command == "import":
+                    await import_users(db, args.path, args.format)
+                elif args.command == "export":
+                    await export_records(
+                        db=db,
+                        resource=args.resource,
+                        export_format=args.format,
+                        output=args.output,
+                        search=args.search,
+                        event_type=args.event_type,
+                        user_id=args.user_id,
+                        since=args.since,
+                    )
+                elif args.command == "archive-audit-logs":
+                    await archive_audit_log_records(
+                        db,
+                        older_than_days=args.older_than_days,
+                        archive_dir=args.archive_dir,
+                    )
                 break
             except Exception:
                 sys.exit(1)
@@ -15,7 +15,7 @@ import sys
 from pathlib import Path
 
 from app.bootstrap_superuser import bootstrap_superuser, create_superuser
-from app.database.database import get_db
+from app.database.database import get_autocommit_db
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent
@@ -55,7 +55,7 @@ async def main() -> None:
     if args.email and args.password:
         logger.info(f"Creating superuser: {args.email}")
 
-        async for db in get_db():
+        async for db in get_autocommit_db():
             try:
                 success = await create_superuser(
                     db=db,
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark admin user listing through ORM objects versus column projection.
+
+Seeds synthetic users inside a transaction, then measures rows/sec for
+100-row and 1000-row pages using:
+
+- get_multi + AdminUserResponse.model_validate (full ORM rows)
+- get_multi_projected (only AdminUserResponse columns, built from row mappings)
+
+Everything is rolled back afterwards.
+
+Usage:
+    python scripts/development/benchmark_admin_listing.py --users 20000 --runs 20
+
+Requires a PostgreSQL database at DATABASE_URL migrated to head.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.system.admin import admin_user_crud
+from app.database.database import engine
+from app.schemas.admin.admin import AdminUserResponse
+
+PAGE_SIZES = (100, 1000)
+
+SEED_SQL = """
+INSERT INTO users (
+    id, email, username, hashed_password, is_superuser, is_verified, is_deleted,
+    created_at, updated_at
+)
+SELECT
+    gen_random_uuid(),
+    'bench_user_' || g || '@example.com',
+    'bench_user_' || g,
+    repeat('x', 60),
+    false,
+    g % 2 = 0,
+    false,
+    now(),
+    now()
+FROM generate_series(1, :count) AS g
+"""
+
+
+async def _rows_per_second(
+    session: AsyncSession,
+    fetch: Callable[[AsyncSession, int], Awaitable[list[Any]]],
+    page_size: int,
+    runs: int,
+) -> float:
+    """Return the median rows/sec for fetching one page."""
+    timings = []
+    for _ in range(runs):
+        # Start every run with an empty identity map so the ORM path pays
+        # for instantiating objects each time
+        session.expunge_all()
+        start = time.perf_counter()
+        rows = await fetch(session, page_size)
+        timings.append(time.perf_counter() - start)
+    return len(rows) / statistics.median(timings)
+
+
+async def _orm_page(session: AsyncSession, page_size: int) -> list[AdminUserResponse]:
+    users = await admin_user_crud.get_multi(session, limit=page_size)
+    return [AdminUserResponse.model_validate(user) for user in users]
+
+
+async def _projected_page(
+    session: AsyncSession,
+    page_size: int,
+) -> list[AdminUserResponse]:
+    return await admin_user_crud.get_user_responses(session, limit=page_size)
+
+
+async def run_benchmark(users: int, runs: int) -> None:
+    """Seed users, time both listing paths per page size, then roll back."""
+    results: list[tuple[int, float, float]] = []
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            print(f"Seeding {users} users...")
+            await conn.execute(text(SEED_SQL), {"count": users})
+            await conn.execute(text("ANALYZE users"))
+
+            session = AsyncSession(bind=conn, expire_on_commit=False)
+            for page_size in PAGE_SIZES:
+                # Warm up both paths (statement caches, projection cache)
+                await _orm_page(session, page_size)
+                await _projected_page(session, page_size)
+
+                orm_rps = await _rows_per_second(session, _orm_page, page_size, runs)
+                projected_rps = await _rows_per_second(
+                    session,
+                    _projected_page,
+                    page_size,
+                    runs,
+                )
+                results.append((page_size, orm_rps, projected_rps))
+            await session.close()
+        finally:
+            await transaction.rollback()
+
+    await engine.dispose()
+
+    print(f"\nMedian rows/sec over {runs} runs:")
+    print(f"{'page':>6}  {'ORM':>12}  {'projected':>12}  {'speedup':>8}")
+    for page_size, orm_rps, projected_rps in results:
+        print(
+            f"{page_size:>6}  {orm_rps:>12,.0f}  {projected_rps:>12,.0f}  "
+            f"{projected_rps / orm_rps:>7.1f}x",
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.users, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark audit log context queries with and without the JSONB GIN index.
+
+Seeds synthetic audit logs inside a transaction (10M by default), runs a
+get_audit_logs_by_context style query with ix_audit_log_context (combined
+with the event and time indexes) and then without it (every candidate row's
+context is parsed and compared), prints both plans and timings, then rolls
+everything back.
+
+Usage:
+    python scripts/development/benchmark_audit_context.py --rows 10000000 --provider google
+
+Requires a PostgreSQL database at DATABASE_URL migrated to head.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import timedelta
+
+from sqlalchemy import desc, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.crud.system.audit_log import audit_context_contains
+from app.database.database import engine
+from app.models import AuditLog
+from app.utils.datetime_utils import utc_now
+
+# One OAuth provider in eight rows, one failure in five, spread over 90 days
+SEED_SQL = """
+INSERT INTO audit_logs (id, timestamp, event_type, ip_address, success, context)
+SELECT
+    gen_random_uuid(),
+    now() - (g % 7776000) * interval '1 second',
+    (ARRAY['login_success', 'login_failed', 'logout', 'password_change'])[g % 4 + 1],
+    '10.' || (g % 256) || '.' || (g / 256 % 256) || '.1',
+    g % 5 <> 0,
+    jsonb_build_object(
+        'oauth_provider',
+        (ARRAY['google', 'github', 'apple', 'microsoft',
+               'facebook', 'gitlab', 'okta', 'auth0'])[g % 8 + 1],
+        'attempt', g % 10
+    )
+FROM generate_series(1, :count) AS g
+"""
+
+
+async def _time_query(conn: AsyncConnection, sql: str, runs: int) -> tuple[str, float]:
+    """Return the EXPLAIN ANALYZE plan and median latency in milliseconds."""
+    plan_rows = (await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"))).all()
+    plan = "\n".join(row[0] for row in plan_rows)
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await conn.execute(text(sql))
+        timings.append((time.perf_counter() - start) * 1000)
+    return plan, statistics.median(timings)
+
+
+async def run_benchmark(rows: int, provider: str, days: int, runs: int) -> None:
+    """Seed audit logs, compare plans with and without the GIN index, roll back."""
+    statement = (
+        select(AuditLog)
+        .filter(
+            audit_context_contains({"oauth_provider": provider}),
+            AuditLog.event_type == "login_failed",
+            AuditLog.timestamp >= utc_now() - timedelta(days=days),
+        )
+        .order_by(desc(AuditLog.timestamp))
+        .limit(100)
+    )
+    sql = str(
+        statement.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        ),
+    )
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            print(f"Seeding {rows} audit logs...")
+            await conn.execute(text(SEED_SQL), {"count": rows})
+            await conn.execute(text("ANALYZE audit_logs"))
+            gin_plan, gin_ms = await _time_query(conn, sql, runs)
+
+            # Dropping the index is rolled back with the seed data; it leaves
+            # the old plan, which parses the context of every candidate row
+            await conn.execute(text("DROP INDEX ix_audit_log_context"))
+            scan_plan, scan_ms = await _time_query(conn, sql, runs)
+        finally:
+            await transaction.rollback()
+
+    await engine.dispose()
+
+    print("\n=== Without context GIN index ===")
+    print(scan_plan)
+    print("\n=== With context GIN index ===")
+    print(gin_plan)
+    print(f"\nMedian latency over {runs} runs:")
+    print(f"  without GIN index: {scan_ms:.2f} ms")
+    print(f"  with GIN index:    {gin_ms:.2f} ms")
+    if gin_ms > 0:
+        print(f"  speedup:           {scan_ms / gin_ms:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--provider", default="google")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.rows, args.provider, args.days, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-request auth lookups through the ORM versus the asyncpg fast path.
+
+Seeds one user, API key and refresh token inside a transaction, then measures
+the median per-lookup time of:
+
+- get_user_by_id (get_current_user)
+- verify_api_key_in_db (get_api_key_user)
+- verify_refresh_token_in_db (access token refresh)
+
+via app.crud.auth (ORM) and app.crud.auth.fast_path (raw asyncpg). The API
+key and refresh token lookups include the same bcrypt verification on both
+paths, so compare the "saved" column rather than the ratio. Everything is
+rolled back afterwards.
+
+Usage:
+    python scripts/development/benchmark_auth_fast_path.py --runs 2000
+
+Requires a PostgreSQL database at DATABASE_URL migrated to head.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.auth import api_key as crud_api_key
+from app.crud.auth import fast_path
+from app.crud.auth import refresh_token as crud_refresh_token
+from app.crud.auth import user as crud_user
+from app.database.database import UNIT_OF_WORK_KEY, engine
+from app.models import User
+from app.models.core.base import apply_column_defaults
+from app.schemas.auth.user import APIKeyCreate
+
+RAW_API_KEY = "sk_benchmark_fast_path"
+RAW_REFRESH_TOKEN = "benchmark-fast-path-refresh-token"
+
+
+async def _seed(session: AsyncSession) -> str:
+    """Insert the user, API key and refresh token; return the user ID."""
+    user = User()
+    user.email = "bench_fast_path@example.com"
+    user.username = "bench_fast_path"
+    user.hashed_password = "x" * 60
+    apply_column_defaults(user)
+    session.add(user)
+    await session.flush()
+
+    await crud_api_key.create_api_key(
+        session,
+        APIKeyCreate(label="bench", scopes=["read"]),
+        user_id=str(user.id),
+        raw_key=RAW_API_KEY,
+    )
+    await crud_refresh_token.create_refresh_token(
+        session,
+        str(user.id),
+        RAW_REFRESH_TOKEN,
+    )
+    return str(user.id)
+
+
+async def _median_microseconds(
+    session: AsyncSession,
+    lookup: Callable[[], Awaitable[Any]],
+    runs: int,
+) -> float:
+    """Return the median time of one lookup in microseconds."""
+    # Warm up statement caches on both paths
+    for _ in range(10):
+        assert await lookup() is not None
+    timings = []
+    for _ in range(runs):
+        # Each request gets a fresh session, so start with an empty identity map
+        session.expunge_all()
+        start = time.perf_counter()
+        await lookup()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1_000_000
+
+
+async def run_benchmark(runs: int) -> None:
+    """Seed the rows, time each lookup on both paths, then roll back."""
+    results: list[tuple[str, float, float]] = []
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            # Flush instead of commit so the outer transaction can be rolled back
+            session = AsyncSession(
+                bind=conn,
+                expire_on_commit=False,
+                info={UNIT_OF_WORK_KEY: True},
+            )
+            user_id = await _seed(session)
+
+            lookups = (
+                (
+                    "get_user_by_id",
+                    lambda: crud_user.get_user_by_id(session, user_id),
+                    lambda: fast_path.get_user_by_id(session, user_id),
+                ),
+                (
+                    "verify_api_key_in_db",
+                    lambda: crud_api_key.verify_api_key_in_db(session, RAW_API_KEY),
+                    lambda: fast_path.verify_api_key_in_db(session, RAW_API_KEY),
+                ),
+                (
+                    "verify_refresh_token_in_db",
+                    lambda: crud_refresh_token.verify_refresh_token_in_db(
+                        session,
+                        RAW_REFRESH_TOKEN,
+                    ),
+                    lambda: fast_path.verify_refresh_token_in_db(
+                        session,
+                        RAW_REFRESH_TOKEN,
+                    ),
+                ),
+            )
+            for name, orm_lookup, fast_lookup in lookups:
+                orm_us = await _median_microseconds(session, orm_lookup, runs)
+                fast_us = await _median_microseconds(session, fast_lookup, runs)
+                results.append((name, orm_us, fast_us))
+            await session.close()
+        finally:
+            await transaction.rollback()
+
+    await engine.dispose()
+
+    print(f"\nMedian microseconds per lookup over {runs} runs:")
+    print(f"{'lookup':<28}  {'ORM':>10}  {'fast path':>10}  {'saved':>10}")
+    for name, orm_us, fast_us in results:
+        print(
+            f"{name:<28}  {orm_us:>10,.1f}  {fast_us:>10,.1f}  "
+            f"{orm_us - fast_us:>10,.1f}",
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.runs))
+
+
+if __name__ == "__main__":
+    main()
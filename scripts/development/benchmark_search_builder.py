@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark SearchFilterBuilder query construction.
+
+Measures build_query/build_statement throughput for a typical user search
+with the query template cache cold (cleared before every build) and warm,
+and reports the resulting cache statistics. No database is needed.
+
+Usage:
+    python scripts/development/benchmark_search_builder.py --iterations 20000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+
+from app.models import User
+from app.utils.search_filter import (
+    SearchFilterBuilder,
+    clear_search_query_cache,
+    create_user_search_filters,
+    get_search_query_cache_stats,
+)
+
+
+def _config(index: int) -> Any:
+    """Same filter shape every time, different values."""
+    return create_user_search_filters(
+        search_query=f"user{index}",
+        is_verified=index % 2 == 0,
+        oauth_provider="google",
+        date_created_after=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        sort_by="created_at",
+        sort_order="desc",
+    )
+
+
+def _measure(label: str, iterations: int, build: Callable[[int], Any]) -> None:
+    """Run build for each iteration and print throughput."""
+    start = time.perf_counter()
+    for index in range(iterations):
+        build(index)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<28} {iterations / elapsed:>10,.0f} ops/s "
+        f"({elapsed / iterations * 1e6:.1f} us/op)",
+    )
+
+
+def run_benchmark(iterations: int) -> None:
+    """Compare cold and warm template cache throughput."""
+    configs = [_config(index) for index in range(iterations)]
+
+    def cold_build_query(index: int) -> Any:
+        clear_search_query_cache()
+        return SearchFilterBuilder(User).build_query(configs[index])
+
+    def warm_build_query(index: int) -> Any:
+        return SearchFilterBuilder(User).build_query(configs[index])
+
+    def warm_build_statement(index: int) -> Any:
+        return SearchFilterBuilder(User).build_statement(configs[index])
+
+    _measure("build_query (cold cache)", iterations, cold_build_query)
+    clear_search_query_cache()
+    _measure("build_query (warm cache)", iterations, warm_build_query)
+    _measure("build_statement (warm cache)", iterations, warm_build_statement)
+
+    stats = get_search_query_cache_stats()
+    print(
+        f"\nCache: {stats['hits']} hits, {stats['misses']} misses, "
+        f"hit ratio {stats['hit_ratio']:.4f}",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+    run_benchmark(args.iterations)
+
+
+if __name__ == "__main__":
+    main()
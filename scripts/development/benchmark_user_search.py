@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark substring user search with and without the trigram indexes.
+
+Seeds a large number of synthetic users inside a transaction, runs the query
+produced by SearchFilterBuilder with index scans disabled (the old sequential
+scan plan) and enabled (the pg_trgm GIN plan), prints both plans and timings,
+then rolls everything back.
+
+Usage:
+    python scripts/development/benchmark_user_search.py --users 1000000 --query r_12345
+
+Requires a PostgreSQL database at DATABASE_URL migrated to head.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.database.database import engine
+from app.models import User
+from app.utils.search_filter import SearchFilterBuilder, create_user_search_filters
+
+SEED_SQL = """
+INSERT INTO users (
+    id, email, username, is_superuser, is_verified, is_deleted,
+    created_at, updated_at
+)
+SELECT
+    gen_random_uuid(),
+    'bench_user_' || g || '@example.com',
+    'bench_user_' || g,
+    false,
+    g % 2 = 0,
+    false,
+    now(),
+    now()
+FROM generate_series(1, :count) AS g
+"""
+
+
+async def _time_query(conn: AsyncConnection, sql: str, runs: int) -> tuple[str, float]:
+    """Return the EXPLAIN ANALYZE plan and median latency in milliseconds."""
+    plan_rows = (await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"))).all()
+    plan = "\n".join(row[0] for row in plan_rows)
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await conn.execute(text(sql))
+        timings.append((time.perf_counter() - start) * 1000)
+    return plan, statistics.median(timings)
+
+
+async def run_benchmark(users: int, query: str, runs: int) -> None:
+    """Seed users, compare sequential and trigram plans, then roll back."""
+    config = create_user_search_filters(search_query=query)
+    statement = SearchFilterBuilder(User).build_query(config).limit(20)
+    sql = str(
+        statement.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        ),
+    )
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            print(f"Seeding {users} users...")
+            await conn.execute(text(SEED_SQL), {"count": users})
+            await conn.execute(text("ANALYZE users"))
+
+            await conn.execute(text("SET LOCAL enable_bitmapscan = off"))
+            await conn.execute(text("SET LOCAL enable_indexscan = off"))
+            seq_plan, seq_ms = await _time_query(conn, sql, runs)
+
+            await conn.execute(text("SET LOCAL enable_bitmapscan = on"))
+            await conn.execute(text("SET LOCAL enable_indexscan = on"))
+            idx_plan, idx_ms = await _time_query(conn, sql, runs)
+        finally:
+            await transaction.rollback()
+
+    await engine.dispose()
+
+    print("\n=== Without trigram index ===")
+    print(seq_plan)
+    print("\n=== With trigram index ===")
+    print(idx_plan)
+    print(f"\nMedian latency over {runs} runs:")
+    print(f"  sequential scan: {seq_ms:.2f} ms")
+    print(f"  trigram index:   {idx_ms:.2f} ms")
+    if idx_ms > 0:
+        print(f"  speedup:         {seq_ms / idx_ms:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--query", default="r_12345")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.users, args.query, args.runs))
+
+
+if __name__ == "__main__":
+    main()
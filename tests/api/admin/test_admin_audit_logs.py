@@ -0,0 +1,268 @@
+import types
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+def _admin():
+    return types.SimpleNamespace(id=uuid.UUID("00000000-0000-0000-0000-0000000000aa"))
+
+
+def _log(timestamp):
+    return types.SimpleNamespace(
+        id=uuid.uuid4(),
+        timestamp=timestamp,
+        user_id=None,
+        event_type="login_failed",
+        ip_address="10.0.0.1",
+        user_agent=None,
+        success=False,
+        context={"oauth_provider": "google"},
+        session_id=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_audit_logs_pages_with_cursor(monkeypatch, async_client):
+    from app.api.admin import audit_logs as mod
+    from app.main import app
+    from app.utils.pagination import decode_keyset_cursor, encode_keyset_cursor
+
+    app.dependency_overrides[mod.require_superuser] = lambda: _admin()
+
+    previous = (datetime(2025, 1, 2, tzinfo=UTC), uuid.uuid4())
+    log = _log(datetime(2025, 1, 1, tzinfo=UTC))
+    captured = {}
+
+    async def fake_search(db, config, limit, after):  # type: ignore[no-untyped-def]
+        captured.update(config=config, limit=limit, after=after)
+        return [log], (log.timestamp, log.id)
+
+    monkeypatch.setattr(mod, "search_audit_logs", fake_search)
+
+    try:
+        r = await async_client.get(
+            "/api/admin/audit-logs",
+            params={
+                "event_type": "login_failed",
+                "success": "false",
+                "limit": 1,
+                "cursor": encode_keyset_cursor(*previous),
+            },
+        )
+    finally:
+        app.dependency_overrides.pop(mod.require_superuser, None)
+
+    assert r.status_code == 200
+    body = r.json()
+    assert [item["id"] for item in body["items"]] == [str(log.id)]
+    assert body["limit"] == 1
+    assert decode_keyset_cursor(body["next_cursor"]) == (log.timestamp, log.id)
+    assert captured["after"] == previous
+    assert captured["limit"] == 1
+    assert {f.field: f.value for f in captured["config"].filters} == {
+        "event_type": "login_failed",
+        "success": False,
+    }
+
+
+@pytest.mark.asyncio
+async def test_list_audit_logs_last_page_has_no_cursor(monkeypatch, async_client):
+    from app.api.admin import audit_logs as mod
+    from app.main import app
+
+    app.dependency_overrides[mod.require_superuser] = lambda: _admin()
+
+    async def fake_search(db, config, limit, after):  # type: ignore[no-untyped-def]
+        assert after is None
+        return [], None
+
+    monkeypatch.setattr(mod, "search_audit_logs", fake_search)
+
+    try:
+        r = await async_client.get("/api/admin/audit-logs")
+    finally:
+        app.dependency_overrides.pop(mod.require_superuser, None)
+
+    assert r.status_code == 200
+    assert r.json() == {"items": [], "limit": 50, "next_cursor": None}
+
+
+@pytest.mark.asyncio
+async def test_list_audit_logs_rejects_malformed_cursor(async_client):
+    from app.api.admin import audit_logs as mod
+    from app.main import app
+
+    app.dependency_overrides[mod.require_superuser] = lambda: _admin()
+    try:
+        r = await async_client.get("/api/admin/audit-logs?cursor=garbage")
+    finally:
+        app.dependency_overrides.pop(mod.require_superuser, None)
+
+    assert r.status_code == 400
+    assert r.json()["error"]["message"] == "Invalid pagination cursor"
+
+
+@pytest.mark.asyncio
+async def test_audit_log_histogram_returns_buckets(monkeypatch, async_client):
+    from app.api.admin import audit_logs as mod
+    from app.main import app
+
+    app.dependency_overrides[mod.require_superuser] = lambda: _admin()
+
+    bucket = datetime(2025, 1, 1, tzinfo=UTC)
+    captured = {}
+
+    async def fake_histogram(db, config, interval):  # type: ignore[no-untyped-def]
+        captured.update(config=config, interval=interval)
+        return [(bucket, 7)]
+
+    monkeypatch.setattr(mod, "get_audit_log_histogram", fake_histogram)
+
+    try:
+        r = await async_client.get(
+            "/api/admin/audit-logs/histogram",
+            params={"interval": "day", "occurred_after": "2025-01-01T00:00:00Z"},
+        )
+    finally:
+        app.dependency_overrides.pop(mod.require_superuser, None)
+
+    assert r.status_code == 200
+    body = r.json()
+    assert body["interval"] == "day"
+    assert body["buckets"] == [{"bucket": "2025-01-01T00:00:00Z", "count": 7}]
+    assert captured["interval"] == "day"
+    assert [f.field for f in captured["config"].filters] == ["timestamp"]
+
+
+@pytest.mark.asyncio
+async def test_audit_log_histogram_rejects_unknown_interval(async_client):
+    from app.api.admin import audit_logs as mod
+    from app.main import app
+
+    app.dependency_overrides[mod.require_superuser] = lambda: _admin()
+    try:
+        r = await async_client.get("/api/admin/audit-logs/histogram?interval=second")
+    finally:
+        app.dependency_overrides.pop(mod.require_superuser, None)
+
+    assert r.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_audit_rollups_reports_watermarks(monkeypatch, async_client):
+    from app.api.admin import audit_logs as mod
+    from app.main import app
+
+    app.dependency_overrides[mod.require_superuser] = lambda: _admin()
+    processed = datetime(2025, 1, 1, tzinfo=UTC)
+
+    async def fake_watermarks(db):  # type: ignore[no-untyped-def]
+        return {"failed_logins_per_ip_minute": processed}
+
+    monkeypatch.setattr(mod, "get_audit_rollup_watermarks", fake_watermarks)
+
+    try:
+        r = await async_client.get("/api/admin/audit-logs/rollups")
+    finally:
+        app.dependency_overrides.pop(mod.require_superuser, None)
+
+    assert r.status_code == 200
+    rollups = {item["name"]: item for item in r.json()}
+    assert set(rollups) == set(mod.AUDIT_ROLLUPS)
+    assert rollups["failed_logins_per_ip_minute"]["processed_until"] == (
+        "2025-01-01T00:00:00Z"
+    )
+    assert rollups["api_key_usage_per_key_hour"]["processed_until"] is None
+
+
+@pytest.mark.asyncio
+async def test_read_audit_rollup_returns_buckets(monkeypatch, async_client):
+    from app.api.admin import audit_logs as mod
+    from app.main import app
+
+    app.dependency_overrides[mod.require_superuser] = lambda: _admin()
+    bucket = types.SimpleNamespace(
+        bucket_start=datetime(2025, 1, 1, 12, 30, tzinfo=UTC),
+        dimension="10.0.0.1",
+        count=4,
+    )
+    captured = {}
+
+    async def fake_rollup(db, name, since, until, dimension, limit):  # type: ignore[no-untyped-def]
+        captured.update(name=name, since=since, until=until, dimension=dimension)
+        return [bucket]
+
+    async def fake_watermarks(db):  # type: ignore[no-untyped-def]
+        return {}
+
+    monkeypatch.setattr(mod, "get_audit_rollup", fake_rollup)
+    monkeypatch.setattr(mod, "get_audit_rollup_watermarks", fake_watermarks)
+
+    try:
+        r = await async_client.get(
+            "/api/admin/audit-logs/rollups/failed_logins_per_ip_minute",
+            params={"until": "2025-01-02T00:00:00Z", "dimension": "10.0.0.1"},
+        )
+    finally:
+        app.dependency_overrides.pop(mod.require_superuser, None)
+
+    assert r.status_code == 200
+    body = r.json()
+    assert body["interval"] == "minute"
+    assert body["buckets"] == [
+        {"bucket_start": "2025-01-01T12:30:00Z", "dimension": "10.0.0.1", "count": 4},
+    ]
+    assert captured["name"] == "failed_logins_per_ip_minute"
+    assert captured["dimension"] == "10.0.0.1"
+    # Without since, the last 24 hours before until are read
+    assert captured["until"] - captured["since"] == timedelta(hours=24)
+
+
+@pytest.mark.asyncio
+async def test_read_audit_rollup_top(monkeypatch, async_client):
+    from app.api.admin import audit_logs as mod
+    from app.main import app
+
+    app.dependency_overrides[mod.require_superuser] = lambda: _admin()
+
+    async def fake_top(db, name, since, until, limit):  # type: ignore[no-untyped-def]
+        assert limit == 3
+        return [("key-1", 120), ("key-2", 7)]
+
+    async def fake_watermarks(db):  # type: ignore[no-untyped-def]
+        return {}
+
+    monkeypatch.setattr(mod, "get_audit_rollup_top", fake_top)
+    monkeypatch.setattr(mod, "get_audit_rollup_watermarks", fake_watermarks)
+
+    try:
+        r = await async_client.get(
+            "/api/admin/audit-logs/rollups/api_key_usage_per_key_hour/top?limit=3",
+        )
+    finally:
+        app.dependency_overrides.pop(mod.require_superuser, None)
+
+    assert r.status_code == 200
+    assert r.json()["items"] == [
+        {"dimension": "key-1", "count": 120},
+        {"dimension": "key-2", "count": 7},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_unknown_audit_rollup_returns_404(async_client):
+    from app.api.admin import audit_logs as mod
+    from app.main import app
+
+    app.dependency_overrides[mod.require_superuser] = lambda: _admin()
+    try:
+        r = await async_client.get("/api/admin/audit-logs/rollups/nope")
+    finally:
+        app.dependency_overrides.pop(mod.require_superuser, None)
+
+    assert r.status_code == 404
+    assert r.json()["error"]["message"] == "Unknown audit rollup: nope"
@@ -0,0 +1,120 @@
+import types
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+def _admin():
+    return types.SimpleNamespace(id=uuid.UUID("00000000-0000-0000-0000-0000000000aa"))
+
+
+class _SessionContext:
+    def __init__(self, session):
+        self._session = session
+        self.closed = False
+
+    async def __aenter__(self):
+        return self._session
+
+    async def __aexit__(self, *exc):  # type: ignore[no-untyped-def]
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_export_users_streams_ndjson_with_filters(monkeypatch, async_client):
+    from app.api.admin import exports as mod
+    from app.main import app
+
+    app.dependency_overrides[mod.require_superuser] = lambda: _admin()
+
+    session = object()
+    context = _SessionContext(session)
+    monkeypatch.setattr(mod, "AsyncSessionLocal", lambda: context)
+
+    captured = {}
+
+    async def fake_stream_export(db, model, schema, config, export_format):
+        captured.update(db=db, model=model, schema=schema, config=config)
+        yield b'{"id":"1"}\n'
+        yield b'{"id":"2"}\n'
+
+    monkeypatch.setattr(mod, "stream_export", fake_stream_export)
+
+    r = await async_client.get("/api/admin/exports/users?search=alice&is_verified=true")
+    app.dependency_overrides.clear()
+
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    assert 'filename="users-' in r.headers["content-disposition"]
+    assert r.headers["content-disposition"].endswith('.ndjson"')
+    assert r.text.splitlines() == ['{"id":"1"}', '{"id":"2"}']
+    # The stream runs on its own session, closed once the body is sent
+    assert captured["db"] is session and context.closed
+    assert captured["model"] is mod.User
+    config = captured["config"]
+    assert config.text_search.query == "alice"
+    assert [f.field for f in config.filters] == ["is_verified"]
+
+
+@pytest.mark.asyncio
+async def test_export_audit_logs_csv(monkeypatch, async_client):
+    from app.api.admin import exports as mod
+    from app.main import app
+
+    app.dependency_overrides[mod.require_superuser] = lambda: _admin()
+
+    row = {
+        "id": uuid.uuid4(),
+        "timestamp": datetime(2025, 1, 1, tzinfo=UTC),
+        "user_id": None,
+        "event_type": "login_failed",
+        "ip_address": None,
+        "user_agent": None,
+        "success": False,
+        "context": None,
+        "session_id": None,
+    }
+
+    class FakeSession:
+        async def stream(self, statement, params=None):  # type: ignore[no-untyped-def]
+            assert params == {"filter_0": "login_failed"}
+
+            class Result:
+                def mappings(self):
+                    return self
+
+                async def partitions(self):
+                    yield [row]
+
+            return Result()
+
+    monkeypatch.setattr(
+        mod,
+        "AsyncSessionLocal",
+        lambda: _SessionContext(FakeSession()),
+    )
+
+    r = await async_client.get(
+        "/api/admin/exports/audit-logs?format=csv&event_type=login_failed",
+    )
+    app.dependency_overrides.clear()
+
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/csv")
+    lines = r.text.splitlines()
+    assert lines[0].startswith("id,timestamp,user_id,event_type")
+    assert len(lines) == 2 and "login_failed" in lines[1]
+
+
+@pytest.mark.asyncio
+async def test_export_rejects_unknown_format(async_client):
+    from app.api.admin import exports as mod
+    from app.main import app
+
+    app.dependency_overrides[mod.require_superuser] = lambda: _admin()
+    r = await async_client.get("/api/admin/exports/users?format=xml")
+    app.dependency_overrides.clear()
+    assert r.status_code == 422
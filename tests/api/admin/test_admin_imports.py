@@ -0,0 +1,71 @@
+import types
+import uuid
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+def _admin():
+    return types.SimpleNamespace(id=uuid.UUID("00000000-0000-0000-0000-0000000000aa"))
+
+
+@pytest.mark.asyncio
+async def test_import_users_streams_body_to_crud(monkeypatch, async_client):
+    from app.api.admin import imports as mod
+    from app.main import app
+
+    app.dependency_overrides[mod.require_superuser] = lambda: _admin()
+
+    seen = []
+
+    async def fake_import_users(db, records):
+        async for line, record in records:
+            seen.append((line, record))
+        return {
+            "total_rows": len(seen),
+            "imported": 1,
+            "failed": 1,
+            "errors": [
+                {
+                    "line": 3,
+                    "email": "b@example.com",
+                    "username": "bob",
+                    "reason": "Email already registered",
+                },
+            ],
+        }
+
+    monkeypatch.setattr(mod.admin_user_crud, "import_users", fake_import_users)
+
+    body = (
+        "email,username,password\n"
+        "a@example.com,alice,Str0ng!Pass\n"
+        "b@example.com,bob,Str0ng!Pass\n"
+    )
+    r = await async_client.post(
+        "/api/admin/imports/users?format=csv",
+        content=body,
+        headers={"content-type": "text/csv"},
+    )
+    app.dependency_overrides.clear()
+
+    assert r.status_code == 200
+    data = r.json()
+    assert data["imported"] == 1 and data["failed"] == 1
+    assert data["errors"][0]["line"] == 3
+    assert [line for line, _ in seen] == [2, 3]
+    assert seen[0][1]["username"] == "alice"
+
+
+@pytest.mark.asyncio
+async def test_import_users_requires_superuser(async_client):
+    from app.core.admin import admin as core_admin_module
+    from app.main import app
+
+    app.dependency_overrides[core_admin_module.get_current_user] = lambda: (
+        types.SimpleNamespace(id=uuid.uuid4(), is_superuser=False)
+    )
+    r = await async_client.post("/api/admin/imports/users", content=b"")
+    app.dependency_overrides.clear()
+    assert r.status_code == 403
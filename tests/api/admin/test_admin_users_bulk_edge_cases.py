@@ -19,31 +19,28 @@ async def test_bulk_operations_mixed_and_invalid(monkeypatch, async_client):
 
     ids = [uuid.uuid4(), uuid.uuid4(), uuid.uuid4()]
 
-    calls = {"n": 0}
+    captured = {}
 
-    async def toggle_ver(db, uid):
-        # return user objects alternating between verified/unverified and None (failure)
-        calls["n"] += 1
-        if calls["n"] == 1:
-            return types.SimpleNamespace(is_verified=False)
-        if calls["n"] == 2:
-            return None
-        return types.SimpleNamespace(is_verified=True)
+    async def bulk_update(db, user_ids, operation, performed_by=None, **kwargs):
+        captured.update(user_ids=user_ids, operation=operation, by=performed_by)
+        # second id is missing from the database
+        return [user_ids[0], user_ids[2]]
 
-    monkeypatch.setattr(mod.admin_user_crud, "toggle_verification_status", toggle_ver)
+    monkeypatch.setattr(mod.admin_user_crud, "bulk_update_users", bulk_update)
 
-    # verify: first id toggles twice to become verified, second fails, third already verified counts success
+    # duplicates are ignored; ids not returned by the UPDATE are reported as failed
     r = await async_client.post(
         "/api/admin/bulk-operations",
-        json={"operation": "verify", "user_ids": [str(i) for i in ids]},
+        json={"operation": "verify", "user_ids": [str(i) for i in [*ids, ids[0]]]},
     )
     assert r.status_code == 200
     body = r.json()
-    assert (
-        body["successful"] == 2
-        and body["failed"] == 1
-        and len(body["failed_user_ids"]) == 1
-    )
+    assert captured["user_ids"] == ids
+    assert captured["operation"] == "verify"
+    assert captured["by"] == _admin().id
+    assert body["total_users"] == 3
+    assert body["successful"] == 2 and body["failed"] == 1
+    assert body["failed_user_ids"] == [str(ids[1])]
 
     # invalid operation should mark all as failed
     r = await async_client.post(
@@ -52,3 +49,60 @@ async def test_bulk_operations_mixed_and_invalid(monkeypatch, async_client):
     )
     app.dependency_overrides.clear()
     assert r.status_code == 422 or r.json()["failed"] == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("operation", "detail"),
+    [
+        ("delete", "Cannot delete your own account"),
+        ("remove_superuser", "Cannot modify your own superuser status"),
+    ],
+)
+async def test_bulk_operations_refuse_own_account(
+    monkeypatch,
+    async_client,
+    operation,
+    detail,
+):
+    from app.api.admin import users as mod
+    from app.main import app
+
+    app.dependency_overrides[mod.require_superuser] = lambda: _admin()
+
+    async def bulk_update(*args, **kwargs):
+        raise AssertionError("bulk update ran")
+
+    monkeypatch.setattr(mod.admin_user_crud, "bulk_update_users", bulk_update)
+
+    r = await async_client.post(
+        "/api/admin/bulk-operations",
+        json={
+            "operation": operation,
+            "user_ids": [str(uuid.uuid4()), str(_admin().id)],
+        },
+    )
+    app.dependency_overrides.clear()
+    assert r.status_code == 400
+    assert detail in r.text
+
+
+@pytest.mark.asyncio
+async def test_bulk_operations_keep_the_inline_cap(async_client):
+    from app.api.admin import users as mod
+    from app.main import app
+    from app.schemas.admin.admin import BULK_OPERATION_MAX_USERS
+
+    app.dependency_overrides[mod.require_superuser] = lambda: _admin()
+    r = await async_client.post(
+        "/api/admin/bulk-operations",
+        json={
+            "operation": "verify",
+            "user_ids": [
+                str(uuid.uuid4()) for _ in range(BULK_OPERATION_MAX_USERS + 1)
+            ],
+        },
+    )
+    app.dependency_overrides.clear()
+    assert BULK_OPERATION_MAX_USERS == 100
+    assert r.status_code == 422
@@ -14,20 +14,13 @@ def _admin():
 async def test_list_users_with_filters(monkeypatch, async_client):
     from app.api.admin import users as mod
     from app.main import app
+    from app.schemas.admin.admin import AdminUserResponse
 
     app.dependency_overrides[mod.require_superuser] = lambda: _admin()
 
-    async def fake_get_users(
-        db,
-        skip,
-        limit,
-        is_superuser,
-        is_verified,
-        is_deleted,
-        oauth_provider,
-    ):
+    async def fake_get_user_responses(db, skip, limit, filters):
         return [
-            types.SimpleNamespace(
+            AdminUserResponse(
                 id=uuid.uuid4(),
                 email="a@example.com",
                 username="axxx",
@@ -49,7 +42,11 @@ async def test_list_users_with_filters(monkeypatch, async_client):
         assert filters["is_verified"] is True and filters["is_deleted"] is False
         return 1
 
-    monkeypatch.setattr(mod.admin_user_crud, "get_users", fake_get_users)
+    monkeypatch.setattr(
+        mod.admin_user_crud,
+        "get_user_responses",
+        fake_get_user_responses,
+    )
     monkeypatch.setattr(mod.admin_user_crud, "count", fake_count)
 
     r = await async_client.get("/api/admin/users?is_verified=true&is_deleted=false")
@@ -310,41 +307,30 @@ async def test_bulk_operations_variants(monkeypatch, async_client):
 
     uid = uuid.uuid4()
 
-    # verify path where user becomes verified on second toggle
-    calls = {"n": 0}
-
-    async def toggle_ver(db, u):
-        calls["n"] += 1
-        return types.SimpleNamespace(is_verified=(calls["n"] % 2 == 0))
-
-    monkeypatch.setattr(mod.admin_user_crud, "toggle_verification_status", toggle_ver)
-
-    r = await async_client.post(
-        "/api/admin/bulk-operations",
-        json={"operation": "verify", "user_ids": [str(uid)]},
-    )
-    assert r.status_code == 200 and r.json()["successful"] == 1
-
-    # unverify path where user becomes unverified on second toggle
-    calls = {"n": 0}
+    async def bulk_all(db, user_ids, operation, **kwargs):
+        return list(user_ids)
 
-    async def toggle_ver2(db, u):
-        calls["n"] += 1
-        return types.SimpleNamespace(is_verified=(calls["n"] % 2 == 1))
+    monkeypatch.setattr(mod.admin_user_crud, "bulk_update_users", bulk_all)
 
-    monkeypatch.setattr(mod.admin_user_crud, "toggle_verification_status", toggle_ver2)
+    for operation in ("verify", "unverify", "delete", "restore"):
+        r = await async_client.post(
+            "/api/admin/bulk-operations",
+            json={"operation": operation, "user_ids": [str(uid)]},
+        )
+        assert r.status_code == 200 and r.json()["successful"] == 1
 
+    # operations without a set-based update fail every id
     r = await async_client.post(
         "/api/admin/bulk-operations",
-        json={"operation": "unverify", "user_ids": [str(uid)]},
+        json={"operation": "activate", "user_ids": [str(uid)]},
     )
-    assert r.status_code == 200 and r.json()["successful"] == 1
+    assert r.status_code == 200 and r.json()["failed"] == 1
 
     # exception path using a valid operation
-    async def toggle_raise(*a, **k):
+    async def bulk_raise(*a, **k):
         raise RuntimeError("x")
 
-    monkeypatch.setattr(mod.admin_user_crud, "toggle_verification_status", toggle_raise)
+    monkeypatch.setattr(mod.admin_user_crud, "bulk_update_users", bulk_raise)
     r = await async_client.post(
         "/api/admin/bulk-operations",
         json={"operation": "verify", "user_ids": [str(uid)]},
@@ -14,24 +14,19 @@ def _admin():
 async def test_list_users_with_all_filters(monkeypatch, async_client):
     from app.api.admin import users as mod
     from app.main import app
+    from app.schemas.admin.admin import AdminUserResponse
 
     app.dependency_overrides[mod.require_superuser] = lambda: _admin()
 
-    async def fake_get_users(
-        db,
-        skip,
-        limit,
-        is_superuser,
-        is_verified,
-        is_deleted,
-        oauth_provider,
-    ):
-        assert is_superuser is True
-        assert is_verified is False
-        assert is_deleted is True
-        assert oauth_provider == "google"
+    async def fake_get_user_responses(db, skip, limit, filters):
+        assert filters == {
+            "is_superuser": True,
+            "is_verified": False,
+            "is_deleted": True,
+            "oauth_provider": "google",
+        }
         return [
-            types.SimpleNamespace(
+            AdminUserResponse(
                 id=uuid.uuid4(),
                 email="a@example.com",
                 username="axxx",
@@ -57,7 +52,11 @@ async def test_list_users_with_all_filters(monkeypatch, async_client):
         }
         return 1
 
-    monkeypatch.setattr(mod.admin_user_crud, "get_users", fake_get_users)
+    monkeypatch.setattr(
+        mod.admin_user_crud,
+        "get_user_responses",
+        fake_get_user_responses,
+    )
     monkeypatch.setattr(mod.admin_user_crud, "count", fake_count)
 
     r = await async_client.get(
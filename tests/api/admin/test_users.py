@@ -55,14 +55,22 @@ async def test_admin_list_success(monkeypatch, async_client):
 
     # Mock CRUD to return users and count
     from app.api.admin import users as admin_users_module
+    from app.schemas.admin.admin import AdminUserResponse
 
-    async def fake_get_users(db, skip, limit, **kwargs):
-        return [_admin_user("1"), _admin_user("2")]
+    async def fake_get_user_responses(db, skip, limit, **kwargs):
+        return [
+            AdminUserResponse.model_validate(_admin_user("1")),
+            AdminUserResponse.model_validate(_admin_user("2")),
+        ]
 
     async def fake_count(db, **kwargs):
         return 2
 
-    monkeypatch.setattr(admin_users_module.admin_user_crud, "get_users", fake_get_users)
+    monkeypatch.setattr(
+        admin_users_module.admin_user_crud,
+        "get_user_responses",
+        fake_get_user_responses,
+    )
     monkeypatch.setattr(admin_users_module.admin_user_crud, "count", fake_count)
 
     resp = await async_client.get(
@@ -151,20 +151,14 @@ async def test_bulk_operations_verify_mixed(monkeypatch, async_client):
         True,
     )
 
-    calls = {"count": 0}
-
-    async def fake_toggle_verification(db, uid):
-        calls["count"] += 1
-        # Fail every second call
-        if calls["count"] % 2 == 0:
-            return None
-        # Simulate that the function toggles but may need a second call; endpoint calls twice in some cases
-        return _user(10, verified=False)
+    async def fake_bulk_update(db, user_ids, operation, **kwargs):
+        # Every second user is missing
+        return user_ids[::2]
 
     monkeypatch.setattr(
         admin_users.admin_user_crud,
-        "toggle_verification_status",
-        fake_toggle_verification,
+        "bulk_update_users",
+        fake_bulk_update,
     )
 
     req = {
@@ -187,7 +181,11 @@ async def test_bulk_operations_verify_mixed(monkeypatch, async_client):
     data = resp.json()
     assert data["operation"] == "verify"
     assert data["total_users"] == 4
-    assert data["successful"] + data["failed"] == 4
+    assert data["successful"] == 2
+    assert data["failed_user_ids"] == [
+        "00000000-0000-0000-0000-000000000011",
+        "00000000-0000-0000-0000-000000000013",
+    ]
 
 
 @pytest.mark.asyncio
@@ -200,14 +198,14 @@ async def test_bulk_operations_unverify_counts(monkeypatch, async_client):
         True,
     )
 
-    async def fake_toggle_verification(db, uid):
-        # Return a user each call; when operation is unverify, endpoint will call twice to flip correctly
-        return _user(20, verified=True)
+    async def fake_bulk_update(db, user_ids, operation, **kwargs):
+        assert operation == "unverify"
+        return list(user_ids)
 
     monkeypatch.setattr(
         admin_users.admin_user_crud,
-        "toggle_verification_status",
-        fake_toggle_verification,
+        "bulk_update_users",
+        fake_bulk_update,
     )
 
     req = {
@@ -228,4 +226,152 @@ async def test_bulk_operations_unverify_counts(monkeypatch, async_client):
     data = resp.json()
     assert data["operation"] == "unverify"
     assert data["total_users"] == 2
-    assert data["successful"] + data["failed"] == 2
+    assert data["successful"] == 2
+    assert data["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_operation_job_requires_celery(monkeypatch, async_client):
+    from app.api.admin import users as admin_users
+    from app.main import app
+
+    app.dependency_overrides[admin_users.require_superuser] = lambda: _admin_user()
+    monkeypatch.setattr(admin_users, "is_celery_enabled", lambda: False)
+
+    resp = await async_client.post(
+        "/api/admin/bulk-operations/jobs",
+        json={
+            "operation": "verify",
+            "user_ids": ["00000000-0000-0000-0000-000000000010"],
+        },
+    )
+    app.dependency_overrides.clear()
+    assert resp.status_code == 503
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("operation", ["delete", "remove_superuser"])
+async def test_bulk_operation_job_refuses_own_account(
+    monkeypatch,
+    async_client,
+    operation,
+):
+    from app.api.admin import users as admin_users
+    from app.main import app
+
+    app.dependency_overrides[admin_users.require_superuser] = lambda: _admin_user()
+    monkeypatch.setattr(admin_users, "is_celery_enabled", lambda: True)
+
+    def fake_submit(name, *args):
+        raise AssertionError("job submitted")
+
+    monkeypatch.setattr(admin_users, "submit_task", fake_submit)
+
+    resp = await async_client.post(
+        "/api/admin/bulk-operations/jobs",
+        json={
+            "operation": operation,
+            "user_ids": [
+                "00000000-0000-0000-0000-000000000020",
+                str(_admin_user().id),
+            ],
+        },
+    )
+    app.dependency_overrides.clear()
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bulk_operation_job_submit_and_poll(monkeypatch, async_client):
+    from app.api.admin import users as admin_users
+    from app.main import app
+
+    app.dependency_overrides[admin_users.require_superuser] = lambda: _admin_user()
+    monkeypatch.setattr(admin_users, "is_celery_enabled", lambda: True)
+
+    submitted = {}
+
+    def fake_submit(name, *args):
+        submitted.update(name=name, args=args)
+        return types.SimpleNamespace(id="job-1")
+
+    monkeypatch.setattr(admin_users, "submit_task", fake_submit)
+
+    user_ids = [f"00000000-0000-0000-0000-00000000002{i}" for i in range(3)]
+    resp = await async_client.post(
+        "/api/admin/bulk-operations/jobs",
+        json={"operation": "delete", "user_ids": [*user_ids, user_ids[0]]},
+    )
+    assert resp.status_code == 202
+    assert resp.json() == {
+        "job_id": "job-1",
+        "operation": "delete",
+        "total_users": 3,
+        "status": "PENDING",
+    }
+    assert submitted["name"] == admin_users.BULK_OPERATION_TASK
+    assert submitted["args"] == (
+        "delete",
+        user_ids,
+        "00000000-0000-0000-0000-000000000001",
+    )
+
+    monkeypatch.setattr(
+        admin_users,
+        "get_task_status",
+        lambda job_id: {
+            "task_id": job_id,
+            "status": "PROGRESS",
+            "ready": False,
+            "successful": False,
+            "failed": False,
+            "progress": {"processed": 2, "total": 3, "successful": 1, "failed": 1},
+        },
+    )
+    resp = await async_client.get("/api/admin/bulk-operations/jobs/job-1")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["status"] == "PROGRESS"
+    assert data["processed"] == 2 and data["total_users"] == 3
+    assert data["successful"] == 1 and data["failed"] == 1
+    assert data["result"] is None
+
+    final = {
+        "operation": "delete",
+        "total_users": 3,
+        "successful": 3,
+        "failed": 0,
+        "failed_user_ids": [],
+    }
+    monkeypatch.setattr(
+        admin_users,
+        "get_task_status",
+        lambda job_id: {
+            "task_id": job_id,
+            "status": "SUCCESS",
+            "ready": True,
+            "successful": True,
+            "failed": False,
+            "result": final,
+        },
+    )
+    resp = await async_client.get("/api/admin/bulk-operations/jobs/job-1")
+    app.dependency_overrides.clear()
+    data = resp.json()
+    assert data["ready"] is True
+    assert data["processed"] == 3 and data["successful"] == 3
+    assert data["result"]["failed_user_ids"] == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_operation_job_unknown_id(monkeypatch, async_client):
+    from app.api.admin import users as admin_users
+    from app.main import app
+
+    app.dependency_overrides[admin_users.require_superuser] = lambda: _admin_user()
+    monkeypatch.setattr(admin_users, "is_celery_enabled", lambda: True)
+    monkeypatch.setattr(admin_users, "get_task_status", lambda job_id: None)
+
+    resp = await async_client.get("/api/admin/bulk-operations/jobs/missing")
+    app.dependency_overrides.clear()
+    assert resp.status_code == 404
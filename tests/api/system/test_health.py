@@ -58,6 +58,8 @@ async def test_metrics(async_client):
     assert resp.status_code == 200
     data = resp.json()
     assert "system" in data and "application" in data
+    assert "hit_ratio" in data["application"]["search_query_cache"]
+    assert isinstance(data["application"]["cache"], dict)
 
 
 @pytest.mark.asyncio
@@ -63,6 +63,17 @@ async def test_readiness_check_failure(monkeypatch, async_client):
     assert r.status_code == 503
 
 
+@pytest.mark.asyncio
+async def test_readiness_waits_for_startup_warmup(monkeypatch, async_client):
+    from app.database.warmup import warmup_state
+
+    monkeypatch.setattr(warmup_state, "pending", True)
+
+    r = await async_client.get("/api/system/health/ready")
+    assert r.status_code == 503
+    assert r.json()["error"]["message"] == "Service warming up"
+
+
 @pytest.mark.asyncio
 async def test_database_health_success(monkeypatch, async_client):
     from app.api.system import health as mod
@@ -96,3 +107,6 @@ async def test_database_health_success(monkeypatch, async_client):
     assert r.status_code == 200
     data = r.json()
     assert data["status"] == "healthy" and data["table_count"] == 7
+    assert {"evicted", "recycled", "pool_invalidations"} <= set(
+        data["connection_pool"],
+    )
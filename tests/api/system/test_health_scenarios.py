@@ -76,6 +76,7 @@ async def test_health_check_db_pool_metrics_success(monkeypatch, async_client):
     data = r.json()
     assert data["checks"]["database"] == "healthy"
     assert "database_pools" in data and "async" in data["database_pools"]
+    assert data["database_pools"]["async"]["evicted"] == 0
 
 
 @pytest.mark.asyncio
@@ -127,22 +127,10 @@ async def test_list_deleted_users(monkeypatch, async_client):
 
     app.dependency_overrides[user_admin_module.get_current_user] = lambda: _admin_user()
 
-    async def fake_get_deleted_users(db, skip, limit):
-        return [_deleted_user(1), _deleted_user(2)]
+    async def fake_search(db, config, skip, limit):
+        return [_deleted_user(1), _deleted_user(2)], 2
 
-    async def fake_count_deleted_users(db):
-        return 2
-
-    monkeypatch.setattr(
-        user_admin_module.admin_user_crud,
-        "get_deleted_users",
-        fake_get_deleted_users,
-    )
-    monkeypatch.setattr(
-        user_admin_module.admin_user_crud,
-        "count_deleted_users",
-        fake_count_deleted_users,
-    )
+    monkeypatch.setattr(user_admin_module.admin_user_crud, "search", fake_search)
 
     r = await async_client.get(
         "/api/users/deleted?page=1&size=2",
@@ -162,22 +150,10 @@ async def test_search_deleted_users(monkeypatch, async_client):
 
     app.dependency_overrides[user_admin_module.get_current_user] = lambda: _admin_user()
 
-    async def fake_get_deleted_users(db, skip, limit):
-        return [_deleted_user(1)]
+    async def fake_search(db, config, skip, limit):
+        return [_deleted_user(1)], 1
 
-    async def fake_count_deleted_users(db):
-        return 1
-
-    monkeypatch.setattr(
-        user_admin_module.admin_user_crud,
-        "get_deleted_users",
-        fake_get_deleted_users,
-    )
-    monkeypatch.setattr(
-        user_admin_module.admin_user_crud,
-        "count_deleted_users",
-        fake_count_deleted_users,
-    )
+    monkeypatch.setattr(user_admin_module.admin_user_crud, "search", fake_search)
 
     r = await async_client.get(
         "/api/users/deleted/search?deletion_reason=cleanup",
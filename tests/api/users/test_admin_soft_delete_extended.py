@@ -134,22 +134,10 @@ async def test_search_deleted_users_filters_and_pagination_next(
             deletion_reason="cleanup",
         )
 
-    async def fake_get_deleted_users(db, skip, limit):
-        return [_deleted_user_only_date(1), _deleted_user_only_date(2)]
+    async def fake_search(db, config, skip, limit):
+        return [_deleted_user_only_date(1), _deleted_user_only_date(2)], 4
 
-    async def fake_count_deleted_users(db):
-        return 4
-
-    monkeypatch.setattr(
-        user_admin_module.admin_user_crud,
-        "get_deleted_users",
-        fake_get_deleted_users,
-    )
-    monkeypatch.setattr(
-        user_admin_module.admin_user_crud,
-        "count_deleted_users",
-        fake_count_deleted_users,
-    )
+    monkeypatch.setattr(user_admin_module.admin_user_crud, "search", fake_search)
 
     # Page 1 of size 2, total 4 -> has_next True, has_prev False
     r = await async_client.get(
@@ -175,7 +163,7 @@ async def test_search_deleted_users_pagination_prev_only(monkeypatch, async_clie
 
     app.dependency_overrides[user_admin_module.get_current_user] = lambda: _admin_user()
 
-    async def fake_get_deleted_users(db, skip, limit):
+    async def fake_search(db, config, skip, limit):
         return [
             types.SimpleNamespace(
                 id=uuid.UUID("00000000-0000-0000-0000-0000000000ff"),
@@ -190,21 +178,9 @@ async def test_search_deleted_users_pagination_prev_only(monkeypatch, async_clie
                 deleted_by=_admin_user().id,
                 deletion_reason="cleanup",
             ),
-        ]
+        ], 3
 
-    async def fake_count_deleted_users(db):
-        return 3
-
-    monkeypatch.setattr(
-        user_admin_module.admin_user_crud,
-        "get_deleted_users",
-        fake_get_deleted_users,
-    )
-    monkeypatch.setattr(
-        user_admin_module.admin_user_crud,
-        "count_deleted_users",
-        fake_count_deleted_users,
-    )
+    monkeypatch.setattr(user_admin_module.admin_user_crud, "search", fake_search)
 
     # Page 2 of size 2, total 3 -> total_pages 2, has_prev True, has_next False
     r = await async_client.get(
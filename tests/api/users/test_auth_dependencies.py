@@ -162,3 +162,27 @@ async def test_get_api_key_user_success_and_scope_check(monkeypatch):
     with pytest.raises(Exception) as exc:
         dep2(api_user)
     assert "missing required scope" in str(exc.value)
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_uses_fast_path_when_enabled(monkeypatch):
+    from app.api.users import auth as mod
+
+    monkeypatch.setattr(mod.settings, "ENABLE_DB_FAST_PATH", True)
+    monkeypatch.setattr(
+        mod.jwt,
+        "decode",
+        lambda token, key, algorithms: {"sub": "user-1"},
+    )
+
+    async def orm_lookup(db, user_id):  # type: ignore[no-untyped-def]
+        raise AssertionError("ORM path should not run")
+
+    async def fast_lookup(db, user_id):  # type: ignore[no-untyped-def]
+        return types.SimpleNamespace(id=user_id)
+
+    monkeypatch.setattr(mod.crud_user, "get_user_by_id", orm_lookup)
+    monkeypatch.setattr(mod.fast_path, "get_user_by_id", fast_lookup)
+
+    user = await mod.get_current_user(token="tok", db=types.SimpleNamespace())
+    assert user.id == "user-1"
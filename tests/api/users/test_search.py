@@ -27,11 +27,8 @@ def _schema_user(idx: int):
 async def test_list_users_basic(monkeypatch, async_client):
     from app.api.users import search as search_module
 
-    async def fake_get_users(db, skip, limit, **kwargs):
-        return [_schema_user(1), _schema_user(2)]
-
-    async def fake_count(db, **kwargs):
-        return 2
+    async def fake_search(db, config, skip, limit):
+        return [_schema_user(1), _schema_user(2)], 2
 
     # Bypass auth dependency get_current_user
     from app.api.users import auth as user_auth
@@ -47,8 +44,7 @@ async def test_list_users_basic(monkeypatch, async_client):
 
     monkeypatch.setattr(crud_user, "get_user_by_id", fake_get_user_by_id)
 
-    monkeypatch.setattr(search_module.admin_user_crud, "get_users", fake_get_users)
-    monkeypatch.setattr(search_module.admin_user_crud, "count", fake_count)
+    monkeypatch.setattr(search_module.admin_user_crud, "search", fake_search)
 
     resp = await async_client.get(
         "/api/users/",
@@ -66,11 +62,8 @@ async def test_list_users_basic(monkeypatch, async_client):
 async def test_search_users_metadata(monkeypatch, async_client):
     from app.api.users import search as search_module
 
-    async def fake_get_users(db, skip, limit, **kwargs):
-        return [_schema_user(3)]
-
-    async def fake_count(db, **kwargs):
-        return 1
+    async def fake_search(db, config, skip, limit):
+        return [_schema_user(3)], 1
 
     from app.api.users import auth as user_auth
 
@@ -85,8 +78,7 @@ async def test_search_users_metadata(monkeypatch, async_client):
 
     monkeypatch.setattr(crud_user, "get_user_by_id", fake_get_user_by_id)
 
-    monkeypatch.setattr(search_module.admin_user_crud, "get_users", fake_get_users)
-    monkeypatch.setattr(search_module.admin_user_crud, "count", fake_count)
+    monkeypatch.setattr(search_module.admin_user_crud, "search", fake_search)
 
     resp = await async_client.get(
         "/api/users/search?search=abc&is_verified=true&sort_by=username&sort_order=asc",
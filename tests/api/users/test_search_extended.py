@@ -39,15 +39,14 @@ async def test_search_users_filters_all_and_pagination(monkeypatch, async_client
 
     monkeypatch.setattr(crud_user, "get_user_by_id", fake_get_user_by_id)
 
-    # CRUD results
-    async def fake_get_users(db, skip, limit, **kwargs):
-        return [_schema_user(1), _schema_user(2), _schema_user(3)]
+    # CRUD results; total of 8 exercises the pagination calcs
+    captured = {}
 
-    async def fake_count(db, **kwargs):
-        return 8  # total to exercise pagination calcs
+    async def fake_search(db, config, skip, limit):
+        captured.update(config=config, skip=skip, limit=limit)
+        return [_schema_user(1), _schema_user(2), _schema_user(3)], 8
 
-    monkeypatch.setattr(search_module.admin_user_crud, "get_users", fake_get_users)
-    monkeypatch.setattr(search_module.admin_user_crud, "count", fake_count)
+    monkeypatch.setattr(search_module.admin_user_crud, "search", fake_search)
 
     # Provide all filters to populate filters_applied list and pagination state
     resp = await async_client.get(
@@ -77,6 +76,17 @@ async def test_search_users_filters_all_and_pagination(monkeypatch, async_client
         and data["has_next"] is True
     )
     assert data["sort_field"] == "email" and data["sort_order"] == "desc"
+    # Filters are pushed down to the query rather than ignored
+    config = captured["config"]
+    assert captured["skip"] == 3 and captured["limit"] == 3
+    assert config.text_search.query == "abc"
+    assert {f.field for f in config.filters} == {
+        "is_verified",
+        "oauth_provider",
+        "is_superuser",
+        "is_deleted",
+        "created_at",
+    }
 
 
 @pytest.mark.asyncio
@@ -95,14 +105,10 @@ async def test_list_users_empty(monkeypatch, async_client):
 
     monkeypatch.setattr(crud_user, "get_user_by_id", fake_get_user_by_id)
 
-    async def fake_get_users(db, skip, limit, **kwargs):
-        return []
-
-    async def fake_count(db, **kwargs):
-        return 0
+    async def fake_search(db, config, skip, limit):
+        return [], 0
 
-    monkeypatch.setattr(search_module.admin_user_crud, "get_users", fake_get_users)
-    monkeypatch.setattr(search_module.admin_user_crud, "count", fake_count)
+    monkeypatch.setattr(search_module.admin_user_crud, "search", fake_search)
 
     resp = await async_client.get(
         "/api/users/",
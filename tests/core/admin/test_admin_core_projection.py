@@ -0,0 +1,85 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+pytestmark = pytest.mark.unit
+
+
+class MappingsResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return iter(self._rows)
+
+
+class RecordingSession:
+    def __init__(self, rows):
+        self._rows = rows
+        self.statements = []
+
+    async def execute(self, statement, params=None):  # type: ignore[no-untyped-def]
+        self.statements.append(statement)
+        return MappingsResult(self._rows)
+
+
+def _row(**overrides):
+    row = {
+        "id": uuid.uuid4(),
+        "email": "a@example.com",
+        "username": "alice",
+        "is_superuser": False,
+        "is_verified": True,
+        "is_deleted": False,
+        "created_at": datetime(2025, 1, 1, tzinfo=UTC),
+        "oauth_provider": None,
+        "oauth_id": None,
+        "oauth_email": None,
+        "deletion_requested_at": None,
+        "deletion_confirmed_at": None,
+        "deletion_scheduled_for": None,
+    }
+    row.update(overrides)
+    return row
+
+
+def test_projection_columns_follow_schema_fields():
+    from app.core.admin.admin import get_projection_columns
+    from app.models import User
+    from app.schemas.admin.admin import AdminUserResponse
+
+    columns = get_projection_columns(User, AdminUserResponse)
+
+    assert [column.name for column in columns] == list(AdminUserResponse.model_fields)
+    # Cached per (model, schema)
+    assert get_projection_columns(User, AdminUserResponse) is columns
+
+
+@pytest.mark.asyncio
+async def test_get_multi_projected_selects_only_schema_columns():
+    from app.crud.system.admin import AdminUserCRUD
+    from app.schemas.admin.admin import AdminUserResponse
+
+    rows = [_row(username="alice"), _row(username="bob", is_verified=False)]
+    db = RecordingSession(rows)
+
+    users = await AdminUserCRUD().get_user_responses(
+        db,
+        skip=10,
+        limit=2,
+        filters={"is_verified": True, "unknown": 1},
+    )
+
+    assert all(isinstance(user, AdminUserResponse) for user in users)
+    assert [user.username for user in users] == ["alice", "bob"]
+
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    select_list = sql.split("FROM")[0]
+    assert "users.username" in select_list
+    assert "hashed_password" not in select_list
+    assert "token" not in select_list
+    assert "search_vector" not in select_list
+    assert "WHERE users.is_verified" in sql
+    assert "ORDER BY users.id" in sql
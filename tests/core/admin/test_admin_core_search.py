@@ -0,0 +1,105 @@
+import types
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+pytestmark = pytest.mark.unit
+
+
+class DummyResult:
+    def __init__(self, rows=None, scalar_value=None):
+        self._rows = rows or []
+        self._scalar_value = scalar_value
+
+    def all(self):
+        return self._rows
+
+    def scalar(self):
+        return self._scalar_value
+
+
+class RecordingSession:
+    def __init__(self, *results):
+        self._results = list(results)
+        self.statements = []
+        self.params = []
+
+    async def execute(self, statement, params=None):  # type: ignore[no-untyped-def]
+        self.statements.append(statement)
+        self.params.append(params)
+        return self._results.pop(0)
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_search_returns_page_and_window_total():
+    from app.crud.system.admin import AdminUserCRUD
+    from app.utils.search_filter import create_user_search_filters
+
+    u1 = types.SimpleNamespace(id="u1")
+    u2 = types.SimpleNamespace(id="u2")
+    db = RecordingSession(DummyResult(rows=[(u1, 7), (u2, 7)]))
+
+    config = create_user_search_filters(search_query="abc", is_verified=True)
+    users, total = await AdminUserCRUD().search(db, config, skip=0, limit=2)
+
+    assert users == [u1, u2]
+    assert total == 7
+    # Page and total come from a single statement
+    assert len(db.statements) == 1
+    sql = _sql(db.statements[0])
+    assert "count(*) OVER ()" in sql
+    assert "lower(users.username)" in sql
+    assert "users.is_verified" in sql
+    assert "LIMIT" in sql and "OFFSET" in sql
+    # Filter values travel as bound parameters
+    assert db.params[0]["search_pattern"] == "%abc%"
+    assert True in db.params[0].values()
+
+
+@pytest.mark.asyncio
+async def test_search_empty_first_page_skips_count():
+    from app.crud.system.admin import AdminUserCRUD
+    from app.utils.search_filter import SearchFilterConfig
+
+    db = RecordingSession(DummyResult(rows=[]))
+
+    users, total = await AdminUserCRUD().search(db, SearchFilterConfig(), skip=0)
+
+    assert users == []
+    assert total == 0
+    assert len(db.statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_past_last_page_falls_back_to_count():
+    from app.crud.system.admin import AdminUserCRUD
+    from app.utils.search_filter import create_deleted_user_search_filters
+
+    db = RecordingSession(DummyResult(rows=[]), DummyResult(scalar_value=5))
+
+    config = create_deleted_user_search_filters(sort_by="deleted_at")
+    users, total = await AdminUserCRUD().search(db, config, skip=40, limit=20)
+
+    assert users == []
+    assert total == 5
+    count_sql = _sql(db.statements[1])
+    assert "count(*)" in count_sql
+    assert "users.is_deleted" in count_sql
+    assert "ORDER BY" not in count_sql
+
+
+def test_user_date_filters_target_created_at():
+    from datetime import UTC, datetime
+
+    from app.models import User
+    from app.utils.search_filter import SearchFilterBuilder, create_user_search_filters
+
+    config = create_user_search_filters(
+        date_created_after=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+    sql = _sql(SearchFilterBuilder(User).build_query(config))
+    assert "users.created_at >=" in sql
@@ -46,6 +46,20 @@ def test_api_key_generate_hash_verify_fingerprint():
     assert len(fp) == 64
 
 
+def test_api_key_issued_at_needs_a_valid_signature():
+    import time
+
+    from app.core.security.security import api_key_issued_at, generate_api_key
+
+    k = generate_api_key()
+    assert abs(api_key_issued_at(k) - time.time()) < 5
+    # A made-up key can't claim to be new, and older keys have no issue time
+    forged = k[:-8] + ("0" * 8 if k[-8:] != "0" * 8 else "1" * 8)
+    assert api_key_issued_at(forged) is None
+    assert api_key_issued_at(k[:-8]) is None
+    assert api_key_issued_at("sk_" + "A" * 43) is None
+
+
 def test_create_access_token_contains_subject_and_exp():
     from jose import jwt
 
@@ -56,3 +70,24 @@ def test_create_access_token_contains_subject_and_exp():
     decoded = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
     assert decoded["sub"] == "user1"
     assert "exp" in decoded
+
+
+@pytest.mark.asyncio
+async def test_get_password_hashes_uses_process_pool_and_keeps_order(monkeypatch):
+    from app.core.security import security
+
+    monkeypatch.setattr(security.settings, "PASSWORD_HASH_WORKERS", 2)
+    monkeypatch.setattr(security, "_hash_executor", None)
+    passwords = ["Password1!", "Password2!", "Password3!"]
+    try:
+        hashes = await security.get_password_hashes(passwords)
+        executor = security._hash_executor
+        assert executor is not None and executor._max_workers == 2
+    finally:
+        security.shutdown_hash_executor()
+    assert security._hash_executor is None
+
+    assert len(hashes) == 3
+    for password, hashed in zip(passwords, hashes, strict=True):
+        assert security.verify_password(password, hashed)
+    assert await security.get_password_hashes([]) == []
@@ -0,0 +1,155 @@
+import types
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+USER_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class FakeStatement:
+    def __init__(self, connection, sql):  # type: ignore[no-untyped-def]
+        self.connection = connection
+        self.sql = sql
+
+    async def fetchrow(self, *args):  # type: ignore[no-untyped-def]
+        self.connection.calls.append((self.sql, args))
+        return self.connection.row
+
+
+class FakeDriverConnection:
+    def __init__(self, row=None):  # type: ignore[no-untyped-def]
+        self.row = row
+        self.calls = []
+        self.prepared = []
+
+    async def prepare(self, sql):  # type: ignore[no-untyped-def]
+        self.prepared.append(sql)
+        return FakeStatement(self, sql)
+
+
+class FakeSession:
+    """AsyncSession stand-in exposing a fake asyncpg connection."""
+
+    def __init__(self, row=None):  # type: ignore[no-untyped-def]
+        self.driver = FakeDriverConnection(row)
+
+    async def connection(self):  # type: ignore[no-untyped-def]
+        driver = self.driver
+
+        class Connection:
+            async def get_raw_connection(self):  # type: ignore[no-untyped-def]
+                return types.SimpleNamespace(driver_connection=driver)
+
+        return Connection()
+
+
+def _user_row():  # type: ignore[no-untyped-def]
+    return (
+        USER_ID,
+        "e@example.com",
+        "validuser",
+        False,
+        True,
+        NOW,
+        None,
+        False,
+        None,
+        None,
+        None,
+        NOW,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_id_returns_record_usable_as_user_response():
+    from app.crud.auth import fast_path
+    from app.schemas.auth.user import UserResponse
+
+    db = FakeSession(_user_row())
+
+    user = await fast_path.get_user_by_id(db, str(USER_ID))
+
+    assert isinstance(user, fast_path.UserRecord)
+    assert db.driver.calls == [(fast_path.USER_BY_ID_SQL, (USER_ID,))]
+    response = UserResponse.model_validate(user)
+    assert response.id == USER_ID
+    assert response.username == "validuser"
+
+
+@pytest.mark.asyncio
+async def test_get_user_by_id_rejects_malformed_ids_without_a_query():
+    from app.crud.auth import fast_path
+
+    db = FakeSession(_user_row())
+
+    assert await fast_path.get_user_by_id(db, "not-a-uuid") is None
+    assert db.driver.calls == []
+
+
+def test_statements_use_the_partial_index_predicate():
+    from app.crud.auth import fast_path
+    from app.models.core.base import ACTIVE_ROW_PREDICATE
+
+    for sql in fast_path.FAST_PATH_STATEMENTS:
+        assert ACTIVE_ROW_PREDICATE in sql
+
+
+@pytest.mark.asyncio
+async def test_verify_api_key_checks_hash(monkeypatch):
+    from app.crud.auth import fast_path
+
+    row = ("HASH", USER_ID, USER_ID, "ci", ["read"], True, None)
+    monkeypatch.setattr(fast_path, "fingerprint_api_key", lambda raw: "fp")
+
+    monkeypatch.setattr(fast_path, "verify_api_key", lambda raw, hashed: True)
+    record = await fast_path.verify_api_key_in_db(FakeSession(row), "sk_test")
+    assert record == fast_path.APIKeyRecord(
+        USER_ID,
+        USER_ID,
+        "ci",
+        ["read"],
+        True,
+        None,
+    )
+
+    monkeypatch.setattr(fast_path, "verify_api_key", lambda raw, hashed: False)
+    assert await fast_path.verify_api_key_in_db(FakeSession(row), "sk_test") is None
+
+
+@pytest.mark.asyncio
+async def test_verify_refresh_token_falls_back_to_orm_for_legacy_tokens(monkeypatch):
+    from app.crud.auth import fast_path
+    from app.crud.auth import refresh_token as crud_refresh_token
+
+    legacy = types.SimpleNamespace(id=USER_ID, user_id=USER_ID, expires_at=NOW)
+
+    async def verify_with_orm(db, raw_token):  # type: ignore[no-untyped-def]
+        return legacy
+
+    monkeypatch.setattr(
+        crud_refresh_token,
+        "verify_refresh_token_in_db",
+        verify_with_orm,
+    )
+
+    record = await fast_path.verify_refresh_token_in_db(FakeSession(None), "raw")
+
+    assert record == fast_path.RefreshTokenRecord(USER_ID, USER_ID, NOW)
+
+
+@pytest.mark.asyncio
+async def test_statements_are_prepared_once_per_connection():
+    from app.crud.auth import fast_path
+
+    db = FakeSession(_user_row())
+    await fast_path.prepare_fast_path_statements(db.driver)
+
+    await fast_path.get_user_by_id(db, str(USER_ID))
+    await fast_path.get_user_by_id(db, str(USER_ID))
+
+    assert db.driver.prepared == list(fast_path.FAST_PATH_STATEMENTS)
+    assert len(db.driver.calls) == 2
@@ -0,0 +1,75 @@
+import types
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+pytestmark = pytest.mark.unit
+
+USER_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
+class RecordingSession:
+    def __init__(self, value=None, rowcount=0):
+        self.value = value
+        self.rowcount = rowcount
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, statement):  # type: ignore[no-untyped-def]
+        self.statements.append(statement)
+        return types.SimpleNamespace(
+            scalar_one_or_none=lambda: self.value,
+            rowcount=self.rowcount,
+        )
+
+    async def commit(self):
+        self.commits += 1
+
+
+def _sql(statement):
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_upsert_replaces_pending_token_for_user_and_purpose():
+    from app.crud.auth import one_time_token as crud
+
+    db = RecordingSession()
+    await crud.upsert_one_time_token(
+        db,
+        "verification",
+        str(USER_ID),
+        "ab" * 32,
+        datetime(2025, 1, 1, tzinfo=UTC),
+    )
+
+    sql = _sql(db.statements[0])
+    assert sql.startswith("INSERT INTO one_time_tokens")
+    assert "ON CONFLICT (user_id, purpose) DO UPDATE" in sql
+    assert db.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_consume_deletes_unexpired_token_in_one_statement():
+    from app.crud.auth import one_time_token as crud
+
+    db = RecordingSession(value=USER_ID)
+    user_id = await crud.consume_one_time_token(db, "password_reset", "ab" * 32)
+
+    assert user_id == USER_ID
+    sql = _sql(db.statements[0])
+    assert sql.startswith("DELETE FROM one_time_tokens")
+    assert "one_time_tokens.expires_at > " in sql
+    assert "RETURNING one_time_tokens.user_id" in sql
+
+
+@pytest.mark.asyncio
+async def test_delete_expired_one_time_tokens_returns_count():
+    from app.crud.auth import one_time_token as crud
+
+    db = RecordingSession(rowcount=3)
+
+    assert await crud.delete_expired_one_time_tokens(db) == 3
+    assert "one_time_tokens.expires_at <= " in _sql(db.statements[0])
@@ -142,6 +142,7 @@ async def test_revoke_refresh_token_sets_flag_and_commits(monkeypatch):
     class Tok:
         def __init__(self):
             self.is_revoked = False
+            self.user_id = "u1"
 
     class Res:
         def __init__(self, t):
@@ -0,0 +1,225 @@
+import types
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from app.models import APIKey, RefreshToken, User
+from app.models.core.base import ACTIVE_ROW_PREDICATE
+
+pytestmark = pytest.mark.unit
+
+
+class _Result:
+    def scalar_one_or_none(self):  # type: ignore[no-untyped-def]
+        return None
+
+    def scalar(self):  # type: ignore[no-untyped-def]
+        return 0
+
+
+class RecordingSession:
+    def __init__(self):  # type: ignore[no-untyped-def]
+        self.statements = []
+        self.committed = False
+
+    async def execute(self, statement, *_args, **_kwargs):  # type: ignore[no-untyped-def]
+        self.statements.append(statement)
+        return _Result()
+
+    async def commit(self):  # type: ignore[no-untyped-def]
+        self.committed = True
+
+
+def _sql(statement) -> str:
+    return str(
+        statement.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        ),
+    )
+
+
+def _partial_indexes(model) -> dict[str, str]:
+    return {
+        index.name: str(index.dialect_options["postgresql"]["where"])
+        for index in model.__table__.indexes
+        if index.dialect_options["postgresql"]["where"] is not None
+    }
+
+
+def test_not_deleted_renders_the_partial_index_predicate():
+    for model in (User, APIKey, RefreshToken):
+        table = model.__tablename__
+        assert _sql(model.not_deleted()) == f"{table}.{ACTIVE_ROW_PREDICATE}"
+        assert ACTIVE_ROW_PREDICATE in _sql(model.get_active_query())
+
+
+def test_hot_lookup_indexes_are_partial_over_active_rows():
+    user_indexes = _partial_indexes(User)
+    for name in (
+        "uq_user_email_active",
+        "uq_user_username_active",
+    ):
+        assert user_indexes[name] == ACTIVE_ROW_PREDICATE
+    assert _partial_indexes(APIKey)["ix_api_key_fingerprint"] == ACTIVE_ROW_PREDICATE
+    assert (
+        _partial_indexes(RefreshToken)["ix_refresh_token_fingerprint"]
+        == ACTIVE_ROW_PREDICATE
+    )
+
+
+def test_email_and_username_are_not_unique_table_wide():
+    # A soft-deleted account must not block reusing its email or username
+    columns = User.__table__.c
+    for name in ("email", "username"):
+        assert not columns[name].unique
+    assert not any(
+        {column.name for column in constraint.columns} & {"email", "username"}
+        for constraint in User.__table__.constraints
+        if constraint.__class__.__name__ == "UniqueConstraint"
+    )
+
+
+@pytest.mark.asyncio
+async def test_lookups_emit_the_partial_index_predicate():
+    from app.crud.auth import api_key as crud_api_key
+    from app.crud.auth import refresh_token as crud_refresh_token
+    from app.crud.auth import user as crud_user
+
+    db = RecordingSession()
+    await crud_user.get_user_by_email(db, "a@example.com")
+    await crud_user.get_user_by_username(db, "alice")
+    await crud_api_key.verify_api_key_in_db(db, "sk_test")
+    await crud_refresh_token.verify_refresh_token_in_db(db, "raw-token")
+
+    email_sql, username_sql, api_key_sql, refresh_sql = (
+        _sql(statement) for statement in db.statements[:4]
+    )
+    assert f"users.{ACTIVE_ROW_PREDICATE}" in email_sql
+    assert f"users.{ACTIVE_ROW_PREDICATE}" in username_sql
+    assert f"api_keys.{ACTIVE_ROW_PREDICATE}" in api_key_sql
+    assert f"refresh_tokens.{ACTIVE_ROW_PREDICATE}" in refresh_sql
+    assert all("is_deleted IS" not in _sql(statement) for statement in db.statements)
+
+
+def test_deleted_flag_search_filter_is_a_literal():
+    from app.utils.search_filter import SearchFilterBuilder, create_user_search_filters
+
+    statement, params = SearchFilterBuilder(User).build_statement(
+        create_user_search_filters(is_deleted=False, is_verified=True),
+    )
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert f"users.{ACTIVE_ROW_PREDICATE}" in sql
+    # Other flags still travel as bound parameters
+    assert list(params.values()) == [True]
+
+
+@pytest.mark.asyncio
+async def test_restore_user_refuses_when_identity_was_reused(monkeypatch):
+    from app.crud.auth import user as crud_user
+
+    user_obj = types.SimpleNamespace(
+        is_deleted=True,
+        deleted_at="then",
+        email="a@example.com",
+        username="alice",
+    )
+
+    async def fake_get_user_by_id_any_status(_db, _id):  # type: ignore[no-untyped-def]
+        return user_obj
+
+    class ConflictResult:
+        def scalar_one_or_none(self):  # type: ignore[no-untyped-def]
+            return "other-user-id"
+
+    class ConflictSession(RecordingSession):
+        async def execute(self, statement, *_args, **_kwargs):  # type: ignore[no-untyped-def]
+            self.statements.append(statement)
+            return ConflictResult()
+
+    monkeypatch.setattr(
+        crud_user,
+        "get_user_by_id_any_status",
+        fake_get_user_by_id_any_status,
+    )
+    db = ConflictSession()
+
+    assert await crud_user.restore_user(db, "u1") is False
+    assert user_obj.is_deleted is True
+    assert db.committed is False
+    assert f"users.{ACTIVE_ROW_PREDICATE}" in _sql(db.statements[0])
+
+
+def test_bulk_restore_skips_users_whose_identity_was_reused():
+    from app.crud.system.admin import _bulk_operation_update
+
+    _, guard = _bulk_operation_update("restore", None)
+    sql = _sql(guard)
+    assert "users.is_deleted = true" in sql
+    assert "NOT (EXISTS" in sql
+    assert f"users_1.{ACTIVE_ROW_PREDICATE}" in sql
+
+
+# EXPLAIN checks against a PostgreSQL database migrated to head. They force
+# index use where possible, so a plan that still reads the heap directly
+# means the planner couldn't prove the partial index applies.
+EXPLAIN_LOOKUPS = (
+    (
+        "uq_user_email_active",
+        lambda: User.get_active_query().filter(User.email == "a@example.com"),
+    ),
+    (
+        "uq_user_username_active",
+        lambda: User.get_active_query().filter(User.username == "alice"),
+    ),
+    (
+        "ix_api_key_fingerprint",
+        lambda: APIKey.get_active_query().filter(APIKey.key_fingerprint == "fp"),
+    ),
+    (
+        "ix_refresh_token_fingerprint",
+        lambda: RefreshToken.get_active_query().filter(
+            RefreshToken.token_fingerprint == "fp",
+        ),
+    ),
+)
+
+
+@pytest.fixture
+async def explain_conn():  # type: ignore[no-untyped-def]
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from app.database.database import async_database_url
+
+    engine = create_async_engine(async_database_url)
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            has_index = await conn.scalar(
+                text("SELECT to_regclass('uq_user_email_active') IS NOT NULL"),
+            )
+            if not has_index:
+                pytest.skip("Database is not migrated to head")
+            await conn.execute(text("SET LOCAL enable_seqscan = off"))
+            yield conn
+            await transaction.rollback()
+    except OSError:
+        pytest.skip("PostgreSQL is not available")
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("index_name", "build_query"), EXPLAIN_LOOKUPS)
+async def test_active_lookup_plans_use_partial_index(
+    explain_conn,
+    index_name,
+    build_query,
+):
+    sql = _sql(build_query())
+    plan = "\n".join(
+        row[0] for row in await explain_conn.execute(text(f"EXPLAIN {sql}"))
+    )
+    assert index_name in plan, plan
@@ -125,7 +125,12 @@ async def test_update_user_password(monkeypatch):
 @pytest.mark.asyncio
 async def test_soft_delete_and_restore_user(monkeypatch):
     # Soft delete uses get_user_by_id
-    user_obj = types.SimpleNamespace(is_deleted=False, deleted_at=None)
+    user_obj = types.SimpleNamespace(
+        is_deleted=False,
+        deleted_at=None,
+        email="a@example.com",
+        username="alice",
+    )
 
     async def fake_get_user_by_id(_db, _id):  # type: ignore[no-untyped-def]
         return user_obj
@@ -146,6 +151,8 @@ async def test_soft_delete_and_restore_user(monkeypatch):
         "get_user_by_id_any_status",
         fake_get_user_by_id_any_status,
     )
+    # No active user has taken the email or username in the meantime
+    db = _FakeSession(_ScalarOneOrNoneResult(None))
     ok2 = await crud_user.restore_user(db, "u1")
     assert ok2 is True and user_obj.is_deleted is False and user_obj.deleted_at is None
 
@@ -115,10 +115,22 @@ async def test_soft_restore_permanent_delete(monkeypatch):
     assert ok is True
     assert db.commit_called >= 1
 
-    # restore requires is_deleted True
+    # restore requires is_deleted True and no active user holding the
+    # same email or username
     db = FakeDB(value=deleted_user)
+
+    async def fake_get_user_by_id_any_status(_db, _id):  # type: ignore[no-untyped-def]
+        return deleted_user
+
+    monkeypatch.setattr(
+        crud,
+        "get_user_by_id_any_status",
+        fake_get_user_by_id_any_status,
+    )
+    db.value = None
     ok = await crud.restore_user(db, "444")
     assert ok is True
+    monkeypatch.undo()
 
     # permanently delete
     db = FakeDB(value=deleted_user)
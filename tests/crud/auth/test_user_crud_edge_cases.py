@@ -90,34 +90,6 @@ async def test_create_oauth_user_sets_verified_and_commits():
     assert len(db.added) == 1
 
 
-@pytest.mark.asyncio
-async def test_get_user_by_verification_token_found_and_none():
-    from app.crud.auth import user as crud
-    from app.models import User
-
-    db = FakeDB()
-    db.set_result(single=User(email="c@x.com", username="c"))
-    u = await crud.get_user_by_verification_token(db, "tok")
-    assert u is not None
-    db.set_result(single=None)
-    u2 = await crud.get_user_by_verification_token(db, "tok")
-    assert u2 is None
-
-
-@pytest.mark.asyncio
-async def test_get_user_by_deletion_token_found_and_none():
-    from app.crud.auth import user as crud
-    from app.models import User
-
-    db = FakeDB()
-    db.set_result(single=User(email="d@x.com", username="d"))
-    u = await crud.get_user_by_deletion_token(db, "tok")
-    assert u is not None
-    db.set_result(single=None)
-    u2 = await crud.get_user_by_deletion_token(db, "tok")
-    assert u2 is None
-
-
 @pytest.mark.asyncio
 async def test_permanently_delete_user_found_and_none():
     from app.crud.auth import user as crud
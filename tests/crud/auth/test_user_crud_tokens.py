@@ -37,55 +37,6 @@ def _user(**over):
     return types.SimpleNamespace(**base)
 
 
-@pytest.mark.asyncio
-async def test_update_verification_token_none_and_success():
-    from app.crud.auth import user as crud
-
-    db = FakeDB(value=None)
-    ok = await crud.update_verification_token(db, "u1", "tok", types.SimpleNamespace())
-    assert ok is False
-
-    db = FakeDB(value=_user())
-    ok = await crud.update_verification_token(db, "u1", "tok", types.SimpleNamespace())
-    assert ok is True and db.commit_called >= 1
-
-
-@pytest.mark.asyncio
-async def test_update_password_reset_token_none_and_success():
-    from app.crud.auth import user as crud
-
-    db = FakeDB(value=None)
-    ok = await crud.update_password_reset_token(
-        db,
-        "u1",
-        "tok",
-        types.SimpleNamespace(),
-    )
-    assert ok is False
-
-    db = FakeDB(value=_user())
-    ok = await crud.update_password_reset_token(
-        db,
-        "u1",
-        "tok",
-        types.SimpleNamespace(),
-    )
-    assert ok is True and db.commit_called >= 1
-
-
-@pytest.mark.asyncio
-async def test_update_deletion_token_none_and_success():
-    from app.crud.auth import user as crud
-
-    db = FakeDB(value=None)
-    ok = await crud.update_deletion_token(db, "u1", "tok", types.SimpleNamespace())
-    assert ok is False
-
-    db = FakeDB(value=_user())
-    ok = await crud.update_deletion_token(db, "u1", "tok", types.SimpleNamespace())
-    assert ok is True and db.commit_called >= 1
-
-
 @pytest.mark.asyncio
 async def test_verify_user_none_and_success():
     from app.crud.auth import user as crud
@@ -0,0 +1,219 @@
+import types
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
+
+pytestmark = pytest.mark.unit
+
+
+class BulkSession:
+    def __init__(self, fail_on_call=None):
+        self.calls = []
+        self.commits = 0
+        self.rollbacks = 0
+        self._fail_on_call = fail_on_call
+
+    async def execute(self, statement, params=None):  # type: ignore[no-untyped-def]
+        self.calls.append((statement, params))
+        if self._fail_on_call == len(self.calls):
+            raise OperationalError("UPDATE", {}, Exception("boom"))
+        # Pretend every id except the first in each chunk exists
+        ids = params["ids"][1:]
+        return types.SimpleNamespace(
+            scalars=lambda: types.SimpleNamespace(all=lambda: ids),
+        )
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_users_chunks_with_one_statement_per_chunk():
+    from app.crud.system.admin import AdminUserCRUD
+
+    ids = [uuid.uuid4() for _ in range(5)]
+    db = BulkSession()
+    progress = []
+
+    updated = await AdminUserCRUD().bulk_update_users(
+        db,
+        [*ids, ids[0]],
+        "verify",
+        chunk_size=2,
+        on_progress=lambda processed, ok: progress.append((processed, ok)),
+    )
+
+    assert [params["ids"] for _, params in db.calls] == [ids[0:2], ids[2:4], ids[4:]]
+    assert db.commits == 3
+    assert updated == [ids[1], ids[3]]
+    assert progress == [(2, 1), (4, 2), (5, 2)]
+
+    sql = _sql(db.calls[0][0])
+    assert "UPDATE users SET is_verified" in sql
+    assert "users.id = ANY" in sql
+    assert "RETURNING users.id" in sql
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_users_delete_is_guarded():
+    from app.crud.system.admin import AdminUserCRUD
+
+    admin_id = uuid.uuid4()
+    db = BulkSession()
+
+    await AdminUserCRUD().bulk_update_users(
+        db,
+        [uuid.uuid4()],
+        "delete",
+        performed_by=admin_id,
+    )
+
+    statement = db.calls[0][0]
+    sql = _sql(statement)
+    assert "is_deleted = false" in sql
+    assert "deleted_by" in sql
+    assert admin_id in statement.compile().params.values()
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_users_rolls_back_failed_chunk():
+    from app.crud.system.admin import AdminUserCRUD
+
+    ids = [uuid.uuid4() for _ in range(4)]
+    db = BulkSession(fail_on_call=1)
+
+    updated = await AdminUserCRUD().bulk_update_users(db, ids, "restore", chunk_size=2)
+
+    assert db.rollbacks == 1
+    assert db.commits == 1
+    assert updated == [ids[3]]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_users_rejects_unknown_operation():
+    from app.crud.system.admin import AdminUserCRUD
+
+    with pytest.raises(ValueError, match="Unsupported bulk operation"):
+        await AdminUserCRUD().bulk_update_users(BulkSession(), [], "activate")
+
+
+class ImportSession:
+    def __init__(self, conflicts=(), fail_copy=False):
+        self.statements = []
+        self.copies = []
+        self.commits = 0
+        self.rollbacks = 0
+        self._conflicts = list(conflicts)
+        self._fail_copy = fail_copy
+
+    async def execute(self, statement, params=None):  # type: ignore[no-untyped-def]
+        self.statements.append(str(statement))
+        conflicts = []
+        if "INSERT INTO users" in str(statement):
+            # Conflicts are reported by the first merge only
+            conflicts, self._conflicts = self._conflicts, []
+        return types.SimpleNamespace(all=lambda: conflicts)
+
+    async def connection(self):
+        session = self
+
+        class Driver:
+            async def copy_records_to_table(self, table, records, columns):
+                if session._fail_copy:
+                    raise OperationalError("COPY", {}, Exception("boom"))
+                session.copies.append((table, list(records), columns))
+
+        raw = types.SimpleNamespace(driver_connection=Driver())
+
+        async def get_raw_connection():
+            return raw
+
+        return types.SimpleNamespace(get_raw_connection=get_raw_connection)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+async def _records(*records):
+    for line, record in enumerate(records, start=1):
+        yield line, record
+
+
+def _record(name):
+    return {"email": f"{name}@example.com", "username": name, "password": "Str0ng!Pass"}
+
+
+@pytest.fixture
+def fake_hashes(monkeypatch):
+    from app.crud.system import admin as admin_module
+
+    async def hashes(passwords):
+        return [f"hash:{password}" for password in passwords]
+
+    monkeypatch.setattr(admin_module, "get_password_hashes", hashes)
+
+
+@pytest.mark.asyncio
+async def test_import_users_copies_batches_and_reports_conflicts(fake_hashes):
+    from app.crud.system.admin import USER_IMPORT_STAGING_TABLE, AdminUserCRUD
+
+    db = ImportSession(
+        conflicts=[(3, "carol@example.com", "carol", "Email already registered")],
+    )
+
+    result = await AdminUserCRUD().import_users(
+        db,
+        _records(
+            _record("alice"),
+            {"email": "bad"},
+            _record("carol"),
+            _record("dave"),
+        ),
+        batch_size=2,
+    )
+
+    assert result["total_rows"] == 4
+    assert result["imported"] == 2
+    assert result["failed"] == 2
+    assert [error["line"] for error in result["errors"]] == [2, 3]
+    assert result["errors"][0]["reason"].startswith("Missing fields")
+
+    # alice + carol in the first batch, dave in the second
+    assert [len(rows) for _, rows, _ in db.copies] == [2, 1]
+    table, rows, columns = db.copies[0]
+    assert table == USER_IMPORT_STAGING_TABLE
+    assert columns[0] == "line" and columns[4] == "hashed_password"
+    assert rows[0][0] == 1 and rows[0][2] == "alice@example.com"
+    assert rows[0][4] == "hash:Str0ng!Pass"
+    assert db.commits == 2
+    assert "ON COMMIT DELETE ROWS" in db.statements[0]
+    assert "ON CONFLICT DO NOTHING" in db.statements[1]
+
+
+@pytest.mark.asyncio
+async def test_import_users_failed_batch_is_rolled_back(fake_hashes):
+    from app.crud.system.admin import AdminUserCRUD
+
+    db = ImportSession(fail_copy=True)
+
+    result = await AdminUserCRUD().import_users(
+        db,
+        _records(_record("alice"), _record("bob")),
+    )
+
+    assert db.rollbacks == 1 and db.commits == 0
+    assert result["imported"] == 0 and result["failed"] == 2
+    assert {error["reason"] for error in result["errors"]} == {"Database error"}
+    assert all("password" not in error for error in result["errors"])
@@ -1,4 +1,5 @@
 import types
+import uuid
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -140,3 +141,235 @@ async def test_cleanup_old_audit_logs(monkeypatch):
 
     deleted = await mod.cleanup_old_audit_logs(db, days_to_keep=90)
     assert deleted == 1 and db.deleted == [old]
+
+
+@pytest.mark.asyncio
+async def test_get_audit_logs_by_context_combines_filters():
+    from sqlalchemy.dialects import postgresql
+
+    from app.crud.system import audit_log as mod
+
+    since = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    statements = []
+
+    class RecordingSession(FakeSession):
+        async def execute(self, statement, *a, **k):
+            statements.append(statement)
+            return FakeResult([_log()])
+
+    logs = await mod.get_audit_logs_by_context(
+        RecordingSession(),
+        {"oauth_provider": "google"},
+        event_type="login_failed",
+        success=False,
+        since=since,
+        limit=10,
+    )
+
+    assert len(logs) == 1
+    compiled = statements[0].compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "audit_logs.context @> " in sql
+    assert "audit_logs.event_type = " in sql
+    assert "audit_logs.timestamp >= " in sql
+    assert "ORDER BY audit_logs.timestamp DESC" in sql
+    assert {"oauth_provider": "google"} in compiled.params.values()
+
+
+def test_audit_context_index_uses_jsonb_path_ops():
+    from sqlalchemy.dialects.postgresql import JSONB
+
+    from app.models import AuditLog
+
+    assert isinstance(AuditLog.__table__.c.context.type, JSONB)
+    index = next(
+        i for i in AuditLog.__table__.indexes if i.name == "ix_audit_log_context"
+    )
+    options = index.dialect_options["postgresql"]
+    assert options["using"] == "gin"
+    assert options["ops"] == {"context": "jsonb_path_ops"}
+
+
+class _RowsResult(FakeResult):
+    def all(self):
+        return self._items
+
+
+class _StatementRecorder(FakeSession):
+    def __init__(self, items):
+        super().__init__()
+        self._items = items
+        self.statements = []
+        self.params = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        self.params.append(params)
+        return _RowsResult(self._items)
+
+
+@pytest.mark.asyncio
+async def test_search_audit_logs_pages_by_keyset():
+    import uuid
+
+    from sqlalchemy.dialects import postgresql
+
+    from app.crud.system import audit_log as mod
+    from app.utils.search_filter import create_audit_log_search_filters
+
+    now = datetime(2025, 1, 10, tzinfo=timezone.utc)
+    logs = [
+        types.SimpleNamespace(id=uuid.uuid4(), timestamp=now - timedelta(minutes=i))
+        for i in range(3)
+    ]
+    db = _StatementRecorder(logs)
+    after = (now, uuid.uuid4())
+
+    page, next_key = await mod.search_audit_logs(
+        db,
+        create_audit_log_search_filters(event_type="login_failed", sort_by="user_id"),
+        limit=2,
+        after=after,
+    )
+
+    # One extra row is fetched to detect the next page
+    assert page == logs[:2]
+    assert next_key == (logs[1].timestamp, logs[1].id)
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    assert "audit_logs.event_type = " in sql
+    assert "audit_logs.timestamp <= " in sql
+    assert "audit_logs.id < " in sql
+    assert "OFFSET" not in sql
+    assert sql.endswith(
+        "ORDER BY audit_logs.timestamp DESC, audit_logs.id DESC \n LIMIT %(param_1)s",
+    )
+    assert db.statements[0].compile().params["param_1"] == 3
+    assert db.params[0] == {"filter_0": "login_failed"}
+
+
+@pytest.mark.asyncio
+async def test_search_audit_logs_last_page_has_no_next_key():
+    from app.crud.system import audit_log as mod
+    from app.utils.search_filter import SearchFilterConfig
+
+    db = _StatementRecorder([_log()])
+
+    page, next_key = await mod.search_audit_logs(db, SearchFilterConfig(), limit=5)
+
+    assert len(page) == 1
+    assert next_key is None
+
+
+@pytest.mark.asyncio
+async def test_get_audit_log_histogram_groups_by_bucket():
+    from sqlalchemy.dialects import postgresql
+
+    from app.crud.system import audit_log as mod
+    from app.utils.search_filter import create_audit_log_search_filters
+
+    bucket = datetime(2025, 1, 10, 5, tzinfo=timezone.utc)
+    db = _StatementRecorder([types.SimpleNamespace(bucket=bucket, count=4)])
+
+    buckets = await mod.get_audit_log_histogram(
+        db,
+        create_audit_log_search_filters(success=False),
+        interval="day",
+    )
+
+    assert buckets == [(bucket, 4)]
+    compiled = db.statements[0].compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "date_trunc(" in sql and "count(*) AS count" in sql
+    assert "GROUP BY date_trunc(" in sql
+    assert "ORDER BY bucket" in sql
+    assert "day" in compiled.params.values()
+
+
+@pytest.mark.asyncio
+async def test_get_audit_log_histogram_rejects_unknown_interval():
+    from app.crud.system import audit_log as mod
+    from app.utils.search_filter import SearchFilterConfig
+
+    with pytest.raises(ValueError, match="Unsupported histogram interval"):
+        await mod.get_audit_log_histogram(
+            _StatementRecorder([]),
+            SearchFilterConfig(),
+            interval="second",
+        )
+
+
+@pytest.mark.asyncio
+async def test_delete_audit_logs_in_range_deletes_in_chunks():
+    from sqlalchemy.dialects import postgresql
+
+    from app.crud.system import audit_log as mod
+
+    rowcounts = iter([2, 2, 1])
+
+    class DeletingSession(FakeSession):
+        def __init__(self):
+            super().__init__()
+            self.statements = []
+            self.commits = 0
+
+        async def execute(self, statement, *a, **k):
+            self.statements.append(statement)
+            return types.SimpleNamespace(rowcount=next(rowcounts))
+
+        async def commit(self):
+            self.commits += 1
+
+    db = DeletingSession()
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    deleted = await mod.delete_audit_logs_in_range(
+        db,
+        start,
+        start + timedelta(days=1),
+        batch_size=2,
+    )
+
+    assert deleted == 5
+    # Each chunk is committed on its own
+    assert db.commits == 3
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("DELETE FROM audit_logs WHERE audit_logs.id IN (SELECT")
+    assert "LIMIT" in sql
+
+
+@pytest.mark.asyncio
+async def test_delete_audit_logs_in_range_limits_to_given_ids():
+    from sqlalchemy.dialects import postgresql
+
+    from app.crud.system import audit_log as mod
+
+    class DeletingSession(FakeSession):
+        def __init__(self):
+            super().__init__()
+            self.statements = []
+
+        async def execute(self, statement, *a, **k):
+            self.statements.append(statement)
+            return types.SimpleNamespace(rowcount=2)
+
+        async def commit(self):
+            pass
+
+    db = DeletingSession()
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    ids = [uuid.uuid4() for _ in range(3)]
+
+    deleted = await mod.delete_audit_logs_in_range(
+        db,
+        start,
+        start + timedelta(days=1),
+        batch_size=2,
+        ids=iter(ids),
+    )
+
+    # One chunk of at most batch_size ids per statement, read as needed
+    assert deleted == 4
+    assert len(db.statements) == 2
+    compiled = db.statements[0].compile(dialect=postgresql.dialect())
+    assert "audit_logs.timestamp >=" in str(compiled)
+    assert compiled.params["id_1"] == ids[:2]
@@ -0,0 +1,148 @@
+import types
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+pytestmark = pytest.mark.unit
+
+
+def _sql(statement):
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class _Result:
+    def __init__(self, scalar=None, rows=(), rowcount=0):
+        self._scalar = scalar
+        self._rows = list(rows)
+        self.rowcount = rowcount
+
+    def scalar_one(self):
+        return self._scalar
+
+    def all(self):
+        return self._rows
+
+    def scalars(self):
+        return types.SimpleNamespace(all=lambda: self._rows)
+
+
+class _RollupDB:
+    """Fake session keeping the watermark between windows."""
+
+    def __init__(self, watermark):
+        self.watermark = watermark
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        sql = _sql(statement)
+        if sql.startswith("SELECT audit_rollup_watermarks.processed_until"):
+            return _Result(scalar=self.watermark)
+        if sql.startswith("UPDATE audit_rollup_watermarks"):
+            self.watermark = statement.compile().params["processed_until"]
+        return _Result(rowcount=3)
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_audit_rollup_processes_windows_since_watermark(monkeypatch):
+    from app.crud.system import audit_rollup as mod
+
+    monkeypatch.setattr(mod.settings, "AUDIT_ROLLUP_MAX_WINDOW_HOURS", 24)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    until = start + timedelta(hours=30)
+    db = _RollupDB(start)
+
+    updated = await mod.refresh_audit_rollup(
+        db,
+        "failed_logins_per_ip_minute",
+        until=until,
+    )
+
+    # 30 hours are split into a 24 hour and a 6 hour window
+    assert updated == 6
+    assert db.watermark == until
+    assert db.commits == 3
+    upserts = [
+        sql
+        for sql in map(_sql, db.statements)
+        if sql.startswith("INSERT INTO audit_log_rollups")
+    ]
+    assert len(upserts) == 2
+    assert "ON CONFLICT (rollup, bucket_start, dimension) DO UPDATE" in upserts[0]
+    assert "audit_log_rollups.count + excluded.count" in upserts[0]
+    assert "audit_logs.success = false" in upserts[0]
+    assert "audit_logs.timestamp >= " in upserts[0]
+
+
+@pytest.mark.asyncio
+async def test_refresh_audit_rollup_locks_and_seeds_watermark():
+    from app.crud.system import audit_rollup as mod
+
+    until = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    db = _RollupDB(until)
+
+    updated = await mod.refresh_audit_rollup(
+        db,
+        "api_key_usage_per_key_hour",
+        until=until,
+    )
+
+    assert updated == 0
+    assert db.commits == 1
+    seed, lock = map(_sql, db.statements)
+    assert seed.startswith("INSERT INTO audit_rollup_watermarks")
+    assert "min(audit_logs.timestamp)" in seed
+    assert "ON CONFLICT (rollup) DO NOTHING" in seed
+    assert lock.endswith("FOR UPDATE")
+
+
+@pytest.mark.asyncio
+async def test_refresh_audit_rollup_rejects_unknown_rollup():
+    from app.crud.system import audit_rollup as mod
+
+    with pytest.raises(ValueError, match="Unknown audit rollup"):
+        await mod.refresh_audit_rollup(_RollupDB(None), "nope")
+
+
+def test_api_key_rollup_groups_by_context_key():
+    from app.crud.system import audit_rollup as mod
+
+    statement = mod._upsert_counts(
+        "api_key_usage_per_key_hour",
+        mod.AUDIT_ROLLUPS["api_key_usage_per_key_hour"],
+        datetime(2025, 1, 1, tzinfo=timezone.utc),
+        datetime(2025, 1, 2, tzinfo=timezone.utc),
+    )
+
+    sql = _sql(statement)
+    assert "GROUP BY date_trunc(" in sql
+    assert "audit_logs.context ->> " in sql
+
+
+@pytest.mark.asyncio
+async def test_get_audit_rollup_top_sums_counts():
+    from app.crud.system import audit_rollup as mod
+
+    class _DB:
+        async def execute(self, statement):
+            self.statement = statement
+            return _Result(rows=[("10.0.0.1", 12), ("", 3)])
+
+    db = _DB()
+    top = await mod.get_audit_rollup_top(
+        db,
+        "failed_logins_per_ip_minute",
+        since=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        until=datetime(2025, 1, 2, tzinfo=timezone.utc),
+        limit=5,
+    )
+
+    assert top == [("10.0.0.1", 12), ("", 3)]
+    sql = _sql(db.statement)
+    assert "sum(audit_log_rollups.count)" in sql
+    assert "ORDER BY total DESC" in sql
@@ -0,0 +1,220 @@
+"""
+Creating a row must cost one round trip: the INSERT sent by the commit.
+
+Ids, timestamps and flags are generated client-side, so the created object is
+complete without a refresh SELECT after the commit. The statements are counted
+on a real in-memory SQLite engine.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import CreateColumn, CreateTable
+
+from app.models import APIKey, AuditLog, RefreshToken, User
+from app.schemas.auth.user import APIKeyCreate, UserCreate
+
+pytestmark = pytest.mark.unit
+
+
+# SQLite stand-ins for the Postgres-only column types. The tables are created
+# with CreateTable, which leaves out their Postgres-only indexes.
+@compiles(UUID, "sqlite")
+def _compile_uuid(_type, _compiler, **_kw):  # type: ignore[no-untyped-def]
+    return "CHAR(32)"
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb(_type, _compiler, **_kw):  # type: ignore[no-untyped-def]
+    return "JSON"
+
+
+@compiles(TSVECTOR, "sqlite")
+def _compile_tsvector(_type, _compiler, **_kw):  # type: ignore[no-untyped-def]
+    return "TEXT"
+
+
+@compiles(CreateColumn, "sqlite")
+def _compile_column(create, compiler, **kw):  # type: ignore[no-untyped-def]
+    column = create.element
+    if column.computed is not None:
+        return f"{column.name} TEXT"
+    return compiler.visit_create_column(create, **kw)
+
+
+class CountingDatabase:
+    """A session on an in-memory engine that records every statement sent."""
+
+    def __init__(self, session, statements):  # type: ignore[no-untyped-def]
+        self.session = session
+        self.statements = statements
+
+
+@pytest.fixture
+async def counting_db():  # type: ignore[no-untyped-def]
+    engine = create_async_engine("sqlite+aiosqlite://")
+    try:
+        async with engine.begin() as conn:
+            for model in (User, APIKey, RefreshToken, AuditLog):
+                await conn.execute(CreateTable(model.__table__))
+
+        statements: list[str] = []
+
+        def record(_conn, _cursor, statement, *_args):  # type: ignore[no-untyped-def]
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        session_factory = async_sessionmaker(
+            engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        async with session_factory() as session:
+            yield CountingDatabase(session, statements)
+    finally:
+        await engine.dispose()
+
+
+def _assert_single_insert(db, table, created, *timestamp_fields):  # type: ignore[no-untyped-def]
+    [statement] = db.statements
+    assert statement.startswith(f"INSERT INTO {table} ")
+    assert not db.session.in_transaction()
+    assert created.id is not None
+    for field in timestamp_fields:
+        assert getattr(created, field) is not None
+
+
+def _user_create(**overrides):  # type: ignore[no-untyped-def]
+    data = {
+        "email": "e@example.com",
+        "username": "validuser",
+        "password": "Password123!",
+        "is_superuser": False,
+    }
+    data.update(overrides)
+    return UserCreate(**data)
+
+
+@pytest.mark.asyncio
+async def test_create_user_is_one_round_trip(counting_db, monkeypatch):
+    from app.crud.auth import user as crud_user
+
+    monkeypatch.setattr(crud_user, "get_password_hash", lambda p: "HASHED")
+    db = counting_db
+
+    created = await crud_user.create_user(db.session, _user_create())
+
+    _assert_single_insert(db, "users", created, "created_at", "updated_at")
+    assert created.is_deleted is False
+    assert created.is_verified is False
+
+
+@pytest.mark.asyncio
+async def test_create_oauth_user_is_one_round_trip(counting_db):
+    from app.crud.auth import user as crud_user
+
+    db = counting_db
+
+    created = await crud_user.create_oauth_user(
+        db.session,
+        "e@example.com",
+        "validuser",
+        "google",
+        "oauth-id",
+        "e@example.com",
+    )
+
+    _assert_single_insert(db, "users", created, "created_at", "updated_at")
+    assert created.is_verified is True
+
+
+@pytest.mark.asyncio
+async def test_create_api_key_is_one_round_trip(counting_db):
+    from app.crud.auth import api_key as crud_api_key
+
+    db = counting_db
+
+    created = await crud_api_key.create_api_key(
+        db.session,
+        APIKeyCreate(label="ci", scopes=["read"]),
+        user_id="00000000-0000-0000-0000-000000000001",
+        raw_key="sk_test",
+    )
+
+    _assert_single_insert(db, "api_keys", created, "created_at", "updated_at")
+    assert created.is_active is True
+    assert created.scopes == ["read"]
+
+
+@pytest.mark.asyncio
+async def test_create_refresh_token_is_one_round_trip(counting_db):
+    from app.crud.auth import refresh_token as crud_refresh_token
+
+    db = counting_db
+
+    created = await crud_refresh_token.create_refresh_token(
+        db.session,
+        # The SQLite UUID type only binds UUID objects (asyncpg also takes str)
+        uuid.UUID("00000000-0000-0000-0000-000000000001"),  # type: ignore[arg-type]
+        "raw-refresh-token",
+    )
+
+    _assert_single_insert(
+        db,
+        "refresh_tokens",
+        created,
+        "created_at",
+        "updated_at",
+    )
+    assert created.is_revoked is False
+
+
+@pytest.mark.asyncio
+async def test_create_audit_log_is_one_round_trip(counting_db):
+    from app.crud.system import audit_log as crud_audit_log
+
+    db = counting_db
+
+    created = await crud_audit_log.create_audit_log(
+        db.session,
+        "login",
+        success=False,
+    )
+
+    _assert_single_insert(db, "audit_logs", created, "timestamp")
+    assert created.success is False
+
+
+@pytest.mark.asyncio
+async def test_admin_create_user_is_one_round_trip(counting_db, monkeypatch):
+    from app.crud.system import admin as crud_admin
+
+    monkeypatch.setattr(crud_admin, "get_password_hash", lambda p: "HASHED")
+    db = counting_db
+
+    created = await crud_admin.admin_user_crud.create_user(
+        db.session,
+        _user_create(),
+    )
+
+    _assert_single_insert(db, "users", created, "created_at", "updated_at")
+
+
+@pytest.mark.asyncio
+async def test_create_inside_unit_of_work_only_flushes(counting_db):
+    from app.crud.system import audit_log as crud_audit_log
+    from app.database.database import UNIT_OF_WORK_KEY
+
+    db = counting_db
+    db.session.info[UNIT_OF_WORK_KEY] = True
+
+    await crud_audit_log.create_audit_log(db.session, "login")
+
+    # Flushed, but left for the request to commit
+    [statement] = db.statements
+    assert statement.startswith("INSERT INTO audit_logs ")
+    assert db.session.in_transaction()
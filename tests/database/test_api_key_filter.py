@@ -0,0 +1,254 @@
+import time
+import types
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.core.security.security import fingerprint_api_key
+
+pytestmark = pytest.mark.unit
+
+
+def _fingerprints(prefix, count):  # type: ignore[no-untyped-def]
+    return [fingerprint_api_key(f"{prefix}_{i}") for i in range(count)]
+
+
+class FakeConnection:
+    def __init__(self, dialect):  # type: ignore[no-untyped-def]
+        self.dialect = types.SimpleNamespace(name=dialect)
+        self.executed = []
+
+    def execute(self, statement, params):  # type: ignore[no-untyped-def]
+        self.executed.append((str(statement), params))
+
+
+class FakeSession:
+    def __init__(self, dialect="postgresql"):  # type: ignore[no-untyped-def]
+        self.info = {}
+        self.bind = FakeConnection(dialect)
+        self.executed = 0
+
+    def connection(self):  # type: ignore[no-untyped-def]
+        return self.bind
+
+    async def execute(self, statement):  # type: ignore[no-untyped-def]
+        self.executed += 1
+        return types.SimpleNamespace(scalar_one_or_none=lambda: None)
+
+
+@pytest.fixture
+def key_filter(monkeypatch):  # type: ignore[no-untyped-def]
+    from app.database.api_key_filter import api_key_filter, settings
+
+    monkeypatch.setattr(settings, "API_KEY_FILTER", True)
+    yield api_key_filter
+    api_key_filter.__init__()
+
+
+def test_bloom_filter_has_no_false_negatives():
+    from app.database.api_key_filter import BloomFilter
+
+    bloom = BloomFilter(1000, 0.01)
+    keys = _fingerprints("sk_live", 1000)
+    for fingerprint in keys:
+        bloom.add(fingerprint)
+
+    assert all(fingerprint in bloom for fingerprint in keys)
+    false_positives = sum(
+        fingerprint in bloom for fingerprint in _fingerprints("sk_scan", 10000)
+    )
+    assert false_positives < 300
+    assert bloom.false_positive_rate == pytest.approx(0.01, rel=0.5)
+    # About 1.2 bytes per key at 1%
+    assert bloom.memory_bytes < 1300
+
+
+def test_filter_is_only_used_once_loaded(key_filter):
+    live, scan = _fingerprints("sk_live", 1)[0], _fingerprints("sk_scan", 1)[0]
+
+    # Not loaded yet: every key is looked up
+    assert key_filter.might_exist(scan)
+    key_filter.record_false_positive(scan)
+    assert key_filter.as_dict()["checks"] == 0
+
+    key_filter.finish_rebuild([live])
+    assert key_filter.might_exist(live)
+    assert not key_filter.might_exist(scan)
+
+    key_filter.reset()
+    assert key_filter.might_exist(scan)
+
+
+def test_keys_added_during_a_rebuild_are_kept(key_filter):
+    old, created, loaded = _fingerprints("sk", 3)
+    key_filter.finish_rebuild([old])
+
+    key_filter.begin_rebuild()
+    key_filter.add(created)
+    key_filter.finish_rebuild([loaded])
+
+    assert key_filter.might_exist(created)
+    assert key_filter.might_exist(loaded)
+    # Deactivated keys drop out on rebuild
+    assert not key_filter.might_exist(old)
+    stats = key_filter.as_dict()
+    assert stats["entries"] == 2 and stats["rebuilds"] == 2
+    assert stats["rejected"] == 1
+
+
+def test_new_keys_are_added_on_commit_and_dropped_on_rollback(key_filter):
+    from app.database.api_key_filter import publish_api_key
+
+    first, second = _fingerprints("sk", 2)
+    key_filter.finish_rebuild([])
+    session = Session(create_engine("sqlite://"))
+
+    session.execute(text("SELECT 1"))
+    publish_api_key(session, first)
+    session.rollback()
+    assert not key_filter.might_exist(first)
+
+    publish_api_key(session, second)
+    session.commit()
+    assert key_filter.might_exist(second)
+    session.close()
+
+
+def test_new_keys_are_notified_on_postgres(key_filter):
+    from app.database import api_key_filter as mod
+
+    fingerprint = _fingerprints("sk", 1)[0]
+    session = FakeSession()
+
+    mod.publish_api_key(session, fingerprint)
+    mod._notify_pending_api_keys(session)
+
+    [(sql, params)] = session.bind.executed
+    assert "pg_notify" in sql
+    assert params == {"channel": mod.API_KEY_CHANNEL, "payload": fingerprint}
+    assert mod.PENDING_FINGERPRINTS_KEY not in session.info
+
+
+def test_keys_newer_than_the_last_rebuild_are_looked_up(key_filter, monkeypatch):
+    from app.database import api_key_filter as mod
+
+    fingerprint = _fingerprints("sk", 1)[0]
+    monkeypatch.setattr(mod.time, "time", lambda: 10_000.0)
+    key_filter.begin_rebuild()
+    monkeypatch.setattr(mod.time, "time", lambda: 20_000.0)
+    key_filter.finish_rebuild([])
+    assert key_filter.built_from == 10_000.0
+
+    # Issued after the rebuild started, or just before it (clock skew, slow
+    # requests): it may have committed too late to be loaded
+    assert key_filter.might_exist(fingerprint, 10_001.0)
+    assert key_filter.might_exist(fingerprint, 10_000.0 - mod.NEW_KEY_GRACE)
+    assert not key_filter.might_exist(fingerprint, 9_000.0)
+    assert not key_filter.might_exist(fingerprint)
+    stats = key_filter.as_dict()
+    assert stats["new_keys"] == 2 and stats["rejected"] == 2
+    assert stats["passed"] == 0
+
+    # A new key that isn't found isn't a false positive of the filter
+    key_filter.record_false_positive(fingerprint)
+    assert key_filter.as_dict()["false_positives"] == 0
+
+
+@pytest.mark.asyncio
+async def test_new_keys_are_looked_up_before_their_notification(
+    key_filter,
+    monkeypatch,
+):
+    from app.core.security.security import generate_api_key
+    from app.crud.auth import api_key as crud_api_key
+    from app.crud.auth import fast_path
+
+    rows = []
+
+    async def fake_fetchrow(db, sql, *args):  # type: ignore[no-untyped-def]
+        rows.append(args)
+
+    monkeypatch.setattr(fast_path, "_fetchrow", fake_fetchrow)
+    key_filter.finish_rebuild(_fingerprints("sk_live", 10))
+    session = FakeSession()
+    raw_key = generate_api_key()
+
+    assert await crud_api_key.verify_api_key_in_db(session, raw_key) is None
+    assert session.executed == 1
+    assert await fast_path.verify_api_key_in_db(session, raw_key) is None
+    assert rows == [(fingerprint_api_key(raw_key),)]
+    assert key_filter.as_dict()["rejected"] == 0
+
+    # Keys from before the rebuild are still rejected without a query
+    old_key = generate_api_key()
+    key_filter.built_from = time.time() + 2 * 3600
+    assert await crud_api_key.verify_api_key_in_db(session, old_key) is None
+    assert session.executed == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_keys_are_rejected_without_a_query(key_filter, monkeypatch):
+    from app.crud.auth import api_key as crud_api_key
+    from app.crud.auth import fast_path
+
+    async def fail_fetchrow(*args):  # type: ignore[no-untyped-def]
+        raise AssertionError("queried the database")
+
+    monkeypatch.setattr(fast_path, "_fetchrow", fail_fetchrow)
+    key_filter.finish_rebuild(_fingerprints("sk_live", 10))
+    session = FakeSession()
+
+    assert await crud_api_key.verify_api_key_in_db(session, "sk_scan") is None
+    assert await fast_path.verify_api_key_in_db(session, "sk_scan") is None
+    assert session.executed == 0
+    assert key_filter.as_dict()["rejected"] == 2
+
+    # A key the filter lets through but the database doesn't have
+    key_filter.add(fingerprint_api_key("sk_deleted"))
+    assert await crud_api_key.verify_api_key_in_db(session, "sk_deleted") is None
+    assert session.executed == 1
+    stats = key_filter.as_dict()
+    assert stats["false_positives"] == 1
+    assert stats["observed_false_positive_rate"] == pytest.approx(1 / 3)
+
+
+@pytest.mark.asyncio
+async def test_created_and_rotated_keys_are_published(key_filter, monkeypatch):
+    from app.crud.auth import api_key as crud_api_key
+    from app.database.api_key_filter import PENDING_FINGERPRINTS_KEY
+    from app.schemas.auth.user import APIKeyCreate
+
+    old_key = types.SimpleNamespace(
+        id="k1",
+        user_id="u1",
+        label="ci",
+        scopes=["read"],
+        expires_at=None,
+        is_active=True,
+    )
+
+    async def fake_get_api_key_by_id(_db, _key_id, _user_id=None):  # type: ignore[no-untyped-def]
+        return old_key
+
+    async def fake_commit_or_flush(_db):  # type: ignore[no-untyped-def]
+        pass
+
+    monkeypatch.setattr(crud_api_key, "get_api_key_by_id", fake_get_api_key_by_id)
+    monkeypatch.setattr(crud_api_key, "commit_or_flush", fake_commit_or_flush)
+    monkeypatch.setattr(crud_api_key, "hash_api_key", lambda key: "hash")
+    session = FakeSession()
+    session.add = lambda obj: None
+
+    created = await crud_api_key.create_api_key(
+        session,
+        APIKeyCreate(label="ci", scopes=["read"]),
+        raw_key="sk_created",
+    )
+    rotated, raw_key = await crud_api_key.rotate_api_key(session, "k1")
+
+    assert rotated.key_fingerprint == fingerprint_api_key(raw_key)
+    assert session.info[PENDING_FINGERPRINTS_KEY] == {
+        created.key_fingerprint,
+        rotated.key_fingerprint,
+    }
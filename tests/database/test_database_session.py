@@ -12,6 +12,9 @@ async def test_get_db_closes_session(monkeypatch):
     closed = {"done": False}
 
     class FakeSession:
+        def __init__(self):  # type: ignore[no-untyped-def]
+            self.info = {}
+
         async def close(self):  # type: ignore[no-untyped-def]
             closed["done"] = True
 
@@ -36,3 +39,144 @@ async def test_get_db_closes_session(monkeypatch):
     # give loop a chance to settle
     await asyncio.sleep(0)
     assert closed["done"] is True
+
+
+class RecordingSession:
+    def __init__(self):  # type: ignore[no-untyped-def]
+        self.info = {}
+        self.calls = []
+        self.is_active = True
+
+    async def __aenter__(self):  # type: ignore[no-untyped-def]
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+        return False
+
+    async def flush(self):  # type: ignore[no-untyped-def]
+        self.calls.append("flush")
+
+    async def commit(self):  # type: ignore[no-untyped-def]
+        self.calls.append("commit")
+
+    async def rollback(self):  # type: ignore[no-untyped-def]
+        self.calls.append("rollback")
+
+    async def close(self):  # type: ignore[no-untyped-def]
+        self.calls.append("close")
+
+
+async def _run_request(monkeypatch, error=None):  # type: ignore[no-untyped-def]
+    from app.database import database as db
+
+    session = RecordingSession()
+    monkeypatch.setattr(db, "AsyncSessionLocal", lambda: session)
+
+    agen = db.get_db()
+    yielded = await agen.__anext__()
+    await db.commit_or_flush(yielded)
+    await db.commit_or_flush(yielded)
+    if error is None:
+        with pytest.raises(StopAsyncIteration):
+            await agen.__anext__()
+    else:
+        with pytest.raises(type(error)):
+            await agen.athrow(error)
+    return session.calls
+
+
+@pytest.mark.asyncio
+async def test_get_db_commits_once_per_request(monkeypatch):
+    calls = await _run_request(monkeypatch)
+    assert calls == ["flush", "flush", "commit", "close"]
+
+
+@pytest.mark.asyncio
+async def test_get_db_keeps_writes_when_endpoint_raises_http_error(monkeypatch):
+    from fastapi import HTTPException
+
+    calls = await _run_request(monkeypatch, HTTPException(status_code=401))
+    assert calls == ["flush", "flush", "commit", "close"]
+
+
+@pytest.mark.asyncio
+async def test_get_db_rolls_back_http_error_after_failed_flush(monkeypatch):
+    from fastapi import HTTPException
+
+    from app.database import database as db
+
+    session = RecordingSession()
+    session.is_active = False
+    monkeypatch.setattr(db, "AsyncSessionLocal", lambda: session)
+
+    agen = db.get_db()
+    await agen.__anext__()
+    with pytest.raises(HTTPException):
+        await agen.athrow(HTTPException(status_code=409))
+
+    assert session.calls == ["rollback", "close"]
+
+
+@pytest.mark.asyncio
+async def test_get_db_rolls_back_a_flush_error_the_endpoint_handled(monkeypatch):
+    from sqlalchemy import select
+    from sqlalchemy.exc import IntegrityError
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+    from app.database import database as db
+
+    class Base(DeclarativeBase):
+        pass
+
+    class Item(Base):
+        __tablename__ = "items"
+        id: Mapped[int] = mapped_column(primary_key=True)
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+            await connection.execute(Item.__table__.insert().values(id=1))
+        monkeypatch.setattr(db, "AsyncSessionLocal", async_sessionmaker(engine))
+
+        # Like reset_password: a failed write is caught and answered normally
+        agen = db.get_db()
+        session = await agen.__anext__()
+        session.add(Item(id=2))
+        await session.flush()
+        session.add(Item(id=1))
+        with pytest.raises(IntegrityError):
+            await session.flush()
+        assert session.is_active is False
+        with pytest.raises(StopAsyncIteration):
+            await agen.__anext__()
+
+        async with engine.connect() as connection:
+            rows = await connection.execute(select(Item.id))
+            assert rows.scalars().all() == [1]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_db_rolls_back_on_unexpected_error(monkeypatch):
+    calls = await _run_request(monkeypatch, RuntimeError("boom"))
+    assert calls == ["flush", "flush", "rollback", "close"]
+
+
+@pytest.mark.asyncio
+async def test_autocommit_session_commits_each_write(monkeypatch):
+    from app.database import database as db
+
+    session = RecordingSession()
+    monkeypatch.setattr(db, "AsyncSessionLocal", lambda: session)
+
+    agen = db.get_autocommit_db()
+    yielded = await agen.__anext__()
+    await db.commit_or_flush(yielded)
+    await db.commit_or_flush(yielded)
+    with pytest.raises(StopAsyncIteration):
+        await agen.__anext__()
+
+    assert session.calls == ["commit", "commit", "close"]
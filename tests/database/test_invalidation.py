@@ -0,0 +1,134 @@
+import json
+import types
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+pytestmark = pytest.mark.unit
+
+
+class FakeConnection:
+    def __init__(self, dialect):  # type: ignore[no-untyped-def]
+        self.dialect = types.SimpleNamespace(name=dialect)
+        self.executed = []
+
+    def execute(self, statement, params):  # type: ignore[no-untyped-def]
+        self.executed.append((str(statement), params))
+
+
+class FakeSession:
+    def __init__(self, dialect="postgresql"):  # type: ignore[no-untyped-def]
+        self.info = {}
+        self.bind = FakeConnection(dialect)
+
+    def connection(self):  # type: ignore[no-untyped-def]
+        return self.bind
+
+    async def flush(self):  # type: ignore[no-untyped-def]
+        pass
+
+    async def commit(self):  # type: ignore[no-untyped-def]
+        pass
+
+
+@pytest.fixture
+def invalidation(monkeypatch):  # type: ignore[no-untyped-def]
+    from app.database import invalidation as mod
+
+    monkeypatch.setattr(mod.settings, "CACHE_PG_NOTIFY", True)
+    monkeypatch.setattr(mod.settings, "ENABLE_REDIS", False)
+    return mod
+
+
+def test_publish_invalidation_collects_tags_until_commit(invalidation):
+    session = FakeSession()
+
+    invalidation.publish_invalidation(session, "user:1")
+    invalidation.publish_invalidation(session, "user:1", "sessions:1")
+    invalidation._notify_pending_invalidations(session)
+
+    [(sql, params)] = session.bind.executed
+    assert "pg_notify" in sql
+    assert params["channel"] == invalidation.INVALIDATION_CHANNEL
+    assert json.loads(params["payload"]) == {"tags": ["sessions:1", "user:1"]}
+    assert invalidation.PENDING_INVALIDATIONS_KEY not in session.info
+
+    # Nothing pending, nothing sent
+    invalidation._notify_pending_invalidations(session)
+    assert len(session.bind.executed) == 1
+
+
+def test_publish_invalidation_is_skipped_without_the_bus(invalidation, monkeypatch):
+    # Sessions without info (test doubles) are ignored
+    invalidation.publish_invalidation(object(), "user:1")
+
+    monkeypatch.setattr(invalidation.settings, "ENABLE_REDIS", True)
+    monkeypatch.setattr(invalidation.settings, "CACHE_BACKEND", "tiered")
+    session = FakeSession()
+    invalidation.publish_invalidation(session, "user:1")
+    assert session.info == {}
+
+    monkeypatch.setattr(invalidation.settings, "CACHE_PG_NOTIFY", False)
+    monkeypatch.setattr(invalidation.settings, "ENABLE_REDIS", False)
+    invalidation.publish_invalidation(session, "user:1")
+    assert session.info == {}
+
+
+def test_other_dialects_send_nothing(invalidation):
+    session = FakeSession(dialect="sqlite")
+
+    invalidation.publish_invalidation(session, "user:1")
+    invalidation._notify_pending_invalidations(session)
+
+    assert session.bind.executed == []
+    assert invalidation.PENDING_INVALIDATIONS_KEY not in session.info
+
+
+def test_oversized_payload_becomes_a_full_flush(invalidation):
+    tags = [f"user:{i:032d}" for i in range(400)]
+
+    assert json.loads(invalidation.build_payload(tags)) == {"clear": True}
+    assert json.loads(invalidation.build_payload(tags[:2])) == {"tags": tags[:2]}
+
+
+def test_session_events_send_on_commit_and_discard_on_rollback(invalidation):
+    session = Session(create_engine("sqlite://"))
+
+    session.execute(text("SELECT 1"))
+    invalidation.publish_invalidation(session, "user:1")
+    session.rollback()
+    assert invalidation.PENDING_INVALIDATIONS_KEY not in session.info
+
+    invalidation.publish_invalidation(session, "user:2")
+    session.commit()
+    assert invalidation.PENDING_INVALIDATIONS_KEY not in session.info
+    session.close()
+
+
+@pytest.mark.asyncio
+async def test_crud_mutations_publish_invalidations(invalidation, monkeypatch):
+    from app.crud.auth import api_key as crud_api_key
+    from app.crud.auth import user as crud_user
+
+    user = types.SimpleNamespace(is_verified=False)
+    key = types.SimpleNamespace(id="k1", user_id="u1", is_active=True)
+
+    async def fake_get_user_by_id(_db, _user_id):  # type: ignore[no-untyped-def]
+        return user
+
+    async def fake_get_api_key_by_id(_db, _key_id, _user_id=None):  # type: ignore[no-untyped-def]
+        return key
+
+    monkeypatch.setattr(crud_user, "get_user_by_id", fake_get_user_by_id)
+    monkeypatch.setattr(crud_api_key, "get_api_key_by_id", fake_get_api_key_by_id)
+    session = FakeSession()
+
+    assert await crud_user.verify_user(session, "u1") is True
+    assert await crud_api_key.deactivate_api_key(session, "k1") is True
+
+    assert session.info[invalidation.PENDING_INVALIDATIONS_KEY] == {
+        "user:u1",
+        "api_key:k1",
+        "api_keys:u1",
+    }
@@ -0,0 +1,193 @@
+import asyncio
+import types
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+class FakeConnection:
+    def __init__(self, engine, behaviour):  # type: ignore[no-untyped-def]
+        self.engine = engine
+        self.behaviour = behaviour
+        self.invalidated = False
+        self.closed = False
+
+    async def exec_driver_sql(self, sql):  # type: ignore[no-untyped-def]
+        if isinstance(self.behaviour, BaseException):
+            raise self.behaviour
+        if self.behaviour == "hang":
+            await asyncio.sleep(10)
+        return types.SimpleNamespace(scalar=lambda: self.behaviour == "standby")
+
+    async def invalidate(self):  # type: ignore[no-untyped-def]
+        self.invalidated = True
+
+    async def close(self):  # type: ignore[no-untyped-def]
+        self.closed = True
+        self.engine.held -= 1
+
+
+class FakePool:
+    def __init__(self, idle):  # type: ignore[no-untyped-def]
+        self.idle = idle
+
+    def checkedin(self):  # type: ignore[no-untyped-def]
+        return self.idle
+
+
+class FakeEngine:
+    def __init__(self, behaviours):  # type: ignore[no-untyped-def]
+        self.pool = FakePool(len(behaviours))
+        self.connections = [FakeConnection(self, b) for b in behaviours]
+        self.disposed = False
+        self.held = 0
+        self.max_held = 0
+        self._unused = iter(self.connections)
+
+    async def connect(self):  # type: ignore[no-untyped-def]
+        self.held += 1
+        self.max_held = max(self.max_held, self.held)
+        return next(self._unused)
+
+    async def dispose(self):  # type: ignore[no-untyped-def]
+        self.disposed = True
+
+
+@pytest.fixture
+def checker(monkeypatch):  # type: ignore[no-untyped-def]
+    from app.database import pool_checker
+
+    monkeypatch.setattr(
+        pool_checker,
+        "pool_checker_stats",
+        pool_checker.PoolCheckerStats(),
+    )
+    monkeypatch.setattr(pool_checker.settings, "DB_POOL_CHECK_TIMEOUT", 0.01)
+    return pool_checker
+
+
+def _use_engine(monkeypatch, checker, behaviours):  # type: ignore[no-untyped-def]
+    engine = FakeEngine(behaviours)
+    monkeypatch.setattr(checker, "engine", engine)
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_check_pool_pings_each_idle_connection(monkeypatch, checker):
+    engine = _use_engine(monkeypatch, checker, ["primary", "primary"])
+
+    await checker.check_pool()
+
+    stats = checker.pool_checker_stats
+    assert stats.checks == 1 and stats.evicted == 0
+    assert stats.last_check_at is not None
+    assert all(c.closed and not c.invalidated for c in engine.connections)
+    assert engine.disposed is False
+    # Never more than one idle connection is taken from requests
+    assert engine.max_held == 1
+
+
+@pytest.mark.asyncio
+async def test_check_pool_stops_when_requests_take_the_idle_connections(
+    monkeypatch,
+    checker,
+):
+    engine = _use_engine(monkeypatch, checker, ["primary", "primary", "primary"])
+    ping = checker._ping
+
+    async def ping_then_lose_the_rest(connection):  # type: ignore[no-untyped-def]
+        # Requests check out the remaining idle connections meanwhile
+        engine.pool.idle = 0
+        return await ping(connection)
+
+    monkeypatch.setattr(checker, "_ping", ping_then_lose_the_rest)
+
+    await checker.check_pool()
+
+    # No new connection is opened just to be pinged
+    assert [c.closed for c in engine.connections] == [True, False, False]
+    assert engine.held == 0
+
+
+@pytest.mark.asyncio
+async def test_check_pool_evicts_dead_and_unresponsive_connections(
+    monkeypatch,
+    checker,
+):
+    engine = _use_engine(
+        monkeypatch,
+        checker,
+        ["primary", OSError("connection reset"), "hang"],
+    )
+
+    await checker.check_pool()
+
+    assert [c.invalidated for c in engine.connections] == [False, True, True]
+    assert all(c.closed for c in engine.connections)
+    assert checker.pool_checker_stats.evicted == 2
+    assert checker.pool_checker_stats.pool_invalidations == 0
+    assert engine.disposed is False
+
+
+@pytest.mark.asyncio
+async def test_check_pool_counts_disconnect_as_pool_invalidation(monkeypatch, checker):
+    from sqlalchemy.exc import DBAPIError
+
+    disconnect = DBAPIError(
+        "SELECT",
+        {},
+        Exception("gone"),
+        connection_invalidated=True,
+    )
+    engine = _use_engine(monkeypatch, checker, [disconnect])
+
+    await checker.check_pool()
+
+    # SQLAlchemy already invalidated the connection and the pool
+    assert engine.connections[0].invalidated is False
+    assert checker.pool_checker_stats.evicted == 1
+    assert checker.pool_checker_stats.pool_invalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_check_pool_invalidates_pool_after_failover(monkeypatch, checker):
+    engine = _use_engine(monkeypatch, checker, ["primary", "standby", "primary"])
+
+    await checker.check_pool()
+
+    assert engine.disposed is True
+    assert checker.pool_checker_stats.pool_invalidations == 1
+    assert checker.pool_checker_stats.recycled == 3
+
+
+@pytest.mark.asyncio
+async def test_check_pool_skips_empty_pool(monkeypatch, checker):
+    engine = _use_engine(monkeypatch, checker, [])
+
+    await checker.check_pool()
+
+    assert checker.pool_checker_stats.checks == 1
+    assert engine.disposed is False
+
+
+@pytest.mark.asyncio
+async def test_start_and_stop_pool_checker(monkeypatch, checker):
+    checks = []
+
+    async def fake_check_pool():  # type: ignore[no-untyped-def]
+        checks.append(True)
+        raise RuntimeError("database down")
+
+    monkeypatch.setattr(checker, "check_pool", fake_check_pool)
+    monkeypatch.setattr(checker.settings, "DB_POOL_CHECK_INTERVAL", 0)
+
+    checker.start_pool_checker()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    await checker.stop_pool_checker()
+
+    # Failed checks are recorded and the loop keeps going
+    assert len(checks) > 1
+    assert checker.pool_checker_stats.last_error == "database down"
+    assert checker._checker_task is None
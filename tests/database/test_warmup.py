@@ -0,0 +1,141 @@
+import asyncio
+import types
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+class FakeDriver:
+    pass
+
+
+class FakeConnection:
+    def __init__(self, opened):  # type: ignore[no-untyped-def]
+        self.opened = opened
+        self.driver = FakeDriver()
+        self.closed = False
+
+    async def get_raw_connection(self):  # type: ignore[no-untyped-def]
+        # Every connection must be open before any is released
+        assert len(self.opened) == self.expected
+        return types.SimpleNamespace(driver_connection=self.driver)
+
+    async def close(self):  # type: ignore[no-untyped-def]
+        self.closed = True
+
+
+def _fake_engine(count):  # type: ignore[no-untyped-def]
+    opened = []
+
+    async def connect():  # type: ignore[no-untyped-def]
+        await asyncio.sleep(0)
+        connection = FakeConnection(opened)
+        connection.expected = count
+        opened.append(connection)
+        return connection
+
+    return types.SimpleNamespace(connect=connect), opened
+
+
+@pytest.mark.asyncio
+async def test_warm_up_pool_holds_connections_and_prepares_statements(monkeypatch):
+    from app.database import warmup
+
+    fake_engine, opened = _fake_engine(3)
+    prepared = []
+
+    async def fake_prepare(driver):  # type: ignore[no-untyped-def]
+        prepared.append(driver)
+
+    monkeypatch.setattr(warmup, "engine", fake_engine)
+    monkeypatch.setattr(warmup, "prepare_fast_path_statements", fake_prepare)
+    monkeypatch.setattr(warmup.settings, "DB_POOL_SIZE", 3)
+    monkeypatch.setattr(warmup.settings, "ENABLE_DB_FAST_PATH", True)
+
+    # Capped at the pool size
+    assert await warmup.warm_up_pool(10) == 3
+    assert [c.driver for c in opened] == prepared
+    assert all(c.closed for c in opened)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_pool_skips_statements_without_the_fast_path(monkeypatch):
+    from app.database import warmup
+
+    fake_engine, opened = _fake_engine(2)
+
+    async def fail_prepare(driver):  # type: ignore[no-untyped-def]
+        raise AssertionError("prepared fast-path statements")
+
+    monkeypatch.setattr(warmup, "engine", fake_engine)
+    monkeypatch.setattr(warmup, "prepare_fast_path_statements", fail_prepare)
+    monkeypatch.setattr(warmup.settings, "DB_POOL_SIZE", 5)
+    monkeypatch.setattr(warmup.settings, "ENABLE_DB_FAST_PATH", False)
+
+    assert await warmup.warm_up_pool(2) == 2
+    assert all(c.closed for c in opened)
+
+
+@pytest.mark.asyncio
+async def test_readiness_waits_for_background_warmup(monkeypatch):
+    from app.database import warmup
+
+    release = asyncio.Event()
+
+    async def slow_pool(connections):  # type: ignore[no-untyped-def]
+        await release.wait()
+        return connections
+
+    async def no_redis():  # type: ignore[no-untyped-def]
+        return None
+
+    monkeypatch.setattr(warmup, "warm_up_pool", slow_pool)
+    monkeypatch.setattr(warmup, "warm_up_redis", no_redis)
+    monkeypatch.setattr(warmup.settings, "DB_WARMUP_CONNECTIONS", 2)
+
+    warmup.start_warmup()
+    await asyncio.sleep(0)
+    assert warmup.is_warmed_up() is False
+
+    release.set()
+    await warmup.warmup_state.task
+    assert warmup.is_warmed_up() is True
+    assert warmup.warmup_state.connections == 2
+    assert warmup.warmup_state.error is None
+
+
+@pytest.mark.asyncio
+async def test_failed_warmup_still_finishes(monkeypatch):
+    from app.database import warmup
+
+    async def broken_pool(connections):  # type: ignore[no-untyped-def]
+        raise ConnectionRefusedError("db down")
+
+    async def no_redis():  # type: ignore[no-untyped-def]
+        return None
+
+    monkeypatch.setattr(warmup, "warm_up_pool", broken_pool)
+    monkeypatch.setattr(warmup, "warm_up_redis", no_redis)
+
+    warmup.start_warmup()
+    await warmup.warmup_state.task
+
+    assert warmup.is_warmed_up() is True
+    assert warmup.warmup_state.error == "db down"
+
+
+@pytest.mark.asyncio
+async def test_stop_warmup_cancels_pending_task(monkeypatch):
+    from app.database import warmup
+
+    async def hang(connections):  # type: ignore[no-untyped-def]
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(warmup, "warm_up_pool", hang)
+
+    warmup.start_warmup()
+    await warmup.stop_warmup()
+
+    assert warmup.is_warmed_up() is True
+    assert warmup.warmup_state.task is None
@@ -40,3 +40,20 @@ def test_soft_delete_restore_and_queries():
     assert isinstance(Dummy.get_active_query(), Select)
     assert isinstance(Dummy.get_deleted_query(), Select)
     assert isinstance(Dummy.get_all_query(), Select)
+
+
+def test_apply_column_defaults_fills_only_unset_columns():
+    from app.models import APIKey
+    from app.models.core.base import apply_column_defaults
+
+    api_key = APIKey()
+    api_key.is_active = False
+    apply_column_defaults(api_key)
+
+    assert isinstance(api_key.id, uuid.UUID)
+    assert api_key.created_at is not None
+    assert api_key.updated_at is not None
+    assert api_key.scopes == []
+    assert api_key.is_deleted is False
+    # Explicitly set values win over defaults
+    assert api_key.is_active is False
@@ -24,3 +24,14 @@ def test_audit_log_helpers():
     AuditLog.add_context.__get__(log, AuditLog)("k", 1)
     assert AuditLog.get_context.__get__(log, AuditLog)("k") == 1
     assert AuditLog.get_context.__get__(log, AuditLog)("missing", 42) == 42
+
+
+def test_audit_rollup_primary_key_covers_range_reads():
+    from app.models.system.audit_rollup import AuditLogRollup, AuditRollupWatermark
+
+    assert [c.name for c in AuditLogRollup.__table__.primary_key] == [
+        "rollup",
+        "bucket_start",
+        "dimension",
+    ]
+    assert [c.name for c in AuditRollupWatermark.__table__.primary_key] == ["rollup"]
@@ -341,7 +341,7 @@ class TestBootstrapSuperuser:
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = [existing_superuser]
 
-        with patch("app.bootstrap_superuser.get_db") as mock_get_db:
+        with patch("app.bootstrap_superuser.get_autocommit_db") as mock_get_db:
             mock_get_db.return_value.__aiter__.return_value = [mock_db]
 
             with patch.object(mock_db, "execute") as mock_execute:
@@ -361,7 +361,7 @@ class TestBootstrapSuperuser:
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = []
 
-        with patch("app.bootstrap_superuser.get_db") as mock_get_db:
+        with patch("app.bootstrap_superuser.get_autocommit_db") as mock_get_db:
             mock_get_db.return_value.__aiter__.return_value = [mock_db]
 
             with patch.object(mock_db, "execute") as mock_execute:
@@ -389,7 +389,7 @@ class TestBootstrapSuperuser:
         mock_result = MagicMock()
         mock_result.scalars.return_value.all.return_value = []
 
-        with patch("app.bootstrap_superuser.get_db") as mock_get_db:
+        with patch("app.bootstrap_superuser.get_autocommit_db") as mock_get_db:
             mock_get_db.return_value.__aiter__.return_value = [mock_db]
 
             with patch.object(mock_db, "execute") as mock_execute:
@@ -413,7 +413,7 @@ class TestBootstrapSuperuser:
         """Test bootstrap with database exception."""
         mock_db = AsyncMock()
 
-        with patch("app.bootstrap_superuser.get_db") as mock_get_db:
+        with patch("app.bootstrap_superuser.get_autocommit_db") as mock_get_db:
             mock_get_db.return_value.__aiter__.return_value = [mock_db]
 
             with patch.object(mock_db, "execute") as mock_execute:
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from app.core.security.security import fingerprint_api_key
+
+pytestmark = pytest.mark.unit
+
+
+class FakeListenConnection:
+    """Stand-in for the asyncpg calls the listener makes."""
+
+    def __init__(self):  # type: ignore[no-untyped-def]
+        self.listeners = {}
+        self.termination_listeners = []
+        self.closed = False
+
+    async def add_listener(self, channel, callback):  # type: ignore[no-untyped-def]
+        self.listeners[channel] = callback
+
+    def add_termination_listener(self, callback):  # type: ignore[no-untyped-def]
+        self.termination_listeners.append(callback)
+
+    def is_closed(self):  # type: ignore[no-untyped-def]
+        return self.closed
+
+    async def fetchval(self, sql):  # type: ignore[no-untyped-def]
+        return 1
+
+    async def close(self, timeout=None):  # type: ignore[no-untyped-def]
+        self.closed = True
+
+    def terminate(self):  # type: ignore[no-untyped-def]
+        self.closed = True
+        for callback in self.termination_listeners:
+            callback(self)
+
+    def notify(self, channel, payload):  # type: ignore[no-untyped-def]
+        self.listeners[channel](self, 1, channel, payload)
+
+
+async def _settle():  # type: ignore[no-untyped-def]
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_listener_loads_the_filter_and_drops_it_when_disconnected(
+    monkeypatch,
+):
+    from app.database.api_key_filter import API_KEY_CHANNEL, api_key_filter
+    from app.services.auth import api_key_filter_listener as listener
+
+    connections = []
+    attempts = []
+    live = fingerprint_api_key("sk_live")
+    created = fingerprint_api_key("sk_created")
+
+    async def fake_connect(dsn, **kwargs):  # type: ignore[no-untyped-def]
+        attempts.append(dsn)
+        if len(attempts) > 1:
+            raise OSError("connection refused")
+        connection = FakeListenConnection()
+        connections.append(connection)
+        return connection
+
+    async def fake_rebuild():  # type: ignore[no-untyped-def]
+        api_key_filter.begin_rebuild()
+        api_key_filter.finish_rebuild([live])
+
+    monkeypatch.setattr(listener.asyncpg, "connect", fake_connect)
+    monkeypatch.setattr(listener, "rebuild_api_key_filter", fake_rebuild)
+    monkeypatch.setattr(listener, "RECONNECT_DELAY", 0)
+
+    listener.start_api_key_filter_listener()
+    try:
+        await _settle()
+        assert api_key_filter.ready
+        assert api_key_filter.might_exist(live)
+        assert not api_key_filter.might_exist(created)
+
+        # Keys created by other workers
+        connections[0].notify(API_KEY_CHANNEL, created)
+        assert api_key_filter.might_exist(created)
+
+        # Notifications may be missed while disconnected: look everything up
+        connections[0].terminate()
+        await _settle()
+        assert len(attempts) > 1
+        assert not api_key_filter.ready
+        assert api_key_filter.might_exist(fingerprint_api_key("sk_scan"))
+    finally:
+        await listener.stop_api_key_filter_listener()
+        api_key_filter.__init__()
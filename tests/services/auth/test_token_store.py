@@ -0,0 +1,206 @@
+from datetime import timedelta
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+class FakeSavepoint:
+    rolled_back = False
+
+    async def __aenter__(self):  # type: ignore[no-untyped-def]
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+        self.rolled_back = exc_type is not None
+        return False
+
+
+class SavepointSession:
+    """Session stand-in that only supports begin_nested()."""
+
+    def __init__(self):  # type: ignore[no-untyped-def]
+        self.savepoint = FakeSavepoint()
+
+    def begin_nested(self):  # type: ignore[no-untyped-def]
+        return self.savepoint
+
+    async def rollback(self):  # type: ignore[no-untyped-def]
+        raise AssertionError("rolled back the whole transaction")
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio calls the token store uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    async def set(self, key, value, ex=None, get=False):  # type: ignore[no-untyped-def]
+        previous = self.data.get(key)
+        self.data[key] = value
+        self.ttls[key] = ex
+        return previous if get else True
+
+    async def getdel(self, key):  # type: ignore[no-untyped-def]
+        self.ttls.pop(key, None)
+        return self.data.pop(key, None)
+
+    async def delete(self, *keys):  # type: ignore[no-untyped-def]
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def pipeline(self, transaction=True):  # type: ignore[no-untyped-def]
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        self.calls.append((args, kwargs))
+
+    async def execute(self):
+        return [await self.client.set(*args, **kwargs) for args, kwargs in self.calls]
+
+
+@pytest.mark.asyncio
+async def test_redis_store_keeps_only_fingerprints_with_ttl():
+    from app.services.auth.token_store import RedisTokenStore, TokenPurpose
+
+    client = FakeRedis()
+    store = RedisTokenStore(client)
+    ttl = timedelta(hours=1)
+
+    assert await store.issue(None, TokenPurpose.VERIFICATION, "u1", "raw-token", ttl)
+
+    assert not any("raw-token" in key for key in client.data)
+    assert "raw-token" not in client.data.values()
+    assert set(client.ttls.values()) == {ttl}
+
+
+@pytest.mark.asyncio
+async def test_redis_store_tokens_are_single_use_and_purpose_bound():
+    from app.services.auth.token_store import RedisTokenStore, TokenPurpose
+
+    store = RedisTokenStore(FakeRedis())
+    ttl = timedelta(hours=1)
+    await store.issue(None, TokenPurpose.PASSWORD_RESET, "u1", "tok", ttl)
+
+    assert await store.consume(None, TokenPurpose.VERIFICATION, "tok") is None
+    assert await store.consume(None, TokenPurpose.PASSWORD_RESET, "tok") == "u1"
+    assert await store.consume(None, TokenPurpose.PASSWORD_RESET, "tok") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_store_new_token_and_revoke_invalidate_previous():
+    from app.services.auth.token_store import RedisTokenStore, TokenPurpose
+
+    store = RedisTokenStore(FakeRedis())
+    ttl = timedelta(hours=1)
+    await store.issue(None, TokenPurpose.DELETION, "u1", "first", ttl)
+    await store.issue(None, TokenPurpose.DELETION, "u1", "second", ttl)
+
+    assert await store.consume(None, TokenPurpose.DELETION, "first") is None
+
+    await store.revoke(None, TokenPurpose.DELETION, "u1")
+    assert await store.consume(None, TokenPurpose.DELETION, "second") is None
+
+
+@pytest.mark.asyncio
+async def test_database_store_hashes_tokens(monkeypatch):
+    from app.core.security.security import fingerprint_one_time_token
+    from app.services.auth import token_store as mod
+
+    calls = []
+
+    async def fake_upsert(db, purpose, user_id, token_hash, expires_at):  # type: ignore[no-untyped-def]
+        calls.append(("upsert", purpose, user_id, token_hash))
+
+    async def fake_consume(db, purpose, token_hash):  # type: ignore[no-untyped-def]
+        calls.append(("consume", purpose, token_hash))
+        return "00000000-0000-0000-0000-000000000001"
+
+    monkeypatch.setattr(mod, "upsert_one_time_token", fake_upsert)
+    monkeypatch.setattr(mod, "consume_one_time_token", fake_consume)
+
+    store = mod.DatabaseTokenStore()
+    purpose = mod.TokenPurpose.VERIFICATION
+    db = SavepointSession()
+    assert await store.issue(db, purpose, "u1", "tok", timedelta(hours=1))
+    assert (
+        await store.consume(None, purpose, "tok")
+        == "00000000-0000-0000-0000-000000000001"
+    )
+    assert db.savepoint.rolled_back is False
+
+    fingerprint = fingerprint_one_time_token("tok")
+    assert calls == [
+        ("upsert", "verification", "u1", fingerprint),
+        ("consume", "verification", fingerprint),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_database_store_issue_for_missing_user_fails(monkeypatch):
+    from sqlalchemy.exc import IntegrityError
+
+    from app.services.auth import token_store as mod
+
+    async def fake_upsert(*args):  # type: ignore[no-untyped-def]
+        raise IntegrityError("INSERT", {}, Exception("fk violation"))
+
+    monkeypatch.setattr(mod, "upsert_one_time_token", fake_upsert)
+    db = SavepointSession()
+
+    issued = await mod.DatabaseTokenStore().issue(
+        db,
+        mod.TokenPurpose.DELETION,
+        "missing",
+        "tok",
+        timedelta(hours=1),
+    )
+
+    assert issued is False
+    assert db.savepoint.rolled_back is True
+
+
+def test_get_token_store_falls_back_to_database(monkeypatch):
+    from app.services.auth import token_store as mod
+    from app.services.external import redis as redis_service
+
+    monkeypatch.setattr(mod.settings, "ENABLE_REDIS", True)
+    monkeypatch.setattr(mod.settings, "TOKEN_STORE_BACKEND", "redis")
+
+    monkeypatch.setattr(redis_service, "redis_client", None)
+    assert isinstance(mod.get_token_store(), mod.DatabaseTokenStore)
+
+    monkeypatch.setattr(redis_service, "redis_client", FakeRedis())
+    assert isinstance(mod.get_token_store(), mod.RedisTokenStore)
+
+    monkeypatch.setattr(mod.settings, "TOKEN_STORE_BACKEND", "database")
+    assert isinstance(mod.get_token_store(), mod.DatabaseTokenStore)
+
+
+@pytest.mark.asyncio
+async def test_email_service_issues_and_consumes_through_store(monkeypatch):
+    from app.services.auth.token_store import RedisTokenStore
+    from app.services.external import email as email_mod
+
+    store = RedisTokenStore(FakeRedis())
+    monkeypatch.setattr(email_mod, "get_token_store", lambda: store)
+    service = email_mod.EmailService()
+
+    token = await service.create_password_reset_token(None, "u1")
+
+    assert token is not None
+    assert await service.verify_token(None, token) is None
+    assert await service.verify_password_reset_token(None, token) == "u1"
+    assert await service.verify_password_reset_token(None, token) is None
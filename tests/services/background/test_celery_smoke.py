@@ -23,3 +23,50 @@ def test_submit_task_eager_mode(monkeypatch):
     celery_app.conf.task_always_eager = True
     res = celery_service.submit_task("app.services.celery_tasks.cleanup_task")
     assert res is not None
+
+
+def test_refresh_audit_rollups_task_refreshes_each_rollup(monkeypatch):
+    from app.crud.system import audit_rollup
+    from app.database import database
+    from app.services.background.celery_tasks import refresh_audit_rollups_task
+
+    class FakeSession:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def rollback(self):
+            pass
+
+    async def fake_refresh(db, name):
+        if name == "api_key_usage_per_key_hour":
+            raise RuntimeError("boom")
+        return 2
+
+    monkeypatch.setattr(database, "AsyncSessionLocal", FakeSession)
+    monkeypatch.setattr(audit_rollup, "refresh_audit_rollup", fake_refresh)
+
+    result = refresh_audit_rollups_task.run()
+
+    assert result == {
+        "status": "partial",
+        "buckets_updated": {"failed_logins_per_ip_minute": 2},
+    }
+
+
+def test_audit_rollups_are_scheduled():
+    from app.services.background.celery_app import celery_app
+
+    entry = celery_app.conf.beat_schedule["refresh-audit-rollups"]
+    assert entry["task"] == "app.services.celery_tasks.refresh_audit_rollups_task"
+
+
+def test_expired_one_time_token_purge_is_scheduled():
+    from app.services.background.celery_app import celery_app
+
+    entry = celery_app.conf.beat_schedule["purge-expired-one-time-tokens"]
+    assert (
+        entry["task"] == "app.services.celery_tasks.purge_expired_one_time_tokens_task"
+    )
@@ -0,0 +1,720 @@
+import asyncio
+import json
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio calls the cache uses."""
+
+    def __init__(self, broker=None):  # type: ignore[no-untyped-def]
+        self.data = {}
+        self.ttls = {}
+        # Clients sharing a broker see each other's pub/sub messages
+        self.broker = broker if broker is not None else []
+
+    async def get(self, key):  # type: ignore[no-untyped-def]
+        return self.data.get(key)
+
+    async def mget(self, keys):  # type: ignore[no-untyped-def]
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None, nx=False):  # type: ignore[no-untyped-def]
+        if nx and key in self.data:
+            return None
+        self.data[key] = str(value)
+        self.ttls[key] = ex
+        return True
+
+    async def incr(self, key):  # type: ignore[no-untyped-def]
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    async def expire(self, key, seconds, nx=False, gt=False):  # type: ignore[no-untyped-def]
+        current = self.ttls.get(key)
+        if (nx and current is None) or (
+            gt and current is not None and seconds > current
+        ):
+            self.ttls[key] = seconds
+
+    async def delete(self, *keys):  # type: ignore[no-untyped-def]
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def scan_iter(self, match, count=None):  # type: ignore[no-untyped-def]
+        prefix = match.rstrip("*")
+        for key in list(self.data):
+            if key.startswith(prefix):
+                yield key
+
+    async def publish(self, channel, message):  # type: ignore[no-untyped-def]
+        for pubsub in self.broker:
+            if channel in pubsub.channels:
+                pubsub.queue.put_nowait(
+                    {"type": "message", "channel": channel, "data": message},
+                )
+
+    def pubsub(self):  # type: ignore[no-untyped-def]
+        return FakePubSub(self.broker)
+
+    def pipeline(self, transaction=True):  # type: ignore[no-untyped-def]
+        return FakePipeline(self)
+
+
+class FakePubSub:
+    def __init__(self, broker):  # type: ignore[no-untyped-def]
+        self.broker = broker
+        self.channels = set()
+        self.queue = asyncio.Queue()
+        self.closed = False
+
+    async def subscribe(self, channel):  # type: ignore[no-untyped-def]
+        self.channels.add(channel)
+        self.broker.append(self)
+        self.queue.put_nowait({"type": "subscribe", "channel": channel, "data": 1})
+
+    async def listen(self):  # type: ignore[no-untyped-def]
+        while True:
+            message = await self.queue.get()
+            if isinstance(message, BaseException):
+                raise message
+            yield message
+
+    async def close(self):  # type: ignore[no-untyped-def]
+        self.closed = True
+        self.broker.remove(self)
+
+
+class FakePipeline:
+    def __init__(self, client):  # type: ignore[no-untyped-def]
+        self.client = client
+        self.calls = []
+
+    async def __aenter__(self):  # type: ignore[no-untyped-def]
+        return self
+
+    async def __aexit__(self, *exc):  # type: ignore[no-untyped-def]
+        return False
+
+    def __getattr__(self, name):  # type: ignore[no-untyped-def]
+        def queue(*args, **kwargs):  # type: ignore[no-untyped-def]
+            self.calls.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self):  # type: ignore[no-untyped-def]
+        return [
+            await getattr(self.client, name)(*args, **kwargs)
+            for name, args, kwargs in self.calls
+        ]
+
+
+@pytest.fixture
+def cache_mod(monkeypatch):  # type: ignore[no-untyped-def]
+    from app.services.cache import cache as mod
+
+    monkeypatch.setattr(mod, "_caches", {})
+    monkeypatch.setattr(mod.settings, "ENABLE_REDIS", False)
+    return mod
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_least_recently_used():
+    from app.services.cache import MISSING, MemoryCacheBackend
+
+    backend = MemoryCacheBackend(max_entries=2, max_bytes=1_000_000)
+    await backend.set("a", 1, 60)
+    await backend.set("b", 2, 60)
+    assert await backend.get("a") == 1
+    await backend.set("c", 3, 60)
+
+    assert await backend.get("b") is MISSING
+    assert await backend.get("a") == 1
+    assert backend.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_respects_memory_cap():
+    from app.services.cache import MISSING, MemoryCacheBackend
+
+    backend = MemoryCacheBackend(max_entries=100, max_bytes=20_000)
+    for i in range(10):
+        await backend.set(f"k{i}", "x" * 5_000, 60)
+
+    assert backend.bytes <= 20_000
+    assert backend.stats()["evictions"] > 0
+    assert await backend.get("k9") != MISSING
+
+    # A value larger than the whole cache isn't stored
+    await backend.set("huge", "x" * 50_000, 60)
+    assert await backend.get("huge") is MISSING
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_expires_entries(monkeypatch):
+    from app.services.cache import MISSING, MemoryCacheBackend, backends
+
+    now = [1000.0]
+    monkeypatch.setattr(backends.time, "monotonic", lambda: now[0])
+    backend = MemoryCacheBackend(max_entries=10, max_bytes=1_000_000)
+    await backend.set("short", "v", 5)
+    await backend.set("long", "v", 60)
+
+    now[0] += 10
+    assert await backend.get("short") is MISSING
+    assert await backend.get("long") == "v"
+    assert backend.stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_invalidates_tags():
+    from app.services.cache import MISSING, MemoryCacheBackend
+
+    backend = MemoryCacheBackend(max_entries=10, max_bytes=1_000_000)
+    await backend.set("u1:profile", 1, 60, tags=["user:1"])
+    await backend.set("u1:keys", 2, 60, tags=["user:1", "api_keys"])
+    await backend.set("u2:profile", 3, 60, tags=["user:2"])
+
+    await backend.invalidate_tags(["user:1"])
+    assert await backend.get("u1:profile") is MISSING
+    assert await backend.get("u1:keys") is MISSING
+    assert await backend.get("u2:profile") == 3
+    assert backend.stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_round_trips_json_and_versions_tags():
+    from app.services.cache import MISSING, RedisCacheBackend
+
+    client = FakeRedis()
+    backend = RedisCacheBackend(client)
+    await backend.set("a", {"id": 1, "tags": ["x"]}, 30, tags=["user:1"])
+    await backend.set("b", None, 90, tags=["user:1"])
+    await backend.set("c", "other", 30, tags=["user:2"])
+
+    assert await backend.get("a") == {"id": 1, "tags": ["x"]}
+    assert await backend.get("b") is None
+    assert client.ttls["cache:a"] == 30
+    # The tag version outlives every value that references it
+    assert client.ttls["cache:version:user:1"] == 90
+
+    # Invalidation bumps the version instead of finding the keys
+    await backend.invalidate_tags(["user:1"])
+    assert client.data["cache:version:user:1"] == "1"
+    assert await backend.get("a") is MISSING
+    assert await backend.get("b") is MISSING
+    assert await backend.get("c") == "other"
+    assert backend.stats()["stale_reads"] == 2
+
+    # Values written after the invalidation carry the new version
+    await backend.set("a", {"id": 1}, 30, tags=["user:1"])
+    assert await backend.get("a") == {"id": 1}
+
+    await backend.clear()
+    assert client.data == {}
+
+
+def test_cache_key_skips_sessions_and_rejects_unstable_arguments():
+    import inspect
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.services.cache import build_cache_key
+
+    class FakeSession:
+        pass
+
+    async def lookup(db, user_id, include=("a",)):  # type: ignore[no-untyped-def]
+        return None
+
+    signature = inspect.signature(lookup)
+    first = build_cache_key(lookup, signature, (AsyncSession(), "u1"), {})
+    second = build_cache_key(lookup, signature, (AsyncSession(),), {"user_id": "u1"})
+    other = build_cache_key(lookup, signature, (AsyncSession(), "u2"), {})
+
+    assert first == second != other
+    assert first.startswith(f"{lookup.__module__}.{lookup.__qualname__}:")
+
+    with pytest.raises(TypeError, match="key="):
+        build_cache_key(lookup, signature, (FakeSession(), "u1"), {})
+
+
+@pytest.mark.asyncio
+async def test_cached_single_flight_loads_once(cache_mod):
+    calls = []
+    release = asyncio.Event()
+
+    @cache_mod.cached(ttl=60)
+    async def load(user_id):  # type: ignore[no-untyped-def]
+        calls.append(user_id)
+        await release.wait()
+        return {"id": user_id}
+
+    tasks = [asyncio.create_task(load("u1")) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == ["u1"]
+    assert results == [{"id": "u1"}] * 5
+    stats = cache_mod.get_cache().stats()
+    assert stats["coalesced"] == 4 and stats["misses"] == 5
+
+    assert await load("u1") == {"id": "u1"}
+    assert cache_mod.get_cache().stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_load_errors_reach_waiters_and_are_not_cached(cache_mod):
+    attempts = []
+    release = asyncio.Event()
+
+    @cache_mod.cached(ttl=60)
+    async def load():  # type: ignore[no-untyped-def]
+        attempts.append(1)
+        await release.wait()
+        if len(attempts) == 1:
+            raise RuntimeError("database down")
+        return "ok"
+
+    tasks = [asyncio.create_task(load()) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert await load() == "ok"
+    assert len(attempts) == 2
+    assert cache_mod.get_cache().stats()["load_errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_load_does_not_store_stale_value(cache_mod):
+    release = asyncio.Event()
+    values = iter(["stale", "fresh"])
+
+    @cache_mod.cached(ttl=60, tags=lambda user_id: [f"user:{user_id}"])
+    async def load(user_id):  # type: ignore[no-untyped-def]
+        await release.wait()
+        return next(values)
+
+    task = asyncio.create_task(load("u1"))
+    await asyncio.sleep(0)
+    await cache_mod.get_cache().invalidate_tags(["user:u1"])
+    release.set()
+
+    assert await task == "stale"
+    assert await load("u1") == "fresh"
+
+
+@pytest.mark.asyncio
+async def test_other_workers_invalidation_during_load_reads_as_stale():
+    from app.services.cache import MISSING, RedisCacheBackend
+    from app.services.cache.cache import Cache
+
+    client = FakeRedis()
+    worker_a = Cache(RedisCacheBackend(client), 60)
+    worker_b = Cache(RedisCacheBackend(client), 60)
+    await worker_a.set("seed", 1, tags=["user:1"])
+    release = asyncio.Event()
+
+    async def load():  # type: ignore[no-untyped-def]
+        await release.wait()
+        return "old"
+
+    task = asyncio.create_task(worker_a.get_or_load("k", load, tags=["user:1"]))
+    await asyncio.sleep(0)
+    await worker_b.invalidate_tags(["user:1"])
+    release.set()
+
+    assert await task == "old"
+    # Stored with the versions read before the load, so it's already stale
+    assert await worker_b.get("k") is MISSING
+    reload = worker_a.get_or_load(
+        "k",
+        lambda: asyncio.sleep(0, result="new"),
+        tags=["user:1"],
+    )
+    assert await reload == "new"
+    assert await worker_b.get("k") == "new"
+
+
+@pytest.mark.asyncio
+async def test_backend_errors_count_as_misses(cache_mod, monkeypatch):
+    cache = cache_mod.get_cache()
+
+    async def broken(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(cache.backend, "get", broken)
+    monkeypatch.setattr(cache.backend, "set", broken)
+
+    assert await cache.get_or_load("k", lambda: asyncio.sleep(0, result=1)) == 1
+    assert cache.stats()["backend_errors"] == 2
+
+
+def test_get_cache_uses_redis_when_configured(cache_mod, monkeypatch):
+    from app.services.external import redis as redis_service
+
+    monkeypatch.setattr(cache_mod.settings, "ENABLE_REDIS", True)
+    monkeypatch.setattr(cache_mod.settings, "CACHE_BACKEND", "redis")
+
+    monkeypatch.setattr(redis_service, "redis_client", None)
+    assert cache_mod.get_cache().backend.name == "memory"
+
+    client = FakeRedis()
+    monkeypatch.setattr(redis_service, "redis_client", client)
+    cache = cache_mod.get_cache()
+    assert cache.backend.name == "redis"
+    assert cache_mod.get_cache() is cache
+
+    # A reconnected client gets a new backend
+    monkeypatch.setattr(redis_service, "redis_client", FakeRedis())
+    assert cache_mod.get_cache() is not cache
+    assert set(cache_mod.get_cache_stats()) == {"memory", "redis"}
+
+
+@pytest.mark.asyncio
+async def test_cache_status_middleware_reports_hits_and_misses(cache_mod):
+    from httpx import ASGITransport, AsyncClient
+    from starlette.applications import Starlette
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    from app.services.cache import CacheStatusMiddleware
+
+    @cache_mod.cached(ttl=60)
+    async def load():  # type: ignore[no-untyped-def]
+        return 1
+
+    async def cached_endpoint(request):  # type: ignore[no-untyped-def]
+        return JSONResponse({"value": await load()})
+
+    async def plain_endpoint(request):  # type: ignore[no-untyped-def]
+        return JSONResponse({})
+
+    app = Starlette(
+        routes=[Route("/cached", cached_endpoint), Route("/plain", plain_endpoint)],
+    )
+    app.add_middleware(CacheStatusMiddleware)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as c:
+        assert (await c.get("/cached")).headers["X-Cache-Status"] == "MISS"
+        assert (await c.get("/cached")).headers["X-Cache-Status"] == "HIT"
+        assert "X-Cache-Status" not in (await c.get("/plain")).headers
+
+
+def _tiered_worker(client, l1_ttl=30):  # type: ignore[no-untyped-def]
+    from app.services.cache import (
+        MemoryCacheBackend,
+        RedisCacheBackend,
+        TieredCacheBackend,
+    )
+
+    return TieredCacheBackend(
+        MemoryCacheBackend(max_entries=100, max_bytes=1_000_000),
+        RedisCacheBackend(client),
+        l1_ttl,
+    )
+
+
+@pytest.mark.asyncio
+async def test_tiered_backend_reads_l1_then_l2():
+    from app.services.cache import MISSING
+
+    client = FakeRedis()
+    worker_a = _tiered_worker(client)
+    worker_b = _tiered_worker(client)
+
+    await worker_a.set("profile", {"name": "a"}, 300, tags=["user:1"])
+
+    assert await worker_b.get("profile") == {"name": "a"}
+    assert await worker_b.get("profile") == {"name": "a"}
+    assert worker_b.stats()["l2_hits"] == 1
+    assert worker_b.stats()["l1_hits"] == 1
+    assert await worker_b.get("missing") is MISSING
+
+
+@pytest.mark.asyncio
+async def test_tiered_backend_publishes_invalidations_to_other_workers():
+    from app.services.cache import MISSING
+    from app.services.cache.cache import Cache
+
+    client = FakeRedis()
+    worker_a = _tiered_worker(client)
+    worker_b = _tiered_worker(client)
+    listener = client.pubsub()
+    await listener.subscribe(worker_b.channel)
+    await listener.queue.get()
+
+    await worker_a.set("profile", {"name": "a"}, 300, tags=["user:1"])
+    await worker_a.set("other", 1, 300)
+    await worker_b.get("profile")
+    await worker_b.get("other")
+
+    await worker_a.invalidate_tags(["user:1"])
+    await worker_a.delete("other")
+
+    cache_b = Cache(worker_b, 300)
+    while not listener.queue.empty():
+        message = await listener.queue.get()
+        await cache_b.apply_invalidation(json.loads(message["data"]))
+
+    assert worker_b.stats()["invalidations_received"] == 2
+    assert worker_b.l1.stats()["entries"] == 0
+    assert await worker_b.get("profile") is MISSING
+    assert await worker_b.get("other") is MISSING
+
+    # A worker ignores its own messages; it already applied them
+    await worker_a.apply_invalidation({"origin": worker_a.origin, "clear": True})
+    assert worker_a.stats()["invalidations_received"] == 0
+
+
+@pytest.mark.asyncio
+async def test_tiered_backend_missed_message_is_stale_for_l1_ttl_at_most(monkeypatch):
+    from app.services.cache import MISSING, backends
+
+    now = [1000.0]
+    monkeypatch.setattr(backends.time, "monotonic", lambda: now[0])
+    client = FakeRedis()
+    worker_a = _tiered_worker(client)
+    worker_b = _tiered_worker(client, l1_ttl=5)
+
+    await worker_a.set("profile", {"name": "old"}, 300, tags=["user:1"])
+    await worker_b.get("profile")
+
+    # worker_b isn't listening, so it misses the message
+    await worker_a.invalidate_tags(["user:1"])
+    assert await worker_b.get("profile") == {"name": "old"}
+
+    now[0] += 6
+    # The L2 copy carries the old tag version, so it isn't served either
+    assert await worker_b.get("profile") is MISSING
+
+
+@pytest.mark.asyncio
+async def test_invalidation_listener_flushes_on_subscribe_and_applies_messages(
+    cache_mod,
+    monkeypatch,
+):
+    from app.services.cache import invalidation
+    from app.services.external import redis as redis_service
+
+    client = FakeRedis()
+    monkeypatch.setattr(cache_mod.settings, "ENABLE_REDIS", True)
+    monkeypatch.setattr(cache_mod.settings, "CACHE_BACKEND", "tiered")
+    monkeypatch.setattr(redis_service, "redis_client", client)
+    monkeypatch.setattr(invalidation, "RECONNECT_DELAY", 0)
+
+    cache = cache_mod.get_cache()
+    await cache.set("stale", 1, 300)
+    other_worker = _tiered_worker(client)
+
+    invalidation.start_invalidation_listener()
+    try:
+        for _ in range(5):
+            await asyncio.sleep(0)
+        # Whatever this worker cached before subscribing may have been missed
+        assert cache.backend.l1.stats()["entries"] == 0
+
+        await cache.set("profile", 1, 300, tags=["user:1"])
+        await other_worker.invalidate_tags(["user:1"])
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert cache.backend.l1.stats()["entries"] == 0
+
+        # A dropped connection resubscribes
+        pubsub = client.broker[0]
+        pubsub.queue.put_nowait(ConnectionError("connection lost"))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert pubsub.closed
+        assert len(client.broker) == 1 and client.broker[0] is not pubsub
+    finally:
+        await invalidation.stop_invalidation_listener()
+
+
+def test_get_cache_builds_tiered_backend(cache_mod, monkeypatch):
+    from app.services.external import redis as redis_service
+
+    monkeypatch.setattr(cache_mod.settings, "ENABLE_REDIS", True)
+    monkeypatch.setattr(cache_mod.settings, "CACHE_BACKEND", "tiered")
+    monkeypatch.setattr(redis_service, "redis_client", FakeRedis())
+
+    cache = cache_mod.get_cache()
+
+    assert cache.backend.name == "tiered"
+    assert cache.backend.l1_ttl == cache_mod.settings.CACHE_L1_TTL
+    assert cache_mod.get_cache() is cache
+
+
+class FakeListenConnection:
+    """Stand-in for the asyncpg calls the Postgres listener makes."""
+
+    def __init__(self):  # type: ignore[no-untyped-def]
+        self.listeners = {}
+        self.termination_listeners = []
+        self.closed = False
+
+    async def add_listener(self, channel, callback):  # type: ignore[no-untyped-def]
+        self.listeners[channel] = callback
+
+    def add_termination_listener(self, callback):  # type: ignore[no-untyped-def]
+        self.termination_listeners.append(callback)
+
+    def is_closed(self):  # type: ignore[no-untyped-def]
+        return self.closed
+
+    async def fetchval(self, sql):  # type: ignore[no-untyped-def]
+        return 1
+
+    async def close(self, timeout=None):  # type: ignore[no-untyped-def]
+        self.closed = True
+
+    def terminate(self):  # type: ignore[no-untyped-def]
+        self.closed = True
+        for callback in self.termination_listeners:
+            callback(self)
+
+    async def notify(self, channel, payload):  # type: ignore[no-untyped-def]
+        await self.listeners[channel](self, 1, channel, payload)
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_applies_invalidation_messages():
+    from app.services.cache import MISSING, MemoryCacheBackend
+
+    backend = MemoryCacheBackend(max_entries=10, max_bytes=1_000_000)
+    await backend.set("profile", 1, 60, tags=["user:1"])
+    await backend.set("keys", 2, 60)
+    await backend.set("other", 3, 60)
+
+    await backend.apply_invalidation({"tags": ["user:1"], "keys": ["keys"]})
+    assert await backend.get("profile") is MISSING
+    assert await backend.get("keys") is MISSING
+    assert await backend.get("other") == 3
+
+    await backend.apply_invalidation({"clear": True})
+    assert backend.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pg_invalidation_listener_applies_notifications_and_reconnects(
+    cache_mod,
+    monkeypatch,
+):
+    from app.database.invalidation import INVALIDATION_CHANNEL
+    from app.services.cache import MISSING, pg_invalidation
+
+    connections = []
+    dsns = []
+
+    async def fake_connect(dsn, **kwargs):  # type: ignore[no-untyped-def]
+        dsns.append(dsn)
+        if len(dsns) == 2:
+            raise OSError("connection refused")
+        connection = FakeListenConnection()
+        connections.append(connection)
+        return connection
+
+    monkeypatch.setattr(pg_invalidation.asyncpg, "connect", fake_connect)
+    monkeypatch.setattr(
+        pg_invalidation.settings,
+        "DATABASE_URL",
+        "postgresql+asyncpg://app:secret@db/app",
+    )
+    monkeypatch.setattr(pg_invalidation.settings, "DATABASE_LISTEN_URL", None)
+    monkeypatch.setattr(pg_invalidation, "RECONNECT_DELAY", 0)
+
+    cache = cache_mod.get_cache()
+    await cache.set("stale", 1, 300)
+
+    pg_invalidation.start_pg_invalidation_listener()
+    try:
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert dsns == ["postgresql://app:secret@db/app"]
+        # Whatever was cached before listening may have been missed
+        assert cache.backend.stats()["entries"] == 0
+
+        await cache.set("profile", 1, 300, tags=["user:1"])
+        await cache.set("other", 2, 300, tags=["user:2"])
+        await connections[0].notify(
+            INVALIDATION_CHANNEL,
+            json.dumps({"tags": ["user:1"]}),
+        )
+        await connections[0].notify(INVALIDATION_CHANNEL, "not json")
+        assert await cache.get("profile") is MISSING
+        assert await cache.get("other") == 2
+
+        # A lost connection is reopened, retrying failed attempts, and the
+        # cache is flushed again
+        connections[0].terminate()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert len(dsns) == 3 and len(connections) == 2
+        assert INVALIDATION_CHANNEL in connections[1].listeners
+        assert cache.backend.stats()["entries"] == 0
+    finally:
+        await pg_invalidation.stop_pg_invalidation_listener()
+    assert connections[1].closed
+
+
+@pytest.mark.parametrize(
+    ("database_url", "listen_url", "expected_dsn", "through_pgbouncer"),
+    [
+        ("postgresql://app:pw@db/app", None, "postgresql://app:pw@db/app", False),
+        (
+            "postgresql://app:pw@pgbouncer:5432/app",
+            None,
+            "postgresql://app:pw@pgbouncer:5432/app",
+            True,
+        ),
+        (
+            "postgresql+asyncpg://app:pw@pool:6432/app",
+            None,
+            "postgresql://app:pw@pool:6432/app",
+            True,
+        ),
+        (
+            "postgresql://app:pw@pgbouncer:5432/app",
+            "postgresql+asyncpg://app:pw@postgres:5432/app",
+            "postgresql://app:pw@postgres:5432/app",
+            False,
+        ),
+    ],
+)
+def test_listener_dsn_prefers_the_direct_listen_url(
+    monkeypatch,
+    database_url,
+    listen_url,
+    expected_dsn,
+    through_pgbouncer,
+):
+    from app.services.cache import pg_invalidation
+
+    errors = []
+    monkeypatch.setattr(pg_invalidation.settings, "DATABASE_URL", database_url)
+    monkeypatch.setattr(pg_invalidation.settings, "DATABASE_LISTEN_URL", listen_url)
+    monkeypatch.setattr(
+        pg_invalidation,
+        "logger",
+        type("L", (), {"error": lambda self, *a, **k: errors.append(k)})(),
+    )
+
+    assert pg_invalidation.listener_dsn() == expected_dsn
+    assert pg_invalidation.listens_through_pgbouncer() is through_pgbouncer
+    pg_invalidation.check_listener_dsn("cache_invalidation")
+    assert errors == ([{"listener": "cache_invalidation"}] if through_pgbouncer else [])
+
+
+def test_cached_functions_are_registered(cache_mod, monkeypatch):
+    monkeypatch.setattr(cache_mod, "_cached_functions", set())
+    assert cache_mod.has_cached_functions() is False
+
+    @cache_mod.cached(ttl=60)
+    async def load(value: int) -> int:
+        return value
+
+    assert cache_mod.has_cached_functions() is True
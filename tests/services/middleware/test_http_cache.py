@@ -0,0 +1,205 @@
+import types
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import Depends, FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+pytestmark = pytest.mark.unit
+
+
+def _app():  # type: ignore[no-untyped-def]
+    from app.core.security.security_headers import configure_security_headers
+    from app.services.middleware.http_cache import (
+        PRIVATE,
+        PUBLIC,
+        SENSITIVE,
+        CachePolicy,
+        cache_policy,
+        check_not_modified,
+        configure_http_cache,
+    )
+
+    app = FastAPI()
+    configure_http_cache(app, {"/openapi.json": PUBLIC})
+    configure_security_headers(app)
+    calls = []
+
+    @app.get("/api/profile", dependencies=[Depends(cache_policy(PRIVATE))])
+    def profile():  # type: ignore[no-untyped-def]
+        calls.append("profile")
+        return {"name": "alice"}
+
+    @app.get("/api/versioned", dependencies=[Depends(cache_policy(PRIVATE))])
+    def versioned(request: Request):  # type: ignore[no-untyped-def]
+        check_not_modified(request, "user-1", "2025-01-01T00:00:00")
+        calls.append("versioned")
+        return {"name": "alice"}
+
+    @app.get(
+        "/api/config",
+        dependencies=[Depends(cache_policy(CachePolicy(max_age=60, public=True)))],
+    )
+    def config():  # type: ignore[no-untyped-def]
+        return {"feature": True}
+
+    @app.post("/api/login", dependencies=[Depends(cache_policy(SENSITIVE))])
+    def login():  # type: ignore[no-untyped-def]
+        return {"access_token": "secret"}
+
+    @app.get("/api/undeclared")
+    def undeclared():  # type: ignore[no-untyped-def]
+        return {"ok": True}
+
+    @app.get("/api/self-cached")
+    def self_cached():  # type: ignore[no-untyped-def]
+        return Response("{}", headers={"Cache-Control": "public, max-age=3600"})
+
+    return app, calls
+
+
+def test_declared_route_gets_policy_and_etag_and_answers_304():
+    app, calls = _app()
+    client = TestClient(app)
+
+    first = client.get("/api/profile")
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert "Pragma" not in first.headers
+
+    second = client.get("/api/profile", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+    assert second.headers["Cache-Control"] == "private, no-cache"
+    assert "content-type" not in second.headers
+
+    # Strong and list forms of the validator match too
+    third = client.get(
+        "/api/profile",
+        headers={"If-None-Match": f'"other", {etag.removeprefix("W/")}'},
+    )
+    assert third.status_code == 304
+
+    stale = client.get("/api/profile", headers={"If-None-Match": 'W/"other"'})
+    assert stale.status_code == 200 and stale.json() == {"name": "alice"}
+    assert calls == ["profile"] * 4
+
+
+def test_version_etag_skips_the_endpoint_body():
+    app, calls = _app()
+    client = TestClient(app)
+
+    first = client.get("/api/versioned")
+    etag = first.headers["ETag"]
+    # The endpoint's own ETag is kept rather than a body hash
+    from app.services.middleware.http_cache import weak_etag
+
+    assert etag == weak_etag("user-1", "2025-01-01T00:00:00")
+
+    second = client.get("/api/versioned", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.headers["ETag"] == etag
+    assert second.headers["Cache-Control"] == "private, no-cache"
+    assert calls == ["versioned"]
+
+
+def test_max_age_and_path_policies():
+    app, _ = _app()
+    client = TestClient(app)
+
+    assert client.get("/api/config").headers["Cache-Control"] == ("public, max-age=60")
+    schema = client.get("/openapi.json")
+    assert schema.headers["Cache-Control"] == "public, no-cache"
+    assert (
+        client.get(
+            "/openapi.json",
+            headers={"If-None-Match": schema.headers["ETag"]},
+        ).status_code
+        == 304
+    )
+
+
+def test_sensitive_and_undeclared_routes_are_not_stored():
+    app, _ = _app()
+    client = TestClient(app)
+
+    login = client.post("/api/login")
+    assert login.headers["Cache-Control"].startswith("no-store")
+    assert login.headers["Pragma"] == "no-cache"
+    assert "ETag" not in login.headers
+
+    undeclared = client.get("/api/undeclared")
+    assert undeclared.headers["Cache-Control"].startswith("no-store")
+    assert "ETag" not in undeclared.headers
+
+    # Only a declared policy lifts no-store, not a header set by the route
+    self_cached = client.get("/api/self-cached")
+    assert self_cached.headers["Cache-Control"].startswith("no-store")
+
+
+def test_etag_matches():
+    from app.services.middleware.http_cache import etag_matches
+
+    assert etag_matches('W/"a"', '"a"')
+    assert etag_matches("*", 'W/"a"')
+    assert etag_matches('"b", W/"a"', 'W/"a"')
+    assert not etag_matches(None, 'W/"a"')
+    assert not etag_matches('"b"', 'W/"a"')
+
+
+@pytest.mark.asyncio
+async def test_current_user_is_revalidated_from_updated_at(monkeypatch, async_client):
+    from app.api.users import auth as user_auth
+    from app.crud.auth import user as crud_user
+
+    user = types.SimpleNamespace(
+        id="11111111-1111-1111-1111-111111111111",
+        email="u@example.com",
+        username="user123",
+        is_verified=True,
+        is_superuser=False,
+        created_at="2025-01-01T00:00:00Z",
+        updated_at=datetime(2025, 1, 2, tzinfo=timezone.utc),
+        is_deleted=False,
+    )
+
+    async def fake_get_user_by_id(db, user_id):  # type: ignore[no-untyped-def]
+        return user
+
+    monkeypatch.setattr(user_auth.jwt, "decode", lambda *a, **k: {"sub": "u"})
+    monkeypatch.setattr(crud_user, "get_user_by_id", fake_get_user_by_id)
+    headers = {"authorization": "Bearer dummy", "user-agent": "pytest"}
+
+    first = await async_client.get("/api/users/me", headers=headers)
+    assert first.status_code == 200
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    second = await async_client.get(
+        "/api/users/me",
+        headers={**headers, "If-None-Match": first.headers["ETag"]},
+    )
+    assert second.status_code == 304
+
+    user.updated_at = datetime(2025, 1, 3, tzinfo=timezone.utc)
+    third = await async_client.get(
+        "/api/users/me",
+        headers={**headers, "If-None-Match": first.headers["ETag"]},
+    )
+    assert third.status_code == 200
+    assert third.headers["ETag"] != first.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_features_and_oauth_providers_are_cacheable(async_client):
+    for path in ("/features", "/api/auth/oauth/providers"):
+        first = await async_client.get(path)
+        assert first.headers["Cache-Control"] == "public, no-cache"
+
+        second = await async_client.get(
+            path,
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+        assert second.status_code == 304
@@ -0,0 +1,192 @@
+import gzip
+import json
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+NOW = datetime(2025, 6, 1, 12, 0, tzinfo=UTC)
+USER_ID = uuid.UUID("00000000-0000-0000-0000-0000000000aa")
+
+
+def _row(timestamp, event_type="login_failed", user_id=None):
+    return {
+        "id": uuid.uuid4(),
+        "timestamp": timestamp,
+        "user_id": user_id,
+        "event_type": event_type,
+        "ip_address": "10.0.0.1",
+        "user_agent": None,
+        "success": False,
+        "context": {"reason": "bad_password"},
+        "session_id": None,
+    }
+
+
+class _StreamResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self
+
+    async def partitions(self):
+        # Two fetches per day to exercise multi-partition files
+        for i in range(0, len(self._rows), 2):
+            yield self._rows[i : i + 2]
+
+
+class _ArchiveSession:
+    """Fake session serving audit logs by the [start, end) bounds queried."""
+
+    def __init__(self, rows):
+        self.rows = sorted(rows, key=lambda row: row["timestamp"])
+
+    async def execute(self, statement):
+        cutoff = statement.compile().params["timestamp_1"]
+        oldest = next(
+            (row["timestamp"] for row in self.rows if row["timestamp"] < cutoff),
+            None,
+        )
+        return type("R", (), {"scalar_one_or_none": lambda self: oldest})()
+
+    async def stream(self, statement):
+        params = statement.compile().params
+        start, end = params["timestamp_1"], params["timestamp_2"]
+        return _StreamResult(
+            [row for row in self.rows if start <= row["timestamp"] < end],
+        )
+
+
+@pytest.fixture
+def archived(monkeypatch, tmp_path):
+    from app.services.monitoring import audit_archive as mod
+
+    rows = [
+        _row(NOW - timedelta(days=100, hours=1)),
+        _row(NOW - timedelta(days=100), "logout", USER_ID),
+        _row(NOW - timedelta(days=100) + timedelta(minutes=5)),
+        _row(NOW - timedelta(days=95)),
+        # Inside the retention period
+        _row(NOW - timedelta(days=10)),
+    ]
+    deleted_ranges = []
+
+    async def fake_delete(db, start, end, batch_size, ids):  # type: ignore[no-untyped-def]
+        # Streamed from the spool file, not held in a list
+        assert not isinstance(ids, list | tuple | set)
+        deleted_ranges.append((start, end))
+        archived_ids = set(ids)
+        return sum(
+            1
+            for row in rows
+            if start <= row["timestamp"] < end and row["id"] in archived_ids
+        )
+
+    monkeypatch.setattr(mod, "utc_now", lambda: NOW)
+    monkeypatch.setattr(mod, "delete_audit_logs_in_range", fake_delete)
+
+    return mod, rows, deleted_ranges, tmp_path
+
+
+@pytest.mark.asyncio
+async def test_archive_writes_daily_files_and_index(archived):
+    mod, rows, deleted_ranges, tmp_path = archived
+
+    stats = await mod.archive_audit_logs(
+        _ArchiveSession(rows),
+        older_than_days=90,
+        archive_dir=tmp_path,
+    )
+
+    assert stats == {"archived": 4, "deleted": 4, "files": 2}
+    # Only days that held audit logs are deleted, never past the cutoff
+    assert len(deleted_ranges) == 2
+    assert all(end <= NOW - timedelta(days=90) for _, end in deleted_ranges)
+
+    index = [
+        json.loads(line)
+        for line in (tmp_path / "index.ndjson").read_text().splitlines()
+    ]
+    assert [entry["rows"] for entry in index] == [3, 1]
+    assert index[0]["path"].startswith("date=2025-02-21/")
+    assert index[0]["start"] == rows[0]["timestamp"].isoformat()
+    assert index[0]["end"] == rows[2]["timestamp"].isoformat()
+
+    with gzip.open(tmp_path / index[0]["path"], "rt") as f:
+        archived_rows = [json.loads(line) for line in f]
+    assert [row["id"] for row in archived_rows] == [str(r["id"]) for r in rows[:3]]
+    assert archived_rows[0]["context"] == {"reason": "bad_password"}
+    assert not list(tmp_path.rglob("*.part"))
+
+
+@pytest.mark.asyncio
+async def test_archive_only_deletes_the_archived_ids(archived, monkeypatch):
+    mod, rows, _, tmp_path = archived
+    session = _ArchiveSession(rows)
+    # Written into an archived day while its file was being streamed
+    late = _row(NOW - timedelta(days=100) + timedelta(minutes=1))
+    archive_day = mod._archive_day
+
+    async def archive_then_insert(*args):  # type: ignore[no-untyped-def]
+        ids = await archive_day(*args)
+        rows.append(late)
+        return ids
+
+    monkeypatch.setattr(mod, "_archive_day", archive_then_insert)
+    stats = await mod.archive_audit_logs(
+        session,
+        older_than_days=90,
+        archive_dir=tmp_path,
+    )
+
+    assert stats["archived"] == 4
+    assert stats["deleted"] == 4
+
+
+@pytest.mark.asyncio
+async def test_archive_without_old_audit_logs_writes_nothing(archived):
+    mod, rows, deleted_ranges, tmp_path = archived
+
+    stats = await mod.archive_audit_logs(
+        _ArchiveSession(rows[-1:]),
+        older_than_days=90,
+        archive_dir=tmp_path,
+    )
+
+    assert stats == {"archived": 0, "deleted": 0, "files": 0}
+    assert deleted_ranges == []
+    assert not (tmp_path / "index.ndjson").exists()
+
+
+@pytest.mark.asyncio
+async def test_read_archive_filters_and_skips_files_by_index(archived):
+    mod, rows, _, tmp_path = archived
+    await mod.archive_audit_logs(
+        _ArchiveSession(rows),
+        older_than_days=90,
+        archive_dir=tmp_path,
+    )
+
+    since = NOW - timedelta(days=96)
+    files = list(mod.iter_archive_files(tmp_path, since=since))
+    assert [path.parent.name for path in files] == ["date=2025-02-26"]
+
+    in_range = list(mod.read_archived_audit_logs(tmp_path, since=since))
+    assert [row["id"] for row in in_range] == [str(rows[3]["id"])]
+
+    by_user = list(mod.read_archived_audit_logs(tmp_path, user_id=USER_ID))
+    assert [row["event_type"] for row in by_user] == ["logout"]
+
+    # Naive bounds are taken as UTC
+    naive_until = (NOW - timedelta(days=100)).replace(tzinfo=None)
+    before = list(mod.read_archived_audit_logs(tmp_path, until=naive_until))
+    assert [row["id"] for row in before] == [str(rows[0]["id"])]
+
+
+def test_read_archive_without_index_is_empty(tmp_path):
+    from app.services.monitoring.audit_archive import read_archived_audit_logs
+
+    assert list(read_archived_audit_logs(tmp_path)) == []
@@ -0,0 +1,96 @@
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+pytestmark = pytest.mark.unit
+
+
+def _client(body: bytes = b'{"openapi":"3.1.0"}'):  # type: ignore[no-untyped-def]
+    from app.utils.api_docs import PrecomputedResponse
+
+    app = FastAPI()
+    precomputed = PrecomputedResponse.build(body, "application/json")
+
+    @app.get("/schema")
+    def schema(request: Request):  # type: ignore[no-untyped-def]
+        return precomputed.response(request)
+
+    return TestClient(app), precomputed
+
+
+def test_precomputed_response_negotiates_encoding():
+    from app.utils import api_docs
+
+    body = json.dumps({"paths": {f"/p{i}": {} for i in range(100)}}).encode()
+    client, precomputed = _client(body)
+
+    gzipped = client.get("/schema", headers={"Accept-Encoding": "gzip"})
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert gzipped.headers["Vary"] == "Accept-Encoding"
+    # The client decodes it transparently
+    assert gzipped.content == body
+    assert len(precomputed.gzip_body) < len(body)
+
+    plain = client.get("/schema", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in plain.headers
+    assert plain.content == body
+
+    refused = client.get("/schema", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "Content-Encoding" not in refused.headers
+
+    brotli_wanted = client.get("/schema", headers={"Accept-Encoding": "br, gzip"})
+    expected = "br" if api_docs.brotli is not None else "gzip"
+    assert brotli_wanted.headers["Content-Encoding"] == expected
+
+
+def test_precomputed_response_answers_304():
+    client, precomputed = _client()
+
+    first = client.get("/schema")
+    assert first.headers["ETag"] == precomputed.etag
+
+    second = client.get("/schema", headers={"If-None-Match": precomputed.etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == precomputed.etag
+
+
+def test_compression_is_deterministic():
+    from app.utils.api_docs import PrecomputedResponse
+
+    first = PrecomputedResponse.build(b"x" * 1000, "text/plain")
+    second = PrecomputedResponse.build(b"x" * 1000, "text/plain")
+
+    # Same bytes in every worker, so CDNs see one variant per encoding
+    assert first.gzip_body == second.gzip_body
+    assert gzip.decompress(first.gzip_body) == b"x" * 1000
+
+
+@pytest.mark.asyncio
+async def test_openapi_and_docs_are_served_precomputed(async_client):
+    from app.core.config import settings
+    from app.main import app
+
+    path = f"{settings.API_V1_STR}/openapi.json"
+    schema = await async_client.get(path, headers={"Accept-Encoding": "gzip"})
+    assert schema.status_code == 200
+    assert schema.json() == app.openapi()
+    assert schema.headers["Content-Encoding"] == "gzip"
+    assert schema.headers["Cache-Control"] == (
+        f"public, max-age={settings.DOCS_CACHE_MAX_AGE}"
+    )
+
+    revalidated = await async_client.get(
+        path,
+        headers={"If-None-Match": schema.headers["ETag"]},
+    )
+    assert revalidated.status_code == 304
+
+    docs = await async_client.get("/docs")
+    assert docs.status_code == 200
+    assert docs.headers["content-type"].startswith("text/html")
+    assert f"url: '{path}'" in docs.text
+    assert docs.headers["Cache-Control"].startswith("public, max-age=")
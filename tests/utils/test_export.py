@@ -0,0 +1,148 @@
+import json
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+pytestmark = pytest.mark.unit
+
+
+class StreamResult:
+    def __init__(self, partitions):
+        self._partitions = partitions
+
+    def mappings(self):
+        return self
+
+    async def partitions(self):
+        for partition in self._partitions:
+            yield partition
+
+
+class StreamingSession:
+    def __init__(self, partitions):
+        self._partitions = partitions
+        self.statements = []
+        self.params = []
+
+    async def stream(self, statement, params=None):  # type: ignore[no-untyped-def]
+        self.statements.append(statement)
+        self.params.append(params)
+        return StreamResult(self._partitions)
+
+
+def _audit_row(event_type="login_success", context=None):
+    return {
+        "id": uuid.UUID("00000000-0000-0000-0000-000000000001"),
+        "timestamp": datetime(2025, 1, 1, tzinfo=UTC),
+        "user_id": None,
+        "event_type": event_type,
+        "ip_address": "127.0.0.1",
+        "user_agent": None,
+        "success": True,
+        "context": context,
+        "session_id": None,
+    }
+
+
+async def _collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.asyncio
+async def test_stream_export_ndjson_yields_one_chunk_per_fetch():
+    from app.models import AuditLog
+    from app.schemas.system.audit_log import AuditLogResponse
+    from app.utils.export import ExportFormat, stream_export
+    from app.utils.search_filter import create_audit_log_search_filters
+
+    db = StreamingSession([[_audit_row(), _audit_row("logout")], [_audit_row()]])
+    config = create_audit_log_search_filters(event_type="login_success")
+
+    chunks = await _collect(
+        stream_export(db, AuditLog, AuditLogResponse, config, ExportFormat.NDJSON, 2),
+    )
+
+    assert len(chunks) == 2
+    lines = b"".join(chunks).decode().splitlines()
+    assert len(lines) == 3
+    first = json.loads(lines[0])
+    assert first["id"] == "00000000-0000-0000-0000-000000000001"
+    assert first["timestamp"] == "2025-01-01T00:00:00+00:00"
+
+    statement = db.statements[0]
+    assert statement.get_execution_options()["yield_per"] == 2
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "audit_logs.event_type = %(filter_0)s" in sql
+    assert db.params[0] == {"filter_0": "login_success"}
+
+
+@pytest.mark.asyncio
+async def test_stream_export_csv_writes_header_then_rows():
+    from app.models import AuditLog
+    from app.schemas.system.audit_log import AuditLogResponse
+    from app.utils.export import ExportFormat, stream_export
+    from app.utils.search_filter import SearchFilterConfig
+
+    db = StreamingSession([[_audit_row(context={"a": 1})]])
+
+    chunks = await _collect(
+        stream_export(
+            db,
+            AuditLog,
+            AuditLogResponse,
+            SearchFilterConfig(),
+            ExportFormat.CSV,
+        ),
+    )
+
+    header, row = b"".join(chunks).decode().splitlines()
+    assert header.split(",") == list(AuditLogResponse.model_fields)
+    assert row.startswith(
+        "00000000-0000-0000-0000-000000000001,2025-01-01T00:00:00+00:00,,",
+    )
+    assert '"{""a"":1}"' in row
+
+
+@pytest.mark.asyncio
+async def test_stream_export_users_selects_only_response_columns():
+    from app.models import User
+    from app.schemas.admin.admin import AdminUserResponse
+    from app.utils.export import ExportFormat, stream_export
+    from app.utils.search_filter import create_user_search_filters
+
+    db = StreamingSession([])
+    config = create_user_search_filters(search_query="alice", is_deleted=False)
+
+    assert (
+        await _collect(
+            stream_export(db, User, AdminUserResponse, config, ExportFormat.NDJSON),
+        )
+        == []
+    )
+
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    select_list = sql.split("FROM")[0]
+    assert "hashed_password" not in select_list
+    assert "token" not in select_list
+    assert "lower(users.username)" in sql
+    assert db.params[0]["search_pattern"] == "%alice%"
+
+
+def test_audit_log_search_params_build_filters():
+    from app.utils.search_filter import AuditLogSearchParams
+
+    user_id = uuid.uuid4()
+    config = AuditLogSearchParams(
+        user_id=user_id,
+        success=False,
+        occurred_after=datetime(2025, 1, 1, tzinfo=UTC),
+    ).to_search_config()
+
+    assert [(f.field, f.operator.value) for f in config.filters] == [
+        ("user_id", "equals"),
+        ("success", "equals"),
+        ("timestamp", "gte"),
+    ]
+    assert config.sort_order == "desc"
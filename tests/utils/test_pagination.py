@@ -74,3 +74,26 @@ def test_create_pagination_links_variants():
     assert links["self"].startswith("/api/items?page=1")
     assert links["next"].startswith("/api/items?page=2")
     assert links["last"].startswith("/api/items?page=3")
+
+
+def test_keyset_cursor_round_trip():
+    import uuid
+    from datetime import UTC, datetime
+
+    from app.utils.pagination import decode_keyset_cursor, encode_keyset_cursor
+
+    timestamp = datetime(2025, 3, 4, 5, 6, 7, 123456, tzinfo=UTC)
+    row_id = uuid.uuid4()
+
+    cursor = encode_keyset_cursor(timestamp, row_id)
+
+    assert "=" not in cursor
+    assert decode_keyset_cursor(cursor) == (timestamp, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "bm8tc2VwYXJhdG9y"])
+def test_decode_keyset_cursor_rejects_malformed(cursor):
+    from app.utils.pagination import decode_keyset_cursor
+
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        decode_keyset_cursor(cursor)
@@ -15,9 +15,10 @@ def test_monitor_database_queries_installs_listeners():
 def test_cache_result_logs_hit_and_miss(monkeypatch):
     import asyncio
 
+    from app.services.cache import get_cache
     from app.utils import performance as perf
 
-    perf._performance_cache.clear()
+    asyncio.run(get_cache().clear())
 
     flags = {"debugs": []}
 
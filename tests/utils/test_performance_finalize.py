@@ -88,14 +88,15 @@ def test_monitor_request_performance_exception_logs(monkeypatch):
 
 
 def test_add_performance_headers_and_cache_result_edge(monkeypatch):
+    from app.services.cache import get_cache
     from app.utils import performance as perf
 
     resp = type("R", (), {"headers": {}})()
     perf.add_performance_headers(resp, 0.001)
     assert resp.headers["X-Execution-Time"] == "0.001"
-    assert resp.headers["X-Cache-Status"] == "MISS"
+    assert resp.headers["X-Cache-Status"] == "BYPASS"
 
-    perf._performance_cache.clear()
+    asyncio.run(get_cache().clear())
 
     @perf.cache_result(ttl=1)
     async def g(a, b=2):  # type: ignore[no-untyped-def]
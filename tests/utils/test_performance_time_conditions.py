@@ -58,9 +58,10 @@ def test_monitor_request_performance_time_branches(monkeypatch):
 def test_cache_result_remaining_paths(monkeypatch):
     import asyncio
 
+    from app.services.cache import get_cache
     from app.utils import performance as perf
 
-    perf._performance_cache.clear()
+    asyncio.run(get_cache().clear())
 
     # Ensure hash key path and update
     calls = {"n": 0}
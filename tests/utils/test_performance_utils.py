@@ -8,7 +8,7 @@ def test_add_performance_headers():
     resp = types.SimpleNamespace(headers={})
     add_performance_headers(resp, 0.123)
     assert resp.headers["X-Execution-Time"] == "0.123"
-    assert resp.headers["X-Cache-Status"] == "MISS"
+    assert resp.headers["X-Cache-Status"] == "BYPASS"
 
 
 def test_optimize_query_applies_limit():
@@ -28,10 +28,11 @@ def test_optimize_query_applies_limit():
 
 
 def test_cache_result_decorator(monkeypatch):
+    from app.services.cache import get_cache
     from app.utils import performance as perf
 
     # Ensure a clean cache
-    perf._performance_cache.clear()
+    asyncio.run(get_cache().clear())
 
     calls = {"count": 0}
 
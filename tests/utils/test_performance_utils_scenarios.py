@@ -7,9 +7,10 @@ pytestmark = pytest.mark.unit
 
 @pytest.mark.asyncio
 async def test_cache_result_hits(monkeypatch):
-    from app.utils.performance import _performance_cache, cache_result
+    from app.services.cache import get_cache
+    from app.utils.performance import cache_result
 
-    _performance_cache.clear()
+    await get_cache().clear()
 
     calls = {"n": 0}
 
@@ -72,4 +73,4 @@ def test_add_performance_headers_sets_values():
     r = Resp()
     add_performance_headers(r, 0.123)
     assert r.headers["X-Execution-Time"] == "0.123"
-    assert r.headers["X-Cache-Status"] == "MISS"
+    assert r.headers["X-Cache-Status"] == "BYPASS"
@@ -0,0 +1,144 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models import User
+from app.utils import search_filter as sf
+from app.utils.search_filter import (
+    FilterOperator,
+    SearchFilterBuilder,
+    SearchFilterConfig,
+    create_field_filter,
+    create_text_search,
+    create_user_search_filters,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    sf.clear_search_query_cache()
+    yield
+    sf.clear_search_query_cache()
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_same_shape_reuses_template_with_new_params():
+    builder = SearchFilterBuilder(User)
+    first, first_params = builder.build_statement(
+        create_user_search_filters(search_query="alice", is_verified=True),
+    )
+    second, second_params = builder.build_statement(
+        create_user_search_filters(search_query="bob", is_verified=False),
+    )
+
+    assert first is second
+    assert first_params["search_pattern"] == "%alice%"
+    assert second_params["search_pattern"] == "%bob%"
+    assert [v for k, v in second_params.items() if k.startswith("filter_")] == [False]
+
+    stats = sf.get_search_query_cache_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_values_are_never_inlined():
+    builder = SearchFilterBuilder(User)
+    a = builder.build_query(create_user_search_filters(search_query="alice"))
+    b = builder.build_query(create_user_search_filters(search_query="mallory"))
+    assert _sql(a) == _sql(b)
+    assert "alice" not in _sql(a)
+
+
+def test_different_shape_is_a_miss():
+    builder = SearchFilterBuilder(User)
+    builder.build_statement(create_user_search_filters(search_query="alice"))
+    builder.build_statement(
+        create_user_search_filters(search_query="alice", sort_by="email"),
+    )
+    builder.build_statement(
+        create_user_search_filters(
+            search_query="alice",
+            use_full_text_search=True,
+        ),
+    )
+    stats = sf.get_search_query_cache_stats()
+    assert stats["misses"] == 3 and stats["hits"] == 0 and stats["size"] == 3
+
+
+def test_in_filter_uses_expanding_parameter():
+    builder = SearchFilterBuilder(User)
+    cfg_small = SearchFilterConfig(
+        filters=[create_field_filter("email", FilterOperator.IN, values=["a@b.com"])],
+    )
+    cfg_large = SearchFilterConfig(
+        filters=[
+            create_field_filter(
+                "email",
+                FilterOperator.IN,
+                values=["a@b.com", "c@d.com", "e@f.com"],
+            ),
+        ],
+    )
+    small, _ = builder.build_statement(cfg_small)
+    large, params = builder.build_statement(cfg_large)
+    assert small is large
+    assert params["filter_0"] == ["a@b.com", "c@d.com", "e@f.com"]
+    assert "POSTCOMPILE" in _sql(large)
+
+
+def test_equals_none_becomes_null_check():
+    builder = SearchFilterBuilder(User)
+    statement, params = builder.build_statement(
+        SearchFilterConfig(
+            filters=[create_field_filter("oauth_provider", FilterOperator.EQUALS)],
+        ),
+    )
+    assert "users.oauth_provider IS NULL" in _sql(statement)
+    assert params == {}
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(sf, "SEARCH_QUERY_CACHE_SIZE", 2)
+    builder = SearchFilterBuilder(User)
+    by_email = create_user_search_filters(sort_by="email")
+    by_username = create_user_search_filters(sort_by="username")
+    by_created = create_user_search_filters(sort_by="created_at")
+
+    builder.build_statement(by_email)
+    builder.build_statement(by_username)
+    builder.build_statement(by_email)  # refresh email
+    builder.build_statement(by_created)  # evicts username
+
+    assert sf.get_search_query_cache_stats()["size"] == 2
+    builder.build_statement(by_email)
+    builder.build_statement(by_username)
+    stats = sf.get_search_query_cache_stats()
+    assert stats["hits"] == 2 and stats["misses"] == 4
+
+
+def test_model_metadata_is_computed_once():
+    first = sf.get_model_search_metadata(User)
+    assert sf.get_model_search_metadata(User) is first
+    assert "username" in first.fields and "email" in first.sortable_fields
+    assert first.search_vector_fields == frozenset({"username", "email"})
+    with pytest.raises(AttributeError):
+        first.fields = frozenset()  # type: ignore[misc]
+
+
+def test_full_text_template_keeps_pattern_params_for_fallback():
+    builder = SearchFilterBuilder(User)
+    _, params = builder.build_statement(
+        SearchFilterConfig(
+            text_search=create_text_search(
+                "alice",
+                ["username", "email"],
+                use_full_text_search=True,
+            ),
+        ),
+    )
+    assert params["search_tsquery"] == "alice"
+    assert params["search_pattern"] == "%alice%"
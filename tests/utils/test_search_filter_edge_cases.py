@@ -94,7 +94,7 @@ def test_field_filter_in_not_in_without_values_are_ignored():
 def test_user_and_deleted_user_params_to_search_config():
     from app.utils.search_filter import DeletedUserSearchParams, UserSearchParams
 
-    usp = UserSearchParams(search="a", is_verified=True)
+    usp = UserSearchParams(search="abc", is_verified=True)
     cfg1 = usp.to_search_config()
     assert cfg1 is not None
 
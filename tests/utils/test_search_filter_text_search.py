@@ -1,3 +1,5 @@
+import pytest
+
 from app.models import User
 from app.utils.search_filter import (
     FilterOperator,
@@ -60,3 +62,119 @@ def test_field_filter_not_in_and_in_with_values():
     q = SearchFilterBuilder(User).build_query(cfg)
     s = str(q)
     assert "email" in s and "SELECT" in s
+
+
+def _pg_compile(query):
+    from sqlalchemy.dialects import postgresql
+
+    return query.compile(dialect=postgresql.dialect())
+
+
+def test_text_search_insensitive_uses_trigram_compatible_ilike():
+    ts = create_text_search("Alpha", ["username", "email"])
+    cfg = SearchFilterConfig(text_search=ts)
+    compiled = _pg_compile(SearchFilterBuilder(User).build_query(cfg))
+    # Expression must match the indexed lower(col) for the GIN index to apply
+    assert "lower(users.username) ILIKE" in str(compiled)
+    assert "lower(users.email) ILIKE" in str(compiled)
+    assert set(compiled.params.values()) == {"%alpha%"}
+
+
+def test_text_search_escapes_like_wildcards():
+    ts = create_text_search(
+        "50%_off",
+        ["username"],
+        operator=SearchOperator.STARTS_WITH,
+    )
+    cfg = SearchFilterConfig(text_search=ts)
+    compiled = _pg_compile(SearchFilterBuilder(User).build_query(cfg))
+    assert "ESCAPE" in str(compiled)
+    assert list(compiled.params.values()) == ["50\\%\\_off%"]
+
+
+def test_user_search_params_enforce_min_query_length():
+    from pydantic import ValidationError
+
+    from app.utils.search_filter import MIN_SEARCH_QUERY_LENGTH, UserSearchParams
+
+    with pytest.raises(ValidationError):
+        UserSearchParams(search="a" * (MIN_SEARCH_QUERY_LENGTH - 1))
+    assert UserSearchParams(search="a" * MIN_SEARCH_QUERY_LENGTH).search
+
+
+def test_user_model_declares_trigram_indexes():
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+
+    indexes = {index.name: index for index in User.__table__.indexes}
+    for name, column in [
+        ("ix_user_username_trgm", "username"),
+        ("ix_user_email_trgm", "email"),
+    ]:
+        ddl = str(CreateIndex(indexes[name]).compile(dialect=postgresql.dialect()))
+        assert f"USING gin (lower({column}) gin_trgm_ops)" in ddl
+
+
+def test_full_text_search_uses_stored_search_vector_and_ranks():
+    ts = create_text_search("alice", ["username", "email"], use_full_text_search=True)
+    cfg = SearchFilterConfig(text_search=ts)
+    sql = str(_pg_compile(SearchFilterBuilder(User).build_query(cfg)))
+    assert "users.search_vector @@ websearch_to_tsquery" in sql
+    assert "to_tsvector" not in sql
+    assert "ORDER BY ts_rank(users.search_vector" in sql and "DESC" in sql
+
+
+def test_full_text_search_explicit_sort_overrides_rank():
+    ts = create_text_search("alice", ["username", "email"], use_full_text_search=True)
+    cfg = SearchFilterConfig(text_search=ts, sort_by="username")
+    sql = str(_pg_compile(SearchFilterBuilder(User).build_query(cfg)))
+    assert "ts_rank" not in sql
+    assert "ORDER BY users.username" in sql
+
+
+def test_full_text_search_other_fields_compute_vector():
+    ts = create_text_search("spam", ["deletion_reason"], use_full_text_search=True)
+    cfg = SearchFilterConfig(text_search=ts)
+    sql = str(_pg_compile(SearchFilterBuilder(User).build_query(cfg)))
+    assert "to_tsvector" in sql
+    assert "search_vector" not in sql
+
+
+def test_full_text_search_prefix_matching():
+    ts = create_text_search(
+        "ali smi!",
+        ["username", "email"],
+        use_full_text_search=True,
+        use_prefix_matching=True,
+    )
+    cfg = SearchFilterConfig(text_search=ts)
+    compiled = _pg_compile(SearchFilterBuilder(User).build_query(cfg))
+    assert "users.search_vector @@ to_tsquery" in str(compiled)
+    assert "ali:* & smi:*" in compiled.params.values()
+
+
+def test_full_text_search_prefix_matching_without_terms_falls_back():
+    ts = create_text_search(
+        "!!!",
+        ["username", "email"],
+        use_full_text_search=True,
+        use_prefix_matching=True,
+    )
+    cfg = SearchFilterConfig(text_search=ts)
+    sql = str(_pg_compile(SearchFilterBuilder(User).build_query(cfg)))
+    assert "ILIKE" in sql and "tsquery" not in sql and "ORDER BY" not in sql
+
+
+def test_user_search_vector_is_generated_and_deferred():
+    from sqlalchemy import inspect
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex, CreateTable
+
+    ddl = str(CreateTable(User.__table__).compile(dialect=postgresql.dialect()))
+    assert "search_vector TSVECTOR GENERATED ALWAYS AS" in ddl and "STORED" in ddl
+
+    index = next(i for i in User.__table__.indexes if i.name == "ix_user_search_vector")
+    index_ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+    assert "USING gin (search_vector)" in index_ddl
+
+    assert inspect(User).attrs.search_vector.deferred is True
@@ -0,0 +1,143 @@
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_handles_chunk_boundaries_and_blank_lines():
+    from app.utils.user_import import iter_lines
+
+    lines = await _collect(
+        iter_lines(_chunks(b"\xef\xbb\xbfa,b\r\nc", b"d\n\n", b"ef")),
+    )
+
+    assert lines == [(1, "a,b"), (2, "cd"), (4, "ef")]
+
+
+@pytest.mark.asyncio
+async def test_iter_import_records_csv_uses_header():
+    from app.utils.export import ExportFormat
+    from app.utils.user_import import iter_import_records
+
+    body = b'email,username,password\nA@Example.com,alice,"Pa,ss1!word"\n'
+    records = await _collect(iter_import_records(_chunks(body), ExportFormat.CSV))
+
+    assert records == [
+        (2, {"email": "A@Example.com", "username": "alice", "password": "Pa,ss1!word"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_import_records_csv_keeps_quoted_newlines():
+    from app.utils.export import ExportFormat
+    from app.utils.user_import import iter_import_records
+
+    body = (
+        b'email,username,password\n"a@example.com","al\n\nice","Pa""ss1!"\n'
+        b"b@example.com,bob,Str0ng!Pass\n"
+        b'c@example.com,"carol\n'
+    )
+    records = await _collect(iter_import_records(_chunks(body), ExportFormat.CSV))
+
+    assert records == [
+        (2, {"email": "a@example.com", "username": "al\n\nice", "password": 'Pa"ss1!'}),
+        (5, {"email": "b@example.com", "username": "bob", "password": "Str0ng!Pass"}),
+        # Unterminated quoted field
+        (6, {}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_import_records_reports_invalid_utf8():
+    from app.utils.export import ExportFormat
+    from app.utils.user_import import (
+        INVALID_ENCODING_ERROR,
+        iter_import_records,
+        validate_import_record,
+    )
+
+    body = b"email,username,password\n\xff@example.com,a,b\nb@example.com,bob,pw\n"
+    records = await _collect(iter_import_records(_chunks(body), ExportFormat.CSV))
+    assert records == [
+        (2, None),
+        (3, {"email": "b@example.com", "username": "bob", "password": "pw"}),
+    ]
+
+    body = b'{"email": "a@example.com"}\n{"email": "\xe9"}\n'
+    records = await _collect(iter_import_records(_chunks(body), ExportFormat.NDJSON))
+    assert records == [(1, {"email": "a@example.com"}), (2, None)]
+
+    row, error = validate_import_record(2, None)
+    assert row is None
+    assert error == {
+        "line": 2,
+        "email": None,
+        "username": None,
+        "reason": INVALID_ENCODING_ERROR,
+    }
+
+
+@pytest.mark.asyncio
+async def test_iter_import_records_ndjson_reports_unparseable_lines():
+    from app.utils.export import ExportFormat
+    from app.utils.user_import import iter_import_records
+
+    body = b'{"email": "a@example.com"}\nnot json\n[1]\n'
+    records = await _collect(iter_import_records(_chunks(body), ExportFormat.NDJSON))
+
+    assert records == [(1, {"email": "a@example.com"}), (2, {}), (3, {})]
+
+
+def test_validate_import_record():
+    from app.utils.user_import import validate_import_record
+
+    row, error = validate_import_record(
+        3,
+        {
+            "email": " Alice@Example.com ",
+            "username": "alice",
+            "password": "Str0ng!Pass",
+            "is_verified": "true",
+        },
+    )
+    assert error is None
+    assert row.line == 3
+    assert row.email == "alice@example.com"
+    assert row.is_verified is True and row.is_superuser is False
+
+    row, error = validate_import_record(4, {"email": "a@example.com"})
+    assert row is None
+    assert error == {
+        "line": 4,
+        "email": "a@example.com",
+        "username": None,
+        "reason": "Missing fields: username, password",
+    }
+
+    row, error = validate_import_record(
+        5,
+        {"email": "a@mailinator.com", "username": "alice", "password": "Str0ng!Pass"},
+    )
+    assert row is None
+    assert error["reason"] == "Disposable email addresses are not allowed"
+
+    _, error = validate_import_record(
+        6,
+        {"email": "a@example.com", "username": "admin", "password": "Str0ng!Pass"},
+    )
+    assert error["reason"] == "Username is reserved and cannot be used"
+
+    _, error = validate_import_record(
+        7,
+        {"email": "a@example.com", "username": "alice", "password": "weak"},
+    )
+    assert "at least 8 characters" in error["reason"]